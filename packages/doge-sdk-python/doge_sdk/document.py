@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
+
+EXTRACTION_FINISHED_STATUSES = frozenset({"indexed", "failed"})
 
 
 class DocumentsResource:
@@ -36,6 +40,27 @@ class DocumentsResource:
     def get(self, document_id: str) -> dict[str, Any]:
         return self._root._request("GET", f"/v1/documents/{document_id}")
 
+    def extraction(self, document_id: str) -> dict[str, Any]:
+        return self._root._request("GET", f"/v1/documents/{document_id}/extraction")
+
+    def wait_for_extraction(
+        self,
+        document_id: str,
+        *,
+        timeout: float = 300.0,
+        poll_interval: float = 0.5,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> dict[str, Any]:
+        """Poll the background extraction job until it is ``indexed`` or ``failed``."""
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.extraction(document_id)
+            if job["status"] in EXTRACTION_FINISHED_STATUSES:
+                return job
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"document {document_id} extraction still {job['status']} after {timeout}s")
+            sleep(poll_interval)
+
 
 class AsyncDocumentsResource:
     def __init__(self, root: Any) -> None:
@@ -66,3 +91,24 @@ class AsyncDocumentsResource:
 
     async def get(self, document_id: str) -> dict[str, Any]:
         return await self._root._request("GET", f"/v1/documents/{document_id}")
+
+    async def extraction(self, document_id: str) -> dict[str, Any]:
+        return await self._root._request("GET", f"/v1/documents/{document_id}/extraction")
+
+    async def wait_for_extraction(
+        self,
+        document_id: str,
+        *,
+        timeout: float = 300.0,
+        poll_interval: float = 0.5,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> dict[str, Any]:
+        """Poll the background extraction job until it is ``indexed`` or ``failed``."""
+        deadline = time.monotonic() + timeout
+        while True:
+            job = await self.extraction(document_id)
+            if job["status"] in EXTRACTION_FINISHED_STATUSES:
+                return job
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"document {document_id} extraction still {job['status']} after {timeout}s")
+            await sleep(poll_interval)
@@ -65,6 +65,7 @@ class RunsResource:
         run_id: str,
         last_event_id: str | None = None,
         *,
+        deltas: bool = False,
         reconnect: bool = True,
         max_reconnects: int = 3,
         backoff_seconds: float = 0.25,
@@ -76,7 +77,12 @@ class RunsResource:
             try:
                 from doge_sdk.streaming import iter_sse
 
-                with self._root._client.stream("GET", f"/v1/runs/{run_id}/stream", headers=headers) as response:
+                with self._root._client.stream(
+                    "GET",
+                    f"/v1/runs/{run_id}/stream",
+                    headers=headers,
+                    params={"deltas": "true"} if deltas else None,
+                ) as response:
                     if response.status_code >= 400:
                         response.read()
                         message = response_error_message(response)
@@ -162,6 +168,7 @@ class AsyncRunsResource:
         run_id: str,
         last_event_id: str | None = None,
         *,
+        deltas: bool = False,
         reconnect: bool = True,
         max_reconnects: int = 3,
         backoff_seconds: float = 0.25,
@@ -173,7 +180,12 @@ class AsyncRunsResource:
             try:
                 from doge_sdk.streaming import aiter_sse
 
-                async with self._root._client.stream("GET", f"/v1/runs/{run_id}/stream", headers=headers) as response:
+                async with self._root._client.stream(
+                    "GET",
+                    f"/v1/runs/{run_id}/stream",
+                    headers=headers,
+                    params={"deltas": "true"} if deltas else None,
+                ) as response:
                     if response.status_code >= 400:
                         await response.aread()
                         message = response_error_message(response)
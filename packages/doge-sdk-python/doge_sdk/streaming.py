@@ -3,13 +3,56 @@
 from __future__ import annotations
 
 import json
+import time
 from collections.abc import Iterator
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 
 import httpx
 
 from doge_sdk.run import DogeEvent
 
+MODEL_DELTA_EVENT = "model_delta"
+MODEL_RESPONSE_EVENT = "model_response"
+
+
+@dataclass
+class LiveModelOutput:
+    """Fold ``model_delta`` events from ``runs.stream(..., deltas=True)``.
+
+    Deltas are live-only: they have no event id and are not replayed after a
+    reconnect. The buffers restart after every persisted ``model_response``,
+    which carries the complete text of the round.
+    """
+
+    started_at: float = field(default_factory=time.monotonic)
+    content: str = ""
+    reasoning_content: str = ""
+    first_delta_at: float | None = None
+
+    def feed(self, event: DogeEvent) -> str:
+        """Apply ``event`` and return the content text it added."""
+        if event.type == MODEL_RESPONSE_EVENT:
+            self.content = ""
+            self.reasoning_content = ""
+            return ""
+        if event.type != MODEL_DELTA_EVENT:
+            return ""
+        payload = event.data.get("payload", event.data)
+        if self.first_delta_at is None:
+            self.first_delta_at = time.monotonic()
+        content = str(payload.get("content") or "")
+        self.content += content
+        self.reasoning_content += str(payload.get("reasoning_content") or "")
+        return content
+
+    @property
+    def time_to_first_delta(self) -> float | None:
+        """Seconds from construction to the first delta, if one has arrived."""
+        if self.first_delta_at is None:
+            return None
+        return self.first_delta_at - self.started_at
+
 
 def iter_sse(response: httpx.Response) -> Iterator[DogeEvent]:
     event_id: str | None = None
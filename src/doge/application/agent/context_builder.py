@@ -49,9 +49,29 @@ class ContextBuilder:
         enterprise_context: EnterpriseContext | None = None,
         execution_context: RunExecutionContext | None = None,
     ) -> list[AgentMessage]:
-        context = enterprise_context or (
-            execution_context.enterprise_context if execution_context is not None else None
-        ) or self._enterprise_context
+        return [
+            *self.build_preamble(
+                run,
+                enterprise_context=enterprise_context,
+                execution_context=execution_context,
+            ),
+            *self.event_messages(events),
+        ]
+
+    def build_preamble(
+        self,
+        run: AgentRun,
+        *,
+        enterprise_context: EnterpriseContext | None = None,
+        execution_context: RunExecutionContext | None = None,
+    ) -> list[AgentMessage]:
+        """Render the messages that precede the run's own events.
+
+        The preamble depends only on run metadata, documents and prior session
+        turns, so callers stepping the same run can render it once and reuse
+        it while :meth:`preamble_key` is unchanged.
+        """
+        context = self._resolve_context(enterprise_context, execution_context)
         messages = [
             AgentMessage(
                 role="system",
@@ -66,6 +86,25 @@ class ContextBuilder:
         messages.extend(self._build_document_messages(document_ids, context))
         messages.extend(self._build_session_history(run, context))
         messages.append(AgentMessage(role="user", content=run.question))
+        return messages
+
+    def preamble_key(
+        self,
+        run: AgentRun,
+        *,
+        enterprise_context: EnterpriseContext | None = None,
+        execution_context: RunExecutionContext | None = None,
+    ) -> tuple[object, ...]:
+        """Return what a rendered preamble depends on, with document ACLs re-checked.
+
+        A cached preamble may be reused only while this key is unchanged.
+        """
+        context = self._resolve_context(enterprise_context, execution_context)
+        return (context, tuple(self._authorized_document_ids(run.document_ids, context)))
+
+    def event_messages(self, events: list[AgentEvent]) -> list[AgentMessage]:
+        """Render run events as conversation messages, in sequence order."""
+        messages: list[AgentMessage] = []
         for event in sorted(events, key=lambda item: item.sequence):
             if event.event_type == EventType.MODEL_RESPONSE:
                 payload = event.payload.get("message", {})
@@ -90,6 +129,15 @@ class ContextBuilder:
                 ))
         return messages
 
+    def _resolve_context(
+        self,
+        enterprise_context: EnterpriseContext | None,
+        execution_context: RunExecutionContext | None,
+    ) -> EnterpriseContext | None:
+        return enterprise_context or (
+            execution_context.enterprise_context if execution_context is not None else None
+        ) or self._enterprise_context
+
     def _system_prompt(
         self,
         context: EnterpriseContext | None,
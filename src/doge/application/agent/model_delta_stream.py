@@ -0,0 +1,141 @@
+"""Ephemeral live channel for streamed model output.
+
+``ModelResponseAssembler`` only returns once the provider stream ends, so the
+persisted ``MODEL_RESPONSE`` event lands at the end of a model round. While the
+round is still streaming, :class:`ModelDeltaStream` batches content and
+reasoning deltas and publishes them as ``MODEL_DELTA`` events on a
+:class:`ModelDeltaChannel`. Delta events are never written to the event log and
+carry no sequence, so they cannot be replayed or resumed from; the persisted
+``MODEL_RESPONSE`` stays the source of truth.
+
+Batching only happens while a stream for the run is subscribed, and a slow
+subscriber drops deltas instead of holding up the model round.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable
+from uuid import uuid4
+
+from doge.core.domain.agent_models import AgentEvent, EventType
+from doge.core.ports.event_publisher import IEventPublisher
+
+
+class ModelDeltaChannel(IEventPublisher):
+    """In-process fan-out of ``MODEL_DELTA`` events to live run streams."""
+
+    def __init__(self, *, queue_size: int = 256) -> None:
+        self._queue_size = max(1, queue_size)
+        self._subscribers: dict[str, set[asyncio.Queue[AgentEvent]]] = defaultdict(set)
+        self._dropped = 0
+
+    def has_subscribers(self, run_id: str) -> bool:
+        return bool(self._subscribers.get(run_id))
+
+    async def publish(self, event: AgentEvent) -> None:
+        for queue in list(self._subscribers.get(event.run_id, ())):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._dropped += 1
+
+    async def subscribe(self, run_id: str) -> AsyncIterator[AgentEvent]:
+        queue: asyncio.Queue[AgentEvent] = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers[run_id].add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            subscribers = self._subscribers.get(run_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[run_id]
+
+    def metrics(self) -> dict[str, int]:
+        return {
+            "watched_runs": len(self._subscribers),
+            "subscriptions": sum(len(queues) for queues in self._subscribers.values()),
+            "dropped": self._dropped,
+        }
+
+
+class ModelDeltaStream:
+    """Tee streamed model chunks into batched ``MODEL_DELTA`` events.
+
+    A batch is published once ``flush_interval_seconds`` has passed since the
+    previous one or ``flush_bytes`` of text are buffered, and whatever is left
+    when the provider stream ends is flushed before the round is assembled.
+    """
+
+    def __init__(
+        self,
+        channel: ModelDeltaChannel,
+        *,
+        flush_interval_seconds: float = 0.1,
+        flush_bytes: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._channel = channel
+        self._flush_interval_seconds = max(0.0, flush_interval_seconds)
+        self._flush_bytes = max(1, flush_bytes)
+        self._clock = clock
+
+    async def tee(self, run_id: str, chunks: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        if not self._channel.has_subscribers(run_id):
+            async for chunk in chunks:
+                yield chunk
+            return
+        batch = _DeltaBatch(run_id, self._clock())
+        async for chunk in chunks:
+            message = getattr(chunk, "message", None)
+            batch.add(
+                getattr(message, "content", None),
+                getattr(message, "reasoning_content", None),
+            )
+            if batch.size >= self._flush_bytes or (
+                batch.size and self._clock() - batch.flushed_at >= self._flush_interval_seconds
+            ):
+                await self._channel.publish(batch.flush(self._clock()))
+            yield chunk
+        if batch.size:
+            await self._channel.publish(batch.flush(self._clock()))
+
+
+class _DeltaBatch:
+    def __init__(self, run_id: str, started_at: float) -> None:
+        self.run_id = run_id
+        self.flushed_at = started_at
+        self.size = 0
+        self._index = 0
+        self._content: list[str] = []
+        self._reasoning: list[str] = []
+
+    def add(self, content: Any, reasoning: Any) -> None:
+        if isinstance(content, str) and content:
+            self._content.append(content)
+            self.size += len(content.encode("utf-8"))
+        if isinstance(reasoning, str) and reasoning:
+            self._reasoning.append(reasoning)
+            self.size += len(reasoning.encode("utf-8"))
+
+    def flush(self, now: float) -> AgentEvent:
+        payload: dict[str, Any] = {"index": self._index}
+        if self._content:
+            payload["content"] = "".join(self._content)
+        if self._reasoning:
+            payload["reasoning_content"] = "".join(self._reasoning)
+        self._index += 1
+        self._content.clear()
+        self._reasoning.clear()
+        self.size = 0
+        self.flushed_at = now
+        return AgentEvent(
+            event_id=f"dlt-{uuid4().hex[:12]}",
+            run_id=self.run_id,
+            event_type=EventType.MODEL_DELTA,
+            payload=payload,
+        )
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
 from doge.application.agent.artifact_finalizer import ArtifactFinalizer
@@ -9,9 +12,10 @@ from doge.application.agent.context_builder import ContextBuilder
 from doge.application.agent.model_response_assembler import ModelResponseAssembler
 from doge.application.agent.runtime_args import tool_safe_error_payload
 from doge.application.agent.transition_recorder import TransitionRecorder
-from doge.core.domain.agent_models import AgentRun, EventType, RunStatus
+from doge.core.domain.agent_models import AgentEvent, AgentRun, EventType, RunStatus
 from doge.core.domain.evidence_chunk_models import EvidenceChunk
 from doge.core.domain.run_execution_context import RunExecutionContext
+from doge.core.ports.agent_model import AgentMessage
 from doge.core.ports.agent_repository import (
     IApprovalRepository,
     IArtifactRepository,
@@ -21,9 +25,51 @@ from doge.core.ports.agent_repository import (
 from doge.core.ports.runtime_services import IModelExecutionService, IToolExecutionService, ToolResult
 from doge.shared.scope import TenantScope
 
+# Runs whose incremental step state is kept between steps; older entries are
+# rebuilt from the event log on their next step.
+_RUN_STATE_CACHE_SIZE = 256
+
+
+@dataclass(eq=False)
+class _RunState:
+    """Events, tool results and rendered context accumulated for one run."""
+
+    events: list[AgentEvent] = field(default_factory=list)
+    tool_results: list[ToolResult] = field(default_factory=list)
+    last_sequence: int = 0
+    preamble: list[AgentMessage] | None = None
+    preamble_key: object = None
+    messages: list[AgentMessage] = field(default_factory=list)
+    rendered: int = 0
+    seen: set[str] = field(default_factory=set)
+
+    def extend(self, events: list[AgentEvent]) -> None:
+        for event in sorted(events, key=lambda item: item.sequence):
+            if event.event_id in self.seen:
+                continue
+            self.seen.add(event.event_id)
+            self.events.append(event)
+            self.last_sequence = max(self.last_sequence, event.sequence)
+            if event.event_type == EventType.TOOL_RESULT:
+                result = _tool_result_from_event(event)
+                if result is not None:
+                    self.tool_results.append(result)
+
 
 class RunStepper:
-    """Execute one model/tool round for a run and record the resulting transition."""
+    """Execute one model/tool round for a run and record the resulting transition.
+
+    Consecutive read-only/analytical tool calls that are not approval-gated run
+    concurrently, at most ``max_parallel_tool_calls`` at a time (overridable
+    per run through the model policy). Any other call runs on its own, so
+    high-risk and approval-gated tools keep strict call order. Tool events are
+    always recorded in the order the model emitted the calls.
+
+    Between steps of the same run the stepper keeps the events it has already
+    read, the tool results rebuilt from them and the rendered model context,
+    and only reads events appended since the last step. The state is dropped
+    once the run ends or pauses for approval.
+    """
 
     def __init__(
         self,
@@ -39,6 +85,7 @@ class RunStepper:
         artifact_finalizer: ArtifactFinalizer,
         transition_recorder: TransitionRecorder,
         citation_assembler: Any | None = None,
+        max_parallel_tool_calls: int = 4,
     ) -> None:
         self._runs = run_repository
         self._events = event_repository
@@ -51,30 +98,24 @@ class RunStepper:
         self._artifact_finalizer = artifact_finalizer
         self._recorder = transition_recorder
         self._citation_assembler = citation_assembler
+        self._max_parallel_tool_calls = max(1, max_parallel_tool_calls)
+        self._states: OrderedDict[tuple[str, str], _RunState] = OrderedDict()
 
     async def step(self, scope: TenantScope, run_id: str) -> AgentRun:
         run = self._require_run(scope, run_id)
         if run.status in {RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.CANCELLED}:
-            self._cleanup_tool_results(run.run_id)
-            return self._hydrate(scope, run)
+            return self._finish(scope, run)
         if run.status == RunStatus.CANCELLING:
             await self._recorder.mark_cancelled(run)
-            self._cleanup_tool_results(run.run_id)
-            return self._hydrate(scope, run)
+            return self._finish(scope, run)
 
         await self._recorder.record(run, status=RunStatus.RUNNING)
-        run = self._require_run(scope, run_id)
         execution_context = RunExecutionContext.from_run(run)
         policy = execution_context.model_policy
         enterprise_context = execution_context.enterprise_context
-        events = self._events.list_for_run(run.run_id, tenant_id=scope.tenant_id)
-        tool_results = _tool_results_from_events(events)
-        messages = self._context_builder.build(
-            run,
-            events,
-            enterprise_context=enterprise_context,
-            execution_context=execution_context,
-        )
+        state = self._sync(scope, run_id)
+        tool_results = state.tool_results
+        messages = self._context_messages(run, state, execution_context)
         model_result = await self._model_execution.execute(
             run=run,
             policy=policy,
@@ -99,12 +140,10 @@ class RunStepper:
         run = self._require_run(scope, run_id)
         if run.status == RunStatus.CANCELLING:
             await self._recorder.mark_cancelled(run)
-            self._cleanup_tool_results(run.run_id)
-            return self._hydrate(scope, run)
+            return self._finish(scope, run)
         if response is None:
             await self._recorder.mark_failed(run, "model unavailable", code="model_unavailable")
-            self._cleanup_tool_results(run.run_id)
-            return self._hydrate(scope, run)
+            return self._finish(scope, run)
 
         await self._recorder.record(
             run,
@@ -117,55 +156,55 @@ class RunStepper:
         )
         if model_result.budget_exceeded:
             await self._recorder.mark_failed(run, "run budget exceeded", code="run_budget_exceeded")
-            self._cleanup_tool_results(run.run_id)
-            return self._hydrate(scope, run)
+            return self._finish(scope, run)
 
         if response.message.tool_calls:
-            for call in response.message.tool_calls:
+            timeout = policy.tool_timeout_seconds
+            limiter = asyncio.Semaphore(policy.max_parallel_tool_calls or self._max_parallel_tool_calls)
+
+            async def execute(call: dict[str, Any], concurrent: bool) -> ToolResult | None:
+                async with limiter:
+                    # Calls queued behind the cap re-check cancellation before starting.
+                    if concurrent and self._require_run(scope, run_id).status == RunStatus.CANCELLING:
+                        return None
+                    return await self._tool_execution.execute(
+                        context=enterprise_context,
+                        tool_name=_tool_call_name(call),
+                        arguments=call.get("function", {}).get("arguments", "{}"),
+                        run_id=run_id,
+                        timeout_seconds=float(timeout) if timeout else None,
+                        request_id=execution_context.request_id,
+                    )
+
+            for segment in self._tool_call_segments(response.message.tool_calls, enterprise_context):
                 run = self._require_run(scope, run_id)
                 if run.status == RunStatus.CANCELLING:
                     await self._recorder.mark_cancelled(run)
-                    self._cleanup_tool_results(run.run_id)
-                    return self._hydrate(scope, run)
-                function = call.get("function", {})
-                name = function.get("name", "")
-                arguments = function.get("arguments", "{}")
-                await self._recorder.record(run, events=[(EventType.TOOL_CALL, {"tool_call": call})])
-                timeout = policy.tool_timeout_seconds
-                result = await self._tool_execution.execute(
-                    context=enterprise_context,
-                    tool_name=name,
-                    arguments=arguments,
-                    run_id=run.run_id,
-                    timeout_seconds=float(timeout) if timeout else None,
-                    request_id=execution_context.request_id,
+                    return self._finish(scope, run)
+                await self._recorder.record(
+                    run,
+                    events=[(EventType.TOOL_CALL, {"tool_call": call}) for call in segment],
                 )
-                tool_results.append(result)
+                results = await asyncio.gather(*(execute(call, len(segment) > 1) for call in segment))
                 run = self._require_run(scope, run_id)
-                if run.status == RunStatus.CANCELLING:
+                if run.status == RunStatus.CANCELLING or any(result is None for result in results):
                     await self._recorder.mark_cancelled(run)
-                    self._cleanup_tool_results(run.run_id)
-                    return self._hydrate(scope, run)
-                result_payload: dict[str, Any] = {
-                    "ok": result.ok,
-                    "name": result.name,
-                    "data": result.data,
-                    "error": result.error,
-                }
-                safe_error = tool_safe_error_payload(result)
-                if safe_error is not None:
-                    result_payload["safe_error"] = safe_error
-                if result.evidence_refs is not None:
-                    result_payload["evidence_refs"] = [ref.to_dict() if hasattr(ref, "to_dict") else ref for ref in result.evidence_refs]
+                    return self._finish(scope, run)
                 await self._recorder.record(
                     run,
-                    events=[(EventType.TOOL_RESULT, {
-                        "tool_call_id": call.get("id"),
-                        "name": name,
-                        "result": result_payload,
-                    })],
+                    events=[
+                        (EventType.TOOL_RESULT, {
+                            "tool_call_id": call.get("id"),
+                            "name": _tool_call_name(call),
+                            "result": _tool_result_payload(result),
+                        })
+                        for call, result in zip(segment, results)
+                    ],
                 )
-                if result.data.get("approval_required"):
+                for call, result in zip(segment, results):
+                    if not result.data.get("approval_required"):
+                        continue
+                    name = _tool_call_name(call)
                     approval = run.add_approval(
                         action=result.data.get("action", name),
                         risk_level=result.data.get("risk_level", "high"),
@@ -188,7 +227,7 @@ class RunStepper:
                             "publish_target": approval.publish_target,
                         })],
                     )
-                    return self._hydrate(scope, run)
+                    return self._finish(scope, run)
             await self._recorder.record(run, status=RunStatus.RUNNING)
             return self._hydrate(scope, run)
 
@@ -212,7 +251,7 @@ class RunStepper:
         artifact = self._artifact_finalizer.build_artifact(
             run,
             content,
-            self._events.list_for_run(run.run_id, tenant_id=scope.tenant_id),
+            self._sync(scope, run_id).events,
             usage=response.usage or {},
             citation_data=citation_data,
         )
@@ -226,12 +265,61 @@ class RunStepper:
                 "title": artifact.title,
             })],
         )
-        # Clean up accumulated tool results for this run
-        self._cleanup_tool_results(run.run_id)
-        return self._hydrate(scope, run)
+        return self._finish(scope, run)
 
-    def _cleanup_tool_results(self, run_id: str) -> None:
-        return None
+    def _tool_call_segments(
+        self,
+        calls: list[dict[str, Any]],
+        context: Any,
+    ) -> list[list[dict[str, Any]]]:
+        """Group consecutive parallel-safe calls; every other call runs alone, in order."""
+        segments: list[list[dict[str, Any]]] = []
+        extend_previous = False
+        for call in calls:
+            parallel = bool(self._tool_execution.is_parallel_safe(context, _tool_call_name(call)))
+            if parallel and extend_previous:
+                segments[-1].append(call)
+            else:
+                segments.append([call])
+            extend_previous = parallel
+        return segments
+
+    def _sync(self, scope: TenantScope, run_id: str) -> _RunState:
+        """Return the run's step state after reading events appended since the last sync."""
+        key = (scope.tenant_id, run_id)
+        state = self._states.pop(key, None) or _RunState()
+        self._states[key] = state
+        while len(self._states) > _RUN_STATE_CACHE_SIZE:
+            self._states.popitem(last=False)
+        state.extend(self._events.list_for_run(run_id, after_sequence=state.last_sequence, tenant_id=scope.tenant_id))
+        return state
+
+    def _context_messages(
+        self,
+        run: AgentRun,
+        state: _RunState,
+        execution_context: RunExecutionContext,
+    ) -> list[AgentMessage]:
+        enterprise_context = execution_context.enterprise_context
+        key = self._context_builder.preamble_key(
+            run, enterprise_context=enterprise_context, execution_context=execution_context
+        )
+        if state.preamble is None or key != state.preamble_key:
+            state.preamble = self._context_builder.build_preamble(
+                run,
+                enterprise_context=enterprise_context,
+                execution_context=execution_context,
+            )
+            state.preamble_key = key
+        state.messages.extend(self._context_builder.event_messages(state.events[state.rendered:]))
+        state.rendered = len(state.events)
+        return [*state.preamble, *state.messages]
+
+    def _finish(self, scope: TenantScope, run: AgentRun) -> AgentRun:
+        """Hydrate a run that stops stepping here and drop its step state."""
+        run = self._hydrate(scope, run)
+        self._states.pop((scope.tenant_id, run.run_id), None)
+        return run
 
     def _require_run(self, scope: TenantScope, run_id: str) -> AgentRun:
         get_header = getattr(self._runs, "get_run_header", None)
@@ -241,12 +329,31 @@ class RunStepper:
         return run
 
     def _hydrate(self, scope: TenantScope, run: AgentRun) -> AgentRun:
-        run.events = self._events.list_for_run(run.run_id, tenant_id=scope.tenant_id)
+        run.events = list(self._sync(scope, run.run_id).events)
         run.artifacts = self._artifacts.list_for_run(run.run_id, tenant_id=scope.tenant_id)
         run.approvals = self._approvals.list_for_run(run.run_id, tenant_id=scope.tenant_id)
         return run
 
 
+def _tool_call_name(call: dict[str, Any]) -> str:
+    return call.get("function", {}).get("name", "")
+
+
+def _tool_result_payload(result: ToolResult) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "ok": result.ok,
+        "name": result.name,
+        "data": result.data,
+        "error": result.error,
+    }
+    safe_error = tool_safe_error_payload(result)
+    if safe_error is not None:
+        payload["safe_error"] = safe_error
+    if result.evidence_refs is not None:
+        payload["evidence_refs"] = [ref.to_dict() if hasattr(ref, "to_dict") else ref for ref in result.evidence_refs]
+    return payload
+
+
 def _tool_results_from_events(events: list[Any]) -> list[ToolResult]:
     """Rebuild persisted tool results for restart-safe artifact assembly."""
     results: list[ToolResult] = []
@@ -108,8 +108,8 @@ class ToolApplicationService(ToolExecutionService):
     def get_industry_classification(self, ticker: str, market: str = "us") -> dict[str, Any]:
         return self._provider_execute("get_industry_classification", ticker, market)
 
-    def run_sql_query(self, sql: str, readonly: bool = True) -> dict[str, Any]:
-        return self._provider_execute("run_sql_query", sql, readonly)
+    def run_sql_query(self, sql: str, readonly: bool = True, page_token: str | None = None) -> dict[str, Any]:
+        return self._provider_execute("run_sql_query", sql, readonly, page_token)
 
     def run_python_analysis(self, code: str, timeout: float = 5.0) -> dict[str, Any]:
         return self._provider_execute("run_python_analysis", code, timeout)
@@ -6,6 +6,7 @@ import asyncio
 import time
 from contextlib import suppress
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any
 from uuid import uuid4
 
@@ -15,12 +16,26 @@ from doge.core.ports.agent_runtime import IResearchAgentRuntime
 from doge.core.ports.idempotency_store import IIdempotencyStore
 from doge.core.ports.run_scope_resolver import IRunScopeResolver
 from doge.core.ports.unit_of_work import IAgentUnitOfWork
-from doge.core.ports.worker_queue import IRunQueue
+from doge.core.ports.worker_queue import IRunQueue, RunClaim
 from doge.shared.scope import TenantScope
 
 
 class AsyncioWorker:
-    """Small durable-ish worker backed by SQLite queue metadata."""
+    """Small durable-ish worker backed by SQLite queue metadata.
+
+    Up to ``max_concurrent_runs`` leased runs execute at once, each with its
+    own heartbeat. When every slot is busy the worker stops claiming until a
+    run finishes, so pending work stays in the durable queue where other
+    workers can take it. ``max_runs_per_tenant`` optionally caps the live
+    leases one tenant may hold across all workers.
+
+    Free slots are filled with one batched claim. While idle, the worker
+    wakes on local enqueue signals and, every ``watch_interval_seconds``, on
+    a change of the queue's ``queue_version()`` (a run enqueued by the CLI or
+    another gateway); the claim query itself only runs when one of those
+    fired or ``poll_interval_seconds`` passed, which still picks up expired
+    leases.
+    """
 
     def __init__(
         self,
@@ -34,7 +49,10 @@ class AsyncioWorker:
         lease_seconds: int = 30,
         heartbeat_interval_seconds: float | None = None,
         poll_interval_seconds: float = 1.0,
+        watch_interval_seconds: float = 0.05,
         auto_start: bool = True,
+        max_concurrent_runs: int = 1,
+        max_runs_per_tenant: int | None = None,
     ) -> None:
         self._runtime = runtime
         self._sessions = sessions
@@ -46,10 +64,16 @@ class AsyncioWorker:
         self._lease_seconds = lease_seconds
         self._heartbeat_interval_seconds = heartbeat_interval_seconds or max(1.0, lease_seconds / 3)
         self._poll_interval_seconds = max(0.1, poll_interval_seconds)
+        self._watch_interval_seconds = max(0.01, watch_interval_seconds)
+        self._seen_queue_version: int | None = None
         self._auto_start = auto_start
+        self._max_concurrent_runs = max(1, max_concurrent_runs)
+        self._max_runs_per_tenant = max_runs_per_tenant if max_runs_per_tenant and max_runs_per_tenant > 0 else None
         self._queue: asyncio.Queue[str] = asyncio.Queue()
         self._queued_run_ids: set[str] = set()
+        self._unsettled_signals = 0
         self._active_tasks: dict[str, asyncio.Task[AgentRun]] = {}
+        self._in_flight: dict[str, asyncio.Task[None]] = {}
         self._task: asyncio.Task | None = None
         self._recovered = False
         self._stopping = False
@@ -57,6 +81,12 @@ class AsyncioWorker:
         self._runs_failed = 0
         self._runs_cancelled = 0
         self._total_processing_latency_ms = 0.0
+        self._runs_claimed = 0
+        self._total_queue_wait_ms = 0.0
+        self._max_queue_wait_ms = 0.0
+        self._backpressure_pauses = 0
+        self._queue_wakeups = 0
+        self._empty_claims = 0
         self._last_heartbeat_at: str | None = None
 
     def start(self) -> None:
@@ -83,6 +113,16 @@ class AsyncioWorker:
             ),
             "last_heartbeat_at": self._last_heartbeat_at,
             "active_run_count": len(self._active_tasks),
+            "in_flight_run_count": len(self._in_flight),
+            "max_concurrent_runs": self._max_concurrent_runs,
+            "backpressure_pauses": self._backpressure_pauses,
+            "runs_claimed": self._runs_claimed,
+            "avg_queue_wait_ms": (
+                self._total_queue_wait_ms / self._runs_claimed if self._runs_claimed else 0
+            ),
+            "max_queue_wait_ms": self._max_queue_wait_ms,
+            "queue_wakeups": self._queue_wakeups,
+            "empty_claims": self._empty_claims,
         }
 
     def recover(self) -> None:
@@ -97,11 +137,11 @@ class AsyncioWorker:
         if self._task is None:
             return
         self._stopping = True
-        self._task.cancel()
+        tasks = [self._task, *self._in_flight.values()]
+        for task in tasks:
+            task.cancel()
         try:
-            await self._task
-        except asyncio.CancelledError:
-            pass
+            await asyncio.gather(*tasks, return_exceptions=True)
         finally:
             self._stopping = False
             self._task = None
@@ -189,64 +229,113 @@ class AsyncioWorker:
         return run
 
     async def _process_loop(self) -> None:
+        claimed = False
         while True:
             if self._stopping:
                 return
-            has_signal = False
-            run_id: str | None = None
-            processing_started_at: float | None = None
-            heartbeat_task: asyncio.Task | None = None
+            if len(self._in_flight) >= self._max_concurrent_runs:
+                # Backpressure: leave further work in the durable queue until a slot frees.
+                self._backpressure_pauses += 1
+                await asyncio.wait(set(self._in_flight.values()), return_when=asyncio.FIRST_COMPLETED)
+                continue
+            if not claimed:
+                await self._wait_for_signal()
+            claimed = False
+            self._seen_queue_version = await asyncio.to_thread(self._queue_version)
             try:
-                try:
-                    signal_run_id = await asyncio.wait_for(
-                        self._queue.get(),
-                        timeout=self._poll_interval_seconds,
-                    )
-                    has_signal = True
-                    self._queued_run_ids.discard(signal_run_id)
-                except TimeoutError:
-                    if self._stopping:
-                        return
-                    pass
-                run_id = self._run_queue.claim_atomic(self._worker_id, self._lease_seconds)
-                if run_id is None:
-                    continue
-                processing_started_at = time.monotonic()
-                heartbeat_task = asyncio.create_task(self._heartbeat_loop(run_id))
-                scope = self._scope_for_run(run_id)
-                task = asyncio.create_task(self._runtime.run_to_pause_or_completion(scope, run_id))
-                self._active_tasks[run_id] = task
-                try:
-                    run = await task
-                    final_status = _queue_status_for_run(run)
-                    self._run_queue.release_claim(run_id, self._worker_id, final_status)
-                    self._record_processing_result(final_status, processing_started_at)
-                except asyncio.CancelledError:
-                    if self._stopping:
-                        task.cancel()
-                        with suppress(asyncio.CancelledError):
-                            await task
-                        raise
-                    run = await self._runtime.finalize_cancelled(self._scope_for_run(run_id), run_id)
-                    final_status = _queue_status_for_run(run)
-                    self._run_queue.release_claim(run_id, self._worker_id, final_status)
-                    self._record_processing_result(final_status, processing_started_at)
-                finally:
-                    self._active_tasks.pop(run_id, None)
-                    if heartbeat_task is not None:
-                        heartbeat_task.cancel()
-                        with suppress(asyncio.CancelledError):
-                            await heartbeat_task
+                claims = await asyncio.to_thread(
+                    self._claim_batch, self._max_concurrent_runs - len(self._in_flight)
+                )
             except Exception:
-                if run_id is not None:
-                    await _record_runtime_failure(
-                        self._runtime, run_id, "runtime failure", self._scope_resolver
-                    )
-                    self._run_queue.release_claim(run_id, self._worker_id, "failed")
-                    self._record_processing_result("failed", processing_started_at)
-            finally:
-                if has_signal:
-                    self._queue.task_done()
+                claims = []
+            if not claims:
+                self._empty_claims += 1
+                if not self._in_flight:
+                    self._settle_signals()
+                continue
+            claimed = True
+            for claim in claims:
+                self._record_claim(claim)
+                task = asyncio.create_task(self._process_claim(claim.run_id))
+                self._in_flight[claim.run_id] = task
+                task.add_done_callback(partial(self._forget_in_flight, claim.run_id))
+
+    def _claim_batch(self, limit: int) -> list[RunClaim]:
+        return self._run_queue.claim_batch(
+            self._worker_id,
+            self._lease_seconds,
+            limit,
+            max_per_tenant=self._max_runs_per_tenant,
+        )
+
+    def _queue_version(self) -> int | None:
+        try:
+            return self._run_queue.queue_version()
+        except Exception:
+            return None
+
+    def _forget_in_flight(self, run_id: str, task: asyncio.Task[None]) -> None:
+        if self._in_flight.get(run_id) is task:
+            del self._in_flight[run_id]
+        if not self._in_flight:
+            self._settle_signals()
+
+    async def _wait_for_signal(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._poll_interval_seconds
+        if self._seen_queue_version is None:
+            self._seen_queue_version = await asyncio.to_thread(self._queue_version)
+        watching = self._seen_queue_version is not None
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            timeout = min(remaining, self._watch_interval_seconds) if watching else remaining
+            try:
+                signal_run_id = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            except TimeoutError:
+                if watching and await asyncio.to_thread(self._queue_version) != self._seen_queue_version:
+                    self._queue_wakeups += 1
+                    return
+                continue
+            self._queued_run_ids.discard(signal_run_id)
+            self._unsettled_signals += 1
+            return
+
+    def _settle_signals(self) -> None:
+        """Mark consumed signals done once the worker is idle, so ``_queue.join()`` means drained."""
+        while self._unsettled_signals:
+            self._unsettled_signals -= 1
+            self._queue.task_done()
+
+    async def _process_claim(self, run_id: str) -> None:
+        processing_started_at = time.monotonic()
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop(run_id))
+        try:
+            scope = self._scope_for_run(run_id)
+            task = asyncio.create_task(self._runtime.run_to_pause_or_completion(scope, run_id))
+            self._active_tasks[run_id] = task
+            try:
+                run = await task
+            except asyncio.CancelledError:
+                if self._stopping:
+                    task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await task
+                    raise
+                run = await self._runtime.finalize_cancelled(self._scope_for_run(run_id), run_id)
+            final_status = _queue_status_for_run(run)
+            self._run_queue.release_claim(run_id, self._worker_id, final_status)
+            self._record_processing_result(final_status, processing_started_at)
+        except Exception:
+            await _record_runtime_failure(self._runtime, run_id, "runtime failure", self._scope_resolver)
+            self._run_queue.release_claim(run_id, self._worker_id, "failed")
+            self._record_processing_result("failed", processing_started_at)
+        finally:
+            self._active_tasks.pop(run_id, None)
+            heartbeat_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await heartbeat_task
 
     def is_ready(self) -> bool:
         return self._run_queue.is_ready()
@@ -283,6 +372,12 @@ class AsyncioWorker:
             self._run_queue.heartbeat(self._worker_id, run_id, self._lease_seconds)
             self._last_heartbeat_at = datetime.now(timezone.utc).isoformat()
 
+    def _record_claim(self, claim: RunClaim) -> None:
+        wait_ms = max(0.0, claim.queue_wait_seconds * 1000)
+        self._runs_claimed += 1
+        self._total_queue_wait_ms += wait_ms
+        self._max_queue_wait_ms = max(self._max_queue_wait_ms, wait_ms)
+
     def _record_processing_result(self, final_status: str, started_at: float | None) -> None:
         self._runs_processed += 1
         if final_status == "failed":
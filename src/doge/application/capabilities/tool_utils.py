@@ -10,6 +10,7 @@ from doge.shared.tool_utils import (  # noqa: F401
     claim_matches_rows,
     document_scope_from_context,
     filter_results_for_context,
+    has_top_level_order_by,
     is_restricted_context,
     looks_mutating_sql,
     num,
@@ -17,6 +17,7 @@ class ScanMarketRequest:
     tdx_path: Optional[str] = None
     max_workers: int = 4
     batch_size: int = 50
+    incremental: bool = True  # tdx-local: skip files unchanged since the last scan
 
     def __post_init__(self):
         object.__setattr__(
@@ -25,6 +25,7 @@ class ScanMarketResponse:
     success_count: int = 0
     failed_count: int = 0
     skipped_count: int = 0
+    unchanged_count: int = 0
     results: List[ScanResultItem] = field(default_factory=list)
     duration_seconds: float = 0.0
 
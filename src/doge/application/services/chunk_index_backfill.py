@@ -0,0 +1,67 @@
+"""Background sweep that indexes chunks extraction left unindexed."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkIndexerPort(Protocol):
+    def index_all_pending(self, *, batch_size: int = 256) -> int:
+        ...
+
+
+class ChunkIndexBackfill:
+    """Periodically index every tenant's pending chunks.
+
+    Extraction indexes a document's chunks right away, but chunks can stay
+    pending: indexing failed on the synchronous upload path, or they were
+    extracted before indexing was tracked and have no vector. The sweep runs
+    once at start and then every ``interval_seconds`` on a worker thread.
+    """
+
+    def __init__(self, indexer: ChunkIndexerPort, *, interval_seconds: float = 300.0) -> None:
+        self._indexer = indexer
+        self._interval_seconds = max(1.0, interval_seconds)
+        self._task: asyncio.Task | None = None
+        self._chunks_indexed = 0
+
+    def metrics(self) -> dict[str, int]:
+        return {"chunks_indexed": self._chunks_indexed}
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_once(self) -> int:
+        """Index all pending chunks and return how many were indexed."""
+        indexed = await asyncio.to_thread(self._indexer.index_all_pending)
+        self._chunks_indexed += indexed
+        if indexed:
+            logger.info("chunk index backfill indexed chunks=%d", indexed)
+        return indexed
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 - keep sweeping after a transient error
+                logger.exception("chunk index backfill failed")
+            await asyncio.sleep(self._interval_seconds)
@@ -0,0 +1,264 @@
+"""Background worker that drains the durable document extraction queue."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any, Callable, Protocol
+from uuid import uuid4
+
+from doge.core.domain.document_models import (
+    DocumentExtractionJob,
+    DocumentExtractionStatus,
+    DocumentStatus,
+)
+from doge.core.ports.document_extraction_queue import IDocumentExtractionQueue
+from doge.core.ports.document_repository import IDocumentRepository
+from doge.shared.scope import TenantScope
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentParsingPort(Protocol):
+    def parse_document(self, document: dict, scope: TenantScope) -> dict:
+        ...
+
+    def complete_parse(
+        self,
+        document: dict,
+        scope: TenantScope,
+        *,
+        content: str,
+        parser_error: str | None = None,
+    ) -> dict:
+        ...
+
+
+class DocumentExtractionServicePort(Protocol):
+    def extract(
+        self,
+        document: dict,
+        *,
+        index: bool = True,
+        collect: bool = True,
+        on_batch: Callable[[int], None] | None = None,
+    ) -> Any:
+        ...
+
+    def index_document(self, document_id: str, scope: TenantScope) -> bool:
+        ...
+
+
+class _LeaseLost(Exception):
+    """The job's lease expired and another worker claimed it."""
+
+
+class DocumentExtractionWorker:
+    """Lease extraction jobs and move each document to ``indexed``.
+
+    A claimed ``parsing`` job gets its provider upload, then its pages are
+    parsed once, streamed (through the parse pool) into pages and chunks in
+    page batches, and the text seen is recorded as the document's content;
+    the job becomes ``chunked``; indexing then makes it ``indexed``. A job whose
+    indexing fails stays ``chunked`` and is retried when its lease expires,
+    and one that raises goes back to ``pending`` until ``max_attempts`` is
+    spent. The lease is renewed between stages and after every persisted
+    page batch, so only a stalled worker loses its job to another; every
+    write is fenced on the lease, and a worker that finds it lost drops the
+    job without touching the new owner's progress.
+
+    Up to ``concurrency`` jobs run at once on worker threads. While idle the
+    worker checks the queue's ``queue_version()`` every
+    ``watch_interval_seconds`` and claims only when it changed or
+    ``poll_interval_seconds`` passed, which also picks up expired leases.
+    """
+
+    def __init__(
+        self,
+        queue: IDocumentExtractionQueue,
+        parser: DocumentParsingPort,
+        extraction_service: DocumentExtractionServicePort,
+        documents: IDocumentRepository,
+        *,
+        concurrency: int = 2,
+        worker_id: str | None = None,
+        lease_seconds: int = 300,
+        max_attempts: int = 3,
+        poll_interval_seconds: float = 1.0,
+        watch_interval_seconds: float = 0.05,
+    ) -> None:
+        self._queue = queue
+        self._parser = parser
+        self._extraction_service = extraction_service
+        self._documents = documents
+        self._concurrency = max(1, concurrency)
+        self._worker_id = worker_id or f"document-extraction-{uuid4().hex[:12]}"
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max(1, max_attempts)
+        self._poll_interval_seconds = max(0.1, poll_interval_seconds)
+        self._watch_interval_seconds = max(0.01, watch_interval_seconds)
+        self._seen_queue_version: int | None = None
+        self._task: asyncio.Task | None = None
+        self._jobs_indexed = 0
+        self._jobs_failed = 0
+        self._jobs_lost = 0
+
+    @property
+    def worker_id(self) -> str:
+        return self._worker_id
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "jobs_indexed": self._jobs_indexed,
+            "jobs_failed": self._jobs_failed,
+            "jobs_lost": self._jobs_lost,
+            "concurrency": self._concurrency,
+        }
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_once(self) -> int:
+        """Claim up to ``concurrency`` jobs, process them and return how many ran."""
+        jobs = await asyncio.to_thread(
+            self._queue.claim,
+            self._worker_id,
+            self._lease_seconds,
+            self._concurrency,
+            self._max_attempts,
+        )
+        if jobs:
+            await asyncio.gather(*(asyncio.to_thread(self.process, job) for job in jobs))
+        return len(jobs)
+
+    def process(self, job: DocumentExtractionJob) -> DocumentExtractionStatus:
+        """Advance one claimed job as far as it goes and return its new status."""
+        scope = TenantScope.from_tenant_id(job.tenant_id)
+        try:
+            status = self._advance(job, scope)
+        except _LeaseLost:
+            logger.warning("document extraction lease lost document_id=%s", job.document_id)
+            self._jobs_lost += 1
+            return job.status
+        except Exception as exc:  # noqa: BLE001 - the job records the failure and is retried
+            logger.exception("document extraction failed document_id=%s", job.document_id)
+            error = f"{type(exc).__name__}: {exc}"
+            status = (
+                DocumentExtractionStatus.PENDING
+                if job.attempt_count < self._max_attempts
+                else DocumentExtractionStatus.FAILED
+            )
+            self._queue.update(job.document_id, status, worker_id=self._worker_id, error=error)
+        if status is DocumentExtractionStatus.INDEXED:
+            self._jobs_indexed += 1
+        elif status is DocumentExtractionStatus.FAILED:
+            self._jobs_failed += 1
+        return status
+
+    def _advance(self, job: DocumentExtractionJob, scope: TenantScope) -> DocumentExtractionStatus:
+        document = self._documents.get(job.document_id, scope)
+        if document is None:
+            self._update(job, DocumentExtractionStatus.FAILED, error="document not found")
+            return DocumentExtractionStatus.FAILED
+
+        if job.status is DocumentExtractionStatus.PARSING:
+            document = self._parser.parse_document(document, scope)
+            if document.get("parsing_status") == DocumentStatus.FAILED.value:
+                self._update(
+                    job,
+                    DocumentExtractionStatus.FAILED,
+                    error=document.get("parser_error") or "document parsing failed",
+                )
+                return DocumentExtractionStatus.FAILED
+            self._renew_lease(job)
+            result = self._extraction_service.extract(
+                document,
+                index=False,
+                collect=False,
+                on_batch=lambda _pages: self._renew_lease(job),
+            )
+            if document.get("parsing_status") == DocumentStatus.PARSING.value:
+                document = self._parser.complete_parse(
+                    document,
+                    scope,
+                    content=result.content,
+                    parser_error=result.errors[0] if result.errors else None,
+                )
+                if document.get("parsing_status") == DocumentStatus.FAILED.value:
+                    self._update(
+                        job,
+                        DocumentExtractionStatus.FAILED,
+                        page_count=result.page_count,
+                        chunk_count=result.chunk_count,
+                        error=document.get("parser_error"),
+                    )
+                    return DocumentExtractionStatus.FAILED
+            self._update(
+                job,
+                DocumentExtractionStatus.CHUNKED,
+                page_count=result.page_count,
+                chunk_count=result.chunk_count,
+            )
+            self._renew_lease(job)
+
+        if not self._extraction_service.index_document(job.document_id, scope):
+            # Keep the lease: the job is retried from ``chunked`` once it expires.
+            self._update(job, DocumentExtractionStatus.CHUNKED, error="chunk indexing failed")
+            return DocumentExtractionStatus.CHUNKED
+        self._update(job, DocumentExtractionStatus.INDEXED)
+        return DocumentExtractionStatus.INDEXED
+
+    def _update(self, job: DocumentExtractionJob, status: DocumentExtractionStatus, **fields: Any) -> None:
+        if not self._queue.update(job.document_id, status, worker_id=self._worker_id, **fields):
+            raise _LeaseLost(job.document_id)
+
+    def _renew_lease(self, job: DocumentExtractionJob) -> None:
+        """Push the job's lease out again, or stop the job if another worker took it over."""
+        if not self._queue.heartbeat(self._worker_id, job.document_id, self._lease_seconds):
+            raise _LeaseLost(job.document_id)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                processed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 - keep draining after a transient queue error
+                logger.exception("document extraction worker iteration failed")
+                processed = 0
+            if processed == 0:
+                await self._wait_for_signal()
+
+    async def _wait_for_signal(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._poll_interval_seconds
+        if self._seen_queue_version is None:
+            self._seen_queue_version = await asyncio.to_thread(self._queue_version)
+        if self._seen_queue_version is None:
+            await asyncio.sleep(self._poll_interval_seconds)
+            return
+        while loop.time() < deadline:
+            await asyncio.sleep(self._watch_interval_seconds)
+            version = await asyncio.to_thread(self._queue_version)
+            if version != self._seen_queue_version:
+                self._seen_queue_version = version
+                return
+
+    def _queue_version(self) -> int | None:
+        try:
+            return self._queue.queue_version()
+        except Exception:  # noqa: BLE001 - a busy database only delays the wake-up
+            return None
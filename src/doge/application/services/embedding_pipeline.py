@@ -0,0 +1,103 @@
+"""Batched, cache-aware embedding for RAG ingestion and queries."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from doge.core.ports.embedding import IEmbeddingCache, IEmbeddingProvider
+
+
+@dataclass(frozen=True)
+class EmbeddingRunStats:
+    """Throughput counters for one :meth:`BatchingEmbedder.embed` call."""
+
+    texts: int = 0
+    unique: int = 0
+    cache_hits: int = 0
+    embedded: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def texts_per_second(self) -> float:
+        return self.texts / self.seconds if self.seconds > 0 else 0.0
+
+    def __add__(self, other: "EmbeddingRunStats") -> "EmbeddingRunStats":
+        return EmbeddingRunStats(
+            texts=self.texts + other.texts,
+            unique=self.unique + other.unique,
+            cache_hits=self.cache_hits + other.cache_hits,
+            embedded=self.embedded + other.embedded,
+            batches=self.batches + other.batches,
+            seconds=self.seconds + other.seconds,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "texts_per_second": round(self.texts_per_second, 2)}
+
+
+class BatchingEmbedder:
+    """Embed texts with content-hash dedup, bulk cache I/O and batched calls.
+
+    Texts are keyed by SHA-256 of their content. Hits come from one
+    ``get_many``; misses are grouped into ``batch_size`` provider calls run on
+    up to ``max_workers`` threads, then written back with one ``set_many``.
+    """
+
+    def __init__(
+        self,
+        provider: IEmbeddingProvider,
+        cache: IEmbeddingCache | None = None,
+        *,
+        batch_size: int = 64,
+        max_workers: int = 4,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._provider = provider
+        self._cache = cache
+        self._batch_size = batch_size
+        self._max_workers = max(1, max_workers)
+
+    def embed(self, texts: list[str]) -> tuple[list[list[float]], EmbeddingRunStats]:
+        """Return one vector per input text (in order) and the run's stats."""
+        started = time.perf_counter()
+        keys = [content_hash(text) for text in texts]
+        unique = dict(zip(keys, texts))
+        vectors = self._cache.get_many(list(unique)) if self._cache is not None and unique else {}
+        hits = len(vectors)
+        missing = [key for key in unique if key not in vectors]
+        batches = [missing[start : start + self._batch_size] for start in range(0, len(missing), self._batch_size)]
+        if batches:
+            fresh: dict[str, list[float]] = {}
+            for batch, embedded in zip(batches, self._run_batches([[unique[key] for key in batch] for batch in batches])):
+                fresh.update(zip(batch, embedded))
+            if self._cache is not None:
+                self._cache.set_many(fresh)
+            vectors.update(fresh)
+        stats = EmbeddingRunStats(
+            texts=len(texts),
+            unique=len(unique),
+            cache_hits=hits,
+            embedded=len(missing),
+            batches=len(batches),
+            seconds=time.perf_counter() - started,
+        )
+        return [vectors[key] for key in keys], stats
+
+    def _run_batches(self, batches: list[list[str]]) -> list[list[list[float]]]:
+        if len(batches) == 1 or self._max_workers == 1:
+            return [self._provider.embed_texts(batch) for batch in batches]
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(batches)), thread_name_prefix="doge-embed"
+        ) as pool:
+            return list(pool.map(self._provider.embed_texts, batches))
+
+
+def content_hash(text: str) -> str:
+    """Return the embedding cache key for *text*."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -5,12 +5,15 @@ from __future__ import annotations
 import hashlib
 import mimetypes
 import shutil
+import threading
 from pathlib import Path
 from typing import Protocol
 from uuid import uuid4
 
 from doge.application.services.file_purpose_router import route_kimi_file_purpose
+from doge.core.domain.agent_models import utc_now
 from doge.core.domain.document_models import Document, DocumentStatus
+from doge.core.ports.document_extraction_queue import IDocumentExtractionQueue
 from doge.core.ports.document_repository import IDocumentRepository
 from doge.shared.scope import TenantScope
 
@@ -41,12 +44,23 @@ class DocumentParserPort(Protocol):
 
 
 class DocumentExtractionPort(Protocol):
-    def extract(self, document: Document | dict) -> object:
+    def extract(self, document: Document | dict, *, index: bool = True, collect: bool = True) -> object:
         ...
 
 
 class FileUploadService:
-    """Register local/API-uploaded files with hash, MIME, size and status."""
+    """Register local/API-uploaded files with hash, MIME, size and status.
+
+    With an ``extraction_queue`` the upload only stores the file and its
+    metadata and queues an extraction job; provider upload
+    (:meth:`parse_document`), a single streamed parse with page/chunk
+    extraction, and :meth:`complete_parse` then run on a background worker. Without one everything happens inside the upload call.
+
+    Registrations of the same content are serialized by hash, so concurrent
+    uploads of one file resolve to one document.
+    """
+
+    _HASH_LOCK_STRIPES = 64
 
     DEFAULT_ALLOWED_SUFFIXES = {
         ".pdf", ".txt", ".csv", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
@@ -65,6 +79,7 @@ class FileUploadService:
         kimi_files_client: KimiFilesPort | None = None,
         extraction_service: DocumentExtractionPort | None = None,
         streaming_threshold_bytes: int = 8 * 1024 * 1024,
+        extraction_queue: IDocumentExtractionQueue | None = None,
     ) -> None:
         self._repository = repository
         self._storage_dir = storage_dir
@@ -74,6 +89,12 @@ class FileUploadService:
         self._kimi_files_client = kimi_files_client
         self._extraction_service = extraction_service
         self._streaming_threshold_bytes = streaming_threshold_bytes
+        self._extraction_queue = extraction_queue
+        self._hash_locks = [threading.Lock() for _ in range(self._HASH_LOCK_STRIPES)]
+
+    @property
+    def background_extraction(self) -> bool:
+        return self._extraction_queue is not None
 
     def register_path(
         self,
@@ -109,19 +130,19 @@ class FileUploadService:
         resolved_scope = _resolve_scope(scope, tenant_id)
         self._validate_file(filename, len(payload))
         file_hash = hashlib.sha256(payload).hexdigest()
-        existing = self._repository.get_by_hash(file_hash, resolved_scope)
-        if existing is not None:
-            self._extract(existing)
-            return existing
-
-        storage_path = self._persist_payload(filename, file_hash, payload)
-        return self._register_stored_file(
-            filename=filename,
-            file_hash=file_hash,
-            size_bytes=len(payload),
-            storage_path=storage_path,
-            scope=resolved_scope,
-        )
+        with self._hash_lock(file_hash):
+            existing = self._repository.get_by_hash(file_hash, resolved_scope)
+            if existing is not None:
+                return self._reuse_existing(existing, scope=resolved_scope)
+
+            storage_path = self._persist_payload(filename, file_hash, payload)
+            return self._register_stored_file(
+                filename=filename,
+                file_hash=file_hash,
+                size_bytes=len(payload),
+                storage_path=storage_path,
+                scope=resolved_scope,
+            )
 
     def register_stream(
         self,
@@ -157,19 +178,19 @@ class FileUploadService:
             if size_bytes <= 0:
                 raise FileUploadError("file is empty")
             file_hash = digest.hexdigest()
-            existing = self._repository.get_by_hash(file_hash, resolved_scope)
-            if existing is not None:
-                self._extract(existing)
-                return existing
-            storage_path = self._move_streamed_payload(filename, file_hash, tmp)
-            tmp = None
-            return self._register_stored_file(
-                filename=filename,
-                file_hash=file_hash,
-                size_bytes=size_bytes,
-                storage_path=storage_path,
-                scope=resolved_scope,
-            )
+            with self._hash_lock(file_hash):
+                existing = self._repository.get_by_hash(file_hash, resolved_scope)
+                if existing is not None:
+                    return self._reuse_existing(existing, scope=resolved_scope)
+                storage_path = self._move_streamed_payload(filename, file_hash, tmp)
+                tmp = None
+                return self._register_stored_file(
+                    filename=filename,
+                    file_hash=file_hash,
+                    size_bytes=size_bytes,
+                    storage_path=storage_path,
+                    scope=resolved_scope,
+                )
         finally:
             if tmp is not None and tmp.exists():
                 tmp.unlink()
@@ -185,6 +206,89 @@ class FileUploadService:
     ) -> dict:
         mime_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
         purpose = route_kimi_file_purpose(filename=filename, mime_type=mime_type)
+        if self._extraction_queue is not None:
+            kimi_file_id, content, parser_error, status = None, None, None, DocumentStatus.UPLOADED
+        else:
+            kimi_file_id, content, parser_error, status = self._parse_stored_file(storage_path, purpose)
+
+        document = Document.create(
+            original_filename=filename,
+            file_hash=file_hash,
+            mime_type=mime_type,
+            size_bytes=size_bytes,
+            storage_path=str(storage_path),
+            kimi_file_id=kimi_file_id,
+            kimi_file_purpose=purpose,
+            parsing_status=status,
+            parser_error=parser_error,
+            content=content,
+        )
+        return self._save_and_extract(document, scope=scope)
+
+    def parse_document(self, document: dict, scope: TenantScope) -> dict:
+        """Run the provider upload for a queued document.
+
+        Used by the background extraction worker. A document that still needs
+        a local parse is left ``parsing``: page extraction streams the stored
+        file anyway, and :meth:`complete_parse` then records the text it saw,
+        so the file is parsed once. Documents that were already parsed (or
+        failed) are returned unchanged.
+        """
+        storage_path = document.get("storage_path")
+        status = document.get("parsing_status")
+        if not storage_path or status not in {DocumentStatus.UPLOADED.value, DocumentStatus.PARSING.value}:
+            return document
+        purpose = document.get("kimi_file_purpose") or route_kimi_file_purpose(
+            filename=document.get("original_filename") or "",
+            mime_type=document.get("mime_type"),
+        )
+        kimi_file_id, content, parser_error, status = self._parse_stored_file(Path(storage_path), purpose, local=False)
+        record = {
+            **document,
+            "kimi_file_id": kimi_file_id,
+            "kimi_file_purpose": purpose,
+            "parsing_status": status.value,
+            "status": status.value,
+            "parser_error": parser_error,
+            "content": content,
+            "tenant_id": scope.tenant_id,
+            "updated_at": utc_now(),
+        }
+        return self._save_record(record, scope)
+
+    def complete_parse(
+        self,
+        document: dict,
+        scope: TenantScope,
+        *,
+        content: str,
+        parser_error: str | None = None,
+    ) -> dict:
+        """Record the text page extraction streamed for a document left ``parsing``."""
+        status = DocumentStatus.FAILED if parser_error else DocumentStatus.PARSED
+        record = {
+            **document,
+            "parsing_status": status.value,
+            "status": status.value,
+            "parser_error": parser_error,
+            "content": content,
+            "tenant_id": scope.tenant_id,
+            "updated_at": utc_now(),
+        }
+        return self._save_record(record, scope)
+
+    def _save_record(self, record: dict, scope: TenantScope) -> dict:
+        self._repository.save(record, scope)
+        saved = self._repository.get(record["document_id"], scope)
+        return saved if saved is not None else record
+
+    def _parse_stored_file(
+        self,
+        storage_path: Path,
+        purpose: str,
+        *,
+        local: bool = True,
+    ) -> tuple[str | None, str | None, str | None, DocumentStatus]:
         kimi_file_id: str | None = None
         content: str | None = None
         parser_error: str | None = None
@@ -201,26 +305,15 @@ class FileUploadService:
                 status = DocumentStatus.FAILED
 
         if content is None and purpose == "file-extract" and status is not DocumentStatus.FAILED and self._parser is not None:
+            if not local:
+                return kimi_file_id, content, parser_error, DocumentStatus.PARSING
             try:
                 content = self._parser.parse(storage_path)
                 status = DocumentStatus.PARSED
             except Exception as exc:  # noqa: BLE001 - local parser failure is captured in metadata
                 parser_error = f"local parser failed: {type(exc).__name__}"
                 status = DocumentStatus.FAILED
-
-        document = Document.create(
-            original_filename=filename,
-            file_hash=file_hash,
-            mime_type=mime_type,
-            size_bytes=size_bytes,
-            storage_path=str(storage_path),
-            kimi_file_id=kimi_file_id,
-            kimi_file_purpose=purpose,
-            parsing_status=status,
-            parser_error=parser_error,
-            content=content,
-        )
-        return self._save_and_extract(document, scope=scope)
+        return kimi_file_id, content, parser_error, status
 
     def register_text(
         self,
@@ -289,12 +382,31 @@ class FileUploadService:
         self._repository.save(record, scope)
         saved = self._repository.get(document.document_id, scope)
         result = saved if saved is not None else document.to_dict()
+        if self._extraction_queue is not None:
+            return self._enqueue(result, scope=scope)
         self._extract(result)
         return result
 
+    def _reuse_existing(self, existing: dict, *, scope: TenantScope) -> dict:
+        if self._extraction_queue is not None:
+            return self._enqueue(existing, scope=scope)
+        self._extract(existing)
+        return existing
+
+    def _enqueue(self, document: dict, *, scope: TenantScope) -> dict:
+        job = self._extraction_queue.enqueue(
+            document["document_id"],
+            scope,
+            file_hash=document.get("file_hash"),
+        )
+        return {**document, "extraction_status": job.status.value}
+
     def _extract(self, document: Document | dict) -> None:
         if self._extraction_service is not None:
-            self._extraction_service.extract(document)
+            self._extraction_service.extract(document, collect=False)
+
+    def _hash_lock(self, file_hash: str) -> threading.Lock:
+        return self._hash_locks[int(file_hash[:8], 16) % self._HASH_LOCK_STRIPES]
 
 
 def _resolve_scope(scope: TenantScope | None, tenant_id: str | None) -> TenantScope:
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import logging
 import struct
+import sys
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Protocol
+from typing import Callable, Iterable, Iterator, Protocol
 
 from doge.core.domain.chunk_models import DocumentChunk
 from doge.core.domain.document_models import Document
@@ -13,20 +16,40 @@ from doge.core.domain.page_models import DocumentPage
 from doge.core.ports.evidence_repository import IEvidenceRepository
 from doge.shared.scope import TenantScope
 
+logger = logging.getLogger(__name__)
+
 
 class PageParserPort(Protocol):
+    """Parser port: a bounded ``parse`` preview and an ``iter_pages`` page stream."""
+
     def parse(self, path: str | Path, *, max_chars: int = 12000) -> str:
         ...
 
+    def iter_pages(self, path: str | Path) -> Iterable[str]:
+        ...
+
+
+class ChunkIndexerPort(Protocol):
+    def index_pending(self, scope: TenantScope | None = None, *, document_ids: list[str] | None = None) -> int:
+        ...
+
 
 @dataclass(frozen=True)
 class ExtractionResult:
-    """Result of local page/chunk extraction for one document."""
+    """Result of local page/chunk extraction for one document.
+
+    ``pages`` and ``chunks`` are empty when extraction ran with
+    ``collect=False``; the counts are always set, and ``content`` holds the
+    first ``content_chars`` characters of the page texts, form-feed joined.
+    """
 
     document_id: str
     pages: list[DocumentPage]
     chunks: list[DocumentChunk]
     errors: list[str]
+    page_count: int = 0
+    chunk_count: int = 0
+    content: str = ""
 
 
 class ChunkingService:
@@ -41,10 +64,12 @@ class ChunkingService:
         self._overlap = min(overlap, max(0, chunk_size - 1))
 
     def chunk_pages(self, pages: list[DocumentPage]) -> list[DocumentChunk]:
-        chunks: list[DocumentChunk] = []
+        return list(self.iter_chunks(pages))
+
+    def iter_chunks(self, pages: Iterable[DocumentPage]) -> Iterator[DocumentChunk]:
+        """Yield chunks page by page, consuming ``pages`` lazily."""
         for page in pages:
-            chunks.extend(self.chunk_page(page))
-        return chunks
+            yield from self.chunk_page(page)
 
     def chunk_page(self, page: DocumentPage) -> list[DocumentChunk]:
         text = page.text or ""
@@ -78,7 +103,15 @@ class ChunkingService:
 
 
 class PageExtractionService:
-    """Extract pages/chunks and optionally persist them into evidence storage."""
+    """Extract pages/chunks, optionally persist them and index them for retrieval.
+
+    Documents with a stored file are streamed from it page by page when the
+    parser offers ``iter_pages``, so the whole document is chunked however
+    large it is; provider-extracted and inline content is split on form
+    feeds. Pages flow through chunking as generators and are persisted
+    ``page_batch_size`` pages at a time, one transaction per batch, which
+    keeps memory flat for long filings when results are not collected.
+    """
 
     IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
 
@@ -88,71 +121,145 @@ class PageExtractionService:
         evidence_repository: IEvidenceRepository | None = None,
         parser: PageParserPort | None = None,
         chunking_service: ChunkingService | None = None,
-        parser_max_chars: int = 12000,
+        parser_max_chars: int | None = None,
+        chunk_indexer: ChunkIndexerPort | None = None,
+        page_batch_size: int = 32,
+        content_chars: int = 12000,
     ) -> None:
         self._evidence_repository = evidence_repository
         self._parser = parser
         self._chunking = chunking_service or ChunkingService()
-        self._parser_max_chars = parser_max_chars
+        self._parser_max_chars = parser_max_chars if parser_max_chars is not None else sys.maxsize
+        self._chunk_indexer = chunk_indexer
+        self._page_batch_size = max(1, page_batch_size)
+        self._content_chars = max(0, content_chars)
 
-    def extract(self, document: Document | dict) -> ExtractionResult:
+    def extract(
+        self,
+        document: Document | dict,
+        *,
+        index: bool = True,
+        collect: bool = True,
+        on_batch: Callable[[int], None] | None = None,
+    ) -> ExtractionResult:
+        """Extract, persist and (unless ``index`` is false) index one document.
+
+        With ``collect=False`` the pages and chunks are only persisted, not
+        returned, and the result carries just their counts. ``on_batch`` is
+        called with the pages persisted so far before each page batch is
+        persisted; an exception from it stops the extraction.
+        """
         scope = _scope_for_document(document)
         doc = document if isinstance(document, Document) else Document.from_mapping(document)
-        pages, errors = self._extract_pages(doc)
-        chunks = self._chunking.chunk_pages(pages)
-        if self._evidence_repository is not None:
-            for page in pages:
-                self._evidence_repository.save_page(page, scope)
-            for chunk in chunks:
-                self._evidence_repository.save_chunk(chunk, scope)
+        errors: list[str] = []
+        pages: list[DocumentPage] = []
+        chunks: list[DocumentChunk] = []
+        page_count = chunk_count = 0
+        content: list[str] = []
+        content_chars = 0
+        for batch in _batched(self._iter_pages(doc, errors), self._page_batch_size):
+            for page in batch:
+                if content_chars < self._content_chars and page.text:
+                    text = page.text[: self._content_chars - content_chars]
+                    content.append(text)
+                    content_chars += len(text) + 1
+            batch_chunks = list(self._chunking.iter_chunks(batch))
+            if on_batch is not None:
+                on_batch(page_count)
+            self._persist(doc.document_id, batch, batch_chunks, scope)
+            page_count += len(batch)
+            chunk_count += len(batch_chunks)
+            if collect:
+                pages.extend(batch)
+                chunks.extend(batch_chunks)
+        self._prune(doc.document_id, page_count, scope)
+        if self._evidence_repository is not None and index and chunk_count:
+            self.index_document(doc.document_id, scope)
         return ExtractionResult(
             document_id=doc.document_id,
             pages=pages,
             chunks=chunks,
             errors=errors,
+            page_count=page_count,
+            chunk_count=chunk_count,
+            content="\f".join(content)[: self._content_chars],
         )
 
-    def _extract_pages(self, document: Document) -> tuple[list[DocumentPage], list[str]]:
-        errors: list[str] = []
+    def _persist(
+        self,
+        document_id: str,
+        pages: list[DocumentPage],
+        chunks: list[DocumentChunk],
+        scope: TenantScope,
+    ) -> None:
+        if self._evidence_repository is None:
+            return
+        self._evidence_repository.save_document_extraction(document_id, pages, chunks, scope)
+
+    def _prune(self, document_id: str, page_count: int, scope: TenantScope) -> None:
+        # A re-extracted document that shrank leaves rows past its new last page.
+        if self._evidence_repository is not None:
+            self._evidence_repository.prune_document_extraction(document_id, page_count, scope)
+
+    def index_document(self, document_id: str, scope: TenantScope) -> bool:
+        """Index the document's pending chunks; return False if indexing failed."""
+        if self._chunk_indexer is None:
+            return True
+        try:
+            self._chunk_indexer.index_pending(scope, document_ids=[document_id])
+        except Exception as exc:  # noqa: BLE001 - chunks stay pending for the chunk index backfill
+            logger.warning("chunk indexing failed document_id=%s: %s", document_id, exc)
+            return False
+        return True
+
+    def _iter_pages(self, document: Document, errors: list[str]) -> Iterator[DocumentPage]:
         path = Path(document.storage_path) if document.storage_path else None
         suffix = path.suffix.lower() if path else Path(document.original_filename).suffix.lower()
         if suffix in self.IMAGE_SUFFIXES:
-            page = self._image_page(document, path)
-            return [page], errors
-
-        text = document.content or ""
-        if not text and path is not None and self._parser is not None:
-            try:
-                text = self._parser.parse(path, max_chars=self._parser_max_chars)
-            except Exception as exc:  # noqa: BLE001 - parser failures must be visible and safe
-                error = f"{type(exc).__name__}: {exc}"
-                errors.append(error)
-                return [
-                    DocumentPage.create(
-                        document_id=document.document_id,
-                        page_number=1,
-                        source_hash=document.file_hash,
-                        parser_error=error,
-                    )
-                ], errors
-
-        parts = _split_page_text(text)
-        pages = [
-            DocumentPage.create(
+            yield self._image_page(document, path)
+            return
+
+        page_number = 0
+        try:
+            for part in self._iter_page_texts(document, path):
+                text = part.strip()
+                if not text:
+                    continue
+                page_number += 1
+                yield DocumentPage.create(
+                    document_id=document.document_id,
+                    page_number=page_number,
+                    text=text,
+                    source_hash=document.file_hash,
+                )
+        except Exception as exc:  # noqa: BLE001 - parser failures must be visible and safe
+            error = f"{type(exc).__name__}: {exc}"
+            errors.append(error)
+            yield DocumentPage.create(
                 document_id=document.document_id,
-                page_number=index,
-                text=part,
+                page_number=page_number + 1,
                 source_hash=document.file_hash,
+                parser_error=error,
             )
-            for index, part in enumerate(parts, start=1)
-        ]
-        return pages or [
-            DocumentPage.create(
+            return
+        if page_number == 0:
+            yield DocumentPage.create(
                 document_id=document.document_id,
                 page_number=1,
                 source_hash=document.file_hash,
             )
-        ], errors
+
+    def _iter_page_texts(self, document: Document, path: Path | None) -> Iterator[str]:
+        # Locally parsed content is only a preview; stream the stored file
+        # instead. Provider-extracted content has no local equivalent.
+        if self._parser is not None and path is not None and path.exists() and not document.kimi_file_id:
+            yield from self._parser.iter_pages(path)
+            return
+        text = document.content or ""
+        if not text and path is not None and self._parser is not None:
+            text = self._parser.parse(path, max_chars=self._parser_max_chars)
+        if text:
+            yield from text.split("\f")
 
     def _image_page(self, document: Document, path: Path | None) -> DocumentPage:
         metadata = {
@@ -177,11 +284,10 @@ class PageExtractionService:
         )
 
 
-def _split_page_text(text: str) -> list[str]:
-    if not text:
-        return []
-    parts = [part.strip() for part in text.split("\f")]
-    return [part for part in parts if part]
+def _batched(items: Iterable[DocumentPage], size: int) -> Iterator[list[DocumentPage]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 def _scope_for_document(document: Document | dict) -> TenantScope:
@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
-import hashlib
+import logging
 import re
 from typing import Any
 
+from doge.application.services.embedding_pipeline import BatchingEmbedder, EmbeddingRunStats
 from doge.core.domain.chunk_models import DocumentChunk
 from doge.core.ports.embedding import IEmbeddingCache, IEmbeddingProvider
 from doge.core.ports.evidence_repository import IEvidenceRepository
 from doge.core.ports.vector_store import IVectorStore, VectorRecord
 from doge.shared.scope import TenantScope
 
+logger = logging.getLogger(__name__)
+
 
 class RAGService:
-    """Ingest and retrieve source-backed evidence chunks."""
+    """Index and retrieve source-backed evidence chunks.
+
+    Indexing is a pipeline stage: :meth:`index_pending` embeds the chunks the
+    evidence repository reports as not yet indexed and marks them, so it is
+    idempotent and runs when documents are extracted. :meth:`index_all_pending`
+    sweeps every tenant for chunks left unindexed (failed indexing, chunks
+    from before indexing was tracked). :meth:`search` is read-only over the
+    corpus; it embeds the query, asks the vector store for candidates and
+    loads only those chunks.
+    """
 
     def __init__(
         self,
@@ -23,16 +35,25 @@ class RAGService:
         embedding_provider: IEmbeddingProvider,
         vector_store: IVectorStore,
         embedding_cache: IEmbeddingCache | None = None,
+        embedding_batch_size: int = 64,
+        embedding_workers: int = 4,
     ) -> None:
         self._evidence = evidence_repository
-        self._embeddings = embedding_provider
         self._vectors = vector_store
-        self._cache = embedding_cache
+        self._embedder = BatchingEmbedder(
+            embedding_provider,
+            embedding_cache,
+            batch_size=embedding_batch_size,
+            max_workers=embedding_workers,
+        )
+        self.last_ingestion: EmbeddingRunStats | None = None
 
-    def ingest_chunks(self, chunks: list[DocumentChunk]) -> int:
+    def ingest_chunks(self, chunks: list[DocumentChunk], scope: TenantScope | None = None) -> int:
+        """Embed and upsert chunks (keyed by ``chunk_id``) and mark them indexed."""
+        resolved = scope or TenantScope.local()
+        vectors, stats = self._embedder.embed([chunk.text for chunk in chunks])
         records: list[VectorRecord] = []
-        for chunk in chunks:
-            vector = self._embedding_for(chunk.text)
+        for chunk, vector in zip(chunks, vectors):
             records.append(
                 VectorRecord(
                     record_id=chunk.chunk_id,
@@ -47,12 +68,65 @@ class RAGService:
                         "start_char": chunk.start_char,
                         "end_char": chunk.end_char,
                         "visibility": "local",
+                        "tenant_id": resolved.tenant_id,
                     },
                 )
             )
         self._vectors.upsert(records)
+        self._evidence.mark_chunks_indexed(chunks, resolved)
+        self.last_ingestion = stats
+        logger.info(
+            "rag ingestion chunks=%d unique=%d cache_hits=%d embedded=%d batches=%d "
+            "seconds=%.3f chunks_per_second=%.1f",
+            stats.texts,
+            stats.unique,
+            stats.cache_hits,
+            stats.embedded,
+            stats.batches,
+            stats.seconds,
+            stats.texts_per_second,
+        )
         return len(records)
 
+    def index_pending(
+        self,
+        scope: TenantScope | None = None,
+        *,
+        document_ids: list[str] | None = None,
+        tenant_id: str | None = None,
+        batch_size: int = 256,
+    ) -> int:
+        """Index every chunk not yet indexed; return how many were indexed."""
+        resolved = _resolve_scope(scope, tenant_id)
+        seen: set[str] = set()
+        total = EmbeddingRunStats()
+        while True:
+            chunks = [
+                chunk
+                for chunk in self._evidence.list_unindexed_chunks(resolved, document_ids, limit=batch_size)
+                if chunk.chunk_id not in seen
+            ]
+            if not chunks:
+                self.last_ingestion = total
+                return len(seen)
+            self.ingest_chunks(chunks, resolved)
+            total += self.last_ingestion
+            seen.update(chunk.chunk_id for chunk in chunks)
+
+    def index_all_pending(self, *, batch_size: int = 256) -> int:
+        """Index the pending chunks of every tenant; return how many were indexed.
+
+        A tenant whose indexing fails is logged and skipped, so one bad
+        batch does not hold back the others.
+        """
+        indexed = 0
+        for tenant_id in self._evidence.list_unindexed_tenants():
+            try:
+                indexed += self.index_pending(TenantScope.from_tenant_id(tenant_id), batch_size=batch_size)
+            except Exception as exc:  # noqa: BLE001 - retried on the next sweep
+                logger.warning("chunk index backfill failed tenant_id=%s: %s", tenant_id, exc)
+        return indexed
+
     def search(
         self,
         query: str,
@@ -63,21 +137,29 @@ class RAGService:
         scope: TenantScope | None = None,
         tenant_id: str | None = None,
     ) -> dict[str, Any]:
-        chunks = self._evidence.list_chunks(_resolve_scope(scope, tenant_id), document_ids, limit=1000)
-        self.ingest_chunks(chunks)
-        if not chunks:
+        resolved = _resolve_scope(scope, tenant_id)
+        if document_ids == []:
             return {"query": query, "limit": limit, "results": []}
 
-        query_vector = self._embedding_for(query)
-        vector_filter = dict(metadata_filter or {})
-        if document_ids and len(document_ids) == 1:
-            vector_filter["document_id"] = document_ids[0]
-        vector_results = self._vectors.search(
-            query_vector,
-            top_k=max(limit * 4, limit),
-            metadata_filter=vector_filter or None,
-        )
+        query_vector = self._embedder.embed([query])[0][0]
+        vector_filter = {**(metadata_filter or {}), "tenant_id": resolved.tenant_id}
+        top_k = max(limit * 4, limit)
+        if document_ids:
+            vector_results = [
+                result
+                for document_id in dict.fromkeys(document_ids)
+                for result in self._vectors.search(
+                    query_vector,
+                    top_k=top_k,
+                    metadata_filter={**vector_filter, "document_id": document_id},
+                )
+            ]
+        else:
+            vector_results = self._vectors.search(query_vector, top_k=top_k, metadata_filter=vector_filter)
         vector_scores = {result.record.record_id: result.score for result in vector_results}
+        chunks = self._evidence.get_chunks(list(vector_scores), resolved)
+        if not chunks:
+            return {"query": query, "limit": limit, "results": []}
         query_tokens = set(_tokens(query))
 
         scored: list[tuple[float, DocumentChunk]] = []
@@ -98,17 +180,6 @@ class RAGService:
         ]
         return {"query": query, "limit": limit, "results": results}
 
-    def _embedding_for(self, text: str) -> list[float]:
-        key = _content_hash(text)
-        if self._cache is not None:
-            cached = self._cache.get(key)
-            if cached is not None:
-                return cached
-        vector = self._embeddings.embed_texts([text])[0]
-        if self._cache is not None:
-            self._cache.set(key, vector)
-        return vector
-
 
 def _chunk_result(chunk: DocumentChunk, score: float) -> dict[str, Any]:
     return {
@@ -134,10 +205,6 @@ def _resolve_scope(scope: TenantScope | None, tenant_id: str | None) -> TenantSc
     return TenantScope.from_tenant_id(tenant_id)
 
 
-def _content_hash(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-
 def _tokens(text: str) -> list[str]:
     return re.findall(r"[\w\u4e00-\u9fff]+", text.lower())
 
@@ -0,0 +1,213 @@
+"""Bounded, cancellable execution of synchronous tools.
+
+``asyncio.to_thread`` plus ``wait_for`` abandons a timed-out tool but leaves
+its thread running on the shared default executor, so slow DuckDB queries and
+analyses pile up there under load. :class:`ToolExecutor` runs tools instead on
+
+* one bounded thread pool per :class:`ToolCategory` (analytical work cannot
+  starve read-only lookups), with a cap on calls waiting for a worker —
+  beyond it a call is rejected instead of queued;
+* a :class:`CancellationToken` per call, bound to the worker thread. On
+  timeout the token is cancelled: a call still waiting for a worker is
+  dropped before it starts, and a running one is interrupted through the
+  hooks it registered (DuckDB connections interrupt their query) or stops at
+  its next :func:`~doge.shared.cancellation.raise_if_cancelled` check.
+
+:meth:`ToolExecutor.metrics` reports queue depth, running calls, timeouts and
+calls that were still running after their timeout (``abandoned_running``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Mapping, TypeVar
+
+from doge.config import get_settings
+from doge.core.domain.tool_policy import ToolCategory
+from doge.shared.cancellation import CancellationToken, cancellation_scope
+
+T = TypeVar("T")
+
+
+class ToolExecutorSaturated(RuntimeError):
+    """Raised when a category's wait queue is full."""
+
+
+class ToolExecutorClosed(RuntimeError):
+    """Raised when a call is submitted after :meth:`ToolExecutor.shutdown`."""
+
+
+@dataclass
+class ToolPoolMetrics:
+    """Counters of one category pool."""
+
+    workers: int
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    timeouts: int = 0
+    dropped_before_start: int = 0
+    abandoned_running: int = 0
+    rejected: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class _CategoryPool:
+    def __init__(self, category: ToolCategory, workers: int, max_queue: int) -> None:
+        self.metrics = ToolPoolMetrics(workers=max(1, workers))
+        self.max_queue = max(0, max_queue)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.metrics.workers,
+            thread_name_prefix=f"doge-tool-{category.value}",
+        )
+
+
+class ToolExecutor:
+    """Per-category bounded thread pools with cooperative cancellation.
+
+    Parameters
+    ----------
+    workers:
+        Worker threads per category; categories not listed use
+        ``default_workers``.
+    max_queue:
+        Calls allowed to wait for a worker per category; ``0`` rejects any
+        call that finds every worker busy.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: Mapping[ToolCategory, int] | None = None,
+        default_workers: int = 4,
+        max_queue: int = 64,
+    ) -> None:
+        self._workers = dict(workers or {})
+        self._default_workers = default_workers
+        self._max_queue = max_queue
+        self._lock = threading.Lock()
+        self._pools: dict[ToolCategory, _CategoryPool] = {}
+        self._closed = False
+
+    async def run(
+        self,
+        category: ToolCategory,
+        func: Callable[[], T],
+        *,
+        timeout_seconds: float | None = None,
+    ) -> T:
+        """Run *func* on the category pool; raise ``TimeoutError`` on timeout.
+
+        Raises :class:`ToolExecutorSaturated` when the category's wait queue
+        is full.
+        """
+        pool = self._pool(category)
+        with self._lock:
+            if pool.metrics.queued >= pool.max_queue and pool.metrics.running >= pool.metrics.workers:
+                pool.metrics.rejected += 1
+                raise ToolExecutorSaturated(f"{category.value} tool pool is saturated")
+            pool.metrics.queued += 1
+        token = CancellationToken()
+        call = _Call(token)
+        future = asyncio.get_running_loop().run_in_executor(pool.executor, self._call, pool, call, func)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout_seconds)
+        except TimeoutError:
+            token.cancel()
+            with self._lock:
+                pool.metrics.timeouts += 1
+                if call.started and not future.done():
+                    pool.metrics.abandoned_running += 1
+            raise TimeoutError("tool execution timed out") from None
+        except asyncio.CancelledError:
+            token.cancel()
+            raise
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {category.value: pool.metrics.as_dict() for category, pool in self._pools.items()}
+
+    def shutdown(self) -> None:
+        """Stop accepting work and release idle worker threads."""
+        with self._lock:
+            self._closed = True
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _pool(self, category: ToolCategory) -> _CategoryPool:
+        with self._lock:
+            if self._closed:
+                raise ToolExecutorClosed("tool executor is shut down")
+            pool = self._pools.get(category)
+            if pool is None:
+                pool = _CategoryPool(
+                    category,
+                    self._workers.get(category, self._default_workers),
+                    self._max_queue,
+                )
+                self._pools[category] = pool
+            return pool
+
+    def _call(self, pool: _CategoryPool, call: "_Call", func: Callable[[], T]) -> Any:
+        with self._lock:
+            pool.metrics.queued -= 1
+            if call.token.cancelled:
+                pool.metrics.dropped_before_start += 1
+                return None
+            call.started = True
+            pool.metrics.running += 1
+        try:
+            with cancellation_scope(call.token):
+                return func()
+        finally:
+            with self._lock:
+                pool.metrics.running -= 1
+                pool.metrics.completed += 1
+
+
+class _Call:
+    def __init__(self, token: CancellationToken) -> None:
+        self.token = token
+        self.started = False
+
+
+_EXECUTOR: ToolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_tool_executor() -> ToolExecutor:
+    """Return the process-wide tool executor, creating it from settings."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            daemon = get_settings().daemon
+            _EXECUTOR = ToolExecutor(
+                workers={
+                    ToolCategory.READ_ONLY: daemon.tool_read_only_workers,
+                    ToolCategory.ANALYTICAL: daemon.tool_analytical_workers,
+                },
+                default_workers=daemon.tool_workers,
+                max_queue=daemon.tool_queue_limit,
+            )
+        return _EXECUTOR
+
+
+def peek_tool_executor() -> ToolExecutor | None:
+    """Return the process-wide executor only if one has been created."""
+    return _EXECUTOR
+
+
+def shutdown_tool_executor() -> None:
+    """Uninstall and shut down the process-wide executor."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        executor.shutdown()
@@ -5,7 +5,9 @@ from __future__ import annotations
 from typing import Any
 
 from doge.application.agent.tool_service import ToolApplicationService
+from doge.application.tools.executor import ToolExecutor
 from doge.application.tools.registry import ToolRegistry
+from doge.core.ports.cache import IToolResultCache
 from doge.core.ports.tool_entitlement import IToolEntitlementChecker
 
 
@@ -14,8 +16,15 @@ def build_default_tool_registry(
     *,
     entitlement_checker: IToolEntitlementChecker | None = None,
     context: Any = None,
+    result_cache: IToolResultCache | None = None,
+    executor: ToolExecutor | None = None,
 ) -> ToolRegistry:
-    registry = ToolRegistry(entitlement_checker=entitlement_checker, context=context)
+    registry = ToolRegistry(
+        entitlement_checker=entitlement_checker,
+        context=context,
+        result_cache=result_cache,
+        executor=executor,
+    )
     service = service or ToolApplicationService()
     registry.include_descriptors(service.tool_descriptors(), service)
     return registry
@@ -8,8 +8,10 @@ import json
 from collections.abc import Iterable
 from typing import Any, Callable
 
+from doge.application.tools.executor import ToolExecutor, ToolExecutorClosed, ToolExecutorSaturated
 from doge.core.domain.tool_descriptor import ToolDescriptor
 from doge.core.domain.tool_policy import ToolCategory
+from doge.core.ports.cache import IToolResultCache
 from doge.core.ports.runtime_services import ToolResult
 from doge.core.ports.tool_entitlement import IToolEntitlementChecker
 from doge.shared.errors import SafeError
@@ -23,12 +25,16 @@ class ToolRegistry:
         *,
         entitlement_checker: IToolEntitlementChecker | None = None,
         context: Any = None,
+        result_cache: IToolResultCache | None = None,
+        executor: ToolExecutor | None = None,
     ) -> None:
         self._descriptors: dict[str, ToolDescriptor] = {}
         self._tools: dict[str, Callable[..., ToolResult]] = {}
         self._categories: dict[str, ToolCategory] = {}
         self._entitlement = entitlement_checker or _DefaultEntitlementChecker()
         self._context = context
+        self._result_cache = result_cache
+        self._executor = executor
         self.schemas: list[dict[str, Any]] = []
 
     def register(
@@ -104,6 +110,13 @@ class ToolRegistry:
             })
         return records
 
+    def requires_approval(self, name: str, context: Any = None) -> bool:
+        """Return whether executing ``name`` in ``context`` would stop for human approval."""
+
+        effective_context = self._context if context is None else context
+        category = self._categories.get(name, ToolCategory.READ_ONLY)
+        return self._entitlement.requires_approval(effective_context, name, category)
+
     def execute(self, name: str, arguments: str | dict[str, Any] | None = None, *, context: Any = None) -> ToolResult:
         if name not in self._tools:
             return _tool_error(name, "unknown_tool", "unknown tool")
@@ -118,8 +131,15 @@ class ToolRegistry:
                 return _tool_error(name, "invalid_tool_arguments", "invalid JSON arguments")
         else:
             kwargs = arguments or {}
+        cache_key = self._cache_key(name, kwargs, effective_context, category)
+        if cache_key is not None:
+            cached = self._result_cache.get(name, cache_key)
+            if cached is not None:
+                return cached
         try:
             result = _invoke_tool(self._tools[name], kwargs, effective_context)
+            if cache_key is not None:
+                self._result_cache.put(name, cache_key, result)
             if self._entitlement.requires_approval(effective_context, name, category):
                 result.data.setdefault("approval_required", True)
                 result.data.setdefault("action", name)
@@ -139,6 +159,14 @@ class ToolRegistry:
                 safe_error=safe_error.to_event_payload(),
             )
 
+    def _cache_key(self, name: str, kwargs: Any, context: Any, category: ToolCategory) -> str | None:
+        descriptor = self._descriptors.get(name)
+        if self._result_cache is None or descriptor is None or not descriptor.cacheable:
+            return None
+        if not isinstance(kwargs, dict) or self._entitlement.requires_approval(context, name, category):
+            return None
+        return self._result_cache.key(name, kwargs, getattr(context, "tenant_id", None))
+
     async def execute_async(
         self,
         name: str,
@@ -147,7 +175,26 @@ class ToolRegistry:
         timeout_seconds: float | None = None,
         context: Any = None,
     ) -> ToolResult:
-        """Execute a synchronous tool through a cancellable async boundary."""
+        """Execute a synchronous tool through a cancellable async boundary.
+
+        With a :class:`ToolExecutor` the call runs on its category's bounded
+        pool and a timeout cancels it; otherwise it runs on the default
+        executor and a timed-out call is only abandoned.
+        """
+        if self._executor is not None:
+            category = self._categories.get(name, ToolCategory.READ_ONLY)
+            try:
+                return await self._executor.run(
+                    category,
+                    lambda: self.execute(name, arguments, context=context),
+                    timeout_seconds=timeout_seconds,
+                )
+            except TimeoutError:
+                return _tool_error(name, "tool_execution_timed_out", "tool execution timed out")
+            except ToolExecutorSaturated:
+                return _tool_error(name, "tool_executor_saturated", "tool executor saturated")
+            except ToolExecutorClosed:
+                return _tool_error(name, "tool_executor_unavailable", "tool executor is restarting; retry the call")
         call = asyncio.to_thread(self.execute, name, arguments, context=context)
         if timeout_seconds is None:
             return await call
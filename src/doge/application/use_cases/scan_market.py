@@ -2,27 +2,49 @@
 
 Supports two sources:
 
-- ``tdx-server``: uses an injected ``IMarketDataSource`` to download tickers one
-  by one and persist them.
+- ``tdx-server``: uses an injected ``IMarketDataSource`` to download tickers
+  and persist them. Sources exposing ``download_many`` (the pooled
+  ``TDXDataSource``) fetch concurrently and stream frames back in ticker
+  order; others are called one ticker at a time.
 - ``tdx-local``: uses an injected ``ITdxFileScanner`` to read local .day files
-  and persist them.
+  and persist them. With ``request.incremental`` the scan is driven by the
+  per-file watermarks stored through ``stock_repo``: unchanged files are
+  reported as ``unchanged`` without being parsed, grown files contribute only
+  their appended bars, and the watermarks advance once those bars are written.
 
 The use case owns the single-logical-writer seam: it calls
 ``stock_repo.ensure_schema()`` once, then iterates over the ticker stream and
-calls ``stock_repo.save_prices()`` per frame. Per-ticker read/write failures are
-recorded but do **not** abort the scan (parity with the legacy
-``src/micro/market_scanner`` contract).
+hands frames to ``stock_repo.save_prices_batch()`` in groups of
+``request.batch_size`` (one connection and transaction per group). When the
+scanner parses on a worker pool it still streams frames back in ticker order,
+so persistence stays on this single writer while parsing overlaps it.
+Per-ticker read/write failures are recorded but do **not** abort the scan
+(parity with the legacy ``src/micro/market_scanner`` contract).
 """
 from __future__ import annotations
 
+import logging
 import time
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from doge.application.contracts.request import ScanMarketRequest
 from doge.application.contracts.response import ScanMarketResponse, ScanResultItem
 from doge.core.ports.data_source import IMarketDataSource
-from doge.core.ports.file_scanner import ITdxFileScanner, ProgressCallback
-from doge.core.ports.repository import IStockRepository, StorageWriteError
+from doge.core.ports.file_scanner import (
+    ITdxFileScanner,
+    LocalScanItem,
+    ProgressCallback,
+    TdxFileWatermark,
+)
+from doge.core.ports.repository import (
+    IStockRepository,
+    PriceBatchWriteResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# A buffered frame waiting for the next batch write: (results index, ticker, frame).
+_PendingWrite = tuple[int, str, object]
 
 
 class ScanMarketUseCase:
@@ -34,6 +56,7 @@ class ScanMarketUseCase:
         data_source: Optional[IMarketDataSource] = None,
         file_scanner: Optional[ITdxFileScanner] = None,
         refresh_views_callable: Optional[Callable[[], None]] = None,
+        data_changed_callable: Optional[Callable[[], None]] = None,
     ) -> None:
         """Initialize with injected ports.
 
@@ -42,11 +65,14 @@ class ScanMarketUseCase:
             data_source: Remote data source (used for ``source="tdx-server"``).
             file_scanner: Local .day scanner (used for ``source="tdx-local"``).
             refresh_views_callable: Callable that materializes DuckDB views.
+            data_changed_callable: Callable run once the scan completes, used
+                to drop cached tool results computed from the old data.
         """
         self._stock_repo = stock_repo
         self._data_source = data_source
         self._file_scanner = file_scanner
         self._refresh_views = refresh_views_callable
+        self._data_changed = data_changed_callable
 
     def execute(
         self,
@@ -65,13 +91,17 @@ class ScanMarketUseCase:
         if self._refresh_views is not None:
             try:
                 self._refresh_views()
-            except Exception:
-                # Refresh failure is best-effort; scan still completes.
-                pass
+            except Exception as e:
+                # Refresh failure is best-effort; scan still completes, but
+                # the views keep serving the previous data.
+                logger.warning("view refresh after scan failed; views are stale: %s", e)
+        if self._data_changed is not None:
+            self._data_changed()
 
         success_count = sum(1 for r in results if r.status == "success")
         failed_count = sum(1 for r in results if r.status == "failed")
         skipped_count = sum(1 for r in results if r.status == "skipped")
+        unchanged_count = sum(1 for r in results if r.status == "unchanged")
 
         return ScanMarketResponse(
             market=request.market,
@@ -79,6 +109,7 @@ class ScanMarketUseCase:
             success_count=success_count,
             failed_count=failed_count,
             skipped_count=skipped_count,
+            unchanged_count=unchanged_count,
             results=results,
             duration_seconds=round(time.time() - start_time, 3),
         )
@@ -88,36 +119,86 @@ class ScanMarketUseCase:
         request: ScanMarketRequest,
         progress_callback: Optional[ProgressCallback] = None,
     ) -> list[ScanResultItem]:
-        """Scan local .day files and persist each frame."""
+        """Scan local .day files and persist the frames in batches."""
         if self._file_scanner is None:
             return []
         if not request.tdx_path:
             return []
 
         results: list[ScanResultItem] = []
+        pending: list[_PendingWrite] = []
+        watermarks: dict[str, TdxFileWatermark] = {}
+        advanced: list[TdxFileWatermark] = []
+        for item in self._local_items(request, progress_callback):
+            if item.unchanged:
+                results.append(ScanResultItem(ticker=item.ticker, status="unchanged"))
+                continue
+            if item.watermark is not None:
+                watermarks[item.ticker] = item.watermark
+            if item.frame is None or item.frame.empty:
+                if item.watermark is not None:
+                    advanced.append(item.watermark)
+                continue
+            pending.append((len(results), item.ticker, item.frame))
+            results.append(ScanResultItem(ticker=item.ticker, status="pending"))
+            if len(pending) >= request.batch_size:
+                advanced.extend(self._flush_local(request.market, pending, results, watermarks))
+        advanced.extend(self._flush_local(request.market, pending, results, watermarks))
+
+        if advanced:
+            try:
+                self._stock_repo.save_file_watermarks(request.market, advanced)
+            except Exception as err:
+                # Losing watermarks only costs a fuller rescan next time.
+                logger.warning(
+                    "saving %d TDX file watermark(s) for %s failed; next scan rereads them: %s",
+                    len(advanced), request.market, err,
+                )
+        return results
+
+    def _local_items(
+        self,
+        request: ScanMarketRequest,
+        progress_callback: Optional[ProgressCallback],
+    ) -> Iterator[LocalScanItem]:
+        """Yield :class:`LocalScanItem` values for the configured scan mode."""
+        if request.incremental:
+            yield from self._file_scanner.scan_local_delta(
+                request.market,
+                request.tdx_path,
+                self._stock_repo.get_file_watermarks(request.market),
+                progress_callback=progress_callback,
+            )
+            return
         for frame in self._file_scanner.scan_local(
             request.market, request.tdx_path, progress_callback=progress_callback
         ):
             ticker = str(frame["ticker"].iloc[0]) if "ticker" in frame.columns else ""
-            try:
-                self._stock_repo.save_prices(request.market, frame)
-                results.append(ScanResultItem(ticker=ticker, status="success"))
-            except StorageWriteError as e:
-                results.append(
-                    ScanResultItem(
-                        ticker=ticker,
-                        status="failed",
-                        message=str(e),
-                    )
-                )
-        return results
+            yield LocalScanItem(ticker=ticker, frame=frame)
+
+    def _flush_local(
+        self,
+        market: str,
+        pending: list[_PendingWrite],
+        results: list[ScanResultItem],
+        watermarks: dict[str, TdxFileWatermark],
+    ) -> list[TdxFileWatermark]:
+        """Flush a local batch and return the watermarks of written tickers."""
+        batch = [(index, ticker) for index, ticker, _ in pending]
+        self._flush(market, pending, results)
+        advanced = []
+        for index, ticker in batch:
+            watermark = watermarks.pop(ticker, None)
+            if watermark is not None and results[index].status == "success":
+                advanced.append(watermark)
+        return advanced
 
     def _scan_remote(
         self,
         request: ScanMarketRequest,
         progress_callback: Optional[ProgressCallback] = None,
     ) -> list[ScanResultItem]:
-        """Download tickers from a remote source and persist each frame.
+        """Download tickers from a remote source and persist them in batches.
 
         This owns the canonical server-download persistence loop. Connection
         probing, retry behavior, and provider-specific download details remain
@@ -137,25 +218,23 @@ class ScanMarketUseCase:
             self._data_source.connect(request.market)
 
         results: list[ScanResultItem] = []
-        for ticker in tickers:
-            try:
-                frame = self._data_source.download_kline(ticker, request.market)
-                if frame is None or frame.empty:
-                    results.append(
-                        ScanResultItem(ticker=ticker, status="skipped", message="empty")
-                    )
-                    continue
-                frame["ticker"] = ticker
-                self._stock_repo.save_prices(request.market, frame)
-                results.append(ScanResultItem(ticker=ticker, status="success"))
-            except StorageWriteError as e:
+        pending: list[_PendingWrite] = []
+        for ticker, frame, error in self._remote_frames(tickers, request.market):
+            if error is not None:
                 results.append(
-                    ScanResultItem(ticker=ticker, status="failed", message=str(e))
+                    ScanResultItem(ticker=ticker, status="failed", message=error)
                 )
-            except Exception as e:
+            elif frame is None or frame.empty:
                 results.append(
-                    ScanResultItem(ticker=ticker, status="failed", message=str(e))
+                    ScanResultItem(ticker=ticker, status="skipped", message="empty")
                 )
+            else:
+                frame["ticker"] = ticker
+                pending.append((len(results), ticker, frame))
+                results.append(ScanResultItem(ticker=ticker, status="pending"))
+
+            if len(pending) >= request.batch_size:
+                self._flush(request.market, pending, results)
 
             if progress_callback:
                 progress_callback(
@@ -163,4 +242,42 @@ class ScanMarketUseCase:
                     f"downloaded: {ticker}",
                 )
 
+        self._flush(request.market, pending, results)
         return results
+
+    def _remote_frames(
+        self,
+        tickers: list[str],
+        market: str,
+    ) -> Iterator[tuple[str, object, Optional[str]]]:
+        """Yield ``(ticker, frame, error)`` in ticker order from the data source."""
+        yield from self._data_source.download_many(tickers, market)
+
+    def _flush(
+        self,
+        market: str,
+        pending: list[_PendingWrite],
+        results: list[ScanResultItem],
+    ) -> None:
+        """Write buffered frames as one batch and resolve their result slots."""
+        if not pending:
+            return
+        try:
+            outcome = self._stock_repo.save_prices_batch(market, [frame for _, _, frame in pending])
+        except Exception as e:
+            outcome = PriceBatchWriteResult(
+                failed={ticker: str(e) for _, ticker, _ in pending}
+            )
+
+        for index, ticker, _ in pending:
+            if ticker in outcome.failed:
+                results[index] = ScanResultItem(
+                    ticker=ticker, status="failed", message=outcome.failed[ticker]
+                )
+            else:
+                results[index] = ScanResultItem(
+                    ticker=ticker,
+                    status="success",
+                    rows_appended=outcome.appended.get(ticker, 0),
+                )
+        pending.clear()
@@ -53,8 +53,11 @@ class GatewayContainer:
 
     # -- Documents / RAG --
     def build_rag_service(self): return documents.build_rag_service(self.db_path, self.runtime_container)
-    def build_file_upload_service(self, *, kimi_files_client=None): return documents.build_file_upload_service(self.db_path, self.runtime_container, kimi_files_client=kimi_files_client)
-    def build_page_extraction_service(self): return documents.build_page_extraction_service(self.runtime_container)
+    def build_chunk_index_backfill(self): return documents.build_chunk_index_backfill(self.db_path, self.runtime_container)
+    def build_file_upload_service(self, *, kimi_files_client=None, parser=None, extraction_queue=None): return documents.build_file_upload_service(self.db_path, self.runtime_container, kimi_files_client=kimi_files_client, parser=parser, extraction_queue=extraction_queue)
+    def build_document_parse_pool(self): return documents.build_document_parse_pool()
+    def build_document_extraction_worker(self, upload_service, *, parser=None): return documents.build_document_extraction_worker(self.db_path, self.runtime_container, upload_service, parser=parser)
+    def build_page_extraction_service(self): return documents.build_page_extraction_service(self.runtime_container, self.db_path)
 
     # -- Use cases --
     def build_manage_notes_use_case(self, note_repo=None): return use_cases.build_manage_notes_use_case(note_repo)
@@ -1,12 +1,15 @@
 """Gateway factory helpers for document/RAG services."""
 from __future__ import annotations
+from doge.application.services.chunk_index_backfill import ChunkIndexBackfill
 from doge.application.services.citation_service import CitationService
 from doge.application.services.claim_validation_service import ClaimValidationService
+from doge.application.services.document_extraction_worker import DocumentExtractionWorker
 from doge.application.services.file_upload_service import FileUploadService
 from doge.application.services.page_extraction_service import PageExtractionService
 from doge.application.services.rag_service import RAGService
 from doge.infrastructure.database.embedding_cache import SQLiteEmbeddingCache
 from doge.infrastructure.documents.local_parser import LocalDocumentParser
+from doge.infrastructure.documents.parse_pool import DocumentParsePool
 from doge.infrastructure.llm.embedding_client import HashingEmbeddingProvider
 from doge.infrastructure.llm.kimi_files_client import KimiFilesClient
 from doge.infrastructure.vector.sqlite_store import SQLiteVectorStore
@@ -24,38 +27,81 @@ def build_rag_service(db_path, runtime_container_fn):
     )
 
 
+def build_chunk_index_backfill(db_path, runtime_container_fn):
+    return ChunkIndexBackfill(build_rag_service(db_path, runtime_container_fn))
+
+
 def build_claim_repository(db_path):
     from doge.infrastructure.database.claim_repository import SQLiteClaimRepository
 
     return SQLiteClaimRepository(db_path)
 
 
-def build_file_upload_service(db_path, runtime_container_fn, *, kimi_files_client=None):
+def build_file_upload_service(
+    db_path,
+    runtime_container_fn,
+    *,
+    kimi_files_client=None,
+    parser=None,
+    extraction_queue=None,
+):
+    """Build the upload service; with ``extraction_queue`` uploads only queue extraction."""
     settings = get_settings()
     secret_provider = build_secret_provider()
     if kimi_files_client is None and secret_provider.get_secret("kimi.api_key"):
         kimi_files_client = KimiFilesClient(secret_provider=secret_provider)
     runtime = runtime_container_fn()
-    parser = _build_document_parser(settings)
+    parser = parser if parser is not None else _build_document_parser(settings)
     return FileUploadService(
         runtime.build_agent_document_repository(),
         storage_dir=settings.documents.storage_dir,
         max_file_bytes=settings.documents.max_file_bytes,
         parser=parser,
         kimi_files_client=kimi_files_client,
-        extraction_service=PageExtractionService(
-            evidence_repository=runtime.build_agent_evidence_repository(),
-            parser=parser,
-        ),
+        extraction_service=_build_extraction_service(db_path, runtime_container_fn, parser),
+        extraction_queue=extraction_queue,
+    )
+
+
+def build_document_parse_pool():
+    settings = get_settings()
+    return DocumentParsePool(build_default_document_parser, processes=settings.documents.parse_processes)
+
+
+def build_document_extraction_worker(db_path, runtime_container_fn, upload_service, *, parser=None):
+    settings = get_settings()
+    runtime = runtime_container_fn()
+    parser = parser if parser is not None else _build_document_parser(settings)
+    return DocumentExtractionWorker(
+        runtime.build_agent_document_extraction_queue(),
+        upload_service,
+        _build_extraction_service(db_path, runtime_container_fn, parser),
+        runtime.build_agent_document_repository(),
+        concurrency=settings.documents.extraction_workers,
     )
 
 
-def build_page_extraction_service(runtime_container_fn):
+def build_page_extraction_service(runtime_container_fn, db_path=None):
     settings = get_settings()
     runtime = runtime_container_fn()
     return PageExtractionService(
         evidence_repository=runtime.build_agent_evidence_repository(),
         parser=_build_document_parser(settings),
+        chunk_indexer=build_rag_service(db_path, runtime_container_fn) if db_path is not None else None,
+    )
+
+
+def build_default_document_parser():
+    """Module-level parser factory, picklable for :class:`DocumentParsePool` children."""
+    return _build_document_parser(get_settings())
+
+
+def _build_extraction_service(db_path, runtime_container_fn, parser):
+    runtime = runtime_container_fn()
+    return PageExtractionService(
+        evidence_repository=runtime.build_agent_evidence_repository(),
+        parser=parser,
+        chunk_indexer=build_rag_service(db_path, runtime_container_fn),
     )
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from doge.application.agent.tool_service import ToolApplicationService
 from doge.core.ports.enterprise_governance import EnterpriseAuditEvent
 from doge.infrastructure.code_execution.python import DisabledCodeExecutor, SubprocessCodeExecutor
+from doge.infrastructure.code_execution.sandbox_pool import PooledSubprocessCodeExecutor
 from doge.application.services.portfolio_service import PortfolioService, RiskService, ScenarioService
 from doge.config import get_settings
 from doge.infrastructure.finance.local_connectors import (
@@ -20,7 +21,7 @@ from doge.bootstrap.gateway_factories.market import (
     build_stock_service,
     build_view_service,
 )
-from doge.bootstrap.gateway_factories.repositories import build_note_repository
+from doge.bootstrap.gateway_factories.repositories import build_note_repository, build_view_repository
 
 
 def build_risk_factor_source():
@@ -71,8 +72,10 @@ def build_python_analysis_executor(settings=None):
     if not settings.features.python_analysis_enabled:
         return DisabledCodeExecutor()
     executor = settings.features.python_analysis_executor
-    if executor == "subprocess":
+    if executor in {"subprocess", "pooled"}:
         isolation_enabled = bool(getattr(settings.features, "slot_code_string_isolation", False))
+        if executor == "pooled" and not isolation_enabled:
+            return PooledSubprocessCodeExecutor()
         return SubprocessCodeExecutor(
             isolation_enabled=isolation_enabled,
             audit_sink=_code_string_resource_audit_sink(settings) if isolation_enabled else None,
@@ -106,7 +109,7 @@ def build_tool_application_service(
         company_announcement_repository_factory=guard_factory(lambda: build_company_announcement_repository()),
         consensus_estimate_repository_factory=guard_factory(build_consensus_estimate_repository),
         industry_classification_source_factory=guard_factory(build_industry_classification_source),
-        view_repository_factory=guard_factory(lambda: build_view_service()),
+        view_repository_factory=guard_factory(lambda: build_view_repository()),
         code_executor=build_python_analysis_executor(settings),
         use_capability_providers=True,
     )
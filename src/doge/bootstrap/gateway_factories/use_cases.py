@@ -9,6 +9,7 @@ from doge.application.use_cases.manage_notes import ManageNotesUseCase
 from doge.application.use_cases.populate_stock_names import PopulateStockNamesUseCase
 from doge.application.use_cases.query_ticker import QueryTickerUseCase
 from doge.application.use_cases.scan_market import ScanMarketUseCase
+from doge.infrastructure.cache.tool_result_cache import invalidate_tool_result_cache
 from doge.infrastructure.data_source.tdx_file_scanner import TDXFileScanner
 from doge.bootstrap.gateway_factories.llm import build_default_text_llm_client
 from doge.bootstrap.gateway_factories.market import (
@@ -79,6 +80,7 @@ def build_scan_market_use_case(
     data_source=None,
     file_scanner=None,
     refresh_views_callable=None,
+    data_changed_callable=None,
 ) -> ScanMarketUseCase:
     if stock_repo is None:
         stock_repo = build_storage_repository()
@@ -88,11 +90,14 @@ def build_scan_market_use_case(
         file_scanner = TDXFileScanner()
     if refresh_views_callable is None:
         refresh_views_callable = refresh_views
+    if data_changed_callable is None:
+        data_changed_callable = invalidate_tool_result_cache
     return ScanMarketUseCase(
         stock_repo,
         data_source=data_source,
         file_scanner=file_scanner,
         refresh_views_callable=refresh_views_callable,
+        data_changed_callable=data_changed_callable,
     )
 
 
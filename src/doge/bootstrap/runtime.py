@@ -26,6 +26,7 @@ class RuntimeContainer:
     def build_runtime_outbox_repository(self): return repositories.build_runtime_outbox_repository(self.db_path)
     def build_agent_repositories(self): return repositories.build_agent_repositories(self.db_path)
     def build_agent_document_repository(self): return repositories.build_agent_document_repository(self.db_path)
+    def build_agent_document_extraction_queue(self): return repositories.build_agent_document_extraction_queue(self.db_path)
     def build_agent_evidence_repository(self): return repositories.build_agent_evidence_repository(self.db_path)
     def build_agent_run_queue(self): return repositories.build_agent_run_queue(self.db_path)
     def build_agent_idempotency_store(self): return repositories.build_agent_idempotency_store(self.db_path)
@@ -42,7 +43,7 @@ class RuntimeContainer:
     def build_agent_backends(self, secret_provider=None): return runtime_kernel.build_agent_backends(self.gateway_container, secret_provider)
     def build_agent_runtime_kernel(self, model=None, tool_registry=None, event_publisher=None): return runtime_kernel.build_agent_runtime_kernel(self.db_path, self.gateway_container, self.build_default_tool_registry, model=model, tool_registry=tool_registry, event_publisher=event_publisher)
     def build_research_agent_runtime(self, model: Any = None, tool_registry: Any = None): return runtime_kernel.build_research_agent_runtime(self.gateway_container, self.build_default_tool_registry, model=model, tool_registry=tool_registry)
-    def build_persisted_research_agent_runtime(self, model: Any = None, tool_registry: Any = None, event_publisher: Any = None): return runtime_kernel.build_persisted_research_agent_runtime(self.db_path, self.gateway_container, self.build_default_tool_registry, model=model, tool_registry=tool_registry, event_publisher=event_publisher)
+    def build_persisted_research_agent_runtime(self, model: Any = None, tool_registry: Any = None, event_publisher: Any = None, model_delta_channel: Any = None): return runtime_kernel.build_persisted_research_agent_runtime(self.db_path, self.gateway_container, self.build_default_tool_registry, model=model, tool_registry=tool_registry, event_publisher=event_publisher, model_delta_channel=model_delta_channel)
 
     # -- Agent-backed use cases and tools --
     def build_macro_strategist_agent_use_case(self, runtime=None): return agent_use_cases.build_macro_strategist_agent_use_case(self.build_persisted_research_agent_runtime, runtime)
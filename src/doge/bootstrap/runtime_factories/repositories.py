@@ -7,6 +7,7 @@ from typing import Any
 from doge.infrastructure.database.agent_repositories import (
     SQLiteApprovalRepository,
     SQLiteArtifactRepository,
+    SQLiteDocumentExtractionQueue,
     SQLiteDocumentRepository,
     SQLiteEventRepository,
     SQLiteIdempotencyStore,
@@ -51,6 +52,10 @@ def build_agent_document_repository(db_path):
     return SQLiteDocumentRepository(db_path)
 
 
+def build_agent_document_extraction_queue(db_path):
+    return SQLiteDocumentExtractionQueue(db_path)
+
+
 def build_agent_evidence_repository(db_path):
     return SQLiteEvidenceRepository(db_path)
 
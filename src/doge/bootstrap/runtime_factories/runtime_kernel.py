@@ -9,6 +9,7 @@ from doge.application.agent.approval_coordinator import ApprovalCoordinator
 from doge.application.agent.artifact_citation_assembler import ArtifactCitationAssembler
 from doge.application.agent.artifact_finalizer import ArtifactFinalizer
 from doge.application.agent.context_builder import ContextBuilder
+from doge.application.agent.model_delta_stream import ModelDeltaStream
 from doge.application.agent.model_response_assembler import ModelResponseAssembler
 from doge.application.agent.model_router import ModelRouter
 from doge.application.agent.run_lifecycle_service import RunLifecycleService
@@ -74,6 +75,7 @@ def build_agent_runtime_kernel(
     model=None,
     tool_registry=None,
     event_publisher=None,
+    model_delta_channel=None,
 ) -> RuntimeKernel:
     repos = repositories.build_agent_repositories(db_path)
     gateway = gateway_container_fn()
@@ -127,6 +129,7 @@ def build_agent_runtime_kernel(
             model_router=model_router,
             web_search_stage=WebSearchStage(model, response_assembler=response_assembler),
             agent_backends=agent_backends,
+            delta_stream=_build_model_delta_stream(model_delta_channel),
         ),
         tool_execution_service=ToolExecutionService(
             tool_registry=tool_registry,
@@ -189,6 +192,7 @@ def build_persisted_research_agent_runtime(
     model: Any = None,
     tool_registry: Any = None,
     event_publisher: Any = None,
+    model_delta_channel: Any = None,
 ) -> PersistedResearchAgentRuntime:
     return PersistedResearchAgentRuntime(
         build_agent_runtime_kernel(
@@ -198,10 +202,22 @@ def build_persisted_research_agent_runtime(
             model=model,
             tool_registry=tool_registry,
             event_publisher=event_publisher,
+            model_delta_channel=model_delta_channel,
         )
     )
 
 
+def _build_model_delta_stream(channel) -> ModelDeltaStream | None:
+    if channel is None:
+        return None
+    daemon = get_settings().daemon
+    return ModelDeltaStream(
+        channel,
+        flush_interval_seconds=daemon.model_delta_flush_ms / 1000,
+        flush_bytes=daemon.model_delta_flush_bytes,
+    )
+
+
 def _build_event_watcher():
     settings = get_settings()
     if not settings.features.slot_platform:
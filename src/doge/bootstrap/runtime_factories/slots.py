@@ -406,6 +406,8 @@ def build_slot_aware_tool_registry(
     entitlement_checker: Any = None,
     context: Any = None,
     settings: Any | None = None,
+    result_cache: Any = None,
+    executor: Any = None,
 ) -> ToolRegistry:
     """Assemble a ``ToolRegistry`` from slot contributions + remaining descriptors.
 
@@ -436,7 +438,12 @@ def build_slot_aware_tool_registry(
         entitlement_checker,
         settings=resolved_settings,
     )
-    registry = ToolRegistry(entitlement_checker=effective_entitlement, context=context)
+    registry = ToolRegistry(
+        entitlement_checker=effective_entitlement,
+        context=context,
+        result_cache=result_cache,
+        executor=executor,
+    )
     slot_owned: set[str] = set(_slot_manifest_tool_names(slot_kernel))
     for contribution in contributions:
         if not contribution.tools:
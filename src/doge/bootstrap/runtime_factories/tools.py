@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from typing import Any
 
+from doge.application.tools.executor import get_tool_executor
 from doge.application.tools.factory import build_default_tool_registry as _build_tool_registry
 from doge.config import get_settings
+from doge.infrastructure.cache.tool_result_cache import get_tool_result_cache
 
 
 def build_default_tool_registry(gateway_container_fn, *, entitlement_checker: Any = None, context: Any = None):
@@ -22,9 +24,13 @@ def build_default_tool_registry(gateway_container_fn, *, entitlement_checker: An
             entitlement_checker=entitlement_checker,
             context=context,
             settings=settings,
+            result_cache=get_tool_result_cache(),
+            executor=get_tool_executor(),
         )
     return _build_tool_registry(
         service=gateway_container_fn().build_tool_application_service(),
         entitlement_checker=entitlement_checker,
         context=context,
+        result_cache=get_tool_result_cache(),
+        executor=get_tool_executor(),
     )
@@ -144,8 +144,35 @@ class DBConfig:
     backward-compat fallback. Loaders resolve the DDL via
     :meth:`resolved_views_sql` (tracked-first, data-dir fallback) so the
     version-controlled copy is always preferred when present.
+
+    ``duckdb_view_mode`` (``DOGE_DUCKDB_VIEW_MODE``) is ``view`` for plain
+    views over the attached SQLite files, or ``materialized`` to persist them
+    as incrementally refreshed DuckDB tables.
+
+    ``duckdb_pool_size`` (``DOGE_DUCKDB_POOL_SIZE``) caps the read-only
+    cursors the daemon's process-wide DuckDB session pool hands out at once
+    (default ``4``); ``0`` disables the pool. The pool's read-only handle blocks
+    read-write opens of the DuckDB file from other processes until it is
+    released after a few idle seconds. ``duckdb_threads`` (``DOGE_DUCKDB_THREADS``) sets
+    the pool's DuckDB thread count; ``0`` derives it from the host CPU count.
+
+    ``tool_cache_max_bytes`` (``DOGE_TOOL_CACHE_MAX_BYTES``) bounds the
+    serialized size of cached market tool results; ``0`` disables the cache.
+
+    ``sqlite_pool_size`` (``DOGE_SQLITE_POOL_SIZE``) is the number of idle
+    connections kept per SQLite file by the process-wide connection pools;
+    ``0`` disables pooling and every ``connect()`` opens its own connection.
     """
     dir: Path = field(default_factory=lambda: _env_path("DOGE_DB_DIR", _PROJECT_ROOT / "data"))
+    duckdb_view_mode: str = field(
+        default_factory=lambda: _env_choice("DOGE_DUCKDB_VIEW_MODE", "view", ("view", "materialized"))
+    )
+    duckdb_pool_size: int = field(default_factory=lambda: _env_int("DOGE_DUCKDB_POOL_SIZE", 4))
+    duckdb_threads: int = field(default_factory=lambda: _env_int("DOGE_DUCKDB_THREADS", 0))
+    tool_cache_max_bytes: int = field(
+        default_factory=lambda: _env_int("DOGE_TOOL_CACHE_MAX_BYTES", 16 * 1024 * 1024)
+    )
+    sqlite_pool_size: int = field(default_factory=lambda: _env_int("DOGE_SQLITE_POOL_SIZE", 4))
     cn_db: Path = field(init=False)
     us_db: Path = field(init=False)
     research_db: Path = field(init=False)
@@ -194,7 +221,17 @@ class DBConfig:
 
 @dataclass(frozen=True)
 class TDXConfig:
-    """TDX server settings."""
+    """TDX server and local ``.day`` scanner settings.
+
+    ``local_parser`` selects the :class:`TDXFileScanner` parser mode
+    (``DOGE_TDX_LOCAL_PARSER``): ``mmap`` maps the file tail as a numpy
+    structured array, ``struct`` is the legacy per-record loop.
+    ``local_scan_workers`` (``DOGE_TDX_SCAN_WORKERS``) sets the parse process
+    pool size for ``tdx-local`` scans; ``1`` keeps the in-process serial scan.
+    ``pool_size`` (``DOGE_TDX_POOL_SIZE``) is the number of quotation-server
+    connections :class:`TDXDataSource` holds for concurrent remote downloads;
+    ``1`` keeps the single-client path.
+    """
     cn_servers: tuple[str, ...] = (
         "180.153.18.170", "180.153.18.171", "60.191.117.167",
         "115.238.56.198", "218.75.126.9",
@@ -206,6 +243,11 @@ class TDXConfig:
     cn_port: int = 7709
     us_port: int = 7727
     timeout: int = 5
+    local_parser: str = field(
+        default_factory=lambda: _env_choice("DOGE_TDX_LOCAL_PARSER", "mmap", ("mmap", "struct"))
+    )
+    local_scan_workers: int = field(default_factory=lambda: _env_int("DOGE_TDX_SCAN_WORKERS", 1))
+    pool_size: int = field(default_factory=lambda: _env_int("DOGE_TDX_POOL_SIZE", 1))
 
 
 @dataclass(frozen=True)
@@ -314,11 +356,28 @@ class DeepSeekConfig:
 
 @dataclass(frozen=True)
 class LLMConfig:
-    """Default provider selection for legacy text-only report paths."""
+    """Default provider selection and shared HTTP pool limits for model calls.
+
+    Kimi and DeepSeek calls share process-lifetime HTTP clients. Each pooled
+    client holds at most ``http_max_connections`` connections
+    (``DOGE_LLM_HTTP_MAX_CONNECTIONS``) and keeps up to
+    ``http_max_keepalive_connections`` idle ones
+    (``DOGE_LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS``) for
+    ``http_keepalive_expiry_seconds``. ``http2`` (``DOGE_LLM_HTTP2``) takes
+    effect only when the optional ``h2`` package is installed.
+    """
 
     text_provider: str = field(
         default_factory=lambda: os.environ.get("DOGE_TEXT_LLM_PROVIDER") or "kimi"
     )
+    http_max_connections: int = field(default_factory=lambda: _env_int("DOGE_LLM_HTTP_MAX_CONNECTIONS", 20))
+    http_max_keepalive_connections: int = field(
+        default_factory=lambda: _env_int("DOGE_LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS", 10)
+    )
+    http_keepalive_expiry_seconds: float = field(
+        default_factory=lambda: _env_float("DOGE_LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS", 30.0)
+    )
+    http2: bool = field(default_factory=lambda: _env_bool("DOGE_LLM_HTTP2", True))
 
 
 @dataclass(frozen=True)
@@ -404,6 +463,15 @@ class DocumentConfig:
     max_file_bytes: int = field(
         default_factory=lambda: _env_int("DOGE_DOCUMENT_MAX_BYTES", 100 * 1024 * 1024)
     )
+    # Background extraction jobs processed at once by the daemon worker; 0
+    # extracts synchronously inside the upload request.
+    extraction_workers: int = field(
+        default_factory=lambda: _env_int("DOGE_DOCUMENT_EXTRACTION_WORKERS", 2)
+    )
+    # Parser processes behind background extraction; 0 parses in-thread.
+    parse_processes: int = field(
+        default_factory=lambda: _env_int("DOGE_DOCUMENT_PARSE_PROCESSES", 2)
+    )
 
 
 @dataclass(frozen=True)
@@ -482,10 +550,35 @@ class APIConfig:
 
 @dataclass(frozen=True)
 class DaemonConfig:
-    """Loopback daemon gateway defaults."""
+    """Loopback daemon gateway defaults.
+
+    ``worker_concurrency`` (``DOGE_WORKER_CONCURRENCY``) is how many leased
+    runs the daemon worker executes at once; it stops claiming while all slots
+    are busy. ``worker_tenant_concurrency`` (``DOGE_WORKER_TENANT_CONCURRENCY``)
+    caps the live leases a single tenant may hold; ``0`` leaves it uncapped.
+    ``model_delta_flush_ms`` / ``model_delta_flush_bytes``
+    (``DOGE_MODEL_DELTA_FLUSH_MS`` / ``DOGE_MODEL_DELTA_FLUSH_BYTES``) bound how
+    long streamed model output is batched before it is pushed to run streams
+    that asked for live deltas.
+
+    Agent tools run on one bounded thread pool per tool category:
+    ``tool_read_only_workers`` (``DOGE_TOOL_READ_ONLY_WORKERS``),
+    ``tool_analytical_workers`` (``DOGE_TOOL_ANALYTICAL_WORKERS``) and
+    ``tool_workers`` (``DOGE_TOOL_WORKERS``, every other category).
+    ``tool_queue_limit`` (``DOGE_TOOL_QUEUE_LIMIT``) is how many calls may wait
+    for a worker per category before further calls are rejected.
+    """
 
     port: int = field(default_factory=lambda: _env_int("DOGE_DAEMON_PORT", 8901))
     process_role: str = field(default_factory=lambda: _env_choice("DOGE_PROCESS_ROLE", "all", ("api", "worker", "all")))
+    worker_concurrency: int = field(default_factory=lambda: _env_int("DOGE_WORKER_CONCURRENCY", 4))
+    worker_tenant_concurrency: int = field(default_factory=lambda: _env_int("DOGE_WORKER_TENANT_CONCURRENCY", 0))
+    model_delta_flush_ms: int = field(default_factory=lambda: _env_int("DOGE_MODEL_DELTA_FLUSH_MS", 100))
+    model_delta_flush_bytes: int = field(default_factory=lambda: _env_int("DOGE_MODEL_DELTA_FLUSH_BYTES", 1024))
+    tool_read_only_workers: int = field(default_factory=lambda: _env_int("DOGE_TOOL_READ_ONLY_WORKERS", 8))
+    tool_analytical_workers: int = field(default_factory=lambda: _env_int("DOGE_TOOL_ANALYTICAL_WORKERS", 2))
+    tool_workers: int = field(default_factory=lambda: _env_int("DOGE_TOOL_WORKERS", 4))
+    tool_queue_limit: int = field(default_factory=lambda: _env_int("DOGE_TOOL_QUEUE_LIMIT", 64))
 
 
 @dataclass(frozen=True)
@@ -31,6 +31,8 @@ class EventType(str, Enum):
     RUN_CREATED = "run_created"
     RUN_QUEUED = "run_queued"
     MODEL_RESPONSE = "model_response"
+    # Ephemeral live output batches; published to live streams, never persisted.
+    MODEL_DELTA = "model_delta"
     TOOL_CALL = "tool_call"
     TOOL_RESULT = "tool_result"
     APPROVAL_REQUESTED = "approval_requested"
@@ -20,6 +20,55 @@ class DocumentStatus(str, Enum):
     FAILED = "failed"
 
 
+class DocumentExtractionStatus(str, Enum):
+    """Progress of a document through the background extraction queue.
+
+    ``pending`` jobs wait for a worker; ``parsing`` covers provider upload,
+    text extraction and page/chunk persistence; ``chunked`` documents have
+    their chunks stored but not yet embedded; ``indexed`` documents are
+    searchable.
+    """
+
+    PENDING = "pending"
+    PARSING = "parsing"
+    CHUNKED = "chunked"
+    INDEXED = "indexed"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class DocumentExtractionJob:
+    """Durable extraction job for one document."""
+
+    document_id: str
+    tenant_id: Optional[str] = None
+    file_hash: Optional[str] = None
+    status: DocumentExtractionStatus = DocumentExtractionStatus.PENDING
+    attempt_count: int = 0
+    page_count: Optional[int] = None
+    chunk_count: Optional[int] = None
+    error: Optional[str] = None
+    created_at: str = ""
+    updated_at: str = ""
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {DocumentExtractionStatus.INDEXED, DocumentExtractionStatus.FAILED}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            "document_id": self.document_id,
+            "status": self.status.value,
+            "attempt_count": self.attempt_count,
+            "page_count": self.page_count,
+            "chunk_count": self.chunk_count,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
 @dataclass(frozen=True)
 class Document:
     """Persisted metadata for a real research document."""
@@ -22,6 +22,7 @@ class ModelPolicy:
     max_completion_tokens: int | None = None
     stream: bool = False
     tool_timeout_seconds: float | None = None
+    max_parallel_tool_calls: int | None = None
     thinking_enabled: bool | None = None
     web_search_enabled: bool | None = None
     model_family: str | None = None
@@ -43,6 +44,7 @@ class ModelPolicy:
             "max_completion_tokens",
             "stream",
             "tool_timeout_seconds",
+            "max_parallel_tool_calls",
             "thinking_enabled",
             "web_search_enabled",
             "model_family",
@@ -63,6 +65,7 @@ class ModelPolicy:
             max_completion_tokens=_coerce_optional_int(payload.get("max_completion_tokens")),
             stream=bool(payload.get("stream", cls.stream)),
             tool_timeout_seconds=_coerce_optional_float(payload.get("tool_timeout_seconds")),
+            max_parallel_tool_calls=_coerce_optional_int(payload.get("max_parallel_tool_calls")),
             thinking_enabled=_coerce_optional_bool(payload.get("thinking_enabled")),
             web_search_enabled=_coerce_optional_bool(payload.get("web_search_enabled")),
             model_family=_coerce_optional_str(payload.get("model_family")),
@@ -84,6 +87,7 @@ class ModelPolicy:
             "max_completion_tokens": self.max_completion_tokens,
             "stream": self.stream,
             "tool_timeout_seconds": self.tool_timeout_seconds,
+            "max_parallel_tool_calls": self.max_parallel_tool_calls,
             "thinking_enabled": self.thinking_enabled,
             "web_search_enabled": self.web_search_enabled,
             "model_family": self.model_family,
@@ -101,6 +105,8 @@ class ModelPolicy:
             raise ValueError("max_tokens must be between 1 and 65536")
         if self.max_completion_tokens is not None and not 1 <= self.max_completion_tokens <= 65536:
             raise ValueError("max_completion_tokens must be between 1 and 65536")
+        if self.max_parallel_tool_calls is not None and not 1 <= self.max_parallel_tool_calls <= 16:
+            raise ValueError("max_parallel_tool_calls must be between 1 and 16")
         if self.model_family is not None and self.model_family not in {"k2.6", "k2.7-code", "scripted"}:
             raise ValueError("model_family must be one of: k2.6, k2.7-code, scripted")
         if self.run_budget_usd is not None and self.run_budget_usd < 0:
@@ -22,6 +22,9 @@ class ToolDescriptor:
     timeout_seconds: float | None = None
     status: str = "available"
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Deterministic for a given argument set and market-data version, so the
+    # registry may answer repeated calls from its result cache.
+    cacheable: bool = False
 
     def __post_init__(self) -> None:
         if self.method_name is None:
@@ -9,6 +9,7 @@ from doge.core.ports.agent_repository import (
     IRunRepository,
     ISessionRepository,
 )
+from doge.core.ports.document_extraction_queue import IDocumentExtractionQueue
 from doge.core.ports.document_repository import IDocumentRepository
 from doge.core.ports.embedding import IEmbeddingCache, IEmbeddingProvider
 from doge.core.ports.enterprise_auth import (
@@ -74,7 +75,7 @@ from doge.core.ports.slot_runtime_executor import (
 )
 from doge.core.ports.slot_signing_repository import ISlotSigningRepository, SlotSignerRevocation
 from doge.core.ports.unit_of_work import IAgentUnitOfWork
-from doge.core.ports.worker_queue import IRunQueue
+from doge.core.ports.worker_queue import IRunQueue, RunClaim
 from doge.core.ports.vector_store import IVectorStore, VectorRecord, VectorSearchResult
 
 __all__ = [
@@ -92,6 +93,7 @@ __all__ = [
     "ICodeExecutor",
     "ICompanyAnnouncementRepository",
     "IConsensusEstimateRepository",
+    "IDocumentExtractionQueue",
     "IDocumentRepository",
     "IEvidenceRepository",
     "IEmbeddingCache",
@@ -149,6 +151,7 @@ __all__ = [
     "ExecutionResult",
     "ModelExecutionResult",
     "RoutingDecision",
+    "RunClaim",
     "SlotActivationRecord",
     "SlotSignerRevocation",
     "TDXServer",
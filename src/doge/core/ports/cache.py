@@ -1,7 +1,9 @@
 """Abstract cache interfaces."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+from doge.core.ports.runtime_services import ToolResult
 
 
 class ITickerNameCache(ABC):
@@ -20,3 +22,32 @@ class ITickerNameCache(ABC):
     @abstractmethod
     def clear(self) -> None:
         ...
+
+
+class IToolResultCache(ABC):
+    """Interface for caching results of deterministic, read-only tools.
+
+    Keys are scoped by tenant and by the current market-data version. Callers
+    take the key *before* running the tool, so a result computed while the
+    data changed is filed under the old version and never served.
+    """
+
+    @abstractmethod
+    def key(self, tool_name: str, arguments: Dict[str, Any], tenant_id: Optional[str]) -> Optional[str]:
+        """Return the cache key for this call, or None if it cannot be cached."""
+        ...
+
+    @abstractmethod
+    def get(self, tool_name: str, key: str) -> Optional[ToolResult]:
+        """Return the cached result for ``key``, or None."""
+        ...
+
+    @abstractmethod
+    def put(self, tool_name: str, key: str, result: ToolResult) -> None:
+        """Cache a successful result under ``key``."""
+        ...
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Drop every entry, e.g. after a market scan wrote new data."""
+        ...
@@ -1,7 +1,7 @@
 """Abstract data source interfaces."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 import pandas as pd
 
 
@@ -39,6 +39,24 @@ class IMarketDataSource(ABC):
         """
         ...
 
+    def download_many(
+        self,
+        tickers: Iterable[str],
+        market: str,
+        start: int = 0,
+        count: int = 800,
+    ) -> Iterator[tuple[str, Optional[pd.DataFrame], Optional[str]]]:
+        """Download several tickers, yielding ``(ticker, frame, error)`` in ticker order.
+
+        ``error`` is the text of an unexpected exception for that ticker. The
+        default downloads one ticker at a time; pooled sources override it.
+        """
+        for ticker in tickers:
+            try:
+                yield ticker, self.download_kline(ticker, market, start=start, count=count), None
+            except Exception as e:
+                yield ticker, None, str(e)
+
     @abstractmethod
     def get_latest_market_date(self, market: str) -> Optional[str]:
         """Get the latest trading date from the data source."""
@@ -0,0 +1,76 @@
+"""Durable queue port for background document extraction."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from doge.core.domain.document_models import DocumentExtractionJob, DocumentExtractionStatus
+from doge.shared.scope import TenantScope
+
+
+class IDocumentExtractionQueue(ABC):
+    """One extraction job per document, leased to workers."""
+
+    @abstractmethod
+    def enqueue(
+        self,
+        document_id: str,
+        scope: TenantScope,
+        *,
+        file_hash: str | None = None,
+    ) -> DocumentExtractionJob:
+        """Queue *document_id* and return its job.
+
+        A live job for the same ``file_hash`` is returned as is, so
+        re-uploading a file is not extracted twice. A failed job, or one for
+        content that has since changed, is reset to ``pending``.
+        """
+        ...
+
+    @abstractmethod
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        limit: int,
+        max_attempts: int = 3,
+    ) -> list[DocumentExtractionJob]:
+        """Lease up to ``limit`` pending jobs or jobs whose lease expired.
+
+        Claimed pending jobs move to ``parsing``; jobs past ``max_attempts``
+        move to ``failed`` instead of being returned.
+        """
+        ...
+
+    @abstractmethod
+    def update(
+        self,
+        document_id: str,
+        status: DocumentExtractionStatus,
+        *,
+        worker_id: str,
+        page_count: int | None = None,
+        chunk_count: int | None = None,
+        error: str | None = None,
+    ) -> bool:
+        """Record the progress of a job *worker_id* holds; finished jobs release their lease.
+
+        Returns False, changing nothing, when the job is no longer leased to
+        *worker_id* (it expired and was claimed again).
+        """
+        ...
+
+    @abstractmethod
+    def get(self, document_id: str, scope: TenantScope) -> DocumentExtractionJob | None:
+        ...
+
+    def heartbeat(self, worker_id: str, document_id: str, lease_seconds: int) -> bool:
+        """Extend the lease *worker_id* holds on *document_id*; False if it was lost.
+
+        Queues without leases keep the default, which always succeeds.
+        """
+        return True
+
+    def queue_version(self) -> int | None:
+        """Return a value that changes when jobs are queued; ``None`` if untracked."""
+        return None
@@ -13,10 +13,22 @@ class IEmbeddingProvider(Protocol):
 
 
 class IEmbeddingCache(Protocol):
-    """Cache embeddings by stable content hash."""
+    """Cache embeddings by stable content hash.
+
+    ``get_many``/``set_many`` default to per-key ``get``/``set``; stores that
+    can do bulk I/O override them.
+    """
 
     def get(self, key: str) -> list[float] | None:
         ...
 
     def set(self, key: str, vector: list[float]) -> None:
         ...
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found = {key: self.get(key) for key in keys}
+        return {key: vector for key, vector in found.items() if vector is not None}
+
+    def set_many(self, vectors: dict[str, list[float]]) -> None:
+        for key, vector in vectors.items():
+            self.set(key, vector)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Iterable, Protocol
 
 from doge.core.domain.chunk_models import DocumentChunk
 from doge.core.domain.evidence_chunk_models import EvidenceChunk
@@ -23,6 +23,28 @@ class IEvidenceRepository(Protocol):
     def save_chunk(self, chunk: DocumentChunk, scope: TenantScope) -> None:
         ...
 
+    def save_document_extraction(
+        self,
+        document_id: str,
+        pages: Iterable[DocumentPage],
+        chunks: Iterable[DocumentChunk],
+        scope: TenantScope,
+    ) -> None:
+        """Upsert a batch of one document's pages and chunks in a single transaction.
+
+        Chunks previously stored for the batch's pages but absent from it are
+        deleted with their retrieval vectors, so a re-extracted page keeps only
+        its current chunks. The default saves row by row without that cleanup.
+        """
+        for page in pages:
+            self.save_page(page, scope)
+        for chunk in chunks:
+            self.save_chunk(chunk, scope)
+
+    def prune_document_extraction(self, document_id: str, page_count: int, scope: TenantScope) -> None:
+        """Delete the document's pages and chunks numbered past ``page_count``, with their vectors."""
+        ...
+
     def list_chunks(
         self,
         scope: TenantScope,
@@ -35,6 +57,27 @@ class IEvidenceRepository(Protocol):
         """Retrieve a single chunk by its chunk_id."""
         ...
 
+    def get_chunks(self, chunk_ids: list[str], scope: TenantScope) -> list[DocumentChunk]:
+        """Retrieve the accessible chunks among chunk_ids, in the order requested."""
+        ...
+
+    def list_unindexed_chunks(
+        self,
+        scope: TenantScope,
+        document_ids: list[str] | None = None,
+        limit: int = 256,
+    ) -> list[DocumentChunk]:
+        """List chunks that have not been indexed for retrieval yet."""
+        ...
+
+    def list_unindexed_tenants(self) -> list[str]:
+        """List the tenants that own chunks not yet indexed for retrieval."""
+        ...
+
+    def mark_chunks_indexed(self, chunks: list[DocumentChunk], scope: TenantScope) -> None:
+        """Record that chunks are present in the retrieval index, unless their source hash changed since."""
+        ...
+
     def list_chunks_for_run(self, run_id: str, scope: TenantScope) -> list[DocumentChunk]:
         """List all chunks associated with a given run_id via evidence records."""
         ...
@@ -7,7 +7,8 @@ abstracts reading already-downloaded TDX binary .day files from a local
 vipdoc directory.
 """
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, Optional
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping, Optional
 
 import pandas as pd
 
@@ -15,6 +16,37 @@ import pandas as pd
 ProgressCallback = Callable[[int, str], None]
 
 
+@dataclass(frozen=True)
+class TdxFileWatermark:
+    """What a local scan last saw of one ticker's ``.day`` file.
+
+    ``size`` and ``mtime_ns`` identify an unchanged file without opening it;
+    ``last_date`` is the newest bar already persisted, used to validate that
+    records appended past ``size`` really are new bars.
+    """
+
+    ticker: str
+    size: int
+    mtime_ns: int
+    last_date: str
+
+
+@dataclass(frozen=True)
+class LocalScanItem:
+    """One ticker's outcome from an incremental local scan.
+
+    ``unchanged`` items carry the existing watermark and no frame. Otherwise
+    ``frame`` holds the bars read (``None`` when nothing parseable was found)
+    and ``watermark`` is the value to persist once the frame is written; it
+    is ``None`` when the scanner cannot describe the file.
+    """
+
+    ticker: str
+    watermark: Optional[TdxFileWatermark] = None
+    frame: Optional[pd.DataFrame] = None
+    unchanged: bool = False
+
+
 class ITdxFileScanner(ABC):
     """Port for scanning local TDX .day files into canonical OHLCV frames."""
 
@@ -43,3 +75,20 @@ class ITdxFileScanner(ABC):
     def list_tickers(self, market: str, tdx_path: str) -> list[str]:
         """Return the tickers that would be scanned without parsing files."""
         ...
+
+    def scan_local_delta(
+        self,
+        market: str,
+        tdx_path: str,
+        watermarks: Mapping[str, TdxFileWatermark],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterable[LocalScanItem]:
+        """Yield per-ticker changes relative to ``watermarks``.
+
+        The default implementation cannot diff files: it wraps every
+        :meth:`scan_local` frame as a changed item without a watermark.
+        Scanners that can skip unchanged files override it.
+        """
+        for frame in self.scan_local(market, tdx_path, progress_callback=progress_callback):
+            ticker = str(frame["ticker"].iloc[0]) if "ticker" in frame.columns else ""
+            yield LocalScanItem(ticker=ticker, frame=frame)
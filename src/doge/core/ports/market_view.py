@@ -8,11 +8,44 @@ AC-9. See ADR-0010 for the port-injection decision.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Optional
 
 import pandas as pd
 
 
+class ViewQueryBudgetExceeded(RuntimeError):
+    """Raised when a paged query runs out of its time or memory budget."""
+
+
+@dataclass(frozen=True)
+class ViewQueryPage:
+    """One page of a query result.
+
+    ``total_rows`` is exact once the last page has been read, may be an
+    estimate (``total_is_estimate``) and is ``None`` when it was not counted.
+    """
+
+    frame: pd.DataFrame
+    has_more: bool
+    total_rows: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+@dataclass(frozen=True)
+class ViewCatalogEntry:
+    """Schema and size of one view, recorded when the views were refreshed.
+
+    ``columns`` holds ``(name, type)`` pairs; ``row_count`` is ``None`` when
+    the view failed to evaluate at refresh time.
+    """
+
+    name: str
+    columns: tuple[tuple[str, str], ...]
+    row_count: Optional[int]
+    refreshed_at: Optional[str]
+
+
 class IMarketViewRepository(ABC):
     """Read-only execution handle over the DuckDB analytical views.
 
@@ -33,3 +66,39 @@ class IMarketViewRepository(ABC):
             The query result as a :class:`pandas.DataFrame`.
         """
         ...
+
+    def query_page(
+        self,
+        sql: str,
+        params: Optional[list] = None,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        count_total: bool = False,
+        timeout_seconds: Optional[float] = None,
+        memory_limit: Optional[str] = None,
+    ) -> ViewQueryPage:
+        """Return rows ``offset .. offset + limit`` of *sql*.
+
+        Pages of one statement must come back in a stable order.
+        ``timeout_seconds`` and ``memory_limit`` are budgets an adapter may
+        enforce by raising :class:`ViewQueryBudgetExceeded`. The default
+        materializes the whole result, slices it in ``execute`` order and
+        enforces no budget; adapters override it to push the row cap into the
+        database.
+        """
+        frame = self.execute(sql, params)
+        end = offset + limit
+        return ViewQueryPage(
+            frame=frame.iloc[offset:end].reset_index(drop=True),
+            has_more=len(frame) > end,
+            total_rows=len(frame),
+        )
+
+    def view_catalog(self) -> Optional[list[ViewCatalogEntry]]:
+        """Return the view catalog recorded at the last refresh.
+
+        ``None`` means no catalog is available and callers must introspect
+        the views themselves.
+        """
+        return None
@@ -4,7 +4,10 @@ Implementations live in doge.infrastructure.database.repositories.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Iterable, List, Mapping, Optional
+
+from doge.core.ports.file_scanner import TdxFileWatermark
 
 
 class StorageWriteError(RuntimeError):
@@ -23,6 +26,19 @@ class StorageWriteError(RuntimeError):
     """
 
 
+@dataclass(frozen=True)
+class PriceBatchWriteResult:
+    """Per-ticker outcome of :meth:`IStockRepository.save_prices_batch`.
+
+    ``appended`` maps each successfully written ticker to the number of new
+    rows it gained; ``failed`` maps each rejected ticker to the write error
+    message. A ticker appears in exactly one of the two maps.
+    """
+
+    appended: dict[str, int] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+
+
 class IStockRepository(ABC):
     """Interface for stock price data access."""
 
@@ -92,6 +108,49 @@ class IStockRepository(ABC):
         """
         ...
 
+    def save_prices_batch(
+        self, market: str, frames: Iterable
+    ) -> PriceBatchWriteResult:
+        """Persist several per-ticker OHLCV frames in one bulk write.
+
+        The default implementation calls :meth:`save_prices` once per frame so
+        every repository supports the batch API; write-capable adapters
+        override it with a single-transaction ingest.
+
+        Args:
+            market: Market identifier (``"cn"`` or ``"us"``).
+            frames: Frames shaped as for :meth:`save_prices`, one ticker each.
+
+        Returns:
+            A :class:`PriceBatchWriteResult`. A ``StorageWriteError`` for one
+            ticker is recorded in ``failed`` and does not stop the batch.
+        """
+        result = PriceBatchWriteResult()
+        for frame in frames:
+            ticker = str(frame["ticker"].iloc[0])
+            try:
+                result.appended[ticker] = int(self.save_prices(market, frame) or 0)
+            except StorageWriteError as exc:
+                result.failed[ticker] = str(exc)
+        return result
+
+    def get_file_watermarks(self, market: str) -> Mapping[str, TdxFileWatermark]:
+        """Return the persisted local-scan file watermarks for ``market``.
+
+        The default has none, which makes every local scan a full scan.
+        """
+        return {}
+
+    def save_file_watermarks(
+        self, market: str, watermarks: Iterable[TdxFileWatermark]
+    ) -> None:
+        """Persist local-scan file watermarks after their frames were written.
+
+        The default discards them; write-capable adapters store them next to
+        the prices so the next ``tdx-local`` scan can skip unchanged files.
+        """
+        return None
+
     @abstractmethod
     def get_kline(self, ticker: str, market: str, days: int = 120) -> List[dict]:
         """Get OHLCV k-line data with moving-average indicators.
@@ -52,6 +52,12 @@ class IModelResponseAssembler(Protocol):
         ...
 
 
+class IModelDeltaStream(Protocol):
+    def tee(self, run_id: str, chunks: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Yield ``chunks`` unchanged while publishing live output deltas for ``run_id``."""
+        ...
+
+
 class IWebSearchStage(Protocol):
     async def execute(self, messages: list[Any], query: str) -> list[Any]:
         ...
@@ -91,6 +97,10 @@ class IToolExecutionService(Protocol):
     ) -> ToolResult:
         ...
 
+    def is_parallel_safe(self, context: EnterpriseContext | None, tool_name: str) -> bool:
+        """Return whether the call may run concurrently with others in its round."""
+        return False
+
     def audit(
         self,
         context: EnterpriseContext | None,
@@ -3,12 +3,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from doge.shared.scope import LOCAL_TENANT_ID
+
+
+@dataclass(frozen=True)
+class RunClaim:
+    """A run leased to a worker, with the scheduling facts used to pick it."""
+
+    run_id: str
+    tenant_id: str = LOCAL_TENANT_ID
+    priority: int = 0
+    queue_wait_seconds: float = 0.0
 
 
 class IRunQueue(ABC):
     @abstractmethod
-    def enqueue(self, run_id: str) -> None:
-        """Append a queued status for a run."""
+    def enqueue(self, run_id: str, priority: int | None = None) -> None:
+        """Append a queued status for a run; ``None`` keeps its previous priority."""
         ...
 
     @abstractmethod
@@ -21,6 +34,54 @@ class IRunQueue(ABC):
         """Atomically claim one queued or expired run for a worker."""
         ...
 
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        max_attempts: int = 3,
+        *,
+        max_per_tenant: int | None = None,
+    ) -> RunClaim | None:
+        """Claim the next run, highest priority first and fair across tenants.
+
+        ``max_per_tenant`` skips tenants that already hold that many live
+        leases. The default delegates to :meth:`claim_atomic` for queues that
+        do not track tenants or priorities.
+        """
+        run_id = self.claim_atomic(worker_id, lease_seconds, max_attempts)
+        return RunClaim(run_id) if run_id is not None else None
+
+    def claim_batch(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        limit: int,
+        max_attempts: int = 3,
+        *,
+        max_per_tenant: int | None = None,
+    ) -> list[RunClaim]:
+        """Claim up to ``limit`` runs in :meth:`claim` order.
+
+        The default claims one run at a time; durable queues override it to
+        lease the whole batch in one transaction.
+        """
+        claims: list[RunClaim] = []
+        while len(claims) < limit:
+            claim = self.claim(worker_id, lease_seconds, max_attempts, max_per_tenant=max_per_tenant)
+            if claim is None:
+                break
+            claims.append(claim)
+        return claims
+
+    def queue_version(self) -> int | None:
+        """Return a value that changes whenever any process writes to the queue.
+
+        Workers compare it between claims to wake up for runs enqueued
+        elsewhere without polling the claim query. ``None`` means the queue
+        cannot report changes and workers fall back to polling.
+        """
+        return None
+
     @abstractmethod
     def heartbeat(self, worker_id: str, run_id: str, lease_seconds: int) -> None:
         """Extend an active claim lease for the owning worker."""
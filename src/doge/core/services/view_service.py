@@ -1,9 +1,9 @@
 """DuckDB view introspection service."""
 
 import json
-from typing import List
+from typing import List, Optional
 
-from doge.core.ports.market_view import IMarketViewRepository
+from doge.core.ports.market_view import IMarketViewRepository, ViewCatalogEntry
 
 
 class ViewService:
@@ -12,13 +12,26 @@ class ViewService:
     Depends on the :class:`~doge.core.ports.market_view.IMarketViewRepository`
     port (per ADR-0010), so this service imports no infrastructure and is
     unit-testable with a fake repository.
+
+    Both listings answer from the view catalog recorded at the last view
+    refresh when the repository offers one, and only count each view live
+    when it does not.
     """
 
     def __init__(self, view: IMarketViewRepository):
         self._view = view
 
     def get_view_stats(self) -> dict:
-        """Return {view_name: {"row_count": int|None}} for all DuckDB views."""
+        """Return {view_name: {"row_count": int|None}} for all DuckDB views.
+
+        Catalog-backed entries also carry ``refreshed_at``.
+        """
+        catalog = self._catalog()
+        if catalog is not None:
+            return {
+                entry.name: {"row_count": entry.row_count, "refreshed_at": entry.refreshed_at}
+                for entry in catalog
+            }
         df = self._view.execute(
             "SELECT table_name FROM information_schema.tables WHERE table_type='VIEW'"
         )
@@ -35,10 +48,23 @@ class ViewService:
     def list_views(self) -> str:
         """Return a JSON envelope listing all DuckDB views with row counts.
 
-        The per-view count query is wrapped in a swallow-and-continue block so
+        Catalog-backed rows also carry ``refreshed_at``. Without a catalog the
+        per-view count query is wrapped in a swallow-and-continue block so
         one failing view does not break the whole listing. Used by the MCP
         ``list_views`` tool.
         """
+        catalog = self._catalog()
+        if catalog is not None:
+            rows = [
+                {
+                    "view": entry.name,
+                    "rows": entry.row_count,
+                    "columns": ", ".join(name for name, _type in entry.columns),
+                    "refreshed_at": entry.refreshed_at,
+                }
+                for entry in catalog
+            ]
+            return json.dumps(rows, indent=2, ensure_ascii=False)
         df = self._view.execute(
             "SELECT table_name FROM information_schema.tables WHERE table_type='VIEW'"
         )
@@ -58,4 +84,8 @@ class ViewService:
                 rows.append({"view": vn, "rows": None, "columns": ""})
         return json.dumps(rows, indent=2, ensure_ascii=False)
 
-
+    def _catalog(self) -> Optional[List[ViewCatalogEntry]]:
+        try:
+            return self._view.view_catalog()
+        except Exception:
+            return None
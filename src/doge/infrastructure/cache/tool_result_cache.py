@@ -0,0 +1,178 @@
+"""In-process, content-addressed cache for deterministic tool results.
+
+Market tools answer from the SQLite/DuckDB market files, so the same call
+returns the same rows until a scan writes new data. :class:`LRUToolResultCache`
+keys each result by a digest of
+
+* the tool name,
+* the canonical JSON form of the arguments (sorted keys),
+* the tenant the call runs for, and
+* a data-version watermark — the size and mtime of the market database files
+  plus a generation counter bumped by :meth:`~LRUToolResultCache.invalidate`.
+
+Results are stored as their JSON encoding: every hit decodes a fresh copy, so
+callers cannot mutate a cached entry, and the encoded length is what the LRU
+byte budget is charged. A scan running in another process changes the file
+watermark, so entries cached before it simply stop matching and age out.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from doge.config import get_settings
+from doge.core.ports.cache import IToolResultCache
+from doge.core.ports.runtime_services import ToolResult
+
+
+@dataclass
+class ToolCacheStats:
+    """Per-tool counters."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+class FileDataVersion:
+    """Watermark string derived from the size and mtime of data files."""
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        self._paths = tuple(Path(path) for path in paths)
+
+    def __call__(self) -> str:
+        parts = []
+        for path in self._paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                parts.append("-")
+                continue
+            parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+        return "|".join(parts)
+
+
+class LRUToolResultCache(IToolResultCache):
+    """Byte-bounded LRU of successful tool results."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        data_version: Callable[[], str] = lambda: "",
+    ) -> None:
+        self._max_bytes = max(1, max_bytes)
+        self._data_version = data_version
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[str, str, int]] = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._stats: Dict[str, ToolCacheStats] = {}
+
+    @classmethod
+    def from_settings(cls) -> Optional["LRUToolResultCache"]:
+        settings = get_settings()
+        if settings.db.tool_cache_max_bytes <= 0:
+            return None
+        db = settings.db
+        return cls(
+            max_bytes=db.tool_cache_max_bytes,
+            data_version=FileDataVersion((db.cn_db, db.us_db, db.duckdb)),
+        )
+
+    def key(self, tool_name: str, arguments: Dict[str, Any], tenant_id: Optional[str]) -> Optional[str]:
+        try:
+            canonical = json.dumps(arguments, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+        with self._lock:
+            generation = self._generation
+        material = "\x1f".join((tool_name, canonical, tenant_id or "", str(generation), self._data_version()))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, tool_name: str, key: str) -> Optional[ToolResult]:
+        with self._lock:
+            stats = self._stats.setdefault(tool_name, ToolCacheStats())
+            entry = self._entries.get(key)
+            if entry is None:
+                stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            stats.hits += 1
+        return ToolResult(name=tool_name, data=json.loads(entry[1]))
+
+    def put(self, tool_name: str, key: str, result: ToolResult) -> None:
+        if not result.ok or result.safe_error or result.evidence_refs:
+            return
+        try:
+            payload = json.dumps(result.data, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return
+        size = len(payload.encode("utf-8"))
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (tool_name, payload, size)
+            self._bytes += size
+            self._stats.setdefault(tool_name, ToolCacheStats()).stores += 1
+            while self._bytes > self._max_bytes and self._entries:
+                _, (evicted_tool, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats.setdefault(evicted_tool, ToolCacheStats()).evictions += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+
+    def stats(self) -> Dict[str, ToolCacheStats]:
+        with self._lock:
+            return {name: ToolCacheStats(**vars(stats)) for name, stats in self._stats.items()}
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "generation": self._generation,
+                "tools": {name: dict(vars(stats)) for name, stats in sorted(self._stats.items())},
+            }
+
+
+_CACHE: Optional[LRUToolResultCache] = None
+_CACHE_LOADED = False
+_CACHE_LOCK = threading.Lock()
+
+
+def get_tool_result_cache() -> Optional[LRUToolResultCache]:
+    """Return the process-wide cache, or None when it is disabled."""
+    global _CACHE, _CACHE_LOADED
+    with _CACHE_LOCK:
+        if not _CACHE_LOADED:
+            _CACHE = LRUToolResultCache.from_settings()
+            _CACHE_LOADED = True
+        return _CACHE
+
+
+def peek_tool_result_cache() -> Optional[LRUToolResultCache]:
+    """Return the process-wide cache only if one has been created."""
+    return _CACHE
+
+
+def invalidate_tool_result_cache() -> None:
+    """Drop every cached result of the process-wide cache, if there is one."""
+    cache = _CACHE
+    if cache is not None:
+        cache.invalidate()
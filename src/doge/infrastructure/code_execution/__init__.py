@@ -1,8 +1,11 @@
 """Infrastructure code execution adapters."""
 
 from doge.infrastructure.code_execution.python import DisabledCodeExecutor, SubprocessCodeExecutor
+from doge.infrastructure.code_execution.sandbox_pool import PooledSubprocessCodeExecutor, SandboxWorkerPool
 
 __all__ = [
     "DisabledCodeExecutor",
+    "PooledSubprocessCodeExecutor",
+    "SandboxWorkerPool",
     "SubprocessCodeExecutor",
 ]
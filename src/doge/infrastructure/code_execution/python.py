@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from typing import Any, Callable
 
 from doge.core.ports.code_executor import DisabledCodeExecutor, ExecutionResult, ICodeExecutor
+from doge.shared.cancellation import OperationCancelled, interrupt_on_cancel
 
 _SECRET_ENV_NAMES = frozenset(
     {
@@ -113,22 +114,32 @@ class SubprocessCodeExecutor(ICodeExecutor):
                     ok=False,
                     error="Python analysis code-string isolation is only available on Windows Job Objects in this prototype.",
                 )
-            completed = subprocess.run(
+            with subprocess.Popen(
                 [sys.executable, "-I", "-c", code],
                 text=True,
-                capture_output=True,
-                timeout=bounded_timeout,
-                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 cwd=scratch,
                 env=_sanitized_env(os.environ),
                 start_new_session=(os.name != "nt"),
                 creationflags=_windows_creation_flags(),
-            )
-        except subprocess.TimeoutExpired:
-            return ExecutionResult(ok=False, error="Python analysis timed out.")
+            ) as process:
+                # A cancelled tool call kills the interpreter instead of
+                # leaving it to run out its own timeout.
+                with interrupt_on_cancel(process.kill):
+                    try:
+                        stdout, stderr = process.communicate(timeout=bounded_timeout)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                        process.communicate()
+                        return ExecutionResult(ok=False, error="Python analysis timed out.")
+        except OperationCancelled:
+            return ExecutionResult(ok=False, error="Python analysis cancelled.")
         finally:
             shutil.rmtree(scratch, ignore_errors=True)
-        return _completed_process_result(completed)
+        return _completed_process_result(
+            subprocess.CompletedProcess(process.args, process.returncode, stdout=stdout, stderr=stderr)
+        )
 
     def _execute_with_windows_job_object(
         self,
@@ -0,0 +1,480 @@
+"""Pre-warmed sandbox interpreters for ``run_python_analysis``.
+
+``SubprocessCodeExecutor`` starts a fresh interpreter per call and pays Python
+startup plus the numpy/pandas import before any analysis code runs. With
+``DOGE_PYTHON_ANALYSIS_EXECUTOR=pooled`` the analysis runs on a
+:class:`SandboxWorkerPool` instead:
+
+* each worker is a long-lived *zygote* interpreter started like the plain
+  executor's child (``python -I``, scrubbed environment, scratch cwd) that
+  imports the heavy analysis modules once and then idles;
+* every execution forks a fresh child from a zygote. The child switches to the
+  call's scratch directory, sends stdout/stderr to private files and runs the
+  code in a new namespace. No state carries over between executions, but the
+  imports are already done;
+* the wall-clock timeout and cancellation kill the child, not the zygote;
+* a zygote is recycled after ``max_executions`` calls, or as soon as one of
+  its children breaches a limit — it timed out, died from a signal or raised
+  ``MemoryError``. The pool tops itself back up in the background.
+
+Forking needs POSIX. On Windows :class:`PooledSubprocessCodeExecutor` falls
+back to a plain :class:`SubprocessCodeExecutor`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import select
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from doge.core.ports.code_executor import ExecutionResult, ICodeExecutor
+from doge.infrastructure.code_execution.python import (
+    SubprocessCodeExecutor,
+    _bounded_timeout,
+    _completed_process_indicates_resource_limit,
+    _completed_process_result,
+    _sanitized_env,
+    _unsafe_python,
+)
+from doge.shared.cancellation import OperationCancelled, interrupt_on_cancel, raise_if_cancelled
+
+PRELOADED_MODULES = ("numpy", "pandas")
+
+# Native thread pools created at import time do not survive fork(); keep the
+# numeric libraries single-threaded inside the sandbox.
+_SINGLE_THREAD_ENV = {
+    "OMP_NUM_THREADS": "1",
+    "OPENBLAS_NUM_THREADS": "1",
+    "MKL_NUM_THREADS": "1",
+}
+
+_ZYGOTE_SOURCE = r"""
+import json, os, sys, traceback
+
+for _name in json.loads(sys.argv[1]):
+    try:
+        __import__(_name)
+    except Exception:
+        pass
+
+_rx = os.fdopen(os.dup(0), "rb")
+_tx = os.fdopen(os.dup(1), "wb")
+
+
+def _send(message):
+    _tx.write(json.dumps(message).encode("utf-8") + b"\n")
+    _tx.flush()
+
+
+def _child(job):
+    try:
+        _rx.close()
+        _tx.close()
+        os.chdir(job["cwd"])
+        null = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(null, 0)
+        for fd, path in ((1, job["stdout"]), (2, job["stderr"])):
+            target = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.dup2(target, fd)
+            os.close(target)
+        sys.argv = ["-c"]
+        code = compile(job["code"], "<string>", "exec")
+        exec(code, {"__name__": "__main__", "__builtins__": __builtins__})
+        status = 0
+    except SystemExit as exc:
+        if exc.code is None:
+            status = 0
+        elif isinstance(exc.code, int):
+            status = exc.code
+        else:
+            print(exc.code, file=sys.stderr)
+            status = 1
+    except BaseException:
+        kind, error, tb = sys.exc_info()
+        traceback.print_exception(kind, error, tb.tb_next)
+        status = 1
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        os._exit(status & 0xFF)
+
+
+_send({"ready": True})
+while True:
+    line = _rx.readline()
+    if not line:
+        break
+    job = json.loads(line)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        _child(job)
+    _send({"pid": pid})
+    _, status = os.waitpid(pid, 0)
+    _send({"returncode": os.waitstatus_to_exitcode(status)})
+"""
+
+
+class SandboxWorkerError(RuntimeError):
+    """Raised when a zygote stops answering or exits unexpectedly."""
+
+
+@dataclass(frozen=True)
+class SandboxPoolMetrics:
+    """Point-in-time counters of the sandbox worker pool."""
+
+    size: int
+    idle: int
+    busy: int
+    executions: int
+    warm_hits: int
+    cold_starts: int
+    recycled: int
+    limit_breaches: int
+    warm_hit_rate: float
+    p50_ms: float
+    p95_ms: float
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _SandboxWorker:
+    """One zygote interpreter and its line-delimited JSON channel."""
+
+    def __init__(self, preload: tuple[str, ...], startup_timeout: float) -> None:
+        env = _sanitized_env(os.environ)
+        env.update(_SINGLE_THREAD_ENV)
+        self._scratch = tempfile.mkdtemp(prefix="doge-python-sandbox-")
+        self.process = subprocess.Popen(
+            [sys.executable, "-I", "-c", _ZYGOTE_SOURCE, json.dumps(list(preload))],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self._scratch,
+            env=env,
+            start_new_session=True,
+        )
+        self._buffer = b""
+        self.executions = 0
+        try:
+            self._read(startup_timeout)
+        except BaseException:
+            self.close()
+            raise
+
+    def run(self, code: str, timeout: float, scratch: str, stdout_path: str, stderr_path: str) -> tuple[int | None, bool]:
+        """Run *code* in a forked child; return ``(returncode, timed_out)``."""
+        raise_if_cancelled()
+        self.executions += 1
+        job = {"code": code, "cwd": scratch, "stdout": stdout_path, "stderr": stderr_path}
+        self._write(job)
+        pid = int(self._read(10.0)["pid"])
+        try:
+            with interrupt_on_cancel(lambda: _kill(pid)):
+                try:
+                    return int(self._read(timeout)["returncode"]), False
+                except TimeoutError:
+                    _kill(pid)
+                    return int(self._read(5.0)["returncode"]), True
+        except OperationCancelled:
+            _kill(pid)
+            raise
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        shutil.rmtree(self._scratch, ignore_errors=True)
+
+    def _write(self, message: dict[str, Any]) -> None:
+        try:
+            self.process.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+            self.process.stdin.flush()
+        except OSError as exc:
+            raise SandboxWorkerError("sandbox worker is not accepting work") from exc
+
+    def _read(self, timeout: float) -> dict[str, Any]:
+        deadline = time.monotonic() + timeout
+        fd = self.process.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("sandbox worker did not answer in time")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise SandboxWorkerError("sandbox worker exited")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+
+class SandboxWorkerPool:
+    """Warm zygote interpreters that fork one child per execution.
+
+    Parameters
+    ----------
+    size:
+        Warm workers kept ready. A call that finds none idle starts a cold
+        one rather than waiting; workers beyond ``size`` are closed afterwards.
+    max_executions:
+        Executions after which a worker is replaced.
+    preload:
+        Modules each worker imports before it reports ready.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 2,
+        max_executions: int = 50,
+        preload: tuple[str, ...] = PRELOADED_MODULES,
+        startup_timeout: float = 60.0,
+    ) -> None:
+        self.size = max(1, size)
+        self.max_executions = max(1, max_executions)
+        self.preload = tuple(preload)
+        self._startup_timeout = startup_timeout
+        self._lock = threading.Lock()
+        self._idle: list[_SandboxWorker] = []
+        self._busy = 0
+        self._starting = 0
+        self._closed = False
+        self._executions = 0
+        self._warm_hits = 0
+        self._cold_starts = 0
+        self._recycled = 0
+        self._limit_breaches = 0
+        self._latencies_ms: deque[float] = deque(maxlen=512)
+
+    def warm(self) -> None:
+        """Start workers in the background until ``size`` are idle or starting."""
+        with self._lock:
+            if self._closed:
+                return
+            missing = self.size - len(self._idle) - self._busy - self._starting
+            if missing <= 0:
+                return
+            self._starting += missing
+        for _ in range(missing):
+            threading.Thread(target=self._start_idle_worker, name="doge-sandbox-warm", daemon=True).start()
+
+    def execute(self, code: str, timeout: float) -> ExecutionResult:
+        """Run *code* on a warm worker; the result matches the plain executor's."""
+        started = time.perf_counter()
+        worker, warm = self._checkout()
+        scratch = tempfile.mkdtemp(prefix="doge-python-analysis-")
+        io_dir = tempfile.mkdtemp(prefix="doge-python-io-")
+        stdout_path = os.path.join(io_dir, "stdout")
+        stderr_path = os.path.join(io_dir, "stderr")
+        breach = True
+        try:
+            returncode, timed_out = worker.run(code, timeout, scratch, stdout_path, stderr_path)
+            if timed_out:
+                return ExecutionResult(ok=False, error="Python analysis timed out.")
+            raise_if_cancelled()
+            completed = subprocess.CompletedProcess(
+                ["<sandbox>"],
+                returncode,
+                stdout=_read_text(stdout_path),
+                stderr=_read_text(stderr_path),
+            )
+            breach = (returncode is not None and returncode < 0) or _completed_process_indicates_resource_limit(completed)
+            return _completed_process_result(completed)
+        except OperationCancelled:
+            return ExecutionResult(ok=False, error="Python analysis cancelled.")
+        except (SandboxWorkerError, TimeoutError):
+            return ExecutionResult(ok=False, error="Python analysis worker failed.")
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+            shutil.rmtree(io_dir, ignore_errors=True)
+            self._checkin(worker, breach=breach)
+            with self._lock:
+                self._executions += 1
+                self._warm_hits += int(warm)
+                self._latencies_ms.append((time.perf_counter() - started) * 1000.0)
+
+    def metrics(self) -> SandboxPoolMetrics:
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+            executions = self._executions
+            return SandboxPoolMetrics(
+                size=self.size,
+                idle=len(self._idle),
+                busy=self._busy,
+                executions=executions,
+                warm_hits=self._warm_hits,
+                cold_starts=self._cold_starts,
+                recycled=self._recycled,
+                limit_breaches=self._limit_breaches,
+                warm_hit_rate=round(self._warm_hits / executions, 4) if executions else 0.0,
+                p50_ms=round(_percentile(latencies, 0.50), 3),
+                p95_ms=round(_percentile(latencies, 0.95), 3),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
+
+    def _checkout(self) -> tuple[_SandboxWorker, bool]:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("sandbox worker pool is closed")
+            self._busy += 1
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive:
+                    return worker, True
+                self._recycled += 1
+            self._cold_starts += 1
+        try:
+            return _SandboxWorker(self.preload, self._startup_timeout), False
+        except BaseException:
+            with self._lock:
+                self._busy -= 1
+            raise
+
+    def _checkin(self, worker: _SandboxWorker, *, breach: bool) -> None:
+        with self._lock:
+            self._busy -= 1
+            retire = breach or worker.executions >= self.max_executions or not worker.alive
+            keep = not retire and not self._closed and len(self._idle) < self.size
+            if keep:
+                self._idle.append(worker)
+            if retire:
+                self._recycled += 1
+                self._limit_breaches += int(breach)
+        if not keep:
+            worker.close()
+            self.warm()
+
+    def _start_idle_worker(self) -> None:
+        try:
+            worker = _SandboxWorker(self.preload, self._startup_timeout)
+        except Exception:  # noqa: BLE001 - the next execution starts a cold worker instead
+            with self._lock:
+                self._starting -= 1
+            return
+        with self._lock:
+            self._starting -= 1
+            keep = not self._closed and len(self._idle) < self.size
+            if keep:
+                self._idle.append(worker)
+        if not keep:
+            worker.close()
+
+
+class PooledSubprocessCodeExecutor(ICodeExecutor):
+    """Python analysis on pre-warmed, forked sandbox interpreters.
+
+    Same boundary as the soft :class:`SubprocessCodeExecutor` mode — denylist,
+    scrubbed env, scratch cwd, bounded wall-clock timeout — without paying
+    interpreter startup and the analysis imports on every call.
+    """
+
+    isolation_enabled = False
+    isolation_mode = "subprocess_soft"
+
+    def __init__(self, pool: SandboxWorkerPool | None = None) -> None:
+        self._fallback: Optional[SubprocessCodeExecutor] = None
+        if not hasattr(os, "fork"):
+            self._fallback = SubprocessCodeExecutor()
+            self._pool = None
+            return
+        self._pool = pool if pool is not None else get_sandbox_pool()
+        self._pool.warm()
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def executor_name(self) -> str:
+        return "subprocess" if self._pool is None else "subprocess_pool"
+
+    def execute(self, code: str, timeout: float) -> ExecutionResult:
+        if self._pool is None:
+            return self._fallback.execute(code, timeout)
+        if _unsafe_python(code):
+            return ExecutionResult(ok=False, error="Code uses disallowed operations in the demo sandbox.")
+        return self._pool.execute(code, _bounded_timeout(timeout))
+
+
+def _kill(pid: int) -> None:
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _read_text(path: str) -> str:
+    try:
+        with open(path, "rb") as handle:
+            return handle.read().decode("utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+_POOL: Optional[SandboxWorkerPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_sandbox_pool() -> SandboxWorkerPool:
+    """Return the process-wide sandbox pool, creating it on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = SandboxWorkerPool()
+        return _POOL
+
+
+def peek_sandbox_pool() -> Optional[SandboxWorkerPool]:
+    """Return the process-wide sandbox pool only if one has been created."""
+    return _POOL
+
+
+def shutdown_sandbox_pool() -> None:
+    """Close the process-wide sandbox pool and its idle workers."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
@@ -27,6 +27,12 @@ Design notes
 * ``download_kline`` uses ``tdx_helpers.bars_to_df`` to produce the canonical
   8-column frame
   ``["date", "open", "high", "low", "close", "volume", "amount", "ticker"]``.
+* With ``pool_size > 1`` (``DOGE_TDX_POOL_SIZE``) :meth:`connect` keeps up to
+  that many logged-in clients on the lowest-latency servers in a
+  :class:`TdxConnectionPool`. :meth:`download_many` then fetches tickers on a
+  thread per connection (the work is socket-bound), each request leasing one
+  idle connection and failing over to another host when it errors. Frames
+  are still yielded in ticker order to a single caller-side writer.
 * A bounded local retry loop wraps the per-ticker fetch and **returns None on
   exhaustion** (ADR-0004 item 2 — "No raises for transient failure"). The
   shared ``_retry.py`` helper extraction is deferred (ADR-0004 Migration Plan
@@ -40,7 +46,9 @@ Design notes
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Optional
 
 import pandas as pd
 
@@ -48,6 +56,7 @@ from doge.config import get_settings
 from doge.core.ports.data_source import IMarketDataSource
 from doge.infrastructure.data_source._retry import fetch_with_retry
 from doge.infrastructure.data_source import tdx_helpers
+from doge.infrastructure.data_source.tdx_pool import TdxConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -73,23 +82,38 @@ class TDXDataSource(IMarketDataSource):
     retry_delay:
         Fixed delay in seconds between retries. Mirrors the
         ``YFinanceDataSource`` parameter and ``macro/data_loader.py`` default.
+    preferred_server:
+        Connect to this host only, skipping the probe round and the pool.
+    pool_size:
+        Number of quotation-server connections to hold. ``None`` reads
+        ``get_settings().tdx.pool_size``; ``1`` keeps the single-client path.
     """
 
+    # Downloads kept in flight per pooled connection by ``download_many``.
+    QUEUE_DEPTH_PER_CONNECTION = 4
+
     def __init__(
         self,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
         preferred_server: str | None = None,
+        pool_size: int | None = None,
     ) -> None:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.preferred_server = preferred_server
+        if pool_size is None:
+            pool_size = get_settings().tdx.pool_size
+        self.pool_size = max(1, int(pool_size))
         # ``_client`` is the live ``TdxClient`` (or ``None`` when disconnected /
         # never connected / opentdx absent). ``_market`` remembers which server
         # family was probed so :meth:`disconnect` knows whether the US extended
         # quotation client needs tearing down too.
         self._client: Any = None
         self._market: Optional[str] = None
+        # ``_pool`` is only set when ``pool_size > 1``; ``_client`` then points
+        # at its healthiest connection for single-call compatibility.
+        self._pool: Optional[TdxConnectionPool] = None
 
     # ------------------------------------------------------------------
     # Connection lifecycle (TDX holds a real TCP session to a quote server)
@@ -97,6 +121,9 @@ class TDXDataSource(IMarketDataSource):
     def connect(self, market: str = "cn") -> None:
         """Probe TDX servers and store the first working ``TdxClient``.
 
+        With ``pool_size > 1`` every candidate is probed and the fastest
+        ``pool_size`` logged-in clients are kept in a connection pool instead.
+
         When ``opentdx`` is not installed, or no server can be reached, this
         method leaves :meth:`is_connected` returning ``False`` and never
         raises (ADR-0004 offline-tolerance contract).
@@ -108,12 +135,18 @@ class TDXDataSource(IMarketDataSource):
         """
         cfg = get_settings().tdx
         servers = list(cfg.cn_servers if market == "cn" else cfg.us_servers)
+        if self._pool is not None:
+            self.disconnect()
         if self.preferred_server:
             client = self._connect_preferred_server(market)
             self._client = client
             self._market = market if client is not None else None
             return
 
+        if self.pool_size > 1:
+            self._connect_pool(servers, market, cfg.timeout)
+            return
+
         try:
             client, _host = tdx_helpers.find_working_server(servers, market, timeout=cfg.timeout)
         except Exception as err:  # noqa: BLE001 - server probe raises varied errors
@@ -123,6 +156,29 @@ class TDXDataSource(IMarketDataSource):
         self._client = client
         self._market = market if client is not None else None
 
+    def _connect_pool(self, servers: list[str], market: str, timeout: float) -> None:
+        try:
+            clients = tdx_helpers.find_working_servers(
+                servers, market, timeout=timeout, limit=self.pool_size
+            )
+        except Exception as err:  # noqa: BLE001 - server probe raises varied errors
+            logger.warning("TDX pool probe failed for market=%s: %s", market, err)
+            clients = []
+        if not clients:
+            self._client = None
+            self._market = None
+            return
+        logger.info(
+            "TDX pool connected %d/%d client(s) for market=%s: %s",
+            len(clients),
+            self.pool_size,
+            market,
+            ", ".join(host for _client, host in clients),
+        )
+        self._pool = TdxConnectionPool(clients, market)
+        self._client = clients[0][0]
+        self._market = market
+
     def _connect_preferred_server(self, market: str) -> Any | None:
         cfg = get_settings().tdx
         port = cfg.cn_port if market == "cn" else cfg.us_port
@@ -160,6 +216,12 @@ class TDXDataSource(IMarketDataSource):
         Safe to call when already disconnected or when opentdx is absent
         (no-op in both cases).
         """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+            self._client = None
+            self._market = None
+            return
         client = self._client
         if client is None:
             return
@@ -179,6 +241,8 @@ class TDXDataSource(IMarketDataSource):
 
     def is_connected(self) -> bool:
         """Return ``True`` iff :meth:`connect` succeeded and stored a client."""
+        if self._pool is not None:
+            return self._pool.size > 0
         return self._client is not None
 
     # ------------------------------------------------------------------
@@ -209,7 +273,7 @@ class TDXDataSource(IMarketDataSource):
             retry attempt fails. **Never raises** for transient/empty/opentdx-
             absent conditions (ADR-0004 items 2 + 4).
         """
-        client = self._client
+        client: Any = self._pool if self._pool is not None else self._client
         if client is None:
             logger.warning("TDX download_kline called with no live client (ticker=%s)", ticker)
             return None
@@ -251,12 +315,79 @@ class TDXDataSource(IMarketDataSource):
                 return None
         return df[_OUTPUT_COLUMNS]
 
+    def download_many(
+        self,
+        tickers: Iterable[str],
+        market: str,
+        start: int = 0,
+        count: int = 800,
+    ) -> Iterator[tuple[str, Optional[pd.DataFrame], Optional[str]]]:
+        """Download *tickers* concurrently, yielding results in ticker order.
+
+        Yields ``(ticker, frame, error)`` where ``frame`` follows the
+        :meth:`download_kline` contract and ``error`` is the text of an
+        unexpected exception for that ticker, else ``None``. Without a pool this is a serial loop. With a
+        pool, one thread per connection drains a FIFO window of
+        ``QUEUE_DEPTH_PER_CONNECTION`` tickers per connection, so memory
+        stays flat and a slow ticker only holds back the results queued
+        behind it.
+        """
+        pool = self._pool
+        workers = pool.size if pool is not None else 1
+        if workers <= 1:
+            for ticker in tickers:
+                try:
+                    yield ticker, self.download_kline(ticker, market, start=start, count=count), None
+                except Exception as err:  # noqa: BLE001 - isolate per-ticker failures
+                    logger.error("TDX download failed for %s (%s): %s", ticker, market, err)
+                    yield ticker, None, str(err)
+            return
+
+        remaining = iter(tickers)
+        pending: deque[tuple[str, Future]] = deque()
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tdx-download")
+
+        def submit_next() -> None:
+            ticker = next(remaining, None)
+            if ticker is None:
+                return
+            pending.append(
+                (ticker, executor.submit(self.download_kline, ticker, market, start, count))
+            )
+
+        try:
+            for _ in range(workers * self.QUEUE_DEPTH_PER_CONNECTION):
+                submit_next()
+            while pending:
+                ticker, future = pending.popleft()
+                try:
+                    df, error = future.result(), None
+                except Exception as err:  # noqa: BLE001 - isolate per-ticker failures
+                    logger.error("TDX download failed for %s (%s): %s", ticker, market, err)
+                    df, error = None, str(err)
+                submit_next()
+                yield ticker, df, error
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def get_latest_market_date(self, market: str) -> Optional[str]:
         """Return the most recent trading date observable via TDX.
 
         Returns ``None`` when opentdx is absent, no connection is open, or the
         lookup fails (offline / empty proxy index). Never raises.
         """
+        if self._pool is not None:
+            conn = self._pool.acquire()
+            if conn is None:
+                return None
+            try:
+                return tdx_helpers.get_latest_market_date(conn.client, market)
+            except Exception as err:  # noqa: BLE001 - lookup failures degrade to None
+                logger.warning("TDX get_latest_market_date failed for %s: %s", market, err)
+                return None
+            finally:
+                self._pool.release(conn)
+
         client = self._client
         if client is None:
             return None
@@ -293,8 +424,12 @@ class TDXDataSource(IMarketDataSource):
         filtering), so this passes ``is_retryable=lambda _: True`` to
         preserve that behavior bit-for-bit.
 
+        When *client* is the :class:`TdxConnectionPool`, each attempt leases
+        a connection and fails over across the pooled hosts before counting
+        as one failed attempt (see :meth:`_fetch_failover`).
+
         Args:
-            client: Live ``TdxClient`` (opentdx).
+            client: Live ``TdxClient`` (opentdx) or the connection pool.
             ticker: Canonical ticker to fetch.
             market: ``"cn"`` or ``"us"``.
             start/count: Forwarded to the kline call.
@@ -306,7 +441,7 @@ class TDXDataSource(IMarketDataSource):
             ``list[dict]`` of bars from the TDX client, or ``None`` if every
             retry attempt failed.
         """
-        def _fetch() -> list:
+        def _fetch_one(tdx_client: Any) -> list:
             if market == "cn":
                 mkt, code = ticker_remap(ticker)
                 # ``mkt`` is None only when the ticker has no recognizable
@@ -314,12 +449,17 @@ class TDXDataSource(IMarketDataSource):
                 if mkt is None:  # pragma: no cover - defensive
                     from opentdx.const import MARKET  # type: ignore[import-not-found]
                     mkt = MARKET.SH
-                return client.stock_kline(mkt, code, period_enum.DAILY, start=start, count=count)
-            return client.goods_kline(
+                return tdx_client.stock_kline(mkt, code, period_enum.DAILY, start=start, count=count)
+            return tdx_client.goods_kline(
                 ex_market_enum.US_STOCK, ticker, period_enum.DAILY,
                 start=start, count=count,
             )
 
+        def _fetch() -> list:
+            if isinstance(client, TdxConnectionPool):
+                return self._fetch_failover(client, ticker, _fetch_one)
+            return _fetch_one(client)
+
         def _on_retry(attempt: int, max_retries: int, exc: BaseException) -> None:
             logger.info(
                 "TDX retry %d/%d for %s (%s)",
@@ -339,3 +479,31 @@ class TDXDataSource(IMarketDataSource):
             on_retry=_on_retry,
             label=f"TDX[{ticker}/{market}]",
         )
+
+    @staticmethod
+    def _fetch_failover(pool: TdxConnectionPool, ticker: str, fetch_one: Any) -> list:
+        """Run *fetch_one* on a leased connection, trying each host once.
+
+        Blocks for an idle connection (per-connection backpressure). A host
+        that errors is released as failed and excluded for this ticker; the
+        last error is re-raised once every pooled host has been tried.
+        """
+        tried: set[str] = set()
+        last_error: Optional[BaseException] = None
+        while True:
+            conn = pool.acquire(exclude=tried)
+            if conn is None:
+                break
+            try:
+                bars = fetch_one(conn.client)
+            except Exception as err:  # noqa: BLE001 - provider errors vary
+                pool.release(conn, ok=False)
+                tried.add(conn.host)
+                last_error = err
+                logger.info("TDX host %s failed for %s, failing over: %s", conn.host, ticker, err)
+                continue
+            pool.release(conn)
+            return bars
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError("no pooled TDX connection available")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import concurrent.futures
 import logging
+import time
 from typing import Any
 
 import pandas as pd
@@ -11,10 +12,41 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 
 
+def connect_client(host: str, market: str, timeout: float = 5) -> Any:
+    """Open and log in a ``TdxClient`` against *host*; raise on failure."""
+    from opentdx.tdxClient import TdxClient  # type: ignore[import-not-found]
+
+    client = TdxClient()
+    port = 7709 if market == "cn" else 7727
+    try:
+        client.quotation_client.connect(host, port=port, time_out=timeout)
+        client.quotation_client.login()
+        if market == "us":
+            client.ex_quotation_client.connect(host, port=7727, time_out=timeout)
+            client.ex_quotation_client.login()
+    except Exception:
+        close_client(client, market)
+        raise
+    return client
+
+
+def close_client(client: Any, market: str) -> None:
+    """Best-effort teardown of a client's quotation session(s)."""
+    sessions = ["quotation_client", "ex_quotation_client"] if market == "us" else ["quotation_client"]
+    for name in sessions:
+        session = getattr(client, name, None)
+        if session is None:
+            continue
+        try:
+            session.disconnect()
+        except Exception as err:  # noqa: BLE001 - teardown errors are non-fatal
+            logger.warning("TDX %s disconnect failed: %s", name, err)
+
+
 def find_working_server(servers: list[str], test_market: str, timeout: float = 5) -> tuple[Any | None, str | None]:
     """Probe configured TDX servers and return the first working client."""
     try:
-        from opentdx.tdxClient import TdxClient  # type: ignore[import-not-found]
+        from opentdx.tdxClient import TdxClient  # type: ignore[import-not-found]  # noqa: F401
     except ImportError:
         logger.info("opentdx unavailable; cannot probe TDX servers")
         return None, None
@@ -25,14 +57,7 @@ def find_working_server(servers: list[str], test_market: str, timeout: float = 5
 
     def _test(host: str) -> tuple[Any | None, str | None]:
         try:
-            client = TdxClient()
-            port = 7709 if test_market == "cn" else 7727
-            client.quotation_client.connect(host, port=port, time_out=timeout)
-            client.quotation_client.login()
-            if test_market == "us":
-                client.ex_quotation_client.connect(host, port=7727, time_out=timeout)
-                client.ex_quotation_client.login()
-            return client, host
+            return connect_client(host, test_market, timeout), host
         except Exception:
             return None, None
 
@@ -50,6 +75,71 @@ def find_working_server(servers: list[str], test_market: str, timeout: float = 5
     return None, None
 
 
+def find_working_servers(
+    servers: list[str],
+    test_market: str,
+    timeout: float = 5,
+    limit: int = 1,
+) -> list[tuple[Any, str]]:
+    """Probe every candidate and return up to *limit* logged-in clients.
+
+    Unlike :func:`find_working_server`, which keeps the first server to
+    answer, this waits for the whole probe round and ranks the survivors by
+    connect+login latency, so a connection pool starts on the healthiest
+    hosts. Clients beyond *limit* are disconnected before returning, and
+    probes that miss the round's deadline disconnect when they finish.
+    """
+    try:
+        from opentdx.tdxClient import TdxClient  # type: ignore[import-not-found]  # noqa: F401
+    except ImportError:
+        logger.info("opentdx unavailable; cannot probe TDX servers")
+        return []
+
+    candidates = list(dict.fromkeys(servers[:20]))
+    if not candidates or limit < 1:
+        return []
+
+    def _test(host: str) -> tuple[Any, str, float] | None:
+        started = time.perf_counter()
+        try:
+            client = connect_client(host, test_market, timeout)
+        except Exception:
+            return None
+        return client, host, time.perf_counter() - started
+
+    def _close_straggler(future: concurrent.futures.Future) -> None:
+        if future.cancelled():
+            return
+        probe = future.result()
+        if probe is not None:
+            close_client(probe[0], test_market)
+
+    working: list[tuple[Any, str, float]] = []
+    collected: set[concurrent.futures.Future] = set()
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(10, len(candidates)))
+    futures = [pool.submit(_test, host) for host in candidates]
+    try:
+        for future in concurrent.futures.as_completed(futures, timeout=timeout + 2):
+            collected.add(future)
+            probe = future.result()
+            if probe is not None:
+                working.append(probe)
+    except concurrent.futures.TimeoutError:
+        logger.info("TDX probe round timed out; %d server(s) answered", len(working))
+    finally:
+        # Probes still connecting lost the race; whatever client they end up
+        # with is disconnected as soon as they finish instead of leaking.
+        for future in futures:
+            if future not in collected:
+                future.add_done_callback(_close_straggler)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    working.sort(key=lambda probe: probe[2])
+    for client, _host, _latency in working[limit:]:
+        close_client(client, test_market)
+    return [(client, host) for client, host, _latency in working[:limit]]
+
+
 def ticker_to_market_code(ticker: str) -> tuple[Any | None, str]:
     """Map a canonical CN ticker suffix to the corresponding TDX market enum."""
     try:
@@ -0,0 +1,135 @@
+"""Pool of logged-in TDX quotation clients for concurrent downloads.
+
+A ``TdxClient`` wraps a single TCP session that is not safe to share between
+threads, so the pool leases each connection to exactly one caller at a time.
+That lease is the per-connection backpressure: a download thread blocks in
+:meth:`TdxConnectionPool.acquire` until one of the connections is idle.
+
+Connections that keep failing are evicted (and disconnected) so the
+remaining hosts absorb the load; :meth:`acquire` accepts an ``exclude`` set
+so a caller can fail a request over to a host it has not tried yet.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from doge.infrastructure.data_source import tdx_helpers
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failures after which a pooled connection is evicted.
+DEFAULT_MAX_FAILURES = 3
+
+
+@dataclass
+class PooledConnection:
+    """One logged-in client plus its lease and health bookkeeping."""
+
+    client: Any
+    host: str
+    busy: bool = False
+    failures: int = 0
+    requests: int = 0
+
+
+class TdxConnectionPool:
+    """Thread-safe lease pool over ``(client, host)`` pairs.
+
+    Parameters
+    ----------
+    clients:
+        Logged-in ``(client, host)`` pairs, healthiest first (the order
+        :func:`tdx_helpers.find_working_servers` returns).
+    market:
+        ``"cn"`` or ``"us"``; decides which sessions are torn down on close.
+    max_failures:
+        Consecutive failures after which a connection is evicted.
+    """
+
+    def __init__(
+        self,
+        clients: Iterable[tuple[Any, str]],
+        market: str,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+    ) -> None:
+        self._market = market
+        self._max_failures = max(1, max_failures)
+        self._connections = [PooledConnection(client=client, host=host) for client, host in clients]
+        self._cond = threading.Condition()
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Number of connections still in the pool."""
+        with self._cond:
+            return len(self._connections)
+
+    @property
+    def hosts(self) -> tuple[str, ...]:
+        with self._cond:
+            return tuple(conn.host for conn in self._connections)
+
+    def primary(self) -> Optional[Any]:
+        """Return the healthiest remaining client, or ``None`` when empty."""
+        with self._cond:
+            return self._connections[0].client if self._connections else None
+
+    def acquire(
+        self,
+        exclude: frozenset[str] | set[str] = frozenset(),
+        timeout: Optional[float] = None,
+    ) -> Optional[PooledConnection]:
+        """Lease an idle connection whose host is not in *exclude*.
+
+        Blocks while every eligible connection is busy. Returns ``None`` when
+        the pool is closed, no eligible connection remains, or *timeout*
+        elapses.
+        """
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                eligible = [conn for conn in self._connections if conn.host not in exclude]
+                if not eligible:
+                    return None
+                for conn in eligible:
+                    if not conn.busy:
+                        conn.busy = True
+                        conn.requests += 1
+                        return conn
+                if not self._cond.wait(timeout=timeout):
+                    return None
+
+    def release(self, conn: PooledConnection, ok: bool = True) -> None:
+        """Return a leased connection, evicting it after repeated failures."""
+        evicted = False
+        with self._cond:
+            conn.busy = False
+            if ok:
+                conn.failures = 0
+            else:
+                conn.failures += 1
+                if conn.failures >= self._max_failures and conn in self._connections:
+                    self._connections.remove(conn)
+                    evicted = True
+            self._cond.notify_all()
+        if evicted:
+            logger.warning(
+                "TDX host %s evicted from pool after %d consecutive failures",
+                conn.host,
+                conn.failures,
+            )
+            tdx_helpers.close_client(conn.client, self._market)
+
+    def close(self) -> None:
+        """Disconnect every pooled client and wake blocked callers."""
+        with self._cond:
+            connections, self._connections = self._connections, []
+            self._closed = True
+            self._cond.notify_all()
+        for conn in connections:
+            tdx_helpers.close_client(conn.client, self._market)
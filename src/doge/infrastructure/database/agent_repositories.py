@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -23,7 +24,12 @@ from doge.core.domain.agent_models import (
 from doge.core.domain.enterprise_context import IdentitySnapshot
 from doge.core.domain.model_policy import ModelPolicy
 from doge.core.domain.run_execution_context import WorkflowRunContext
-from doge.core.domain.document_models import Document, DocumentStatus
+from doge.core.domain.document_models import (
+    Document,
+    DocumentExtractionJob,
+    DocumentExtractionStatus,
+    DocumentStatus,
+)
 from doge.core.ports.agent_repository import (
     IApprovalRepository,
     IArtifactRepository,
@@ -32,17 +38,23 @@ from doge.core.ports.agent_repository import (
     IRunRepository,
     ISessionRepository,
 )
+from doge.core.ports.document_extraction_queue import IDocumentExtractionQueue
 from doge.core.ports.idempotency_store import IIdempotencyStore
-from doge.core.ports.worker_queue import IRunQueue
+from doge.core.ports.worker_queue import IRunQueue, RunClaim
 from doge.infrastructure.database.migration_runner import apply_context_migrations
 from doge.infrastructure.database.sqlite import SQLiteConnection
 from doge.infrastructure.database.tenant_guard import (
     LOCAL_TENANT_ID,
     guard_existing_tenant,
+    require_same_tenant,
     resolve_tenant_id,
 )
 from doge.shared.scope import TenantScope
 
+# Queue watchers poll every few milliseconds; a locked database just means
+# "check again next tick", so they never wait long on the busy handler.
+_WATCH_TIMEOUT_SECONDS = 1.0
+
 
 def _schema_path() -> Path:
     return Path(__file__).resolve().with_name("agent_schema.sql")
@@ -381,6 +393,39 @@ class SQLiteEventRepository(_BaseAgentRepository, IEventRepository):
             rows = conn.execute(sql, params).fetchall()
             return [_row_to_event(row) for row in rows]
 
+    def last_rowid(self) -> int:
+        """Return the highest events rowid, the starting cursor for :meth:`tail`."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT COALESCE(MAX(rowid), 0) AS last_rowid FROM events").fetchone()
+            return int(row["last_rowid"])
+
+    def tail(
+        self,
+        after_rowid: int,
+        run_ids: list[str] | None = None,
+        limit: int = 500,
+    ) -> tuple[int, list[tuple[int, AgentEvent]]]:
+        """Return the next cursor and ``(rowid, event)`` pairs appended after ``after_rowid``.
+
+        The cursor is the highest rowid the query covered, not the last
+        matching one, so rows of runs outside ``run_ids`` are stepped over
+        once instead of being rescanned on every call. It only stops at the
+        last returned row when ``limit`` cut the batch short.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT COALESCE(MAX(rowid), 0) AS last_rowid FROM events").fetchone()
+            upper = max(int(row["last_rowid"]), after_rowid)
+            sql = "SELECT rowid AS event_rowid, * FROM events WHERE rowid > ? AND rowid <= ?"
+            params: tuple[Any, ...] = (after_rowid, upper)
+            if run_ids is not None:
+                sql += f" AND run_id IN ({', '.join('?' for _ in run_ids)})"
+                params += tuple(run_ids)
+            sql += " ORDER BY rowid ASC LIMIT ?"
+            rows = conn.execute(sql, (*params, limit)).fetchall()
+        events = [(int(row["event_rowid"]), _row_to_event(row)) for row in rows]
+        cursor = events[-1][0] if len(events) >= limit else upper
+        return cursor, events
+
 
 class SQLiteArtifactRepository(_BaseAgentRepository, IArtifactRepository):
     def save(self, artifact: AgentArtifact, tenant_id: str | None = None) -> None:
@@ -624,64 +669,375 @@ class SQLiteDocumentRepository(_BaseAgentRepository, IDocumentRepository):
             return [_row_to_document_dict(row) for row in rows]
 
 
+class SQLiteDocumentExtractionQueue(_BaseAgentRepository, IDocumentExtractionQueue):
+    """Durable document extraction jobs in the agent database."""
+
+    def __init__(self, db_path: Path | str | None = None) -> None:
+        super().__init__(db_path)
+        self._watch_lock = threading.Lock()
+        self._watch_conn: sqlite3.Connection | None = None
+        self._watch_data_version: int | None = None
+        self._watch_pending: tuple[int, str] | None = None
+        self._watch_version = 0
+
+    def queue_version(self) -> int | None:
+        """Return a counter bumped whenever the set of pending jobs changes.
+
+        The pending snapshot is re-read only after a foreign commit, as in
+        :meth:`SQLiteRunQueue.queue_version`.
+        """
+        with self._watch_lock:
+            if self._watch_conn is None:
+                self._watch_conn = sqlite3.connect(
+                    str(self._db_path), timeout=_WATCH_TIMEOUT_SECONDS, check_same_thread=False
+                )
+            data_version = int(self._watch_conn.execute("PRAGMA data_version").fetchone()[0])
+            if data_version != self._watch_data_version:
+                row = self._watch_conn.execute(
+                    "SELECT COUNT(*), COALESCE(MAX(updated_at), '') FROM document_extraction_jobs WHERE status = ?",
+                    (DocumentExtractionStatus.PENDING.value,),
+                ).fetchone()
+                self._watch_data_version = data_version
+                pending = (int(row[0] or 0), str(row[1]))
+                if pending != self._watch_pending:
+                    self._watch_pending = pending
+                    self._watch_version += 1
+            return self._watch_version
+
+    def enqueue(
+        self,
+        document_id: str,
+        scope: TenantScope | str | None = None,
+        *,
+        file_hash: str | None = None,
+        tenant_id: str | None = None,
+    ) -> DocumentExtractionJob:
+        effective_tenant_id = resolve_tenant_id(None, _tenant_id_from_scope(scope, tenant_id))
+        now = utc_now()
+        with self._connect() as conn:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                existing = conn.execute(
+                    "SELECT * FROM document_extraction_jobs WHERE document_id = ?", (document_id,)
+                ).fetchone()
+                if existing is not None:
+                    require_same_tenant(
+                        existing["tenant_id"],
+                        effective_tenant_id,
+                        resource=f"document_extraction_jobs.document_id={document_id}",
+                    )
+                    unchanged = file_hash is None or existing["file_hash"] == file_hash
+                    if unchanged and existing["status"] != DocumentExtractionStatus.FAILED.value:
+                        conn.commit()
+                        return _row_to_extraction_job(existing)
+                conn.execute(
+                    """
+                    INSERT INTO document_extraction_jobs(
+                        document_id, tenant_id, file_hash, status, attempt_count, created_at, updated_at
+                    )
+                    VALUES (?, ?, ?, ?, 0, ?, ?)
+                    ON CONFLICT(document_id) DO UPDATE SET
+                        file_hash = excluded.file_hash,
+                        status = excluded.status,
+                        attempt_count = 0,
+                        worker_id = NULL,
+                        lease_expires_at = NULL,
+                        error = NULL,
+                        updated_at = excluded.updated_at
+                    """,
+                    (document_id, effective_tenant_id, file_hash, DocumentExtractionStatus.PENDING.value, now, now),
+                )
+                row = conn.execute(
+                    "SELECT * FROM document_extraction_jobs WHERE document_id = ?", (document_id,)
+                ).fetchone()
+                conn.commit()
+                return _row_to_extraction_job(row)
+            except Exception:
+                conn.rollback()
+                raise
+
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        limit: int,
+        max_attempts: int = 3,
+    ) -> list[DocumentExtractionJob]:
+        if limit <= 0:
+            return []
+        now = utc_now()
+        lease_expires_at = _seconds_from_now(lease_seconds)
+        claims: list[DocumentExtractionJob] = []
+        with self._connect() as conn:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                candidates = conn.execute(
+                    """
+                    SELECT * FROM document_extraction_jobs
+                    WHERE status = ?
+                       OR (status IN (?, ?) AND (lease_expires_at IS NULL OR lease_expires_at <= ?))
+                    ORDER BY created_at ASC
+                    LIMIT ?
+                    """,
+                    (
+                        DocumentExtractionStatus.PENDING.value,
+                        DocumentExtractionStatus.PARSING.value,
+                        DocumentExtractionStatus.CHUNKED.value,
+                        now,
+                        # Spare rows cover jobs that are failed here for running out of attempts.
+                        limit * 4,
+                    ),
+                ).fetchall()
+                for row in candidates:
+                    if len(claims) >= limit:
+                        break
+                    attempt_count = int(row["attempt_count"] or 0) + 1
+                    if attempt_count > max_attempts:
+                        conn.execute(
+                            """
+                            UPDATE document_extraction_jobs
+                            SET status = ?, worker_id = NULL, lease_expires_at = NULL,
+                                error = COALESCE(error, 'extraction lease expired'), updated_at = ?
+                            WHERE document_id = ?
+                            """,
+                            (DocumentExtractionStatus.FAILED.value, now, row["document_id"]),
+                        )
+                        continue
+                    # Chunked jobs only lack indexing and resume there.
+                    status = row["status"]
+                    if status == DocumentExtractionStatus.PENDING.value:
+                        status = DocumentExtractionStatus.PARSING.value
+                    conn.execute(
+                        """
+                        UPDATE document_extraction_jobs
+                        SET status = ?, worker_id = ?, lease_expires_at = ?, attempt_count = ?, updated_at = ?
+                        WHERE document_id = ?
+                        """,
+                        (status, worker_id, lease_expires_at, attempt_count, now, row["document_id"]),
+                    )
+                    claimed = conn.execute(
+                        "SELECT * FROM document_extraction_jobs WHERE document_id = ?", (row["document_id"],)
+                    ).fetchone()
+                    claims.append(_row_to_extraction_job(claimed))
+                conn.commit()
+                return claims
+            except Exception:
+                conn.rollback()
+                raise
+
+    def update(
+        self,
+        document_id: str,
+        status: DocumentExtractionStatus,
+        *,
+        worker_id: str,
+        page_count: int | None = None,
+        chunk_count: int | None = None,
+        error: str | None = None,
+    ) -> bool:
+        finished = status in {DocumentExtractionStatus.INDEXED, DocumentExtractionStatus.FAILED}
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE document_extraction_jobs
+                SET status = ?,
+                    page_count = COALESCE(?, page_count),
+                    chunk_count = COALESCE(?, chunk_count),
+                    error = ?,
+                    worker_id = CASE WHEN ? THEN NULL ELSE worker_id END,
+                    lease_expires_at = CASE WHEN ? THEN NULL ELSE lease_expires_at END,
+                    updated_at = ?
+                WHERE document_id = ? AND worker_id = ?
+                """,
+                (status.value, page_count, chunk_count, error, finished, finished, utc_now(), document_id, worker_id),
+            )
+            conn.commit()
+            return cursor.rowcount == 1
+
+    def heartbeat(self, worker_id: str, document_id: str, lease_seconds: int) -> bool:
+        now = utc_now()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE document_extraction_jobs
+                SET lease_expires_at = ?, updated_at = ?
+                WHERE document_id = ? AND worker_id = ? AND status IN (?, ?)
+                """,
+                (
+                    _seconds_from_now(lease_seconds),
+                    now,
+                    document_id,
+                    worker_id,
+                    DocumentExtractionStatus.PARSING.value,
+                    DocumentExtractionStatus.CHUNKED.value,
+                ),
+            )
+            conn.commit()
+            return cursor.rowcount == 1
+
+    def get(
+        self,
+        document_id: str,
+        scope: TenantScope | str | None = None,
+        *,
+        tenant_id: str | None = None,
+    ) -> DocumentExtractionJob | None:
+        sql = "SELECT * FROM document_extraction_jobs WHERE document_id = ?"
+        tenant_sql, tenant_params = _tenant_filter("tenant_id", _tenant_id_from_scope(scope, tenant_id))
+        with self._connect() as conn:
+            row = conn.execute(sql + tenant_sql, (document_id, *tenant_params)).fetchone()
+            return _row_to_extraction_job(row) if row else None
+
+
 class SQLiteRunQueue(_BaseAgentRepository, IRunQueue):
-    def enqueue(self, run_id: str) -> None:
-        self.append_status(run_id, "queued")
+    def __init__(self, db_path: Path | str | None = None) -> None:
+        super().__init__(db_path)
+        self._watch_lock = threading.Lock()
+        self._watch_conn: sqlite3.Connection | None = None
+        self._watch_data_version: int | None = None
+        self._watch_queue_id = 0
+
+    def queue_version(self) -> int | None:
+        """Return the newest ``run_queue`` id, re-read only after foreign commits.
+
+        ``PRAGMA data_version`` on a dedicated read connection changes only
+        when another connection (in this process or another one) commits, so
+        an idle queue is watched without touching any table.
+        """
+        with self._watch_lock:
+            if self._watch_conn is None:
+                self._watch_conn = sqlite3.connect(
+                    str(self._db_path), timeout=_WATCH_TIMEOUT_SECONDS, check_same_thread=False
+                )
+            data_version = int(self._watch_conn.execute("PRAGMA data_version").fetchone()[0])
+            if data_version != self._watch_data_version:
+                row = self._watch_conn.execute("SELECT MAX(queue_id) FROM run_queue").fetchone()
+                self._watch_data_version = data_version
+                self._watch_queue_id = int(row[0] or 0)
+            return self._watch_queue_id
+
+    def enqueue(self, run_id: str, priority: int | None = None) -> None:
+        self.append_status(run_id, "queued", priority=priority)
 
     def dequeue(self) -> str | None:
         return self.claim_atomic("legacy-worker", lease_seconds=30)
 
     def claim_atomic(self, worker_id: str, lease_seconds: int, max_attempts: int = 3) -> str | None:
+        claim = self.claim(worker_id, lease_seconds, max_attempts)
+        return claim.run_id if claim is not None else None
+
+    def claim(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        max_attempts: int = 3,
+        *,
+        max_per_tenant: int | None = None,
+    ) -> RunClaim | None:
+        """Lease the next claimable run (see :meth:`claim_batch`)."""
+        claims = self.claim_batch(worker_id, lease_seconds, 1, max_attempts, max_per_tenant=max_per_tenant)
+        return claims[0] if claims else None
+
+    def claim_batch(
+        self,
+        worker_id: str,
+        lease_seconds: int,
+        limit: int,
+        max_attempts: int = 3,
+        *,
+        max_per_tenant: int | None = None,
+    ) -> list[RunClaim]:
+        """Lease up to ``limit`` claimable runs in one transaction.
+
+        Candidates are the runs whose current queue row is ``queued`` or an
+        expired ``running`` lease, read from ``run_queue_head`` through its
+        ``(status, lease_expires_at)`` index. They are taken by priority, then
+        by how many live leases their tenant holds (counting the tenant's runs
+        ahead of them in the batch), then by queue order, so one busy tenant
+        cannot starve the others at the same priority. The ordering and the
+        per-tenant cap are applied in SQL and only a bounded window is read.
+        """
+        if limit <= 0:
+            return []
         now = utc_now()
         lease_expires_at = _seconds_from_now(lease_seconds)
+        tenant_cap = max(1, max_per_tenant) if max_per_tenant is not None else None
+        claims: list[RunClaim] = []
         with self._connect() as conn:
             try:
                 conn.execute("BEGIN IMMEDIATE")
-                row = conn.execute(
-                    """
-                    SELECT q.*
-                    FROM run_queue q
-                    JOIN (
-                        SELECT run_id, MAX(queue_id) AS max_queue_id
-                        FROM run_queue
-                        GROUP BY run_id
-                    ) latest
-                    ON q.run_id = latest.run_id AND q.queue_id = latest.max_queue_id
-                    WHERE q.status = 'queued'
-                       OR (q.status = 'running' AND (q.lease_expires_at IS NULL OR q.lease_expires_at <= ?))
-                    ORDER BY q.queue_id ASC
-                    LIMIT 1
+                candidates = conn.execute(
+                    f"""
+                    WITH candidates AS (
+                        SELECT q.*, COALESCE(r.tenant_id, '{LOCAL_TENANT_ID}') AS queue_tenant_id
+                        FROM run_queue_head h
+                        JOIN run_queue q ON q.queue_id = h.queue_id
+                        LEFT JOIN runs r ON r.run_id = h.run_id
+                        WHERE h.status = 'queued'
+                           OR (h.status = 'running' AND h.lease_expires_at <= :now)
+                           OR (h.status = 'running' AND h.lease_expires_at IS NULL)
+                    ),
+                    leased AS (
+                        SELECT COALESCE(r.tenant_id, '{LOCAL_TENANT_ID}') AS queue_tenant_id, COUNT(*) AS leased
+                        FROM run_queue_head h
+                        LEFT JOIN runs r ON r.run_id = h.run_id
+                        WHERE h.status = 'running' AND h.lease_expires_at > :now
+                        GROUP BY queue_tenant_id
+                    ),
+                    ranked AS (
+                        SELECT c.*,
+                            COALESCE(l.leased, 0) - 1 + ROW_NUMBER() OVER (
+                                PARTITION BY c.queue_tenant_id
+                                ORDER BY COALESCE(c.priority, 0) DESC, c.queue_id ASC
+                            ) AS tenant_load
+                        FROM candidates c
+                        LEFT JOIN leased l ON l.queue_tenant_id = c.queue_tenant_id
+                    )
+                    SELECT * FROM ranked
+                    WHERE :tenant_cap IS NULL OR tenant_load < :tenant_cap
+                    ORDER BY COALESCE(priority, 0) DESC, tenant_load ASC, queue_id ASC
+                    LIMIT :scan
                     """,
-                    (now,),
-                ).fetchone()
-                if row is None:
-                    conn.commit()
-                    return None
-                attempt_count = int(_row_value(row, "attempt_count") or 0) + 1
-                if attempt_count > max_attempts:
+                    # Spare rows cover runs that are dead-lettered here instead of claimed.
+                    {"now": now, "tenant_cap": tenant_cap, "scan": limit * 4},
+                ).fetchall()
+                for row in candidates:
+                    if len(claims) >= limit:
+                        break
+                    priority = int(_row_value(row, "priority") or 0)
+                    attempt_count = int(_row_value(row, "attempt_count") or 0) + 1
+                    if attempt_count > max_attempts:
+                        conn.execute(
+                            """
+                            INSERT INTO run_queue(
+                                run_id, status, attempt_count, priority, created_at, updated_at
+                            )
+                            VALUES (?, 'dead_letter', ?, ?, ?, ?)
+                            """,
+                            (row["run_id"], attempt_count - 1, priority, now, now),
+                        )
+                        continue
                     conn.execute(
                         """
                         INSERT INTO run_queue(
-                            run_id, status, attempt_count, created_at, updated_at
+                            run_id, status, worker_id, leased_at, lease_expires_at,
+                            attempt_count, priority, created_at, updated_at
                         )
-                        VALUES (?, 'dead_letter', ?, ?, ?)
+                        VALUES (?, 'running', ?, ?, ?, ?, ?, ?, ?)
                         """,
-                        (row["run_id"], int(_row_value(row, "attempt_count") or 0), now, now),
+                        (row["run_id"], worker_id, now, lease_expires_at, attempt_count, priority, now, now),
                     )
-                    conn.commit()
-                    return None
-                conn.execute(
-                    """
-                    INSERT INTO run_queue(
-                        run_id, status, worker_id, leased_at, lease_expires_at,
-                        attempt_count, created_at, updated_at
+                    queued_since = row["lease_expires_at"] if row["status"] == "running" else row["created_at"]
+                    claims.append(
+                        RunClaim(
+                            run_id=row["run_id"],
+                            tenant_id=row["queue_tenant_id"],
+                            priority=priority,
+                            queue_wait_seconds=_seconds_since(queued_since, now),
+                        )
                     )
-                    VALUES (?, 'running', ?, ?, ?, ?, ?, ?)
-                    """,
-                    (row["run_id"], worker_id, now, lease_expires_at, attempt_count, now, now),
-                )
                 conn.commit()
-                return row["run_id"]
+                return claims
             except Exception:
                 conn.rollback()
                 raise
@@ -728,11 +1084,19 @@ class SQLiteRunQueue(_BaseAgentRepository, IRunQueue):
                 conn.execute(
                     """
                     INSERT INTO run_queue(
-                        run_id, status, worker_id, attempt_count, created_at, updated_at
+                        run_id, status, worker_id, attempt_count, priority, created_at, updated_at
                     )
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (run_id, final_status, worker_id, int(row["attempt_count"] or 0), now, now),
+                    (
+                        run_id,
+                        final_status,
+                        worker_id,
+                        int(row["attempt_count"] or 0),
+                        int(_row_value(row, "priority") or 0),
+                        now,
+                        now,
+                    ),
                 )
                 conn.commit()
             except Exception:
@@ -768,26 +1132,27 @@ class SQLiteRunQueue(_BaseAgentRepository, IRunQueue):
                 ).fetchall()
                 for row in rows:
                     attempt_count = int(row["attempt_count"] or 0)
+                    priority = int(_row_value(row, "priority") or 0)
                     if attempt_count >= max_attempts:
                         conn.execute(
                             """
                             INSERT INTO run_queue(
-                                run_id, status, attempt_count, created_at, updated_at
+                                run_id, status, attempt_count, priority, created_at, updated_at
                             )
-                            VALUES (?, 'dead_letter', ?, ?, ?)
+                            VALUES (?, 'dead_letter', ?, ?, ?, ?)
                             """,
-                            (row["run_id"], attempt_count, now, now),
+                            (row["run_id"], attempt_count, priority, now, now),
                         )
                         continue
                     recovered.append(row["run_id"])
                     conn.execute(
                         """
                         INSERT INTO run_queue(
-                            run_id, status, attempt_count, created_at, updated_at
+                            run_id, status, attempt_count, priority, created_at, updated_at
                         )
-                        VALUES (?, 'queued', ?, ?, ?)
+                        VALUES (?, 'queued', ?, ?, ?, ?)
                         """,
-                        (row["run_id"], attempt_count, now, now),
+                        (row["run_id"], attempt_count, priority, now, now),
                     )
                 conn.commit()
                 return recovered
@@ -799,16 +1164,9 @@ class SQLiteRunQueue(_BaseAgentRepository, IRunQueue):
         with self._connect() as conn:
             rows = conn.execute(
                 """
-                SELECT q.run_id
-                FROM run_queue q
-                JOIN (
-                    SELECT run_id, MAX(queue_id) AS max_queue_id
-                    FROM run_queue
-                    GROUP BY run_id
-                ) latest
-                ON q.run_id = latest.run_id AND q.queue_id = latest.max_queue_id
-                WHERE q.status = 'queued'
-                ORDER BY q.queue_id ASC
+                SELECT run_id FROM run_queue_head
+                WHERE status = 'queued'
+                ORDER BY queue_id ASC
                 """
             ).fetchall()
             return [row["run_id"] for row in rows]
@@ -816,26 +1174,16 @@ class SQLiteRunQueue(_BaseAgentRepository, IRunQueue):
     def status_summary(self) -> dict[str, int]:
         with self._connect() as conn:
             rows = conn.execute(
-                """
-                SELECT q.status, COUNT(*) AS count
-                FROM run_queue q
-                JOIN (
-                    SELECT run_id, MAX(queue_id) AS max_queue_id
-                    FROM run_queue
-                    GROUP BY run_id
-                ) latest
-                ON q.run_id = latest.run_id AND q.queue_id = latest.max_queue_id
-                GROUP BY q.status
-                """
+                "SELECT status, COUNT(*) AS count FROM run_queue_head GROUP BY status"
             ).fetchall()
             return {str(row["status"]): int(row["count"]) for row in rows}
 
-    def append_status(self, run_id: str, status: str) -> None:
+    def append_status(self, run_id: str, status: str, *, priority: int | None = None) -> None:
         now = utc_now()
         with self._connect() as conn:
             row = conn.execute(
                 """
-                SELECT attempt_count FROM run_queue
+                SELECT attempt_count, priority FROM run_queue
                 WHERE run_id = ?
                 ORDER BY queue_id DESC
                 LIMIT 1
@@ -843,12 +1191,14 @@ class SQLiteRunQueue(_BaseAgentRepository, IRunQueue):
                 (run_id,),
             ).fetchone()
             attempt_count = int(row["attempt_count"] or 0) if row else 0
+            if priority is None:
+                priority = int(row["priority"] or 0) if row else 0
             conn.execute(
                 """
-                INSERT INTO run_queue(run_id, status, attempt_count, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO run_queue(run_id, status, attempt_count, priority, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                (run_id, status, attempt_count, now, now),
+                (run_id, status, attempt_count, priority, now, now),
             )
             conn.commit()
 
@@ -936,6 +1286,21 @@ def _row_to_run_header(row: sqlite3.Row) -> AgentRun:
     )
 
 
+def _row_to_extraction_job(row: sqlite3.Row) -> DocumentExtractionJob:
+    return DocumentExtractionJob(
+        document_id=row["document_id"],
+        tenant_id=row["tenant_id"],
+        file_hash=row["file_hash"],
+        status=DocumentExtractionStatus(row["status"]),
+        attempt_count=int(row["attempt_count"] or 0),
+        page_count=row["page_count"],
+        chunk_count=row["chunk_count"],
+        error=row["error"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
 def _row_value(row: sqlite3.Row, key: str) -> Any:
     return row[key] if key in row.keys() else None
 
@@ -980,6 +1345,23 @@ def _seconds_ago(seconds: int) -> str:
     return (datetime.now(timezone.utc) - timedelta(seconds=seconds)).isoformat()
 
 
+def _seconds_since(timestamp: str | None, now: str) -> float:
+    """Return seconds elapsed between a queue timestamp and ``now``.
+
+    Rows written by the unit of work use SQLite's ``CURRENT_TIMESTAMP``
+    (naive UTC); repository rows use timezone-aware ISO strings.
+    """
+    if not timestamp:
+        return 0.0
+    try:
+        started = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return 0.0
+    if started.tzinfo is None:
+        started = started.replace(tzinfo=timezone.utc)
+    return max(0.0, (datetime.fromisoformat(now) - started).total_seconds())
+
+
 def _row_to_event(row: sqlite3.Row) -> AgentEvent:
     return AgentEvent(
         event_id=row["event_id"],
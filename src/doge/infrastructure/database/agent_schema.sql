@@ -143,7 +143,8 @@ CREATE TABLE IF NOT EXISTS document_chunks (
     start_char INTEGER NOT NULL,
     end_char INTEGER NOT NULL,
     source_hash TEXT,
-    created_at TEXT NOT NULL
+    created_at TEXT NOT NULL,
+    indexed_at TEXT
 );
 
 CREATE TABLE IF NOT EXISTS evidence_records (
@@ -163,16 +164,19 @@ CREATE TABLE IF NOT EXISTS evidence_records (
 
 CREATE TABLE IF NOT EXISTS embedding_cache (
     key TEXT PRIMARY KEY,
-    vector TEXT NOT NULL,
+    vector BLOB NOT NULL,
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE TABLE IF NOT EXISTS vector_entries (
     record_id TEXT PRIMARY KEY,
-    vector TEXT NOT NULL,
+    vector BLOB NOT NULL,
     text TEXT NOT NULL,
     metadata TEXT,
-    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    dim INTEGER NOT NULL DEFAULT 0,
+    norm REAL NOT NULL DEFAULT 0,
+    revision INTEGER NOT NULL DEFAULT 0
 );
 
 CREATE TABLE IF NOT EXISTS portfolios (
@@ -242,6 +246,7 @@ CREATE TABLE IF NOT EXISTS run_queue (
     leased_at TEXT,
     lease_expires_at TEXT,
     attempt_count INTEGER NOT NULL DEFAULT 0,
+    priority INTEGER NOT NULL DEFAULT 0,
     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
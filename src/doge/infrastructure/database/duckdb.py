@@ -2,6 +2,11 @@
 
 Replaces scattered `connect_duckdb()` and `get_duckdb_connection()`
 calls across ai_analysis, cli, api, mcp_server.
+
+When the daemon has installed a process-wide
+:class:`~doge.infrastructure.database.duckdb_pool.DuckDBSessionPool` for the
+same database files, read-only ``connect()`` hands out a pooled cursor and
+``refresh_views()`` publishes through the pool's swap.
 """
 
 import logging
@@ -13,6 +18,15 @@ from typing import Generator, Optional
 import duckdb
 
 from doge.config import get_settings
+from doge.core.ports.market_view import ViewCatalogEntry
+from doge.infrastructure.database.duckdb_pool import get_duckdb_pool
+from doge.infrastructure.database.materialized_views import (
+    FRESHNESS_TABLE,
+    LIVE_SUFFIX,
+    ViewMaterializer,
+)
+from doge.infrastructure.database.view_catalog import read_view_catalog, write_view_catalog
+from doge.shared.cancellation import interrupt_on_cancel
 
 logger = logging.getLogger(__name__)
 
@@ -62,8 +76,14 @@ class DuckDBConnection:
         """Yield a configured DuckDB connection.
 
         Automatically attaches cn/us SQLite databases.
-        Connection is closed on exit.
+        Connection is closed on exit. If the calling tool is cancelled while
+        the connection is open, the running query is interrupted.
         """
+        pool = self._pool() if self._read_only else None
+        if pool is not None:
+            with pool.session() as cursor, interrupt_on_cancel(cursor.interrupt):
+                yield cursor
+            return
         con = duckdb.connect(self._duckdb_path, read_only=self._read_only)
         try:
             con.execute("SET threads=4")
@@ -74,7 +94,8 @@ class DuckDBConnection:
             con.execute(
                 f"ATTACH IF NOT EXISTS '{self._us_db}' AS us (TYPE sqlite{',' + read_only_flag if read_only_flag else ''})"
             )
-            yield con
+            with interrupt_on_cancel(con.interrupt):
+                yield con
         finally:
             con.close()
 
@@ -85,14 +106,34 @@ class DuckDBConnection:
                 return con.execute(sql, params).df()
             return con.execute(sql).df()
 
-    def refresh_views(self, con: duckdb.DuckDBPyConnection | None = None) -> None:
+    def refresh_views(
+        self,
+        con: duckdb.DuckDBPyConnection | None = None,
+        full: bool = False,
+    ) -> None:
         """Execute the canonical ``views.sql`` to refresh all DuckDB views.
 
         Resolves the DDL via ``DBConfig.resolved_views_sql()`` (S003-005): the
         version-controlled copy at
         ``src/doge/infrastructure/database/views.sql`` is preferred; the
         data-dir mirror ``data/views.sql`` is the backward-compat fallback.
+
+        With ``DOGE_DUCKDB_VIEW_MODE=materialized`` the views are persisted
+        as native tables and refreshed incrementally from the tickers that
+        changed since the previous refresh (see
+        :mod:`doge.infrastructure.database.materialized_views`); ``full``
+        forces every table to be rebuilt.
+
+        Each refresh ends by recording every view's columns and row count in
+        the view catalog (see :meth:`view_catalog`).
         """
+        pool = self._pool() if con is None else None
+        if pool is not None:
+            pool.swap(lambda: self._refresh_views(None, full))
+            return
+        self._refresh_views(con, full)
+
+    def _refresh_views(self, con: duckdb.DuckDBPyConnection | None, full: bool) -> None:
         close_on_exit = False
         if con is None:
             # Need write access for CREATE OR REPLACE VIEW
@@ -108,13 +149,25 @@ class DuckDBConnection:
             with open(views_sql_path, "r", encoding="utf-8") as f:
                 sql = f.read()
             sql = _strip_sql_comments(sql)
+            materializer = None
+            if self._settings.db.duckdb_view_mode == "materialized":
+                materializer = ViewMaterializer(con)
+                materializer.sync_sources(full=full)
             for stmt in sql.split(";"):
                 stmt = stmt.strip()
                 if stmt:
+                    if materializer is not None:
+                        stmt = materializer.rewrite_statement(stmt)
                     try:
                         con.execute(stmt)
                     except Exception:
                         pass  # Best-effort; individual views may fail
+            if materializer is not None:
+                materializer.materialize(full=full)
+            try:
+                write_view_catalog(con, materializer.live_views if materializer is not None else ())
+            except Exception as exc:  # noqa: BLE001 - readers fall back to live counts
+                logger.warning("view catalog refresh failed: %s", exc)
         finally:
             if close_on_exit:
                 con.close()
@@ -135,12 +188,90 @@ class DuckDBConnection:
         """Execute an arbitrary SQL query and return a DataFrame."""
         return self.execute(sql, params)
 
+    @property
+    def pooled(self) -> bool:
+        """Whether ``connect()`` hands out cursors of the shared session pool."""
+        return self._read_only and self._pool() is not None
+
+    def _pool(self):
+        """Return the installed session pool when it serves these files."""
+        pool = get_duckdb_pool()
+        if pool is not None and pool.serves(self._duckdb_path, self._cn_db, self._us_db):
+            return pool
+        return None
+
+    def view_freshness(self, con: Optional[duckdb.DuckDBPyConnection] = None) -> dict:
+        """Return the materialization watermark per view.
+
+        ``{view_name: {"source_max_date", "refreshed_at", "refresh_mode",
+        "row_count"}}``; empty when the views are not materialized.
+        """
+        pool = self._pool() if con is None else None
+        if pool is not None:
+            with pool.session() as cursor:
+                return self.view_freshness(cursor)
+        close_on_exit = False
+        if con is None:
+            con = duckdb.connect(self._duckdb_path, read_only=True)
+            close_on_exit = True
+        try:
+            try:
+                rows = con.execute(
+                    f"SELECT name, source_max_date, refreshed_at, refresh_mode, row_count "
+                    f"FROM {FRESHNESS_TABLE}"
+                ).fetchall()
+            except duckdb.Error:
+                return {}
+            return {
+                name: {
+                    "source_max_date": max_date,
+                    "refreshed_at": refreshed_at.isoformat() if refreshed_at else None,
+                    "refresh_mode": mode,
+                    "row_count": row_count,
+                }
+                for name, max_date, refreshed_at, mode, row_count in rows
+            }
+        finally:
+            if close_on_exit:
+                con.close()
+
+    def view_catalog(self, con: Optional[duckdb.DuckDBPyConnection] = None) -> Optional[list[ViewCatalogEntry]]:
+        """Return the columns and row counts recorded by the last refresh.
+
+        ``None`` when this database has not been refreshed since the catalog
+        was introduced.
+        """
+        pool = self._pool() if con is None else None
+        if pool is not None:
+            with pool.session() as cursor:
+                return self.view_catalog(cursor)
+        if con is not None:
+            return read_view_catalog(con)
+        try:
+            con = duckdb.connect(self._duckdb_path, read_only=True)
+        except duckdb.Error:
+            return None
+        try:
+            return read_view_catalog(con)
+        finally:
+            con.close()
+
     def get_duckdb_view_stats(self, con: Optional[duckdb.DuckDBPyConnection] = None) -> dict:
         """Return {view_name: {"row_count": int|None}} for all DuckDB views.
 
+        Row counts come from the view catalog (with its ``refreshed_at``)
+        when one has been recorded; otherwise every view is counted.
+        Materialized views also carry their freshness watermark
+        (``source_max_date`` / ``refreshed_at``); their ``*_live`` source
+        definitions are not listed.
+
         If ``con`` is provided it is used as-is (caller manages lifecycle);
         otherwise a temporary read-only connection is opened.
         """
+        pool = self._pool() if con is None else None
+        if pool is not None:
+            with pool.session() as cursor:
+                return self.get_duckdb_view_stats(cursor)
         close_on_exit = False
         if con is None:
             con = duckdb.connect(self._duckdb_path, read_only=True)
@@ -150,15 +281,28 @@ class DuckDBConnection:
 
         try:
             views = {}
+            freshness = self.view_freshness(con)
+            catalog = read_view_catalog(con)
+            if catalog is not None:
+                for entry in catalog:
+                    views[entry.name] = {"row_count": entry.row_count, "refreshed_at": entry.refreshed_at}
+                    if entry.name in freshness:
+                        views[entry.name]["source_max_date"] = freshness[entry.name]["source_max_date"]
+                return views
             result = con.execute(
                 "SELECT table_name FROM information_schema.tables WHERE table_type='VIEW'"
             ).fetchall()
             for (vname,) in result:
+                if vname.endswith(LIVE_SUFFIX) and vname[: -len(LIVE_SUFFIX)] in freshness:
+                    continue
                 try:
                     cnt = con.execute(f"SELECT COUNT(*) FROM {vname}").fetchone()[0]
                     views[vname] = {"row_count": cnt}
                 except Exception:
                     views[vname] = {"row_count": None}
+                if vname in freshness:
+                    views[vname]["source_max_date"] = freshness[vname]["source_max_date"]
+                    views[vname]["refreshed_at"] = freshness[vname]["refreshed_at"]
             return views
         finally:
             if close_on_exit:
@@ -0,0 +1,302 @@
+"""Process-wide DuckDB session pool for the long-lived daemon.
+
+``DuckDBConnection.connect()`` opens a fresh database handle, sets the
+thread count and re-ATTACHes both SQLite market files on every call. Inside
+``doged`` that cost lands on every ``/v1`` market query and tool call, so the
+daemon installs a :class:`DuckDBSessionPool` at startup instead:
+
+* one read-only root connection per *generation*, opened lazily with the
+  thread count derived from the host and both SQLite files attached once;
+* a cursor per request (:meth:`DuckDBSessionPool.session`); cursors share the
+  root's catalog and attachments and are read-only like the root;
+* at most ``size`` cursors in use at a time; further callers wait, and the
+  wait is recorded in :class:`DuckDBPoolMetrics`;
+* :meth:`DuckDBSessionPool.swap` drains in-flight cursors, closes the root so
+  ``refresh_views`` can take the DuckDB file read-write, and lets the next
+  session open a new generation that sees the published views;
+* the root is closed again once no cursor was checked out for
+  ``idle_seconds``. DuckDB locks the file per process, so an open read-only
+  root makes a read-write open from another process (``doge scan``
+  refreshing the views) fail; releasing it while idle lets those refreshes
+  through.
+
+The pool is on by default with a small size (``DOGE_DUCKDB_POOL_SIZE``
+defaults to ``4``; ``0`` disables it). The root is opened and attached
+outside the pool lock, so a slow open does not block metrics or releases.
+
+While installed, ``DuckDBConnection`` routes read-only ``connect()`` and
+``refresh_views()`` through the pool (see :func:`get_duckdb_pool`).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Generator, Optional, TypeVar
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def host_thread_count(configured: int = 0) -> int:
+    """Return *configured* when positive, else the host's CPU count."""
+    if configured > 0:
+        return configured
+    return max(1, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class DuckDBPoolMetrics:
+    """Point-in-time pool counters for readiness/diagnostics output."""
+
+    size: int
+    threads: int
+    generation: int
+    open: bool
+    in_use: int
+    waiting: int
+    checkouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class DuckDBSessionPool:
+    """Bounded pool of read-only cursors over one long-lived DuckDB root.
+
+    Parameters
+    ----------
+    duckdb_path, cn_db, us_db:
+        The DuckDB file and the SQLite market files attached as ``cn`` / ``us``.
+    size:
+        Maximum cursors in use at once.
+    threads:
+        DuckDB worker threads for the root; ``0`` derives it from the host.
+    idle_seconds:
+        Close the root after this long without a checkout; ``None`` keeps it
+        open until :meth:`swap` or :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        duckdb_path: str,
+        cn_db: str,
+        us_db: str,
+        size: int = 8,
+        threads: int = 0,
+        idle_seconds: Optional[float] = 5.0,
+    ) -> None:
+        self.duckdb_path = duckdb_path
+        self.cn_db = cn_db
+        self.us_db = us_db
+        self.size = max(1, size)
+        self.threads = host_thread_count(threads)
+        self.idle_seconds = idle_seconds
+        self._idle_timer: Optional[threading.Timer] = None
+        self._cond = threading.Condition()
+        self._root: Optional[duckdb.DuckDBPyConnection] = None
+        self._generation = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._swapping = False
+        self._opening = False
+        self._closed = False
+        self._checkouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def serves(self, duckdb_path: str, cn_db: str, us_db: str) -> bool:
+        """Return whether this pool was built for the given database files."""
+        return (duckdb_path, cn_db, us_db) == (self.duckdb_path, self.cn_db, self.us_db)
+
+    @contextmanager
+    def session(self) -> Generator[duckdb.DuckDBPyConnection, None, None]:
+        """Yield a read-only cursor, blocking while the pool is saturated."""
+        started = time.perf_counter()
+        with self._cond:
+            self._waiting += 1
+            try:
+                while self._swapping or self._opening or self._in_use >= self.size:
+                    if self._closed:
+                        raise RuntimeError("DuckDB session pool is closed")
+                    self._cond.wait()
+                if self._closed:
+                    raise RuntimeError("DuckDB session pool is closed")
+                # The slot is held while the root opens so swap() waits for it.
+                self._in_use += 1
+                root = self._root
+                self._opening = root is None
+            finally:
+                self._waiting -= 1
+        try:
+            if root is None:
+                root = self._open_root()
+            with self._cond:
+                cursor = root.cursor()
+                waited = time.perf_counter() - started
+                self._checkouts += 1
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+        except BaseException:
+            self._release_slot()
+            raise
+        try:
+            yield cursor
+        finally:
+            try:
+                cursor.close()
+            finally:
+                self._release_slot()
+
+    def swap(self, publish: Callable[[], T]) -> T:
+        """Drain cursors, close the root, run *publish*, start a new generation.
+
+        *publish* runs with no pooled handle open on the DuckDB file, so it
+        may connect read-write (``refresh_views``). New sessions wait until it
+        returns and then open a root that sees what it published.
+        """
+        with self._cond:
+            while self._swapping:
+                self._cond.wait()
+            self._swapping = True
+            while self._in_use:
+                self._cond.wait()
+            root, self._root = self._root, None
+        try:
+            if root is not None:
+                root.close()
+            return publish()
+        finally:
+            with self._cond:
+                self._generation += 1
+                self._swapping = False
+                self._cond.notify_all()
+
+    def metrics(self) -> DuckDBPoolMetrics:
+        with self._cond:
+            return DuckDBPoolMetrics(
+                size=self.size,
+                threads=self.threads,
+                generation=self._generation,
+                open=self._root is not None,
+                in_use=self._in_use,
+                waiting=self._waiting,
+                checkouts=self._checkouts,
+                wait_seconds_total=round(self._wait_total, 6),
+                wait_seconds_max=round(self._wait_max, 6),
+            )
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            root, self._root = self._root, None
+            self._cancel_idle_release()
+            self._cond.notify_all()
+        if root is not None:
+            root.close()
+
+    def _schedule_idle_release(self) -> None:
+        """Arm the idle timer for the current checkout (caller holds the lock)."""
+        if self.idle_seconds is None or self._root is None or self._closed:
+            return
+        self._cancel_idle_release()
+        timer = threading.Timer(self.idle_seconds, self._release_idle, args=(self._checkouts,))
+        timer.daemon = True
+        self._idle_timer = timer
+        timer.start()
+
+    def _cancel_idle_release(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _release_idle(self, checkouts: int) -> None:
+        with self._cond:
+            if self._in_use or self._swapping or self._checkouts != checkouts:
+                return
+            root, self._root = self._root, None
+            self._idle_timer = None
+        if root is not None:
+            root.close()
+            logger.info("DuckDB session pool released idle generation=%d", self._generation)
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._in_use -= 1
+            if self._in_use == 0:
+                self._schedule_idle_release()
+            self._cond.notify_all()
+
+    def _open_root(self) -> duckdb.DuckDBPyConnection:
+        """Open the generation's root outside the lock, then publish it."""
+        try:
+            root = self._open()
+        except BaseException:
+            with self._cond:
+                self._opening = False
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            self._opening = False
+            self._cond.notify_all()
+            closed = self._closed
+            if not closed:
+                self._root = root
+        if closed:
+            root.close()
+            raise RuntimeError("DuckDB session pool is closed")
+        return root
+
+    def _open(self) -> duckdb.DuckDBPyConnection:
+        """Connect read-only and attach both market files."""
+        root = duckdb.connect(self.duckdb_path, read_only=True, config={"threads": self.threads})
+        try:
+            root.execute(f"ATTACH IF NOT EXISTS '{self.cn_db}' AS cn (TYPE sqlite, READ_ONLY)")
+            root.execute(f"ATTACH IF NOT EXISTS '{self.us_db}' AS us (TYPE sqlite, READ_ONLY)")
+        except Exception:
+            root.close()
+            raise
+        logger.info(
+            "DuckDB session pool opened generation=%d threads=%d size=%d",
+            self._generation,
+            self.threads,
+            self.size,
+        )
+        return root
+
+
+_POOL: Optional[DuckDBSessionPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def install_duckdb_pool(pool: DuckDBSessionPool) -> DuckDBSessionPool:
+    """Install *pool* as the process-wide pool, closing any previous one."""
+    global _POOL
+    with _POOL_LOCK:
+        previous, _POOL = _POOL, pool
+    if previous is not None and previous is not pool:
+        previous.close()
+    return pool
+
+
+def get_duckdb_pool() -> Optional[DuckDBSessionPool]:
+    """Return the installed process-wide pool, if any."""
+    return _POOL
+
+
+def close_duckdb_pool() -> None:
+    """Uninstall and close the process-wide pool."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
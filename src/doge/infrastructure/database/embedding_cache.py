@@ -1,8 +1,13 @@
-"""SQLite-backed embedding cache."""
+"""SQLite-backed embedding cache.
+
+Vectors are stored as packed little-endian float32 BLOBs, the precision the
+vector store keeps; rows written as JSON by earlier versions are still read.
+"""
 
 from __future__ import annotations
 
 import json
+import struct
 from pathlib import Path
 
 from doge.config import get_settings
@@ -10,6 +15,9 @@ from doge.core.ports.embedding import IEmbeddingCache
 from doge.infrastructure.database.agent_repositories import bootstrap_agent_schema
 from doge.infrastructure.database.sqlite import SQLiteConnection
 
+# Stay well below SQLite's host-parameter limit for IN (...) lookups.
+_LOOKUP_CHUNK = 500
+
 
 class SQLiteEmbeddingCache(IEmbeddingCache):
     def __init__(self, db_path: Path | str | None = None) -> None:
@@ -21,18 +29,43 @@ class SQLiteEmbeddingCache(IEmbeddingCache):
         return self._connection.connect()
 
     def get(self, key: str) -> list[float] | None:
-        with self._connect() as conn:
-            row = conn.execute("SELECT vector FROM embedding_cache WHERE key = ?", (key,)).fetchone()
-            return json.loads(row["vector"]) if row else None
+        return self.get_many([key]).get(key)
 
     def set(self, key: str, vector: list[float]) -> None:
+        self.set_many({key: vector})
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        with self._connect() as conn:
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start : start + _LOOKUP_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                found.update((row["key"], _decode(row["vector"])) for row in rows)
+        return found
+
+    def set_many(self, vectors: dict[str, list[float]]) -> None:
+        if not vectors:
+            return
         with self._connect() as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO embedding_cache(key, vector, created_at)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
                 ON CONFLICT(key) DO UPDATE SET vector = excluded.vector
                 """,
-                (key, json.dumps(vector)),
+                [(key, _encode(vector)) for key, vector in vectors.items()],
             )
             conn.commit()
+
+
+def _encode(vector: list[float]) -> bytes:
+    return struct.pack(f"<{len(vector)}f", *vector)
+
+
+def _decode(payload: bytes | str) -> list[float]:
+    if isinstance(payload, str):
+        return json.loads(payload)
+    return list(struct.unpack(f"<{len(payload) // 4}f", payload))
@@ -1,6 +1,21 @@
+"""Shared, push-based run event subscriber for daemon SSE streams.
+
+One tailer per event loop reads newly appended ``events`` rows by rowid and
+fans them out to every in-process subscription through bounded queues, so the
+number of open streams no longer multiplies the SQLite polling load. Each
+subscription replays persisted history after its ``after_sequence`` (the SSE
+``Last-Event-ID``) before switching to pushed events.
+
+A subscription whose queue overflows is not allowed to stall the tailer: its
+backlog is dropped and it re-reads the gap from SQLite on its next turn, which
+coalesces however many events it missed into one catch-up query.
+"""
+
 from __future__ import annotations
 
 import asyncio
+import sqlite3
+from dataclasses import dataclass
 from pathlib import Path
 from typing import AsyncIterator
 
@@ -8,19 +23,115 @@ from doge.core.domain.agent_models import AgentEvent
 from doge.core.ports.event_subscriber import IEventSubscriber
 from doge.infrastructure.database.agent_repositories import SQLiteEventRepository
 
+# Above this many watched runs the tailer reads every new row instead of
+# binding one parameter per run id.
+_MAX_FILTERED_RUNS = 500
+
+
+@dataclass(eq=False)
+class _Subscription:
+    run_id: str
+    queue: asyncio.Queue[AgentEvent | None]
+
 
 class SQLiteEventSubscriber(IEventSubscriber):
-    def __init__(self, db_path: Path | str | None = None, *, poll_interval_seconds: float = 0.1) -> None:
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        *,
+        poll_interval_seconds: float = 0.1,
+        queue_size: int = 256,
+        batch_size: int = 500,
+    ) -> None:
         self._events = SQLiteEventRepository(db_path)
         self._poll_interval_seconds = poll_interval_seconds
+        self._queue_size = max(1, queue_size)
+        self._batch_size = max(1, batch_size)
+        self._subscriptions: dict[str, set[_Subscription]] = {}
+        self._tailer: asyncio.Task[None] | None = None
+        self._cursor = 0
+        self._tail_queries = 0
+        self._resyncs = 0
 
     async def subscribe(self, run_id: str, after_sequence: int = 0) -> AsyncIterator[AgentEvent]:
+        subscription = _Subscription(run_id, asyncio.Queue(maxsize=self._queue_size))
+        self._ensure_tailer()
+        self._subscriptions.setdefault(run_id, set()).add(subscription)
         last_seen = after_sequence
-        while True:
-            events = self._events.list_for_run(run_id, after_sequence=last_seen)
-            if events:
-                for event in events:
-                    last_seen = event.sequence
-                    yield event
-                continue
-            await asyncio.sleep(self._poll_interval_seconds)
+        try:
+            for event in self._events.list_for_run(run_id, after_sequence=last_seen):
+                last_seen = event.sequence
+                yield event
+            while True:
+                event = await subscription.queue.get()
+                if event is None:
+                    for missed in self._events.list_for_run(run_id, after_sequence=last_seen):
+                        last_seen = missed.sequence
+                        yield missed
+                    continue
+                if event.sequence <= last_seen:
+                    continue
+                last_seen = event.sequence
+                yield event
+        finally:
+            self._unsubscribe(subscription)
+
+    def metrics(self) -> dict[str, int]:
+        return {
+            "subscriptions": sum(len(items) for items in self._subscriptions.values()),
+            "watched_runs": len(self._subscriptions),
+            "tail_queries": self._tail_queries,
+            "resyncs": self._resyncs,
+        }
+
+    def _ensure_tailer(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._tailer is not None and not self._tailer.done() and self._tailer.get_loop() is loop:
+            return
+        if self._tailer is not None and self._tailer.get_loop() is not loop:
+            # Subscriptions of another (typically closed) loop cannot be served here.
+            self._subscriptions.clear()
+        # Take the cursor before the first subscriber replays history so no
+        # row can fall between its replay query and the first tail query.
+        self._cursor = self._events.last_rowid()
+        self._tailer = loop.create_task(self._tail())
+
+    async def _tail(self) -> None:
+        while self._subscriptions:
+            if self._poll_once() < self._batch_size:
+                await asyncio.sleep(self._poll_interval_seconds)
+        if self._tailer is asyncio.current_task():
+            self._tailer = None
+
+    def _poll_once(self) -> int:
+        """Read one batch past the cursor, fan it out and return its size."""
+        run_ids = list(self._subscriptions) if len(self._subscriptions) <= _MAX_FILTERED_RUNS else None
+        try:
+            self._cursor, rows = self._events.tail(self._cursor, run_ids, limit=self._batch_size)
+        except sqlite3.Error:
+            rows = []
+        self._tail_queries += 1
+        for _rowid, event in rows:
+            self._fan_out(event)
+        return len(rows)
+
+    def _fan_out(self, event: AgentEvent) -> None:
+        for subscription in list(self._subscriptions.get(event.run_id, ())):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._resync(subscription)
+
+    def _resync(self, subscription: _Subscription) -> None:
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+        self._resyncs += 1
+
+    def _unsubscribe(self, subscription: _Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.run_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.run_id]
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Iterable
 
 from doge.config import get_settings
+from doge.core.domain.agent_models import utc_now
 from doge.core.domain.chunk_models import DocumentChunk
 from doge.core.domain.evidence_models import EvidenceRecord
 from doge.core.domain.page_models import DocumentPage
@@ -21,6 +23,43 @@ from doge.infrastructure.database.tenant_guard import (
 from doge.shared.scope import TenantScope
 
 
+_UPSERT_PAGE_SQL = """
+    INSERT INTO document_pages(
+        page_id, tenant_id, document_id, page_number, text, image_metadata,
+        source_hash, parser_error, created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(document_id, page_number) DO UPDATE SET
+        tenant_id = excluded.tenant_id,
+        page_id = excluded.page_id,
+        text = excluded.text,
+        image_metadata = excluded.image_metadata,
+        source_hash = excluded.source_hash,
+        parser_error = excluded.parser_error
+"""
+
+_UPSERT_CHUNK_SQL = """
+    INSERT INTO document_chunks(
+        chunk_id, tenant_id, document_id, page_id, page_number, text,
+        start_char, end_char, source_hash, created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(chunk_id) DO UPDATE SET
+        tenant_id = excluded.tenant_id,
+        document_id = excluded.document_id,
+        page_id = excluded.page_id,
+        page_number = excluded.page_number,
+        text = excluded.text,
+        start_char = excluded.start_char,
+        end_char = excluded.end_char,
+        indexed_at = CASE
+            WHEN document_chunks.source_hash IS excluded.source_hash
+            THEN document_chunks.indexed_at
+        END,
+        source_hash = excluded.source_hash
+"""
+
+
 class SQLiteEvidenceRepository(IEvidenceRepository):
     """Persist extracted document evidence in the agent SQLite database."""
 
@@ -49,33 +88,7 @@ class SQLiteEvidenceRepository(IEvidenceRepository):
                 key_value=page.page_id,
                 tenant_id=effective_tenant_id,
             )
-            conn.execute(
-                """
-                INSERT INTO document_pages(
-                    page_id, tenant_id, document_id, page_number, text, image_metadata,
-                    source_hash, parser_error, created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(document_id, page_number) DO UPDATE SET
-                    tenant_id = excluded.tenant_id,
-                    page_id = excluded.page_id,
-                    text = excluded.text,
-                    image_metadata = excluded.image_metadata,
-                    source_hash = excluded.source_hash,
-                    parser_error = excluded.parser_error
-                """,
-                (
-                    page.page_id,
-                    effective_tenant_id,
-                    page.document_id,
-                    page.page_number,
-                    page.text,
-                    json.dumps(page.image_metadata, ensure_ascii=False),
-                    page.source_hash,
-                    page.parser_error,
-                    page.created_at,
-                ),
-            )
+            conn.execute(_UPSERT_PAGE_SQL, _page_params(page, effective_tenant_id))
             conn.commit()
 
     def list_pages(
@@ -112,35 +125,69 @@ class SQLiteEvidenceRepository(IEvidenceRepository):
                 key_value=chunk.chunk_id,
                 tenant_id=effective_tenant_id,
             )
-            conn.execute(
-                """
-                INSERT INTO document_chunks(
-                    chunk_id, tenant_id, document_id, page_id, page_number, text,
-                    start_char, end_char, source_hash, created_at
+            conn.execute(_UPSERT_CHUNK_SQL, _chunk_params(chunk, effective_tenant_id))
+            conn.commit()
+
+    def save_document_extraction(
+        self,
+        document_id: str,
+        pages: Iterable[DocumentPage],
+        chunks: Iterable[DocumentChunk],
+        scope: TenantScope | str | None = None,
+        *,
+        tenant_id: str | None = None,
+    ) -> None:
+        """Upsert a batch of one document's pages and chunks in a single transaction.
+
+        Chunks stored for the batch's pages that the batch no longer contains
+        are deleted, together with their retrieval vectors.
+        """
+        pages = list(pages)
+        chunks = list(chunks)
+        requested_tenant_id = _tenant_id_from_scope(scope, tenant_id)
+        with self._connect() as conn:
+            effective_tenant_id = resolve_tenant_id(_tenant_id_for_document(conn, document_id), requested_tenant_id)
+            for table in ("document_pages", "document_chunks"):
+                for row in conn.execute(
+                    f"SELECT DISTINCT tenant_id FROM {table} WHERE document_id = ?", (document_id,)
+                ).fetchall():
+                    require_same_tenant(
+                        row["tenant_id"], effective_tenant_id, resource=f"{table}.document_id={document_id}"
+                    )
+            conn.executemany(_UPSERT_PAGE_SQL, (_page_params(page, effective_tenant_id) for page in pages))
+            conn.executemany(_UPSERT_CHUNK_SQL, (_chunk_params(chunk, effective_tenant_id) for chunk in chunks))
+            page_numbers = sorted({page.page_number for page in pages})
+            if page_numbers:
+                chunk_ids = [chunk.chunk_id for chunk in chunks]
+                _delete_chunks(
+                    conn,
+                    f"""
+                    document_id = ?
+                    AND page_number IN ({", ".join("?" for _ in page_numbers)})
+                    AND chunk_id NOT IN ({", ".join("?" for _ in chunk_ids)})
+                    """,
+                    (document_id, *page_numbers, *chunk_ids),
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(chunk_id) DO UPDATE SET
-                    tenant_id = excluded.tenant_id,
-                    document_id = excluded.document_id,
-                    page_id = excluded.page_id,
-                    page_number = excluded.page_number,
-                    text = excluded.text,
-                    start_char = excluded.start_char,
-                    end_char = excluded.end_char,
-                    source_hash = excluded.source_hash
-                """,
-                (
-                    chunk.chunk_id,
-                    effective_tenant_id,
-                    chunk.document_id,
-                    chunk.page_id,
-                    chunk.page_number,
-                    chunk.text,
-                    chunk.start_char,
-                    chunk.end_char,
-                    chunk.source_hash,
-                    chunk.created_at,
-                ),
+            conn.commit()
+
+    def prune_document_extraction(
+        self,
+        document_id: str,
+        page_count: int,
+        scope: TenantScope | str | None = None,
+        *,
+        tenant_id: str | None = None,
+    ) -> None:
+        """Delete the document's pages and chunks numbered past ``page_count``.
+
+        The chunks' retrieval vectors are deleted in the same transaction.
+        """
+        tenant_sql, tenant_params = _tenant_filter("tenant_id", _tenant_id_from_scope(scope, tenant_id))
+        with self._connect() as conn:
+            _delete_chunks(conn, f"document_id = ? AND page_number > ?{tenant_sql}", (document_id, page_count, *tenant_params))
+            conn.execute(
+                f"DELETE FROM document_pages WHERE document_id = ? AND page_number > ?{tenant_sql}",
+                (document_id, page_count, *tenant_params),
             )
             conn.commit()
 
@@ -196,6 +243,87 @@ class SQLiteEvidenceRepository(IEvidenceRepository):
             row = conn.execute(sql, params).fetchone()
             return DocumentChunk.from_mapping(dict(row)) if row else None
 
+    def get_chunks(
+        self,
+        chunk_ids: list[str],
+        scope: TenantScope | str | None = None,
+        *,
+        tenant_id: str | None = None,
+    ) -> list[DocumentChunk]:
+        """Retrieve chunks by id in one query, in the order requested."""
+        if not chunk_ids:
+            return []
+        requested_tenant_id = _tenant_id_from_scope(scope, tenant_id)
+        placeholders = ", ".join("?" for _ in chunk_ids)
+        sql = f"SELECT * FROM document_chunks WHERE chunk_id IN ({placeholders})"
+        params: list[object] = list(chunk_ids)
+        tenant_sql, tenant_params = _tenant_condition("tenant_id", requested_tenant_id)
+        if tenant_sql:
+            sql += f" AND {tenant_sql}"
+            params.extend(tenant_params)
+        with self._connect() as conn:
+            rows = {row["chunk_id"]: row for row in conn.execute(sql, params).fetchall()}
+        return [DocumentChunk.from_mapping(dict(rows[chunk_id])) for chunk_id in chunk_ids if chunk_id in rows]
+
+    def list_unindexed_chunks(
+        self,
+        scope: TenantScope | str | None = None,
+        document_ids: list[str] | None = None,
+        limit: int = 256,
+        *,
+        tenant_id: str | None = None,
+    ) -> list[DocumentChunk]:
+        """List chunks not yet marked as indexed for retrieval."""
+        if document_ids == []:
+            return []
+        requested_tenant_id = _tenant_id_from_scope(scope, tenant_id)
+        sql = "SELECT * FROM document_chunks WHERE indexed_at IS NULL"
+        params: list[object] = []
+        if document_ids:
+            placeholders = ", ".join("?" for _ in document_ids)
+            sql += f" AND document_id IN ({placeholders})"
+            params.extend(document_ids)
+        tenant_sql, tenant_params = _tenant_filter("tenant_id", requested_tenant_id)
+        sql += tenant_sql
+        params.extend(tenant_params)
+        sql += " ORDER BY document_id ASC, page_number ASC, start_char ASC LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+            return [DocumentChunk.from_mapping(dict(row)) for row in rows]
+
+    def list_unindexed_tenants(self) -> list[str]:
+        """List the tenants that own chunks not yet indexed for retrieval."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT tenant_id FROM document_chunks WHERE indexed_at IS NULL ORDER BY tenant_id"
+            ).fetchall()
+            return [row["tenant_id"] for row in rows]
+
+    def mark_chunks_indexed(
+        self,
+        chunks: list[DocumentChunk],
+        scope: TenantScope | str | None = None,
+        *,
+        tenant_id: str | None = None,
+    ) -> None:
+        """Record that *chunks*, as read, are present in the retrieval index.
+
+        A chunk whose ``source_hash`` changed since it was read stays pending,
+        so content re-extracted while it was being embedded is indexed again.
+        """
+        if not chunks:
+            return
+        requested_tenant_id = _tenant_id_from_scope(scope, tenant_id)
+        tenant_sql, tenant_params = _tenant_filter("tenant_id", requested_tenant_id)
+        now = utc_now()
+        with self._connect() as conn:
+            conn.executemany(
+                f"UPDATE document_chunks SET indexed_at = ? WHERE chunk_id = ? AND source_hash IS ?{tenant_sql}",
+                [(now, chunk.chunk_id, chunk.source_hash, *tenant_params) for chunk in chunks],
+            )
+            conn.commit()
+
     def list_chunks_for_run(
         self,
         run_id: str,
@@ -411,6 +539,45 @@ class SQLiteEvidenceRepository(IEvidenceRepository):
             return [EvidenceRecord.from_mapping(dict(row)) for row in rows]
 
 
+def _delete_chunks(conn, where: str, params: tuple[object, ...]) -> None:
+    """Delete the chunks matching *where* and their ``vector_entries`` rows."""
+    chunk_ids = [row[0] for row in conn.execute(f"SELECT chunk_id FROM document_chunks WHERE {where}", params)]
+    for start in range(0, len(chunk_ids), 500):
+        batch = chunk_ids[start : start + 500]
+        placeholders = ", ".join("?" for _ in batch)
+        conn.execute(f"DELETE FROM vector_entries WHERE record_id IN ({placeholders})", batch)
+        conn.execute(f"DELETE FROM document_chunks WHERE chunk_id IN ({placeholders})", batch)
+
+
+def _page_params(page: DocumentPage, tenant_id: str) -> tuple[object, ...]:
+    return (
+        page.page_id,
+        tenant_id,
+        page.document_id,
+        page.page_number,
+        page.text,
+        json.dumps(page.image_metadata, ensure_ascii=False),
+        page.source_hash,
+        page.parser_error,
+        page.created_at,
+    )
+
+
+def _chunk_params(chunk: DocumentChunk, tenant_id: str) -> tuple[object, ...]:
+    return (
+        chunk.chunk_id,
+        tenant_id,
+        chunk.document_id,
+        chunk.page_id,
+        chunk.page_number,
+        chunk.text,
+        chunk.start_char,
+        chunk.end_char,
+        chunk.source_hash,
+        chunk.created_at,
+    )
+
+
 def _tenant_id_for_document(conn, document_id: str) -> str | None:
     row = conn.execute("SELECT tenant_id FROM documents WHERE document_id = ?", (document_id,)).fetchone()
     return row["tenant_id"] if row and row["tenant_id"] else None
@@ -6,16 +6,32 @@ and delegating ``execute`` to it. This is the single infrastructure adapter the
 four read-only view-backed services depend on (via the port), per ADR-0010.
 
 The adapter is intentionally thin: it owns no SQL — the concrete view queries
-live in the services that consume it.
+live in the services that consume it. :meth:`DuckDBMarketViewRepository.query_page`
+only wraps the caller's statement so DuckDB itself applies the row window.
 """
 
-from typing import Optional
+import re
+import threading
+from contextlib import contextmanager
+from typing import Generator, Optional
 
+import duckdb
 import pandas as pd
 
-from doge.core.ports.market_view import IMarketViewRepository
+from doge.core.ports.market_view import (
+    IMarketViewRepository,
+    ViewCatalogEntry,
+    ViewQueryBudgetExceeded,
+    ViewQueryPage,
+)
 from .duckdb import DuckDBConnection
 
+# Upper bound for the exact COUNT(*) behind a first page; slower counts fall
+# back to the planner's cardinality estimate.
+COUNT_TIMEOUT_SECONDS = 2.0
+
+_ESTIMATE_RE = re.compile(r"~([\d,]+) rows|EC:\s*(\d+)")
+
 
 class DuckDBMarketViewRepository(IMarketViewRepository):
     """Read-only DuckDB view execution handle for the view-backed services."""
@@ -39,3 +55,132 @@ class DuckDBMarketViewRepository(IMarketViewRepository):
         DataFrame).
         """
         return self._conn.execute(sql, params)
+
+    def query_page(
+        self,
+        sql: str,
+        params: Optional[list] = None,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        count_total: bool = False,
+        timeout_seconds: Optional[float] = None,
+        memory_limit: Optional[str] = None,
+    ) -> ViewQueryPage:
+        """Return one page of *sql* with ``LIMIT``/``OFFSET`` applied inside DuckDB.
+
+        One extra row is fetched to tell whether another page exists. With
+        ``count_total`` a result that does not fit the page is counted under
+        :data:`COUNT_TIMEOUT_SECONDS`, or estimated from the query plan when
+        counting takes longer.
+
+        ``timeout_seconds`` interrupts the query once it runs out; DuckDB
+        only offers ``memory_limit`` per database instance, so it is applied
+        when the query has its own connection rather than a pooled cursor.
+        Either budget running out raises :class:`ViewQueryBudgetExceeded`.
+        """
+        body = _statement_body(sql)
+        offset = max(0, int(offset))
+        limit = max(1, int(limit))
+        bound = list(params or [])
+        with self._conn.connect() as con:
+            if memory_limit and not self._conn.pooled:
+                con.execute(f"SET memory_limit = '{memory_limit}'")
+            with _interrupt_after(con, timeout_seconds) as fired:
+                try:
+                    frame = con.execute(
+                        f"SELECT * FROM (\n{body}\n) AS doge_page LIMIT {limit + 1} OFFSET {offset}",
+                        bound,
+                    ).df()
+                except duckdb.InterruptException:
+                    if fired.is_set():
+                        raise ViewQueryBudgetExceeded("query exceeded its time budget") from None
+                    raise
+                except duckdb.OutOfMemoryException:
+                    raise ViewQueryBudgetExceeded("query exceeded its memory budget") from None
+            has_more = len(frame) > limit
+            frame = frame.iloc[:limit].reset_index(drop=True)
+            if not has_more:
+                return ViewQueryPage(frame=frame, has_more=False, total_rows=offset + len(frame))
+            total, estimated = (None, False)
+            if count_total:
+                total, estimated = _count_rows(con, body, bound, timeout_seconds)
+        return ViewQueryPage(frame=frame, has_more=True, total_rows=total, total_is_estimate=estimated)
+
+    def view_catalog(self) -> Optional[list[ViewCatalogEntry]]:
+        """Return the catalog the last ``refresh_views`` recorded, if any."""
+        return self._conn.view_catalog()
+
+
+def _statement_body(sql: str) -> str:
+    """Return *sql* without trailing semicolons and comments.
+
+    Quoted strings and identifiers are skipped, so ``--`` or ``;`` inside a
+    literal is kept.
+    """
+    end = 0
+    index, size = 0, len(sql)
+    while index < size:
+        char = sql[index]
+        if sql.startswith("--", index):
+            newline = sql.find("\n", index)
+            index = size if newline < 0 else newline
+        elif sql.startswith("/*", index):
+            close = sql.find("*/", index + 2)
+            index = size if close < 0 else close + 2
+        elif char in "'\"":
+            index += 1
+            while index < size:
+                if sql[index] == char:
+                    if not sql.startswith(char * 2, index):
+                        break
+                    index += 1
+                index += 1
+            index += 1
+            end = min(index, size)
+        else:
+            if not char.isspace() and char != ";":
+                end = index + 1
+            index += 1
+    return sql[:end]
+
+
+def _count_rows(con, body: str, params: list, timeout_seconds: Optional[float]) -> tuple[Optional[int], bool]:
+    budget = COUNT_TIMEOUT_SECONDS if timeout_seconds is None else min(COUNT_TIMEOUT_SECONDS, timeout_seconds)
+    with _interrupt_after(con, budget) as fired:
+        try:
+            return int(con.execute(f"SELECT COUNT(*) FROM (\n{body}\n) AS doge_count", params).fetchone()[0]), False
+        except duckdb.InterruptException:
+            if not fired.is_set():
+                raise
+        except duckdb.Error:
+            return None, False
+    try:
+        plan = "\n".join(str(row[-1]) for row in con.execute(f"EXPLAIN {body}", params).fetchall())
+    except duckdb.Error:
+        return None, False
+    match = _ESTIMATE_RE.search(plan)
+    if match is None:
+        return None, False
+    return int((match.group(1) or match.group(2)).replace(",", "")), True
+
+
+@contextmanager
+def _interrupt_after(con, seconds: Optional[float]) -> Generator[threading.Event, None, None]:
+    """Interrupt *con*'s running query after *seconds*; the event marks that it fired."""
+    fired = threading.Event()
+    if not seconds or seconds <= 0:
+        yield fired
+        return
+
+    def _fire() -> None:
+        fired.set()
+        con.interrupt()
+
+    timer = threading.Timer(seconds, _fire)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield fired
+    finally:
+        timer.cancel()
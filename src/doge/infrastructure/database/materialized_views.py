@@ -0,0 +1,331 @@
+"""Materialized DuckDB analytics tables with incremental refresh.
+
+In ``DOGE_DUCKDB_VIEW_MODE=materialized`` the analytical views declared in
+``views.sql`` are persisted as native DuckDB tables instead of being
+recomputed over the attached SQLite files on every query:
+
+* ``mv_stock_prices_{cn,us}`` is a native mirror of ``{cn,us}.stock_prices``.
+  On refresh only tickers whose row fingerprint changed are re-copied, so the
+  SQLite scanner reads one grouped pass plus the changed tickers.
+* Each ``views.sql`` definition is created as ``<view>_live`` with its
+  ``stock_prices`` source rewritten to the mirror. The ``<view>`` name that
+  readers query becomes a thin view over the persisted ``mv_<view>`` table,
+  so no reader SQL changes.
+* ``mv_<view>`` tables are refreshed by :attr:`MaterializedView.refresh`:
+  ``ticker`` views recompute the changed tickers from their earliest changed
+  bar, ``date`` views the date tail from that bar, and ``rebuild`` views (the
+  cross-sectional rankings) are recomputed from the mirror. Window functions
+  only look back, so earlier rows keep their values.
+* The trailing windows in ``views.sql`` are anchored on the market's latest
+  date. When a new trading day moves that anchor, rows that left the window
+  are pruned and, for every ticker that lost bars, the first
+  :attr:`MaterializedView.lookback` bars inside the new window (whose
+  look-back now starts later) are recomputed. A full rebuild is only done on
+  ``full=True``, on the first build, when the anchor moves backwards, or when
+  the view's columns changed.
+* ``mv_freshness`` records, per view, the source max date the table reflects
+  and when and how it was refreshed; readers use it as the freshness
+  watermark (see ``DuckDBConnection.view_freshness``).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+import duckdb
+
+logger = logging.getLogger(__name__)
+
+VIEW_MODES = ("view", "materialized")
+FRESHNESS_TABLE = "mv_freshness"
+LIVE_SUFFIX = "_live"
+
+_CREATE_FRESHNESS_SQL = (
+    f"CREATE TABLE IF NOT EXISTS {FRESHNESS_TABLE} ("
+    "name VARCHAR PRIMARY KEY, market VARCHAR, source_max_date VARCHAR, "
+    "refreshed_at TIMESTAMP, refresh_mode VARCHAR, row_count BIGINT)"
+)
+_CREATE_VIEW_RE = re.compile(r"^(CREATE\s+OR\s+REPLACE\s+VIEW\s+)(\w+)(\s+AS\b)", re.IGNORECASE)
+_SOURCE_RE = re.compile(r"\b(cn|us)\.stock_prices\b")
+# Order-independent per-ticker fingerprint; (ticker, date) is unique so SUM of
+# row hashes only changes when a row is added, removed or restated.
+_FINGERPRINT_SQL = (
+    "SELECT ticker, SUM(hash(date, open, high, low, close, volume, amount)) AS fp "
+    "FROM {source} GROUP BY ticker"
+)
+
+
+@dataclass(frozen=True)
+class MaterializedView:
+    """A ``views.sql`` view persisted as a native table.
+
+    ``refresh`` is ``"ticker"`` when output rows depend only on their own
+    ticker's history, ``"date"`` when rows are per-date aggregates, and
+    ``"rebuild"`` when the whole result must be recomputed (rankings).
+    ``order_by`` restores the view's ``ORDER BY`` on the reader view.
+
+    ``window_days`` is the ``INTERVAL`` of a window anchored on the market's
+    latest date (``None`` when the view has none), and ``lookback`` how many
+    leading bars per ticker inside that window read bars before it through
+    ``LAG`` or ``ROWS ... PRECEDING``.
+    """
+
+    name: str
+    market: str
+    refresh: str
+    order_by: str = ""
+    window_days: Optional[int] = None
+    lookback: int = 0
+
+    @property
+    def table(self) -> str:
+        return "mv_" + self.name.removeprefix("vw_")
+
+    @property
+    def live(self) -> str:
+        return self.name + LIVE_SUFFIX
+
+
+MATERIALIZED_VIEWS: tuple[MaterializedView, ...] = (
+    MaterializedView("vw_market_breadth_cn", "cn", "date", "date DESC", window_days=730, lookback=1),
+    MaterializedView("vw_rsrs_ranking_cn", "cn", "rebuild", "rsrs DESC"),
+    MaterializedView("vw_volume_anomalies_cn", "cn", "ticker", "date DESC, vol_ratio DESC"),
+    # LAG runs over the whole history; the window only filters the output.
+    MaterializedView("vw_cross_sectional_return_cn", "cn", "ticker", "date DESC, ticker", window_days=365),
+    # The first bar loses prev_close and the 60-bar averages span the next 60.
+    MaterializedView("vw_daily_enriched_cn", "cn", "ticker", window_days=365, lookback=61),
+    MaterializedView("vw_market_breadth_us", "us", "date", "date DESC", window_days=365, lookback=1),
+    MaterializedView("vw_rsrs_ranking_us", "us", "rebuild", "rsrs DESC"),
+)
+
+
+def prices_table(market: str) -> str:
+    """Return the native mirror table name for *market*'s ``stock_prices``."""
+    return f"mv_stock_prices_{market}"
+
+
+@dataclass(frozen=True)
+class _SourceDelta:
+    """What changed in one market's ``stock_prices`` since the last sync."""
+
+    tickers: Optional[frozenset[str]]  # None: the mirror was rebuilt
+    since: Optional[str]
+    max_date: Optional[str]
+
+
+class ViewMaterializer:
+    """Drive one materialized refresh on a writable DuckDB connection.
+
+    Call :meth:`sync_sources` before executing ``views.sql`` (the live views
+    bind to the mirror tables), feed every DDL statement through
+    :meth:`rewrite_statement`, then call :meth:`materialize`.
+    """
+
+    def __init__(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        views: tuple[MaterializedView, ...] = MATERIALIZED_VIEWS,
+    ) -> None:
+        self._con = con
+        self._views = {view.name: view for view in views}
+        self._deltas: dict[str, _SourceDelta] = {}
+
+    @property
+    def live_views(self) -> frozenset[str]:
+        """Names of the ``*_live`` source views behind the materialized tables."""
+        return frozenset(view.live for view in self._views.values())
+
+    def rewrite_statement(self, stmt: str) -> str:
+        """Point a ``views.sql`` statement at the mirror and rename its view."""
+        match = _CREATE_VIEW_RE.match(stmt)
+        if match is None or match.group(2) not in self._views:
+            return stmt
+        stmt = _SOURCE_RE.sub(lambda m: prices_table(m.group(1)), stmt)
+        return _CREATE_VIEW_RE.sub(
+            lambda m: m.group(1) + m.group(2) + LIVE_SUFFIX + m.group(3), stmt, count=1
+        )
+
+    def sync_sources(self, full: bool = False) -> None:
+        """Bring each market's price mirror in line with the attached SQLite."""
+        self._con.execute(_CREATE_FRESHNESS_SQL)
+        for market in sorted({view.market for view in self._views.values()}):
+            try:
+                self._deltas[market] = self._sync_market(market, full)
+            except Exception as exc:  # noqa: BLE001 - a missing source skips its market
+                logger.warning("materialized price sync failed market=%s: %s", market, exc)
+
+    def materialize(self, full: bool = False) -> dict[str, str]:
+        """Refresh every ``mv_*`` table; return ``{view: refresh_mode}``."""
+        modes: dict[str, str] = {}
+        for view in self._views.values():
+            delta = self._deltas.get(view.market)
+            if delta is None:
+                continue
+            try:
+                modes[view.name] = self._materialize_view(view, delta, full)
+            except Exception as exc:  # noqa: BLE001 - best-effort, like the plain refresh
+                logger.warning("materialize failed view=%s: %s", view.name, exc)
+        return modes
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _sync_market(self, market: str, full: bool) -> _SourceDelta:
+        source = f"{market}.stock_prices"
+        mirror = prices_table(market)
+        if full or not self._table_exists(mirror):
+            self._con.execute(
+                f"CREATE OR REPLACE TABLE {mirror} AS "
+                f"SELECT * FROM {source} ORDER BY ticker, date"
+            )
+            return _SourceDelta(tickers=None, since=None, max_date=self._max_date(mirror))
+
+        scope = f"_mv_scope_{market}"
+        self._con.execute(
+            f"CREATE OR REPLACE TEMP TABLE {scope} AS "
+            f"SELECT COALESCE(s.ticker, m.ticker) AS ticker "
+            f"FROM ({_FINGERPRINT_SQL.format(source=source)}) s "
+            f"FULL OUTER JOIN ({_FINGERPRINT_SQL.format(source=mirror)}) m "
+            f"ON s.ticker = m.ticker WHERE s.fp IS DISTINCT FROM m.fp"
+        )
+        tickers = frozenset(row[0] for row in self._con.execute(f"SELECT ticker FROM {scope}").fetchall())
+        since = None
+        if tickers:
+            in_scope = f"ticker IN (SELECT ticker FROM {scope})"
+            since = self._con.execute(
+                f"SELECT MIN(date) FROM ("
+                f"(SELECT * FROM {source} WHERE {in_scope} EXCEPT SELECT * FROM {mirror} WHERE {in_scope}) "
+                f"UNION ALL "
+                f"(SELECT * FROM {mirror} WHERE {in_scope} EXCEPT SELECT * FROM {source} WHERE {in_scope}))"
+            ).fetchone()[0]
+            self._con.execute(f"DELETE FROM {mirror} WHERE {in_scope}")
+            self._con.execute(f"INSERT INTO {mirror} SELECT * FROM {source} WHERE {in_scope}")
+        return _SourceDelta(tickers=tickers, since=since, max_date=self._max_date(mirror))
+
+    def _materialize_view(self, view: MaterializedView, delta: _SourceDelta, full: bool) -> str:
+        previous = self._con.execute(
+            f"SELECT source_max_date FROM {FRESHNESS_TABLE} WHERE name = ?", [view.name]
+        ).fetchone()
+        previous_max = previous[0] if previous is not None else None
+        rebuild = (
+            full
+            or delta.tickers is None
+            or previous_max is None
+            or delta.max_date is None
+            or delta.max_date < previous_max
+            or not self._table_exists(view.table)
+            or self._columns(view.table) != self._columns(view.live)
+        )
+        if rebuild:
+            mode = "full"
+            self._rebuild(view)
+        elif not delta.tickers:
+            mode = "fresh"
+        elif view.refresh in ("ticker", "date") and delta.since is not None:
+            mode = "incremental"
+            predicate, params = self._incremental_scope(view, delta, previous_max)
+            self._replace_where(view, predicate, params)
+        else:
+            mode = "full"
+            self._rebuild(view)
+
+        order = f" ORDER BY {view.order_by}" if view.order_by else ""
+        self._con.execute(f"CREATE OR REPLACE VIEW {view.name} AS SELECT * FROM {view.table}{order}")
+        if mode != "fresh":
+            row_count = self._con.execute(f"SELECT COUNT(*) FROM {view.table}").fetchone()[0]
+            self._con.execute(
+                f"INSERT OR REPLACE INTO {FRESHNESS_TABLE} "
+                "VALUES (?, ?, ?, CAST(now() AS TIMESTAMP), ?, ?)",
+                [view.name, view.market, delta.max_date, mode, row_count],
+            )
+        return mode
+
+    def _incremental_scope(
+        self, view: MaterializedView, delta: _SourceDelta, previous_max: str
+    ) -> tuple[str, list]:
+        """Return the rows to replace as a ``{t}``-qualified predicate and params.
+
+        The tail from the earliest changed bar, plus, when the anchored
+        window moved, the pruned rows and the re-anchored head bars.
+        """
+        if view.refresh == "ticker":
+            clauses = [f"({{t}}.ticker IN (SELECT ticker FROM _mv_scope_{view.market}) AND {{t}}.date >= ?)"]
+        else:
+            clauses = ["{t}.date >= ?"]
+        params: list = [delta.since]
+        if view.window_days is None or delta.max_date == previous_max:
+            return " OR ".join(clauses), params
+
+        old_start = _window_start(previous_max, view.window_days)
+        new_start = _window_start(delta.max_date, view.window_days)
+        clauses.append("{t}.date < ?")
+        params.append(new_start)
+        if view.lookback:
+            head = f"_mv_head_{view.table}"
+            mirror = prices_table(view.market)
+            self._con.execute(
+                f"CREATE OR REPLACE TEMP TABLE {head} AS "
+                f"SELECT ticker, MAX(date) AS head_end FROM ("
+                f"SELECT ticker, date, ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY date) AS rn "
+                f"FROM {mirror} WHERE date >= ? AND ticker IN "
+                f"(SELECT ticker FROM {mirror} WHERE date >= ? AND date < ?)"
+                f") WHERE rn <= {int(view.lookback)} GROUP BY ticker",
+                [new_start, old_start, new_start],
+            )
+            if view.refresh == "ticker":
+                clauses.append(f"{{t}}.date <= (SELECT h.head_end FROM {head} h WHERE h.ticker = {{t}}.ticker)")
+            else:
+                head_end = self._con.execute(f"SELECT MAX(head_end) FROM {head}").fetchone()[0]
+                if head_end is not None:
+                    clauses.append("{t}.date <= ?")
+                    params.append(head_end)
+        return " OR ".join(f"({clause})" for clause in clauses), params
+
+    def _rebuild(self, view: MaterializedView) -> None:
+        self._con.execute(f"CREATE OR REPLACE TABLE {view.table} AS SELECT * FROM {view.live}")
+
+    def _replace_where(self, view: MaterializedView, predicate: str, params: list) -> None:
+        """Replace the rows matching *predicate*; ``{t}`` names the table read."""
+        self._con.execute("BEGIN TRANSACTION")
+        try:
+            self._con.execute(
+                f"DELETE FROM {view.table} WHERE {predicate.format(t=view.table)}", params
+            )
+            self._con.execute(
+                f"INSERT INTO {view.table} SELECT * FROM {view.live} "
+                f"WHERE {predicate.format(t=view.live)}",
+                params,
+            )
+            self._con.execute("COMMIT")
+        except Exception:
+            self._con.execute("ROLLBACK")
+            # Column drift in views.sql and similar: fall back to a rebuild.
+            self._rebuild(view)
+
+    def _max_date(self, table: str) -> Optional[str]:
+        value = self._con.execute(f"SELECT MAX(CAST(date AS DATE)) FROM {table}").fetchone()[0]
+        return None if value is None else str(value)
+
+    def _columns(self, name: str) -> list[tuple[str, str]]:
+        return [
+            (row[0], row[1])
+            for row in self._con.execute(f"DESCRIBE {name}").fetchall()
+        ]
+
+    def _table_exists(self, name: str) -> bool:
+        row = self._con.execute(
+            "SELECT COUNT(*) FROM information_schema.tables "
+            "WHERE table_catalog = current_database() AND table_schema = 'main' "
+            "AND table_name = ? AND table_type = 'BASE TABLE'",
+            [name],
+        ).fetchone()
+        return bool(row[0])
+
+
+def _window_start(max_date: str, window_days: int) -> str:
+    """First date inside a ``views.sql`` window of *window_days* ending at *max_date*."""
+    return (date.fromisoformat(max_date) - timedelta(days=window_days)).isoformat()
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import json
+import math
 import sqlite3
+import struct
 from dataclasses import dataclass
 from typing import Callable, Iterable
 
@@ -75,6 +78,12 @@ def _migrations() -> tuple[Migration, ...]:
         Migration("runtime", "runtime_query_indexes", _migrate_runtime_query_indexes),
         Migration("slots", "bundle_activation_state", _migrate_slot_bundle_activation),
         Migration("slots", "signer_revocations", _migrate_slot_signer_revocations),
+        Migration("evidence", "vector_entries_float32", _migrate_vector_entries_float32),
+        Migration("evidence", "chunk_index_state", _migrate_chunk_index_state),
+        Migration("runtime", "run_queue_priority", _migrate_run_queue_priority),
+        Migration("runtime", "run_queue_head", _migrate_run_queue_head),
+        Migration("evidence", "document_extraction_jobs", _migrate_document_extraction_jobs),
+        Migration("evidence", "vector_entries_state", _migrate_vector_entries_state),
     )
 
 
@@ -314,6 +323,75 @@ def _migrate_run_queue_leases(conn: sqlite3.Connection) -> None:
     )
 
 
+def _migrate_run_queue_priority(conn: sqlite3.Connection) -> None:
+    if "priority" not in _columns(conn, "run_queue"):
+        conn.execute("ALTER TABLE run_queue ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+
+
+def _migrate_run_queue_head(conn: sqlite3.Connection) -> None:
+    # run_queue is an append-only status log, so "the run's current status"
+    # used to mean a MAX(queue_id) GROUP BY over the whole log. run_queue_head
+    # keeps one row per run, maintained by triggers so every writer stays in
+    # step, and the claim path reads it through (status, lease_expires_at).
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS run_queue_head (
+            run_id TEXT PRIMARY KEY,
+            queue_id INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            lease_expires_at TEXT,
+            priority INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_run_queue_head_status_lease
+        ON run_queue_head(status, lease_expires_at)
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_run_queue_head_insert
+        AFTER INSERT ON run_queue
+        BEGIN
+            INSERT INTO run_queue_head(run_id, queue_id, status, lease_expires_at, priority)
+            VALUES (NEW.run_id, NEW.queue_id, NEW.status, NEW.lease_expires_at, NEW.priority)
+            ON CONFLICT(run_id) DO UPDATE SET
+                queue_id = excluded.queue_id,
+                status = excluded.status,
+                lease_expires_at = excluded.lease_expires_at,
+                priority = excluded.priority
+            WHERE excluded.queue_id > run_queue_head.queue_id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_run_queue_head_update
+        AFTER UPDATE OF status, lease_expires_at, priority ON run_queue
+        BEGIN
+            UPDATE run_queue_head
+            SET status = NEW.status, lease_expires_at = NEW.lease_expires_at, priority = NEW.priority
+            WHERE run_id = NEW.run_id AND queue_id = NEW.queue_id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO run_queue_head(run_id, queue_id, status, lease_expires_at, priority)
+        SELECT q.run_id, q.queue_id, q.status, q.lease_expires_at, q.priority
+        FROM run_queue q
+        JOIN (
+            SELECT run_id, MAX(queue_id) AS max_queue_id
+            FROM run_queue
+            GROUP BY run_id
+        ) latest
+        ON q.queue_id = latest.max_queue_id
+        """
+    )
+
+
 def _migrate_approval_explanation_fields(conn: sqlite3.Connection) -> None:
     columns = _columns(conn, "approvals")
     additions = {
@@ -503,3 +581,155 @@ def _migrate_slot_signer_revocations(conn: sqlite3.Connection) -> None:
     )
     if "successor_key_id" not in _columns(conn, "slot_signer_revocations"):
         conn.execute("ALTER TABLE slot_signer_revocations ADD COLUMN successor_key_id TEXT")
+
+
+def _migrate_vector_entries_float32(conn: sqlite3.Connection) -> None:
+    columns = _columns(conn, "vector_entries")
+    additions = {
+        "dim": "INTEGER NOT NULL DEFAULT 0",
+        "norm": "REAL NOT NULL DEFAULT 0",
+        "revision": "INTEGER NOT NULL DEFAULT 0",
+    }
+    for column, ddl in additions.items():
+        if column not in columns:
+            conn.execute(f"ALTER TABLE vector_entries ADD COLUMN {column} {ddl}")
+    legacy = conn.execute(
+        "SELECT rowid, vector FROM vector_entries WHERE typeof(vector) = 'text' ORDER BY rowid"
+    ).fetchall()
+    for revision, (rowid, payload) in enumerate(legacy, start=1):
+        values = [float(value) for value in json.loads(payload or "[]")]
+        conn.execute(
+            "UPDATE vector_entries SET vector = ?, dim = ?, norm = ?, revision = ? WHERE rowid = ?",
+            (
+                struct.pack(f"<{len(values)}f", *values),
+                len(values),
+                math.sqrt(sum(value * value for value in values)),
+                revision,
+                rowid,
+            ),
+        )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_vector_entries_revision
+        ON vector_entries(revision)
+        """
+    )
+
+
+def _migrate_vector_entries_state(conn: sqlite3.Connection) -> None:
+    # Vector stores sync their in-process index before every search. A single
+    # state row, kept current by triggers for every writer (including chunk
+    # deletes in the evidence repository), replaces COUNT(*)/MAX(revision)
+    # scans: each written row gets the next revision, and deletes are counted
+    # so readers know to rebuild.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS vector_entries_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            revision INTEGER NOT NULL DEFAULT 0,
+            deletions INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO vector_entries_state(id, revision)
+        SELECT 1, COALESCE(MAX(revision), 0) FROM vector_entries
+        """
+    )
+    for event in ("INSERT", "UPDATE OF vector, text, metadata, dim, norm"):
+        name = "trg_vector_entries_insert" if event == "INSERT" else "trg_vector_entries_update"
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {name}
+            AFTER {event} ON vector_entries
+            BEGIN
+                UPDATE vector_entries_state SET revision = revision + 1 WHERE id = 1;
+                UPDATE vector_entries
+                SET revision = (SELECT revision FROM vector_entries_state WHERE id = 1)
+                WHERE rowid = NEW.rowid;
+            END
+            """
+        )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_vector_entries_delete
+        AFTER DELETE ON vector_entries
+        BEGIN
+            UPDATE vector_entries_state
+            SET revision = revision + 1, deletions = deletions + 1
+            WHERE id = 1;
+        END
+        """
+    )
+
+
+def _migrate_chunk_index_state(conn: sqlite3.Connection) -> None:
+    if "indexed_at" not in _columns(conn, "document_chunks"):
+        conn.execute("ALTER TABLE document_chunks ADD COLUMN indexed_at TEXT")
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_document_chunks_unindexed
+        ON document_chunks(tenant_id, document_id)
+        WHERE indexed_at IS NULL
+        """
+    )
+    # Search used to embed every chunk it read, so chunks that already have a
+    # vector are indexed; tag those vectors with the chunk's tenant so search
+    # can filter on it.
+    conn.execute(
+        """
+        UPDATE vector_entries
+        SET metadata = json_set(
+            COALESCE(metadata, '{}'),
+            '$.tenant_id',
+            COALESCE(
+                (SELECT tenant_id FROM document_chunks WHERE chunk_id = vector_entries.record_id),
+                ?
+            )
+        )
+        WHERE record_id IN (SELECT chunk_id FROM document_chunks)
+        """,
+        (LOCAL_TENANT_ID,),
+    )
+    conn.execute(
+        """
+        UPDATE document_chunks
+        SET indexed_at = ?
+        WHERE indexed_at IS NULL
+          AND chunk_id IN (SELECT record_id FROM vector_entries)
+        """,
+        (utc_now(),),
+    )
+
+
+def _migrate_document_extraction_jobs(conn: sqlite3.Connection) -> None:
+    # One row per document, updated in place as a worker moves it through
+    # pending -> parsing -> chunked -> indexed. Claims read the
+    # (status, lease_expires_at) index; uploads look documents up by
+    # (tenant_id, file_hash) to deduplicate them.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS document_extraction_jobs (
+            document_id TEXT PRIMARY KEY,
+            tenant_id TEXT,
+            file_hash TEXT,
+            status TEXT NOT NULL,
+            attempt_count INTEGER NOT NULL DEFAULT 0,
+            worker_id TEXT,
+            lease_expires_at TEXT,
+            page_count INTEGER,
+            chunk_count INTEGER,
+            error TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_document_extraction_jobs_status_lease
+        ON document_extraction_jobs(status, lease_expires_at)
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_tenant_hash ON documents(tenant_id, file_hash)")
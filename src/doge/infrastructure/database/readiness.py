@@ -7,8 +7,14 @@ import sqlite3
 from pathlib import Path
 from typing import Any
 
+from doge.application.tools.executor import peek_tool_executor
 from doge.config import Settings, get_settings
+from doge.infrastructure.cache.tool_result_cache import peek_tool_result_cache
+from doge.infrastructure.code_execution.sandbox_pool import peek_sandbox_pool
+from doge.infrastructure.database.duckdb_pool import get_duckdb_pool
+from doge.infrastructure.database.sqlite_pool import peek_sqlite_pools
 from doge.infrastructure.database.migration_runner import registered_migrations
+from doge.infrastructure.llm.http_client_pool import peek_model_http_pool
 
 
 def sqlite_access_check(path: Path | str) -> dict[str, Any]:
@@ -49,6 +55,12 @@ class SQLiteRuntimeReadinessProbe:
             "outbox_backlog": self._outbox_backlog_check(),
             "document_storage": self._document_storage_check(),
             "model_provider_configuration": self._model_provider_check(),
+            "duckdb_pool": self._duckdb_pool_check(),
+            "model_http_pool": self._model_http_pool_check(),
+            "tool_result_cache": self._tool_result_cache_check(),
+            "tool_executor": self._tool_executor_check(),
+            "sqlite_pool": self._sqlite_pool_check(),
+            "python_sandbox_pool": self._python_sandbox_pool_check(),
         }
         critical = {"database", "migration_version", "queue_depth", "document_storage"}
         if process_role in {"all", "worker"}:
@@ -163,6 +175,42 @@ class SQLiteRuntimeReadinessProbe:
             "status": "configured" if configured else "unconfigured",
         }
 
+    def _duckdb_pool_check(self) -> dict[str, Any]:
+        pool = get_duckdb_pool()
+        if pool is None:
+            return {"ok": True, "enabled": False}
+        return {"ok": True, "enabled": True, **pool.metrics().as_dict()}
+
+    def _model_http_pool_check(self) -> dict[str, Any]:
+        pool = peek_model_http_pool()
+        if pool is None:
+            return {"ok": True, "enabled": False}
+        return {"ok": True, "enabled": True, **pool.metrics().as_dict()}
+
+    def _tool_result_cache_check(self) -> dict[str, Any]:
+        cache = peek_tool_result_cache()
+        if cache is None:
+            return {"ok": True, "enabled": False}
+        return {"ok": True, "enabled": True, **cache.metrics()}
+
+    def _tool_executor_check(self) -> dict[str, Any]:
+        executor = peek_tool_executor()
+        if executor is None:
+            return {"ok": True, "enabled": False}
+        return {"ok": True, "enabled": True, "pools": executor.metrics()}
+
+    def _sqlite_pool_check(self) -> dict[str, Any]:
+        pools = peek_sqlite_pools()
+        if pools is None:
+            return {"ok": True, "enabled": False}
+        return {"ok": True, "enabled": True, "files": [pool.as_dict() for pool in pools.metrics()]}
+
+    def _python_sandbox_pool_check(self) -> dict[str, Any]:
+        pool = peek_sandbox_pool()
+        if pool is None:
+            return {"ok": True, "enabled": False}
+        return {"ok": True, "enabled": True, **pool.metrics().as_dict()}
+
     def _latest_status_counts(self, table: str, entity_column: str, order_column: str) -> dict[str, int]:
         with self._connect() as conn:
             rows = conn.execute(
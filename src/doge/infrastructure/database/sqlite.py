@@ -1,6 +1,9 @@
 """SQLite connection adapter with context-manager support.
 
 Replaces scattered `sqlite3.connect()` calls in routers and analysis modules.
+Connections come from the process-wide pools in
+:mod:`doge.infrastructure.database.sqlite_pool` unless pooling is disabled
+(``DOGE_SQLITE_POOL_SIZE=0``) or the database is in-memory.
 """
 
 import sqlite3
@@ -9,6 +12,7 @@ from pathlib import Path
 from typing import Generator
 
 from doge.config import get_settings
+from doge.infrastructure.database.sqlite_pool import get_sqlite_pools
 
 
 def _ensure_parent_dir(db_path: str) -> None:
@@ -77,6 +81,13 @@ class SQLiteConnection:
         """Yield a configured SQLite connection."""
         db_path = self._resolve_path()
         _ensure_parent_dir(db_path)
+        pools = get_sqlite_pools()
+        if pools is not None and db_path != ":memory:" and not db_path.startswith("file:"):
+            with pools.connection(db_path) as conn:
+                if self._use_row_factory:
+                    conn.row_factory = sqlite3.Row
+                yield conn
+            return
         conn = sqlite3.connect(db_path)
         conn.execute("PRAGMA foreign_keys = ON")
         if self._use_row_factory:
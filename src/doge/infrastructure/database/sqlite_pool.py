@@ -0,0 +1,346 @@
+"""Process-wide pools of tuned SQLite connections, one pool per database file.
+
+``SQLiteConnection.connect()`` used to open and close a ``sqlite3`` handle for
+every repository call, so a single agent run step paid for dozens of opens,
+schema parses and cold statement caches. While a :class:`SQLitePoolRegistry`
+is installed (the default, see :func:`get_sqlite_pools`), ``connect()`` checks
+a connection out of the pool for its database file instead:
+
+* connections are opened once with ``busy_timeout``, ``mmap_size``,
+  ``temp_store = MEMORY``, ``foreign_keys = ON`` and a larger prepared
+  statement cache, and are reused across threads one checkout at a time;
+* the application's own state databases are switched to WAL with
+  ``synchronous = NORMAL``: SQLite then allows one writer alongside any
+  number of readers, and ``busy_timeout`` queues competing writers. The market
+  files are left in their journal mode — a scan process writes them and the
+  tool result cache watches their size and mtime;
+* on checkin any transaction the caller left open is rolled back and cursors
+  it left unexhausted are closed, so the next caller neither inherits writes
+  nor reads through a stale WAL snapshot;
+* a pool keeps at most ``size`` idle connections. A checkout never waits —
+  nested ``connect()`` calls on one thread stay deadlock-free — and surplus
+  connections are closed on checkin;
+* at most ``max_paths`` files keep pools (least recently used first out), and
+  a pool whose file was deleted or replaced drops its connections.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Generator, Iterable, Optional
+
+from doge.config import get_settings
+
+BUSY_TIMEOUT_SECONDS = 30.0
+MMAP_SIZE_BYTES = 64 * 1024 * 1024
+CACHED_STATEMENTS = 256
+
+
+@dataclass(frozen=True)
+class SQLitePoolMetrics:
+    """Point-in-time counters of one database file's pool."""
+
+    path: str
+    wal: bool
+    size: int
+    idle: int
+    in_use: int
+    opened: int
+    checkouts: int
+    reused: int
+    discarded: int
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class PooledSQLiteConnection(sqlite3.Connection):
+    """``sqlite3.Connection`` that remembers the cursors handed out since checkout."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._open_cursors: weakref.WeakSet[sqlite3.Cursor] = weakref.WeakSet()
+        self.pool_generation = 0
+
+    def cursor(self, *args, **kwargs) -> sqlite3.Cursor:
+        cursor = super().cursor(*args, **kwargs)
+        self._open_cursors.add(cursor)
+        return cursor
+
+    def execute(self, sql: str, parameters=(), /) -> sqlite3.Cursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, parameters, /) -> sqlite3.Cursor:
+        return self.cursor().executemany(sql, parameters)
+
+    def executescript(self, sql_script: str, /) -> sqlite3.Cursor:
+        return self.cursor().executescript(sql_script)
+
+    def reset_for_reuse(self) -> None:
+        """Close leftover cursors and roll back an open transaction."""
+        cursors = list(self._open_cursors)
+        self._open_cursors.clear()
+        for cursor in cursors:
+            cursor.close()
+        if self.in_transaction:
+            self.rollback()
+        self.row_factory = None
+        self.isolation_level = ""
+
+
+class SQLiteConnectionPool:
+    """Reusable, pre-tuned connections to one SQLite database file.
+
+    Parameters
+    ----------
+    db_path:
+        The database file.
+    size:
+        Idle connections kept for reuse.
+    wal:
+        Switch the file to WAL with ``synchronous = NORMAL``.
+    """
+
+    def __init__(self, db_path: str, size: int = 4, *, wal: bool = True) -> None:
+        self.db_path = db_path
+        self.size = max(1, size)
+        self.wal = wal
+        self._lock = threading.Lock()
+        self._idle: list[PooledSQLiteConnection] = []
+        self._identity: Optional[tuple[int, int]] = None
+        self._generation = 0
+        self._closed = False
+        self._in_use = 0
+        self._opened = 0
+        self._checkouts = 0
+        self._reused = 0
+        self._discarded = 0
+
+    @contextmanager
+    def connection(self) -> Generator[PooledSQLiteConnection, None, None]:
+        """Yield a pooled connection; it returns to the pool afterwards."""
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._checkin(conn)
+
+    def metrics(self) -> SQLitePoolMetrics:
+        with self._lock:
+            return SQLitePoolMetrics(
+                path=self.db_path,
+                wal=self.wal,
+                size=self.size,
+                idle=len(self._idle),
+                in_use=self._in_use,
+                opened=self._opened,
+                checkouts=self._checkouts,
+                reused=self._reused,
+                discarded=self._discarded,
+            )
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones close on checkin."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _checkout(self) -> PooledSQLiteConnection:
+        identity = _file_identity(self.db_path)
+        stale: list[PooledSQLiteConnection] = []
+        conn: Optional[PooledSQLiteConnection] = None
+        with self._lock:
+            if identity != self._identity:
+                # Deleted or replaced underneath us: pooled handles point at the old file.
+                stale, self._idle = self._idle, []
+                self._discarded += len(stale)
+                self._identity = identity
+                self._generation += 1
+            if self._idle:
+                conn = self._idle.pop()
+                self._reused += 1
+            self._checkouts += 1
+            self._in_use += 1
+            generation = self._generation
+        for old in stale:
+            old.close()
+        if conn is not None:
+            return conn
+        try:
+            conn = self._open()
+        except BaseException:
+            with self._lock:
+                self._in_use -= 1
+            raise
+        conn.pool_generation = generation
+        with self._lock:
+            self._opened += 1
+            if self._identity is None and generation == self._generation:
+                self._identity = _file_identity(self.db_path)
+        return conn
+
+    def _checkin(self, conn: PooledSQLiteConnection) -> None:
+        try:
+            conn.reset_for_reuse()
+            reusable = True
+        except sqlite3.Error:
+            # Closed by the caller or left in a state rollback cannot repair.
+            reusable = False
+        with self._lock:
+            self._in_use -= 1
+            keep = (
+                reusable
+                and not self._closed
+                and conn.pool_generation == self._generation
+                and len(self._idle) < self.size
+            )
+            if keep:
+                self._idle.append(conn)
+            else:
+                self._discarded += 1
+        if not keep:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def _open(self) -> PooledSQLiteConnection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS,
+            factory=PooledSQLiteConnection,
+        )
+        try:
+            if self.wal:
+                try:
+                    conn.execute("PRAGMA journal_mode = WAL")
+                except sqlite3.OperationalError:
+                    # Another connection holds a lock; WAL is persistent, so a later open retries.
+                    pass
+                conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(f"PRAGMA busy_timeout = {int(BUSY_TIMEOUT_SECONDS * 1000)}")
+            conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.reset_for_reuse()
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+
+class SQLitePoolRegistry:
+    """One :class:`SQLiteConnectionPool` per database file, bounded in count.
+
+    Parameters
+    ----------
+    size:
+        Idle connections each pool keeps.
+    max_paths:
+        Database files with a live pool; the least recently used is closed
+        when another file needs one.
+    journal_exempt:
+        Files left in their own journal mode instead of WAL.
+    """
+
+    def __init__(self, size: int = 4, *, max_paths: int = 16, journal_exempt: Iterable[Path | str] = ()) -> None:
+        self.size = max(1, size)
+        self.max_paths = max(1, max_paths)
+        self._journal_exempt = frozenset(_normalize(path) for path in journal_exempt)
+        self._lock = threading.Lock()
+        self._pools: OrderedDict[str, SQLiteConnectionPool] = OrderedDict()
+        self._pid = os.getpid()
+
+    @contextmanager
+    def connection(self, db_path: str) -> Generator[PooledSQLiteConnection, None, None]:
+        with self.pool(db_path).connection() as conn:
+            yield conn
+
+    def pool(self, db_path: str) -> SQLiteConnectionPool:
+        key = _normalize(db_path)
+        evicted: list[SQLiteConnectionPool] = []
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked child: the parent's handles must not be used or closed here.
+                self._pools = OrderedDict()
+                self._pid = os.getpid()
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = SQLiteConnectionPool(db_path, self.size, wal=key not in self._journal_exempt)
+                self._pools[key] = pool
+                while len(self._pools) > self.max_paths:
+                    evicted.append(self._pools.popitem(last=False)[1])
+            else:
+                self._pools.move_to_end(key)
+        for old in evicted:
+            old.close()
+        return pool
+
+    def metrics(self) -> list[SQLitePoolMetrics]:
+        with self._lock:
+            pools = list(self._pools.values())
+        return [pool.metrics() for pool in pools]
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+
+def _normalize(db_path: Path | str) -> str:
+    return os.path.normcase(os.path.abspath(os.path.expanduser(str(db_path))))
+
+
+def _file_identity(db_path: str) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+_REGISTRY: Optional[SQLitePoolRegistry] = None
+_REGISTRY_LOADED = False
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_sqlite_pools() -> Optional[SQLitePoolRegistry]:
+    """Return the process-wide registry, or None when pooling is disabled."""
+    global _REGISTRY, _REGISTRY_LOADED
+    if _REGISTRY_LOADED:
+        return _REGISTRY
+    with _REGISTRY_LOCK:
+        if not _REGISTRY_LOADED:
+            db = get_settings().db
+            if db.sqlite_pool_size > 0:
+                _REGISTRY = SQLitePoolRegistry(db.sqlite_pool_size, journal_exempt=(db.cn_db, db.us_db))
+            _REGISTRY_LOADED = True
+        return _REGISTRY
+
+
+def peek_sqlite_pools() -> Optional[SQLitePoolRegistry]:
+    """Return the process-wide registry only if one has been created."""
+    return _REGISTRY
+
+
+def close_sqlite_pools() -> None:
+    """Close every pooled connection; the next ``connect()`` re-reads settings."""
+    global _REGISTRY, _REGISTRY_LOADED
+    with _REGISTRY_LOCK:
+        registry, _REGISTRY = _REGISTRY, None
+        _REGISTRY_LOADED = False
+    if registry is not None:
+        registry.close()
@@ -19,13 +19,39 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Mapping, Optional
 
 from doge.config import get_settings
-from doge.core.ports.repository import IStockRepository, StorageWriteError
+from doge.core.ports.file_scanner import TdxFileWatermark
+from doge.core.ports.repository import (
+    IStockRepository,
+    PriceBatchWriteResult,
+    StorageWriteError,
+)
 
 logger = logging.getLogger(__name__)
 
+PRICE_COLUMNS = ("ticker", "date", "open", "high", "low", "close", "volume", "amount")
+
+_UPSERT_PRICES_SQL = (
+    "INSERT INTO stock_prices (ticker, date, open, high, low, close, volume, amount) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(ticker, date) DO UPDATE SET "
+    "open = excluded.open, high = excluded.high, low = excluded.low, "
+    "close = excluded.close, volume = excluded.volume, amount = excluded.amount"
+)
+
+# Local-scan bookkeeping: what each ticker's .day file looked like when its
+# bars were last persisted (see TDXFileScanner.scan_local_delta).
+_CREATE_WATERMARKS_SQL = (
+    "CREATE TABLE IF NOT EXISTS tdx_file_watermarks ("
+    "ticker TEXT PRIMARY KEY, file_size INTEGER NOT NULL, "
+    "mtime_ns INTEGER NOT NULL, last_date TEXT NOT NULL, updated_at TEXT NOT NULL)"
+)
+
+# Keeps ``ticker IN (...)`` parameter lists under SQLite's host-parameter cap.
+_IN_CLAUSE_CHUNK = 500
+
 
 class SQLiteStorageRepository(IStockRepository):
     """Write-capable market price repository backed by direct SQLite access.
@@ -102,6 +128,7 @@ class SQLiteStorageRepository(IStockRepository):
                     "low REAL, close REAL, volume INTEGER, amount REAL, "
                     "PRIMARY KEY (ticker, date))"
                 )
+                conn.execute(_CREATE_WATERMARKS_SQL)
                 conn.commit()
             finally:
                 conn.close()
@@ -186,6 +213,192 @@ class SQLiteStorageRepository(IStockRepository):
         appended = max(0, rows_after - rows_before)
         return appended
 
+    def save_prices_batch(
+        self, market: str, frames: Iterable
+    ) -> PriceBatchWriteResult:
+        """Persist many per-ticker frames with one connection and transaction.
+
+        Each frame keeps the :meth:`save_prices` append semantics: only bars
+        newer than the ticker's stored ``MAX(date)`` are written. The
+        watermarks for the whole batch come from one grouped query, rows go
+        in through a single ``executemany`` upsert on ``(ticker, date)``, and
+        retention is pruned once for every ticker that gained rows. Appended
+        counts are the number of distinct new dates per ticker, so no
+        before/after ``COUNT(*)`` is needed.
+
+        If the batch transaction fails it is rolled back and the frames are
+        retried one by one through :meth:`save_prices`, so only the offending
+        tickers end up in ``failed``.
+
+        Args:
+            market: ``"cn"`` or ``"us"``.
+            frames: Frames shaped as for :meth:`save_prices`.
+
+        Returns:
+            A :class:`PriceBatchWriteResult` keyed by ticker.
+
+        Raises:
+            ValueError: If ``market`` is not ``"cn"`` or ``"us"``.
+        """
+        db_path = self._db_path(market)
+        frames = [
+            frame for frame in frames
+            if frame is not None and not frame.empty and "ticker" in frame.columns
+        ]
+        if not frames:
+            return PriceBatchWriteResult()
+
+        import os
+        import sqlite3
+        from datetime import datetime, timedelta
+
+        retention_days = get_settings().market.retention_days
+        cutoff = (datetime.now() - timedelta(days=retention_days)).strftime("%Y-%m-%d")
+        tickers = [str(frame["ticker"].iloc[0]) for frame in frames]
+        os.makedirs(os.path.dirname(str(db_path)), exist_ok=True)
+
+        appended: dict[str, int] = {}
+        try:
+            conn = sqlite3.connect(str(db_path))
+            try:
+                latest = self._latest_dates(conn, tickers)
+                rows = []
+                for ticker, frame in zip(tickers, frames):
+                    max_existing = latest.get(ticker)
+                    new_data = frame[frame["date"] > max_existing] if max_existing else frame
+                    appended[ticker] = appended.get(ticker, 0) + int(new_data["date"].nunique())
+                    if new_data.empty:
+                        continue
+                    # Optional columns (e.g. ``amount``) a source does not
+                    # provide are stored as NULL, as ``save_prices`` does.
+                    batch = new_data.reindex(columns=list(PRICE_COLUMNS)).astype(object)
+                    batch = batch.where(batch.notna(), None)
+                    batch["ticker"] = ticker
+                    rows.extend(batch.itertuples(index=False, name=None))
+                if rows:
+                    conn.executemany(_UPSERT_PRICES_SQL, rows)
+                    written = [t for t in dict.fromkeys(tickers) if appended.get(t)]
+                    for start in range(0, len(written), _IN_CLAUSE_CHUNK):
+                        chunk = written[start:start + _IN_CLAUSE_CHUNK]
+                        placeholders = ", ".join("?" for _ in chunk)
+                        conn.execute(
+                            "DELETE FROM stock_prices WHERE date < ? "
+                            f"AND ticker IN ({placeholders})",
+                            (cutoff, *chunk),
+                        )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+        except Exception as exc:
+            logger.warning(
+                "save_prices_batch failed market=%s db=%s tickers=%d: %s; "
+                "falling back to per-ticker save_prices",
+                market, db_path, len(frames), exc, exc_info=True,
+            )
+            return super().save_prices_batch(market, frames)
+
+        return PriceBatchWriteResult(appended=appended)
+
+    def get_file_watermarks(self, market: str) -> Mapping[str, TdxFileWatermark]:
+        """Load the ``tdx_file_watermarks`` rows for ``market``.
+
+        Best-effort: a missing table or unreadable DB yields ``{}``, which
+        only costs a full rescan.
+        """
+        db_path = self._db_path(market)
+        import sqlite3
+
+        try:
+            conn = sqlite3.connect(str(db_path))
+            try:
+                rows = conn.execute(
+                    "SELECT ticker, file_size, mtime_ns, last_date FROM tdx_file_watermarks"
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return {}
+        return {
+            ticker: TdxFileWatermark(
+                ticker=ticker, size=int(size), mtime_ns=int(mtime_ns), last_date=last_date
+            )
+            for ticker, size, mtime_ns, last_date in rows
+        }
+
+    def save_file_watermarks(
+        self, market: str, watermarks: Iterable[TdxFileWatermark]
+    ) -> None:
+        """Upsert watermarks in one transaction.
+
+        Raises:
+            ValueError: If ``market`` is not ``"cn"`` or ``"us"``.
+            StorageWriteError: If the write fails; the cause is chained.
+        """
+        db_path = self._db_path(market)
+        rows = [
+            (w.ticker, w.size, w.mtime_ns, w.last_date) for w in watermarks
+        ]
+        if not rows:
+            return
+        import sqlite3
+        from datetime import datetime
+
+        updated_at = datetime.now().isoformat(timespec="seconds")
+        try:
+            conn = sqlite3.connect(str(db_path))
+            try:
+                conn.execute(_CREATE_WATERMARKS_SQL)
+                conn.executemany(
+                    "INSERT INTO tdx_file_watermarks "
+                    "(ticker, file_size, mtime_ns, last_date, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(ticker) DO UPDATE SET "
+                    "file_size = excluded.file_size, mtime_ns = excluded.mtime_ns, "
+                    "last_date = excluded.last_date, updated_at = excluded.updated_at",
+                    [(*row, updated_at) for row in rows],
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as exc:
+            logger.error(
+                "save_file_watermarks failed market=%s db=%s: %s",
+                market, db_path, exc, exc_info=True,
+            )
+            raise StorageWriteError(
+                f"watermark write failed for market={market} db={db_path}: {exc}"
+            ) from exc
+
+    @staticmethod
+    def _db_path(market: str) -> Path:
+        """Resolve the market SQLite path via centralized settings."""
+        if market == "cn":
+            return get_settings().db.cn_db
+        if market == "us":
+            return get_settings().db.us_db
+        raise ValueError(
+            f"unknown market {market!r}; expected 'cn' or 'us'"
+        )
+
+    @staticmethod
+    def _latest_dates(conn, tickers: list[str]) -> dict[str, str]:
+        """Return ``{ticker: MAX(date)}`` for the tickers already stored."""
+        latest: dict[str, str] = {}
+        unique = list(dict.fromkeys(tickers))
+        for start in range(0, len(unique), _IN_CLAUSE_CHUNK):
+            chunk = unique[start:start + _IN_CLAUSE_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            cur = conn.execute(
+                "SELECT ticker, MAX(date) FROM stock_prices "
+                f"WHERE ticker IN ({placeholders}) GROUP BY ticker",
+                chunk,
+            )
+            latest.update({ticker: max_date for ticker, max_date in cur.fetchall() if max_date})
+        return latest
+
     @staticmethod
     def _count_rows(db_path: Path, frame) -> int:
         """Count rows currently stored for the frame's ticker.
@@ -92,7 +92,7 @@ class SQLiteAgentUnitOfWork(IAgentUnitOfWork):
                 self._insert_outbox(conn, created_event)
                 self._insert_event(conn, queued_event, tenant_id=tenant_id)
                 self._insert_outbox(conn, queued_event)
-                self._insert_queue_status(conn, run.run_id, "queued")
+                self._insert_queue_status(conn, run.run_id, "queued", priority=_queue_priority(run))
                 self._touch_session(conn, session_id)
                 conn.commit()
                 events_to_publish = [created_event, queued_event]
@@ -209,19 +209,34 @@ class SQLiteAgentUnitOfWork(IAgentUnitOfWork):
             ),
         )
 
-    def _insert_queue_status(self, conn: sqlite3.Connection, run_id: str, status: str) -> None:
+    def _insert_queue_status(
+        self,
+        conn: sqlite3.Connection,
+        run_id: str,
+        status: str,
+        *,
+        priority: int = 0,
+    ) -> None:
         conn.execute(
             """
-            INSERT INTO run_queue(run_id, status, created_at, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            INSERT INTO run_queue(run_id, status, priority, created_at, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """,
-            (run_id, status),
+            (run_id, status, priority),
         )
 
     def _touch_session(self, conn: sqlite3.Connection, session_id: str) -> None:
         conn.execute("UPDATE sessions SET updated_at = ? WHERE session_id = ?", (utc_now(), session_id))
 
 
+def _queue_priority(run: AgentRun) -> int:
+    """Read the optional ``queue_priority`` model-policy field (higher runs first)."""
+    try:
+        return int(run.model_policy.extra.get("queue_priority") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
 def _json_dumps(value: Any) -> str:
     import json
 
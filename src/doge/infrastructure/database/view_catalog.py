@@ -0,0 +1,100 @@
+"""Per-view schema and row counts recorded at refresh time.
+
+Counting the analytical views is expensive — the RSRS and enriched views are
+window queries over the whole market — so ``list_views`` and the view stats
+must not run ``COUNT(*)`` per request. :func:`write_view_catalog` runs at the
+end of every ``refresh_views`` (after the materialized tables are refreshed)
+and records each view's columns and row count in :data:`CATALOG_TABLE` with a
+``refreshed_at`` timestamp; readers answer from that table with a single
+query via :func:`read_view_catalog`.
+
+The counts describe the data as of ``refreshed_at``. Every writer of the
+market files refreshes the views afterwards, so the catalog stays in step.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Iterable, Optional
+
+import duckdb
+
+from doge.core.ports.market_view import ViewCatalogEntry
+
+logger = logging.getLogger(__name__)
+
+CATALOG_TABLE = "view_catalog"
+
+_CREATE_CATALOG_SQL = (
+    f"CREATE TABLE IF NOT EXISTS {CATALOG_TABLE} ("
+    "name VARCHAR PRIMARY KEY, columns VARCHAR, row_count BIGINT, refreshed_at TIMESTAMP)"
+)
+
+
+def write_view_catalog(con: duckdb.DuckDBPyConnection, hidden: Iterable[str] = ()) -> int:
+    """Record every view's columns and row count; return the number recorded.
+
+    ``hidden`` names views left out of the catalog (the ``*_live`` sources of
+    materialized tables). Counting happens before the catalog is replaced, so
+    readers never see a half-written catalog.
+    """
+    skip = set(hidden)
+    names = [
+        row[0]
+        for row in con.execute(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_catalog = current_database() AND table_schema = 'main' "
+            "AND table_type = 'VIEW' ORDER BY table_name"
+        ).fetchall()
+        if row[0] not in skip
+    ]
+    columns: dict[str, list[list[str]]] = {name: [] for name in names}
+    for name, column, data_type in con.execute(
+        "SELECT table_name, column_name, data_type FROM information_schema.columns "
+        "WHERE table_catalog = current_database() AND table_schema = 'main' "
+        "ORDER BY table_name, ordinal_position"
+    ).fetchall():
+        if name in columns:
+            columns[name].append([column, data_type])
+    rows = []
+    for name in names:
+        try:
+            count = con.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+        except duckdb.Error as exc:
+            logger.warning("view catalog count failed view=%s: %s", name, exc)
+            count = None
+        rows.append([name, json.dumps(columns[name]), count])
+
+    con.execute(_CREATE_CATALOG_SQL)
+    con.execute("BEGIN TRANSACTION")
+    try:
+        con.execute(f"DELETE FROM {CATALOG_TABLE}")
+        if rows:
+            con.executemany(
+                f"INSERT INTO {CATALOG_TABLE} VALUES (?, ?, ?, CAST(now() AS TIMESTAMP))", rows
+            )
+        con.execute("COMMIT")
+    except Exception:
+        con.execute("ROLLBACK")
+        raise
+    return len(rows)
+
+
+def read_view_catalog(con: duckdb.DuckDBPyConnection) -> Optional[list[ViewCatalogEntry]]:
+    """Return the recorded catalog, or ``None`` when no refresh has written one."""
+    try:
+        rows = con.execute(
+            f"SELECT name, columns, row_count, refreshed_at FROM {CATALOG_TABLE} ORDER BY name"
+        ).fetchall()
+    except duckdb.Error:
+        return None
+    return [
+        ViewCatalogEntry(
+            name=name,
+            columns=tuple((column, data_type) for column, data_type in json.loads(columns or "[]")),
+            row_count=row_count,
+            refreshed_at=refreshed_at.isoformat() if refreshed_at else None,
+        )
+        for name, columns, row_count, refreshed_at in rows
+    ]
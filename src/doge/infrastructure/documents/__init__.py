@@ -2,6 +2,7 @@
 
 from doge.infrastructure.documents.file_extractor import FileExtractor
 from doge.infrastructure.documents.local_parser import LocalDocumentParser
+from doge.infrastructure.documents.parse_pool import DocumentParsePool
 from doge.infrastructure.documents.slot import LocalDocumentParserSlot
 
-__all__ = ["FileExtractor", "LocalDocumentParser", "LocalDocumentParserSlot"]
+__all__ = ["DocumentParsePool", "FileExtractor", "LocalDocumentParser", "LocalDocumentParserSlot"]
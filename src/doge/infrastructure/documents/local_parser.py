@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterator
 
 
 class LocalDocumentParser:
@@ -10,16 +11,54 @@ class LocalDocumentParser:
 
     The interview demo keeps extraction deterministic. Binary office/image
     formats degrade to a metadata snippet unless a real extractor is introduced.
+
+    :meth:`parse` returns a bounded preview; :meth:`iter_pages` streams the
+    whole document page by page (form feeds separate pages) without holding
+    more than one page in memory.
     """
 
     TEXT_SUFFIXES = {".txt", ".md", ".csv", ".json", ".log"}
+    READ_SIZE = 64 * 1024
+    # Text without form feeds is cut into pages of at most this many
+    # characters, at the last line break, so one page never holds the file.
+    MAX_PAGE_CHARS = 100_000
 
     def parse(self, path: str | Path, *, max_chars: int = 12000) -> str:
+        file_path = self._existing(path)
+        if file_path.suffix.lower() in self.TEXT_SUFFIXES:
+            with file_path.open("r", encoding="utf-8", errors="replace") as handle:
+                return handle.read(max_chars)
+        return self._binary_snippet(file_path)
+
+    def iter_pages(self, path: str | Path) -> Iterator[str]:
+        file_path = self._existing(path)
+        if file_path.suffix.lower() not in self.TEXT_SUFFIXES:
+            yield self._binary_snippet(file_path)
+            return
+        buffer = ""
+        with file_path.open("r", encoding="utf-8", errors="replace") as handle:
+            while True:
+                block = handle.read(self.READ_SIZE)
+                if not block:
+                    break
+                buffer += block
+                *pages, buffer = buffer.split("\f")
+                yield from pages
+                while len(buffer) > self.MAX_PAGE_CHARS:
+                    cut = buffer.rfind("\n", 0, self.MAX_PAGE_CHARS) + 1 or self.MAX_PAGE_CHARS
+                    yield buffer[:cut]
+                    buffer = buffer[cut:]
+        yield buffer
+
+    @staticmethod
+    def _existing(path: str | Path) -> Path:
         file_path = Path(path)
         if not file_path.exists():
             raise FileNotFoundError(str(file_path))
-        if file_path.suffix.lower() in self.TEXT_SUFFIXES:
-            return file_path.read_text(encoding="utf-8", errors="replace")[:max_chars]
+        return file_path
+
+    @staticmethod
+    def _binary_snippet(file_path: Path) -> str:
         return (
             f"[binary document: {file_path.name}; suffix={file_path.suffix}; "
             f"bytes={file_path.stat().st_size}]"
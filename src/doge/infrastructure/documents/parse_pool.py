@@ -0,0 +1,139 @@
+"""Process pool that runs document parsing off the daemon's threads."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import struct
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+_worker_parser: Any = None
+_PAGE_HEADER = struct.Struct(">Q")
+
+
+class DocumentParsePool:
+    """Parse documents on a bounded pool of worker processes.
+
+    Implements the ``parse(path, *, max_chars)`` and ``iter_pages(path)``
+    parser ports, so it can stand in for the configured parser wherever the
+    background extraction worker parses uploads. :meth:`iter_pages` has the
+    child spool the pages to a temporary file, length-prefixed, and then
+    reads them back one at a time, so neither process holds the whole
+    document. Each child builds its parser once with
+    ``parser_factory``, which must be a picklable module-level callable
+    returning a parser with both ports.
+    ``spawn`` is used because the pool lives inside the threaded daemon
+    where ``fork`` is unsafe. The pool starts lazily on the first parse and
+    is rebuilt if a child dies; ``processes=0`` parses in the calling thread.
+    """
+
+    def __init__(self, parser_factory: Callable[[], Any], *, processes: int = 2) -> None:
+        self._parser_factory = parser_factory
+        self._processes = max(0, processes)
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._local_parser: Any = None
+
+    @property
+    def processes(self) -> int:
+        return self._processes
+
+    def parse(self, path: str | Path, *, max_chars: int = 12000) -> str:
+        if self._processes == 0:
+            return self._parse_local(path, max_chars)
+        pool = self._ensure_pool()
+        try:
+            return pool.submit(_parse_job, str(path), max_chars).result()
+        except BrokenProcessPool:
+            logger.warning("document parse pool broke; restarting path=%s", path)
+            self._discard_pool(pool)
+            raise
+
+    def iter_pages(self, path: str | Path) -> Iterator[str]:
+        if self._processes == 0:
+            yield from self._local().iter_pages(path)
+            return
+        fd, spool = tempfile.mkstemp(prefix="doge-pages-", suffix=".spool")
+        os.close(fd)
+        try:
+            pool = self._ensure_pool()
+            try:
+                pool.submit(_spool_pages_job, str(path), spool).result()
+            except BrokenProcessPool:
+                logger.warning("document parse pool broke; restarting path=%s", path)
+                self._discard_pool(pool)
+                raise
+            with open(spool, "rb") as handle:
+                yield from _read_spooled_pages(handle)
+        finally:
+            os.unlink(spool)
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _parse_local(self, path: str | Path, max_chars: int) -> str:
+        return self._local().parse(path, max_chars=max_chars)
+
+    def _local(self) -> Any:
+        with self._lock:
+            if self._local_parser is None:
+                self._local_parser = self._parser_factory()
+            return self._local_parser
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self._parser_factory,),
+                )
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _init_worker(parser_factory: Callable[[], Any]) -> None:
+    """Process-pool initializer: build the parser once per child."""
+    global _worker_parser
+    _worker_parser = parser_factory()
+
+
+def _parse_job(path: str, max_chars: int) -> str:
+    """Process-pool entry point: parse one document in a worker process."""
+    return _worker_parser.parse(path, max_chars=max_chars)
+
+
+def _spool_pages_job(path: str, spool: str) -> int:
+    """Process-pool entry point: write a document's pages to *spool*."""
+    count = 0
+    with open(spool, "wb") as handle:
+        for page in _worker_parser.iter_pages(path):
+            data = page.encode("utf-8", errors="replace")
+            handle.write(_PAGE_HEADER.pack(len(data)))
+            handle.write(data)
+            count += 1
+    return count
+
+
+def _read_spooled_pages(handle: BinaryIO) -> Iterator[str]:
+    while header := handle.read(_PAGE_HEADER.size):
+        (length,) = _PAGE_HEADER.unpack(header)
+        yield handle.read(length).decode("utf-8")
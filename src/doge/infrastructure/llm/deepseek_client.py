@@ -2,7 +2,8 @@
 
 This adapter wraps the OpenAI SDK (used by DeepSeek's compatible API) and is
 intentionally the **only** module under ``doge.infrastructure`` that imports
-``openai``. It degrades to ``None`` when the API key is missing or the request
+``openai`` for chat (clients come from the shared
+:mod:`~doge.infrastructure.llm.http_client_pool`). It degrades to ``None`` when the API key is missing or the request
 fails, so callers never need to catch SDK-specific exceptions.
 """
 
@@ -12,6 +13,7 @@ from typing import Optional
 from doge.config import get_settings
 from doge.core.ports.llm import ILLMClient
 from doge.core.ports.secrets import ISecretProvider
+from doge.infrastructure.llm.http_client_pool import ModelHttpClientPool, get_model_http_pool
 from doge.infrastructure.secrets import EnvSecretProvider
 
 logger = logging.getLogger(__name__)
@@ -22,11 +24,18 @@ class DeepSeekClient(ILLMClient):
 
     Reads endpoint, model, and API key from :class:`~doge.config.settings.Settings`.
     Lazy-imports ``openai`` inside :meth:`chat` so the rest of the package can be
-    imported without the optional ``openai`` extra installed.
+    imported without the optional ``openai`` extra installed. The client itself
+    is pooled per base URL and key, so repeated calls reuse open connections.
     """
 
-    def __init__(self, *, secret_provider: ISecretProvider | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        secret_provider: ISecretProvider | None = None,
+        http_pool: ModelHttpClientPool | None = None,
+    ) -> None:
         self._secret_provider = secret_provider or EnvSecretProvider()
+        self._http_pool = http_pool
 
     def chat(
         self,
@@ -48,13 +57,16 @@ class DeepSeekClient(ILLMClient):
             return None
 
         try:
-            import openai
+            import openai  # noqa: F401
         except ImportError:  # pragma: no cover - optional extra
             logger.warning("openai package not installed")
             return None
 
         try:
-            client = openai.OpenAI(api_key=api_key, base_url=settings.deepseek.base_url)
+            client = (self._http_pool or get_model_http_pool()).openai(
+                api_key=api_key,
+                base_url=settings.deepseek.base_url,
+            )
             response = client.chat.completions.create(
                 model=settings.deepseek.model,
                 messages=[
@@ -0,0 +1,362 @@
+"""Process-lifetime pooled HTTP clients for OpenAI-compatible model providers.
+
+Building an ``openai`` client per chat call also builds a new httpx connection
+pool, so every model round paid DNS, TCP and TLS setup again. The
+:class:`ModelHttpClientPool` keeps one client per (client class, event loop,
+base URL, credential, headers, timeout) for the life of the process:
+
+* connections are kept alive between calls, within the configured
+  ``httpx.Limits``;
+* HTTP/2 is negotiated when enabled and the optional ``h2`` package is
+  installed, otherwise the pool quietly stays on HTTP/1.1;
+* async clients are bound to the event loop that created them, and clients of
+  closed loops are dropped on the next lookup;
+* every request passes through a counting transport, so :meth:`metrics`
+  reports in-flight requests and how many requests started while the pool was
+  saturated (and therefore had to wait for a connection).
+
+The daemon closes the installed pool on shutdown (see
+:func:`aclose_model_http_pool`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Mapping, Optional
+
+import httpx
+
+from doge.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelHttpPoolMetrics:
+    """Point-in-time counters for readiness/diagnostics output."""
+
+    clients: int
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    in_flight: int
+    peak_in_flight: int
+    requests: int
+    saturated_requests: int
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _RequestCounters:
+    def __init__(self, max_connections: int) -> None:
+        self._lock = threading.Lock()
+        self._max_connections = max_connections
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.saturated_requests = 0
+
+    def started(self) -> None:
+        with self._lock:
+            if self.in_flight >= self._max_connections:
+                self.saturated_requests += 1
+            self.in_flight += 1
+            self.requests += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self) -> None:
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+
+
+class _CountedAsyncStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, counters: _RequestCounters) -> None:
+        self._stream = stream
+        self._counters = counters
+        self._closed = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._counters.finished()
+        await self._stream.aclose()
+
+
+class _CountedSyncStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, counters: _RequestCounters) -> None:
+        self._stream = stream
+        self._counters = counters
+        self._closed = False
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._counters.finished()
+        self._stream.close()
+
+
+class _CountingAsyncTransport(httpx.AsyncBaseTransport):
+    """Count a request as in flight until its response stream is closed."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, counters: _RequestCounters) -> None:
+        self._transport = transport
+        self._counters = counters
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._counters.started()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._counters.finished()
+            raise
+        response.stream = _CountedAsyncStream(response.stream, self._counters)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _CountingSyncTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, counters: _RequestCounters) -> None:
+        self._transport = transport
+        self._counters = counters
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._counters.started()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            self._counters.finished()
+            raise
+        response.stream = _CountedSyncStream(response.stream, self._counters)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+def http2_available() -> bool:
+    """Return whether httpx can negotiate HTTP/2 (the optional ``h2`` package)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class ModelHttpClientPool:
+    """Shared ``openai`` clients backed by long-lived, bounded httpx pools.
+
+    Parameters
+    ----------
+    max_connections, max_keepalive_connections, keepalive_expiry:
+        ``httpx.Limits`` applied to every pooled client.
+    http2:
+        Request HTTP/2; ignored when ``h2`` is not installed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max(1, max_connections),
+            max_keepalive_connections=max(0, min(max_keepalive_connections, max_connections)),
+            keepalive_expiry=keepalive_expiry if keepalive_expiry > 0 else None,
+        )
+        self._http2 = bool(http2) and http2_available()
+        self._counters = _RequestCounters(self._limits.max_connections or 1)
+        self._lock = threading.Lock()
+        self._async_clients: dict[tuple[Any, ...], tuple[asyncio.AbstractEventLoop, Any]] = {}
+        self._sync_clients: dict[tuple[Any, ...], Any] = {}
+
+    @classmethod
+    def from_settings(cls) -> "ModelHttpClientPool":
+        llm = get_settings().llm
+        return cls(
+            max_connections=llm.http_max_connections,
+            max_keepalive_connections=llm.http_max_keepalive_connections,
+            keepalive_expiry=llm.http_keepalive_expiry_seconds,
+            http2=llm.http2,
+        )
+
+    def async_openai(
+        self,
+        *,
+        api_key: str,
+        base_url: str,
+        timeout: float | None = None,
+        default_headers: Mapping[str, str] | None = None,
+    ) -> Any:
+        """Return the pooled ``openai.AsyncOpenAI`` client for the running loop."""
+        from openai import AsyncOpenAI
+
+        loop = asyncio.get_running_loop()
+        key = (AsyncOpenAI, id(loop), *_client_key(api_key, base_url, timeout, default_headers))
+        with self._lock:
+            stale = [item for item, (owner, _) in self._async_clients.items() if owner.is_closed()]
+            for item in stale:
+                del self._async_clients[item]
+            entry = self._async_clients.get(key)
+            if entry is not None and entry[0] is loop:
+                return entry[1]
+            kwargs: dict[str, Any] = {
+                "api_key": api_key,
+                "base_url": base_url,
+                "default_headers": dict(default_headers) if default_headers else None,
+                "http_client": httpx.AsyncClient(
+                    transport=_CountingAsyncTransport(
+                        httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2),
+                        self._counters,
+                    ),
+                ),
+            }
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+            client = AsyncOpenAI(**kwargs)
+            self._async_clients[key] = (loop, client)
+            return client
+
+    def openai(
+        self,
+        *,
+        api_key: str,
+        base_url: str,
+        timeout: float | None = None,
+        default_headers: Mapping[str, str] | None = None,
+    ) -> Any:
+        """Return the pooled synchronous ``openai.OpenAI`` client."""
+        from openai import OpenAI
+
+        key = (OpenAI, *_client_key(api_key, base_url, timeout, default_headers))
+        with self._lock:
+            client = self._sync_clients.get(key)
+            if client is not None:
+                return client
+            kwargs: dict[str, Any] = {
+                "api_key": api_key,
+                "base_url": base_url,
+                "http_client": httpx.Client(
+                    transport=_CountingSyncTransport(
+                        httpx.HTTPTransport(limits=self._limits, http2=self._http2),
+                        self._counters,
+                    ),
+                ),
+            }
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+            if default_headers:
+                kwargs["default_headers"] = dict(default_headers)
+            client = OpenAI(**kwargs)
+            self._sync_clients[key] = client
+            return client
+
+    def metrics(self) -> ModelHttpPoolMetrics:
+        with self._lock:
+            clients = len(self._async_clients) + len(self._sync_clients)
+        counters = self._counters
+        return ModelHttpPoolMetrics(
+            clients=clients,
+            http2=self._http2,
+            max_connections=self._limits.max_connections or 0,
+            max_keepalive_connections=self._limits.max_keepalive_connections or 0,
+            in_flight=counters.in_flight,
+            peak_in_flight=counters.peak_in_flight,
+            requests=counters.requests,
+            saturated_requests=counters.saturated_requests,
+        )
+
+    async def aclose(self) -> None:
+        """Close every pooled client; async clients of other loops are dropped."""
+        with self._lock:
+            async_clients = list(self._async_clients.values())
+            sync_clients = list(self._sync_clients.values())
+            self._async_clients.clear()
+            self._sync_clients.clear()
+        loop = asyncio.get_running_loop()
+        for owner, client in async_clients:
+            if owner is loop:
+                await _close_async(client)
+        for client in sync_clients:
+            _close_sync(client)
+
+    def close(self) -> None:
+        """Close the synchronous clients and drop the async ones."""
+        with self._lock:
+            sync_clients = list(self._sync_clients.values())
+            self._async_clients.clear()
+            self._sync_clients.clear()
+        for client in sync_clients:
+            _close_sync(client)
+
+
+def _client_key(
+    api_key: str,
+    base_url: str,
+    timeout: float | None,
+    default_headers: Mapping[str, str] | None,
+) -> tuple[Any, ...]:
+    # Key on a digest so the registry never holds a second copy of the credential.
+    credential = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    headers = tuple(sorted((default_headers or {}).items()))
+    return (base_url.rstrip("/"), credential, timeout, headers)
+
+
+async def _close_async(client: Any) -> None:
+    close = getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        await close()
+    except Exception as exc:  # noqa: BLE001 - shutdown must not fail on one client
+        logger.warning("model HTTP client close failed: %s", exc)
+
+
+def _close_sync(client: Any) -> None:
+    close = getattr(client, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception as exc:  # noqa: BLE001 - shutdown must not fail on one client
+        logger.warning("model HTTP client close failed: %s", exc)
+
+
+_POOL: Optional[ModelHttpClientPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_model_http_pool() -> ModelHttpClientPool:
+    """Return the process-wide pool, creating it from settings on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ModelHttpClientPool.from_settings()
+        return _POOL
+
+
+def peek_model_http_pool() -> Optional[ModelHttpClientPool]:
+    """Return the process-wide pool only if one has been created."""
+    return _POOL
+
+
+async def aclose_model_http_pool() -> None:
+    """Uninstall and close the process-wide pool."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        await pool.aclose()
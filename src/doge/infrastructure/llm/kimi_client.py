@@ -13,6 +13,7 @@ from doge.core.ports.secrets import ISecretProvider
 from doge.infrastructure.secrets import EnvSecretProvider
 from doge.core.ports.agent_model import AgentMessage, AgentResponse, AgentUsage, IAgentModel
 from doge.infrastructure.llm.cost_calculator import CostCalculator
+from doge.infrastructure.llm.http_client_pool import ModelHttpClientPool, get_model_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,7 @@ class KimiAgentModel(IAgentModel):
         cost_calculator: CostCalculator | None = None,
         secret_provider: ISecretProvider | None = None,
         sleep: Callable[[float], Awaitable[None]] | None = None,
+        http_pool: ModelHttpClientPool | None = None,
     ) -> None:
         settings = get_settings().kimi
         secrets = secret_provider or EnvSecretProvider()
@@ -114,6 +116,7 @@ class KimiAgentModel(IAgentModel):
         self._backoff_max = backoff_max if backoff_max is not None else settings.backoff_max_seconds
         self._cost_calculator = cost_calculator or CostCalculator()
         self._sleep = sleep or asyncio.sleep
+        self._http_pool = http_pool
 
     async def chat(
         self,
@@ -151,12 +154,12 @@ class KimiAgentModel(IAgentModel):
             )
 
         try:
-            from openai import AsyncOpenAI
+            import openai  # noqa: F401
         except ImportError:  # pragma: no cover - dependency is installed in normal envs
             logger.warning("openai package not installed")
             return
 
-        client = AsyncOpenAI(
+        client = (self._http_pool or get_model_http_pool()).async_openai(
             api_key=self._api_key,
             base_url=self._base_url,
             timeout=timeout or self._timeout,
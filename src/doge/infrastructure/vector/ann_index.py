@@ -0,0 +1,250 @@
+"""In-process IVF (inverted file) index over unit-normalized float32 vectors.
+
+``SQLiteVectorStore`` keeps the authoritative vectors in SQLite and mirrors
+them here for search. Vectors are normalized once when added, so cosine
+similarity is a single matrix-vector product.
+
+* Below ``exact_threshold`` rows every query is an exact scan of the matrix.
+* Above it the rows are clustered with k-means into ``sqrt(n)`` lists; a
+  query scores only the rows in its ``nprobe`` nearest lists.
+* Added rows are assigned to their nearest existing centroid. The centroids
+  are retrained when the index has doubled since the last training.
+* The index remembers the highest store ``revision`` it has applied, so a
+  reader can catch up by adding only newer rows, and it persists to a single
+  ``.npz`` file next to the agent database.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+_KMEANS_ITERATIONS = 12
+_KMEANS_SAMPLE_PER_LIST = 64
+
+
+def unit_vector(vector: Sequence[float] | np.ndarray) -> tuple[np.ndarray, float]:
+    """Return ``(float32 unit vector, original norm)``; zero vectors stay zero."""
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array))
+    if norm == 0.0 or not math.isfinite(norm):
+        return np.zeros_like(array), 0.0
+    return array / norm, norm
+
+
+class IVFIndex:
+    """Approximate nearest-neighbour index for one vector dimension.
+
+    Parameters
+    ----------
+    dim:
+        Vector dimension served by this index.
+    nprobe:
+        Inverted lists scored per query once the index is clustered.
+    exact_threshold:
+        Row count below which queries scan every row exactly.
+    """
+
+    def __init__(self, dim: int, *, nprobe: int = 8, exact_threshold: int = 4096) -> None:
+        self.dim = dim
+        self.nprobe = max(1, nprobe)
+        self.exact_threshold = max(0, exact_threshold)
+        self.revision = 0
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._matrix = np.zeros((0, dim), dtype=np.float32)
+        self._centroids: Optional[np.ndarray] = None
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._rows
+
+    @property
+    def clustered(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, ids: Sequence[str], units: np.ndarray) -> None:
+        """Insert or replace unit vectors (``units`` is ``len(ids) x dim``)."""
+        if not len(ids):
+            return
+        units = np.asarray(units, dtype=np.float32).reshape(len(ids), self.dim)
+        existing = len(self._ids)
+        fresh_ids: list[str] = []
+        fresh_rows: list[int] = []
+        replaced: list[int] = []
+        for position, record_id in enumerate(ids):
+            row = self._rows.get(record_id)
+            if row is None:
+                self._rows[record_id] = existing + len(fresh_ids)
+                fresh_ids.append(record_id)
+                fresh_rows.append(position)
+            elif row >= existing:
+                # Duplicate id within one batch: the later vector wins.
+                fresh_rows[row - existing] = position
+            else:
+                self._matrix[row] = units[position]
+                replaced.append(row)
+        if fresh_ids:
+            self._ids.extend(fresh_ids)
+            self._matrix = np.vstack([self._matrix, units[fresh_rows]])
+        if self._centroids is None:
+            self._maybe_train()
+            return
+        if len(self._ids) >= 2 * self._trained_size:
+            self._train()
+            return
+        touched = np.asarray(replaced + list(range(existing, len(self._ids))), dtype=np.int64)
+        assign = np.zeros(len(self._ids), dtype=np.int32)
+        assign[: len(self._assign)] = self._assign
+        assign[touched] = self._nearest_centroid(self._matrix[touched])
+        self._assign = assign
+
+    def search(
+        self,
+        query: np.ndarray,
+        top_k: int,
+        *,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> list[tuple[str, float]]:
+        """Return up to ``top_k`` ``(record_id, cosine)`` pairs, best first.
+
+        ``query`` must already be a unit vector. With ``candidates`` only those
+        ids are scored, exactly; otherwise the clustered index is probed.
+        """
+        if top_k <= 0 or not self._ids:
+            return []
+        if candidates is not None:
+            rows = np.fromiter(
+                (self._rows[record_id] for record_id in candidates if record_id in self._rows),
+                dtype=np.int64,
+            )
+        elif self._centroids is None:
+            rows = None
+        else:
+            rows = self._probe(query, top_k)
+        matrix = self._matrix if rows is None else self._matrix[rows]
+        if not len(matrix):
+            return []
+        scores = matrix @ query
+        limit = min(top_k, len(scores))
+        if limit < len(scores):
+            best = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.lexsort((best if rows is None else rows[best], -scores[best]))]
+        positions = best if rows is None else rows[best]
+        return [(self._ids[int(row)], float(scores[index])) for row, index in zip(positions, best)]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def state(self) -> dict[str, np.ndarray]:
+        return {
+            "ids": np.asarray(self._ids, dtype=str),
+            "matrix": self._matrix,
+            "centroids": self._centroids if self._centroids is not None else np.zeros((0, self.dim), np.float32),
+            "assign": self._assign,
+            "meta": np.asarray([self.dim, self.revision, self._trained_size], dtype=np.int64),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, np.ndarray], **options) -> "IVFIndex":
+        dim, revision, trained_size = (int(value) for value in state["meta"])
+        index = cls(dim, **options)
+        index.revision = revision
+        index._ids = [str(record_id) for record_id in state["ids"]]
+        index._rows = {record_id: row for row, record_id in enumerate(index._ids)}
+        index._matrix = np.asarray(state["matrix"], dtype=np.float32).reshape(len(index._ids), dim)
+        centroids = np.asarray(state["centroids"], dtype=np.float32)
+        index._centroids = centroids if len(centroids) else None
+        index._assign = np.asarray(state["assign"], dtype=np.int32)
+        index._trained_size = trained_size
+        return index
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _probe(self, query: np.ndarray, top_k: int) -> np.ndarray:
+        centroid_scores = self._centroids @ query
+        order = np.argsort(-centroid_scores, kind="stable")
+        nprobe = min(self.nprobe, len(order))
+        while True:
+            rows = np.flatnonzero(np.isin(self._assign, order[:nprobe]))
+            if len(rows) >= top_k or nprobe >= len(order):
+                return rows
+            nprobe = min(len(order), nprobe * 2)
+
+    def _maybe_train(self) -> None:
+        if self.exact_threshold and len(self._ids) >= self.exact_threshold:
+            self._train()
+
+    def _train(self) -> None:
+        count = len(self._ids)
+        nlist = max(1, min(count, int(math.sqrt(count))))
+        rng = np.random.default_rng(count)
+        sample_size = min(count, nlist * _KMEANS_SAMPLE_PER_LIST)
+        sample = self._matrix[rng.choice(count, size=sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = sample[labels == cluster]
+                if len(members):
+                    centroids[cluster] = members.mean(axis=0)
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            centroids = np.divide(centroids, norms, out=np.zeros_like(centroids), where=norms > 0)
+        self._centroids = centroids.astype(np.float32)
+        self._assign = self._nearest_centroid(self._matrix)
+        self._trained_size = count
+
+    def _nearest_centroid(self, units: np.ndarray) -> np.ndarray:
+        assign = np.empty(len(units), dtype=np.int32)
+        for start in range(0, len(units), 8192):
+            block = units[start : start + 8192]
+            assign[start : start + len(block)] = np.argmax(block @ self._centroids.T, axis=1)
+        return assign
+
+
+def save_indexes(path: Path, indexes: dict[int, IVFIndex]) -> None:
+    """Atomically write every per-dimension index to one ``.npz`` file.
+
+    Each call writes its own temporary file next to *path*, so processes
+    saving at the same time never interleave writes into one file; the last
+    ``os.replace`` wins with a complete index.
+    """
+    arrays: dict[str, np.ndarray] = {}
+    for dim, index in indexes.items():
+        for key, value in index.state().items():
+            arrays[f"{dim}.{key}"] = value
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            np.savez(handle, **arrays)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def load_indexes(path: Path, **options) -> dict[int, IVFIndex]:
+    """Load indexes written by :func:`save_indexes`; ``{}`` when unreadable."""
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            grouped: dict[int, dict[str, np.ndarray]] = {}
+            for name in archive.files:
+                dim, key = name.split(".", 1)
+                grouped.setdefault(int(dim), {})[key] = archive[name]
+    except (OSError, ValueError, KeyError):
+        return {}
+    return {dim: IVFIndex.from_state(state, **options) for dim, state in grouped.items()}
@@ -1,23 +1,63 @@
-"""SQLite vector store for local-first RAG retrieval."""
+"""SQLite vector store for local-first RAG retrieval.
+
+Vectors are stored as packed little-endian float32 BLOBs together with their
+dimension and norm. Search goes through an in-process :class:`IVFIndex` per
+dimension that is persisted next to the agent database and caught up before
+every call from the ``vector_entries_state`` row, which triggers keep current
+for every writer: each written row takes the next ``revision`` and deletes
+are counted, so writes and deletes from other processes are seen without
+scanning the table. The index file is rewritten on a full rebuild and otherwise only once
+``persist_every`` revisions have been applied since the last save; a process
+that loads an older file catches up from the table. Metadata filters are
+evaluated in SQL and only the winning rows are read back.
+"""
 
 from __future__ import annotations
 
 import json
+import logging
 import math
+import struct
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+import numpy as np
 
 from doge.config import get_settings
 from doge.core.ports.vector_store import IVectorStore, VectorRecord, VectorSearchResult
 from doge.infrastructure.database.agent_repositories import bootstrap_agent_schema
 from doge.infrastructure.database.sqlite import SQLiteConnection
+from doge.infrastructure.vector.ann_index import IVFIndex, load_indexes, save_indexes, unit_vector
+
+logger = logging.getLogger(__name__)
+
+_SQL_FILTER_TYPES = (str, int, float, bool, type(None))
 
 
 class SQLiteVectorStore(IVectorStore):
-    def __init__(self, db_path: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        *,
+        index_path: Path | str | None = None,
+        nprobe: int = 8,
+        exact_threshold: int = 4096,
+        persist_every: int = 256,
+    ) -> None:
         self._db_path = Path(db_path) if db_path is not None else get_settings().db.agent_db
         bootstrap_agent_schema(self._db_path)
         self._connection = SQLiteConnection(self._db_path, use_row_factory=True)
+        self._index_path = (
+            Path(index_path) if index_path is not None else self._db_path.with_suffix(".vectors.npz")
+        )
+        self._index_options = {"nprobe": nprobe, "exact_threshold": exact_threshold}
+        self._indexes: dict[int, IVFIndex] | None = None
+        self._index_revision = 0
+        self._persist_every = max(1, persist_every)
+        self._persisted_revision: int | None = None
+        self._deletions: int | None = None
+        self._index_lock = threading.Lock()
 
     def _connect(self):
         return self._connection.connect()
@@ -25,24 +65,30 @@ class SQLiteVectorStore(IVectorStore):
     def upsert(self, records: list[VectorRecord]) -> None:
         with self._connect() as conn:
             for record in records:
+                values = [float(value) for value in record.vector]
                 conn.execute(
                     """
-                    INSERT INTO vector_entries(record_id, vector, text, metadata, updated_at)
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    INSERT INTO vector_entries(record_id, vector, text, metadata, updated_at, dim, norm)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
                     ON CONFLICT(record_id) DO UPDATE SET
                         vector = excluded.vector,
                         text = excluded.text,
                         metadata = excluded.metadata,
-                        updated_at = excluded.updated_at
+                        updated_at = excluded.updated_at,
+                        dim = excluded.dim,
+                        norm = excluded.norm
                     """,
                     (
                         record.record_id,
-                        json.dumps(record.vector),
+                        _pack(values),
                         record.text,
                         json.dumps(record.metadata, ensure_ascii=False),
+                        len(values),
+                        unit_vector(values)[1],
                     ),
                 )
             conn.commit()
+            self._sync_index(conn)
 
     def search(
         self,
@@ -51,33 +97,171 @@ class SQLiteVectorStore(IVectorStore):
         top_k: int = 5,
         metadata_filter: dict[str, Any] | None = None,
     ) -> list[VectorSearchResult]:
+        if top_k <= 0:
+            return []
+        query, _norm = unit_vector([float(value) for value in vector])
         with self._connect() as conn:
-            rows = conn.execute("SELECT * FROM vector_entries").fetchall()
-        results: list[VectorSearchResult] = []
-        for row in rows:
-            metadata = json.loads(row["metadata"] or "{}")
-            if metadata_filter and not _matches_filter(metadata, metadata_filter):
-                continue
-            record = VectorRecord(
-                record_id=row["record_id"],
-                vector=json.loads(row["vector"]),
-                text=row["text"],
-                metadata=metadata,
+            indexes = self._sync_index(conn)
+            candidates = None
+            if metadata_filter:
+                candidates = _filtered_ids(conn, metadata_filter)
+                if not candidates:
+                    return []
+            index = indexes.get(len(query))
+            hits = index.search(query, top_k, candidates=candidates) if index is not None else []
+            if len(hits) < top_k:
+                # Records of another dimension score 0.0, as with the previous
+                # brute-force cosine; they only ever pad the tail.
+                hits.extend(_other_dimension(conn, len(query), top_k - len(hits), candidates))
+            records = _load_records(conn, [record_id for record_id, _score in hits])
+        return [
+            VectorSearchResult(record=records[record_id], score=score)
+            for record_id, score in hits
+            if record_id in records
+        ]
+
+    def _sync_index(self, conn) -> dict[int, IVFIndex]:
+        """Bring the in-process indexes up to the store's latest revision."""
+        with self._index_lock:
+            if self._indexes is None:
+                self._indexes = load_indexes(self._index_path, **self._index_options)
+                self._index_revision = max((index.revision for index in self._indexes.values()), default=0)
+                self._persisted_revision = self._index_revision if self._indexes else None
+                self._deletions = None
+            revision, deletions = conn.execute(
+                "SELECT revision, deletions FROM vector_entries_state WHERE id = 1"
+            ).fetchone()
+            rebuilt = revision < self._index_revision or (
+                self._deletions is not None and deletions != self._deletions
             )
-            results.append(VectorSearchResult(record=record, score=_cosine(vector, record.vector)))
-        return sorted(results, key=lambda item: item.score, reverse=True)[:top_k]
+            if rebuilt:
+                # The database was replaced or rows were deleted underneath us.
+                self._indexes, self._index_revision = {}, 0
+            changed = revision > self._index_revision
+            if changed:
+                self._add_rows(conn.execute(
+                    "SELECT record_id, vector, dim, norm FROM vector_entries "
+                    "WHERE revision > ? AND revision <= ? ORDER BY revision",
+                    (self._index_revision, revision),
+                ).fetchall())
+            if self._deletions is None:
+                # A loaded index file may predate deletes: check it once.
+                (count,) = conn.execute("SELECT COUNT(*) FROM vector_entries").fetchone()
+                if self._indexed_count() != count:
+                    self._indexes = {}
+                    self._add_rows(conn.execute(
+                        "SELECT record_id, vector, dim, norm FROM vector_entries ORDER BY revision, rowid"
+                    ).fetchall())
+                    changed = rebuilt = True
+            self._deletions = deletions
+            if changed:
+                self._index_revision = revision
+                for index in self._indexes.values():
+                    index.revision = revision
+                if (
+                    rebuilt
+                    or self._persisted_revision is None
+                    or revision - self._persisted_revision >= self._persist_every
+                ):
+                    self._save_indexes()
+            return self._indexes
+
+    def _add_rows(self, rows: Iterable[Any]) -> None:
+        by_dim: dict[int, tuple[list[str], list[np.ndarray]]] = {}
+        for row in rows:
+            raw = np.frombuffer(row["vector"], dtype="<f4")
+            ids, units = by_dim.setdefault(row["dim"], ([], []))
+            ids.append(row["record_id"])
+            units.append(raw / np.float32(row["norm"]) if row["norm"] else np.zeros_like(raw))
+        for dim, (ids, units) in by_dim.items():
+            index = self._indexes.setdefault(dim, IVFIndex(dim, **self._index_options))
+            index.add(ids, np.vstack(units))
+
+    def _indexed_count(self) -> int:
+        return sum(len(index) for index in self._indexes.values())
+
+    def _save_indexes(self) -> None:
+        try:
+            save_indexes(self._index_path, self._indexes)
+            self._persisted_revision = self._index_revision
+        except OSError as exc:
+            logger.warning("vector index not persisted path=%s: %s", self._index_path, exc)
+
+
+def _pack(values: list[float]) -> bytes:
+    return struct.pack(f"<{len(values)}f", *values)
+
+
+def _unpack(payload: bytes) -> list[float]:
+    return np.frombuffer(payload, dtype="<f4").astype(float).tolist()
+
+
+def _json_path(key: str) -> str | None:
+    if '"' in key or "\\" in key:
+        return None
+    return f'$."{key}"'
+
+
+def _filtered_ids(conn, metadata_filter: dict[str, Any]) -> set[str]:
+    """Return ids whose metadata matches every filter entry.
+
+    Scalar values are compared with ``json_extract`` in SQL; nested values
+    (and keys that cannot be expressed as a JSON path) are checked in Python
+    on the SQL-narrowed rows.
+    """
+    clauses: list[str] = []
+    params: list[Any] = []
+    residual: dict[str, Any] = {}
+    for key, value in metadata_filter.items():
+        path = _json_path(key)
+        if path is None or not isinstance(value, _SQL_FILTER_TYPES):
+            residual[key] = value
+            continue
+        if isinstance(value, float) and not math.isfinite(value):
+            residual[key] = value
+            continue
+        clauses.append("json_extract(metadata, ?) IS ?")
+        params.extend([path, int(value) if isinstance(value, bool) else value])
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = conn.execute(f"SELECT record_id, metadata FROM vector_entries{where}", params).fetchall()
+    if not residual:
+        return {row["record_id"] for row in rows}
+    return {
+        row["record_id"]
+        for row in rows
+        if _matches_filter(json.loads(row["metadata"] or "{}"), residual)
+    }
 
 
 def _matches_filter(metadata: dict[str, Any], metadata_filter: dict[str, Any]) -> bool:
     return all(metadata.get(key) == value for key, value in metadata_filter.items())
 
 
-def _cosine(left: list[float], right: list[float]) -> float:
-    if not left or not right or len(left) != len(right):
-        return 0.0
-    numerator = sum(a * b for a, b in zip(left, right))
-    left_norm = math.sqrt(sum(a * a for a in left))
-    right_norm = math.sqrt(sum(b * b for b in right))
-    if left_norm == 0 or right_norm == 0:
-        return 0.0
-    return numerator / (left_norm * right_norm)
+def _other_dimension(conn, dim: int, limit: int, candidates: set[str] | None) -> list[tuple[str, float]]:
+    rows = conn.execute("SELECT record_id FROM vector_entries WHERE dim != ? ORDER BY rowid", (dim,))
+    padding: list[tuple[str, float]] = []
+    for row in rows:
+        if len(padding) >= limit:
+            break
+        if candidates is None or row["record_id"] in candidates:
+            padding.append((row["record_id"], 0.0))
+    return padding
+
+
+def _load_records(conn, record_ids: list[str]) -> dict[str, VectorRecord]:
+    if not record_ids:
+        return {}
+    placeholders = ",".join("?" for _ in record_ids)
+    rows = conn.execute(
+        f"SELECT record_id, vector, text, metadata FROM vector_entries WHERE record_id IN ({placeholders})",
+        record_ids,
+    ).fetchall()
+    return {
+        row["record_id"]: VectorRecord(
+            record_id=row["record_id"],
+            vector=_unpack(row["vector"]),
+            text=row["text"],
+            metadata=json.loads(row["metadata"] or "{}"),
+        )
+        for row in rows
+    }
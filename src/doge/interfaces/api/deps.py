@@ -7,6 +7,7 @@ or any legacy connection helper directly; they request a port/use case via
 ``doge.bootstrap`` containers.
 """
 
+import asyncio
 import logging
 import os
 
@@ -24,12 +25,16 @@ _research_agent_runtime = None
 _persisted_research_agent_runtime = None
 _event_bus = None
 _event_subscriber = None
+_model_delta_channel = None
 _worker = None
 _run_queue = None
 _idempotency_store = None
 _agent_unit_of_work = None
 _runtime_outbox_publisher = None
 _file_upload_service = None
+_document_parse_pool = None
+_document_extraction_worker = None
+_chunk_index_backfill = None
 _enterprise_governance_repository = None
 _slot_activation_repository = None
 _run_scope_resolver = None
@@ -128,6 +133,14 @@ def get_event_bus():
     return _event_bus
 
 
+def get_model_delta_channel():
+    """Provide the in-process live channel for streamed model output deltas."""
+    global _model_delta_channel
+    if _model_delta_channel is None:
+        _model_delta_channel = factories.build_model_delta_channel()
+    return _model_delta_channel
+
+
 def get_event_subscriber():
     """Provide the cross-process-safe runtime event subscriber."""
     global _event_subscriber
@@ -141,7 +154,8 @@ def get_persisted_research_agent_runtime():
     global _persisted_research_agent_runtime
     if _persisted_research_agent_runtime is None:
         _persisted_research_agent_runtime = _container.runtime.build_persisted_research_agent_runtime(
-            event_publisher=get_event_bus()
+            event_publisher=get_event_bus(),
+            model_delta_channel=get_model_delta_channel(),
         )
     return _persisted_research_agent_runtime
 
@@ -152,13 +166,69 @@ def get_agent_document_repository():
 
 
 def get_file_upload_service():
-    """Provide the shared file upload service."""
+    """Provide the shared file upload service.
+
+    Uploads only queue extraction when a worker drains the queue: this
+    process's document extraction worker, or a dedicated worker process when
+    this one serves the API only. Otherwise extraction runs in the request.
+    """
     global _file_upload_service
     if _file_upload_service is None:
-        _file_upload_service = _container.gateway.build_file_upload_service()
+        settings = get_settings()
+        if settings.documents.extraction_workers > 0 and settings.daemon.process_role == "api":
+            _file_upload_service = _container.gateway.build_file_upload_service(
+                extraction_queue=get_document_extraction_queue(),
+            )
+        else:
+            _file_upload_service = _container.gateway.build_file_upload_service()
     return _file_upload_service
 
 
+def get_document_extraction_queue():
+    """Provide the durable document extraction queue."""
+    return _container.runtime.build_agent_document_extraction_queue()
+
+
+def get_document_extraction_worker():
+    """Provide the background document extraction worker, or None when disabled.
+
+    Building the worker switches the shared upload service to queued
+    extraction, with parsing on the process-wide document parse pool.
+    """
+    global _document_extraction_worker, _document_parse_pool, _file_upload_service
+    if get_settings().documents.extraction_workers <= 0:
+        return None
+    if _document_extraction_worker is None:
+        if _document_parse_pool is None:
+            _document_parse_pool = _container.gateway.build_document_parse_pool()
+        _file_upload_service = _container.gateway.build_file_upload_service(
+            parser=_document_parse_pool,
+            extraction_queue=get_document_extraction_queue(),
+        )
+        _document_extraction_worker = _container.gateway.build_document_extraction_worker(
+            _file_upload_service,
+            parser=_document_parse_pool,
+        )
+    return _document_extraction_worker
+
+
+def start_chunk_index_backfill():
+    """Start the background sweep that indexes chunks left unindexed."""
+    global _chunk_index_backfill
+    if _chunk_index_backfill is None:
+        _chunk_index_backfill = _container.gateway.build_chunk_index_backfill()
+    _chunk_index_backfill.start()
+    return _chunk_index_backfill
+
+
+async def stop_chunk_index_backfill() -> None:
+    """Stop the chunk index backfill sweep, if it was started."""
+    global _chunk_index_backfill
+    backfill, _chunk_index_backfill = _chunk_index_backfill, None
+    if backfill is not None:
+        await backfill.stop()
+
+
 def get_agent_evidence_repository():
     """Provide the persisted evidence repository."""
     return _container.runtime.build_agent_evidence_repository()
@@ -370,6 +440,81 @@ def get_daemon_readiness_probe():
     return SQLiteRuntimeReadinessProbe(settings=get_settings())
 
 
+def start_duckdb_session_pool():
+    """Install the process-wide DuckDB session pool unless disabled (size 0)."""
+
+    from doge.infrastructure.database.duckdb_pool import DuckDBSessionPool, install_duckdb_pool
+
+    db = get_settings().db
+    if db.duckdb_pool_size <= 0:
+        return None
+    return install_duckdb_pool(
+        DuckDBSessionPool(
+            str(db.duckdb),
+            db.cn_db.as_posix(),
+            db.us_db.as_posix(),
+            size=db.duckdb_pool_size,
+            threads=db.duckdb_threads,
+        )
+    )
+
+
+def stop_duckdb_session_pool() -> None:
+    """Close the process-wide DuckDB session pool, if one is installed."""
+
+    from doge.infrastructure.database.duckdb_pool import close_duckdb_pool
+
+    close_duckdb_pool()
+
+
+def stop_sqlite_pools() -> None:
+    """Close the process-wide pooled SQLite connections, if any were opened."""
+
+    from doge.infrastructure.database.sqlite_pool import close_sqlite_pools
+
+    close_sqlite_pools()
+
+
+def stop_python_sandbox_pool() -> None:
+    """Close the process-wide Python analysis sandbox workers, if any were started."""
+
+    from doge.infrastructure.code_execution.sandbox_pool import shutdown_sandbox_pool
+
+    shutdown_sandbox_pool()
+
+
+async def stop_document_extraction_worker() -> None:
+    """Stop the document extraction worker and its parse processes, if started.
+
+    The upload service built for the worker is dropped with it, so a later
+    lifespan rebuilds both.
+    """
+    global _document_extraction_worker, _document_parse_pool, _file_upload_service
+    worker, _document_extraction_worker = _document_extraction_worker, None
+    if worker is not None:
+        await worker.stop()
+        _file_upload_service = None
+    pool, _document_parse_pool = _document_parse_pool, None
+    if pool is not None:
+        await asyncio.to_thread(pool.close)
+
+
+def stop_tool_executor() -> None:
+    """Shut down the process-wide tool executor, if one was created."""
+
+    from doge.application.tools.executor import shutdown_tool_executor
+
+    shutdown_tool_executor()
+
+
+async def stop_model_http_pool() -> None:
+    """Close the process-wide pooled model HTTP clients, if any were created."""
+
+    from doge.infrastructure.llm.http_client_pool import aclose_model_http_pool
+
+    await aclose_model_http_pool()
+
+
 def get_existing_daemon_worker():
     """Return the daemon worker only if this process already created it."""
 
@@ -399,6 +544,8 @@ def get_daemon_worker():
             unit_of_work=get_agent_unit_of_work(),
             scope_resolver=get_run_scope_resolver(),
             auto_start=settings.daemon.process_role != "api",
+            max_concurrent_runs=settings.daemon.worker_concurrency,
+            max_runs_per_tenant=settings.daemon.worker_tenant_concurrency or None,
         )
     return _worker
 
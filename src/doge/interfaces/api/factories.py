@@ -33,6 +33,13 @@ def build_event_bus():
     return EventBus()
 
 
+def build_model_delta_channel():
+    """Build the live-only channel for batched model output deltas."""
+    from doge.platform.runtime import ModelDeltaChannel
+
+    return ModelDeltaChannel()
+
+
 def build_daemon_worker(
     *,
     runtime: Any,
@@ -42,6 +49,8 @@ def build_daemon_worker(
     unit_of_work: Any,
     scope_resolver: Any,
     auto_start: bool,
+    max_concurrent_runs: int = 1,
+    max_runs_per_tenant: int | None = None,
 ):
     """Build the singleton asyncio daemon worker from its wired collaborators."""
     from doge.platform.runtime import AsyncioWorker
@@ -54,6 +63,8 @@ def build_daemon_worker(
         unit_of_work,
         scope_resolver=scope_resolver,
         auto_start=auto_start,
+        max_concurrent_runs=max_concurrent_runs,
+        max_runs_per_tenant=max_runs_per_tenant,
     )
 
 
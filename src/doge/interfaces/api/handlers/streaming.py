@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import suppress
+
 from doge.core.domain.agent_models import RunStatus
 from doge.interfaces.api.handlers.queries import GetRunHandler, RunAccessContext
 
@@ -20,11 +23,25 @@ STREAM_CLOSE_EVENTS = {
 
 
 class RunStreamHandler:
+    """Replay and tail a run's persisted events, optionally with live model deltas.
+
+    Given a ``delta_channel``, :meth:`open` interleaves the persisted stream
+    with the channel's ephemeral ``model_delta`` events. The persisted stream
+    alone decides when the SSE response closes.
+    """
+
     def __init__(self, *, runtime, subscriber) -> None:
         self._runtime = runtime
         self._subscriber = subscriber
 
-    def open(self, *, run_id: str, access: RunAccessContext, after_sequence: int = 0):
+    def open(
+        self,
+        *,
+        run_id: str,
+        access: RunAccessContext,
+        after_sequence: int = 0,
+        delta_channel=None,
+    ):
         run = GetRunHandler(runtime=self._runtime).handle(run_id=run_id, access=access)
         terminal_at_start = run.status in STREAM_CLOSE_STATUSES
         initial_max_sequence = self._max_event_sequence_after(
@@ -32,13 +49,46 @@ class RunStreamHandler:
             after_sequence,
             access=access,
         )
-        return self._iter_events(
+        events = self._iter_events(
             run_id=run_id,
             access=access,
             after_sequence=after_sequence,
             terminal_at_start=terminal_at_start,
             initial_max_sequence=initial_max_sequence,
         )
+        if delta_channel is None or terminal_at_start:
+            return events
+        return self._with_deltas(run_id, events, delta_channel)
+
+    async def _with_deltas(self, run_id: str, events, delta_channel):
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+
+        async def pump_events() -> None:
+            try:
+                async for event in events:
+                    await queue.put(event)
+            finally:
+                queue.put_nowait(finished)
+
+        async def pump_deltas() -> None:
+            async for delta in delta_channel.subscribe(run_id):
+                await queue.put(delta)
+
+        tasks = [asyncio.create_task(pump_deltas()), asyncio.create_task(pump_events())]
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                yield item
+            await tasks[1]
+        finally:
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                with suppress(asyncio.CancelledError):
+                    await task
 
     async def _iter_events(
         self,
@@ -16,12 +16,17 @@ async def lifespan(app: FastAPI):
     process_role = settings.daemon.process_role
     worker = None
     outbox_publisher = None
+    deps.start_duckdb_session_pool()
     if process_role in {"all", "worker"}:
         worker = deps.get_daemon_worker()
         if settings.features.runtime_outbox_publisher:
             outbox_publisher = deps.get_runtime_outbox_publisher()
             outbox_publisher.start()
         worker.start()
+        extraction_worker = deps.get_document_extraction_worker()
+        if extraction_worker is not None:
+            extraction_worker.start()
+        deps.start_chunk_index_backfill()
     try:
         yield
     finally:
@@ -29,3 +34,10 @@ async def lifespan(app: FastAPI):
             await worker.stop()
         if outbox_publisher is not None:
             await outbox_publisher.stop()
+        await deps.stop_document_extraction_worker()
+        await deps.stop_chunk_index_backfill()
+        deps.stop_tool_executor()
+        deps.stop_python_sandbox_pool()
+        deps.stop_duckdb_session_pool()
+        deps.stop_sqlite_pools()
+        await deps.stop_model_http_pool()
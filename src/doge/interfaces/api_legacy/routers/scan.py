@@ -234,7 +234,11 @@ def _run_local_scan(market, tdx_path, db_path, callback, storage_repo):
 
     try:
         resp = uc.execute(request, progress_callback=_wrapped_callback)
-        callback(100, f"local scan complete: {resp.success_count}/{resp.total_tickers} success")
+        callback(
+            100,
+            f"local scan complete: {resp.success_count}/{resp.total_tickers} success, "
+            f"{resp.unchanged_count} unchanged",
+        )
     except Exception as e:
         logger.exception("local scan failed")
         callback(-1, "local scan failed")
@@ -10,6 +10,7 @@ from doge.platform.evidence import (
     FileUploadService,
     FileUploadTooLargeError,
 )
+from doge.core.ports.document_extraction_queue import IDocumentExtractionQueue
 from doge.core.ports.document_repository import IDocumentRepository
 from doge.core.ports.enterprise_governance import IEnterpriseGovernanceRepository
 from doge.interfaces.api import deps
@@ -92,16 +93,36 @@ async def get_document(
     request: Request,
     document_id: str,
     documents: IDocumentRepository = Depends(deps.get_agent_document_repository),
+    extraction_queue: IDocumentExtractionQueue = Depends(deps.get_document_extraction_queue),
     governance: IEnterpriseGovernanceRepository = Depends(deps.get_enterprise_governance_repository),
 ):
-    document = documents.get(document_id, _document_scope(request))
+    scope = _document_scope(request)
+    document = documents.get(document_id, scope)
     if document is None:
         raise HTTPException(404, "document not found")
     ensure_resource_access(request, governance, "document", document_id, "read")
     append_audit(request, governance, "document_read", "document", document_id)
+    job = extraction_queue.get(document_id, scope)
+    if job is not None:
+        document = {**document, "extraction_status": job.status.value}
     return document
 
 
+@router.get("/documents/{document_id}/extraction")
+async def get_document_extraction(
+    request: Request,
+    document_id: str,
+    extraction_queue: IDocumentExtractionQueue = Depends(deps.get_document_extraction_queue),
+    governance: IEnterpriseGovernanceRepository = Depends(deps.get_enterprise_governance_repository),
+):
+    """Return the background extraction job of one document."""
+    job = extraction_queue.get(document_id, _document_scope(request))
+    if job is None:
+        raise HTTPException(404, "document extraction not found")
+    ensure_resource_access(request, governance, "document", document_id, "read")
+    return job.to_dict()
+
+
 def _record_document_create(
     request: Request,
     governance: IEnterpriseGovernanceRepository,
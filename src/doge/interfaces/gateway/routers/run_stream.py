@@ -12,6 +12,11 @@ Streaming semantics (per ADR-0025):
 - ``stream_events`` = replay-only async iterator (not used by this route)
 - ``RunStreamHandler`` + ``IEventSubscriber.subscribe`` = live cross-process SSE
 
+``?deltas=true`` additionally pushes live ``model_delta`` events (batched model
+output) while a model round streams. They carry no SSE ``id`` and are never
+persisted, so ``Last-Event-ID`` resumption and replay only cover persisted
+events; the final ``model_response`` holds the complete round.
+
 New clients should use this ``/v1/runs/{run_id}/stream`` endpoint.
 The legacy ``/api/runs/{run_id}/stream`` is replay-only and deprecated.
 """
@@ -23,6 +28,7 @@ import json
 from fastapi import APIRouter, Depends, Header, HTTPException, Request
 from sse_starlette.sse import EventSourceResponse
 
+from doge.core.domain.agent_models import EventType
 from doge.core.ports.agent_runtime import IResearchAgentRuntime
 from doge.core.ports.event_subscriber import IEventSubscriber
 from doge.interfaces.api import deps
@@ -38,8 +44,10 @@ async def stream_run(
     request: Request,
     run_id: str,
     last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    deltas: bool = False,
     runtime: IResearchAgentRuntime = Depends(deps.get_persisted_research_agent_runtime),
     subscriber: IEventSubscriber = Depends(deps.get_event_subscriber),
+    delta_channel=Depends(deps.get_model_delta_channel),
 ):
     try:
         after_sequence = int(last_event_id or "0")
@@ -50,12 +58,16 @@ async def stream_run(
             run_id=run_id,
             access=request_run_access(request),
             after_sequence=after_sequence,
+            delta_channel=delta_channel if deltas else None,
         )
     except RunNotFound:
         raise HTTPException(404, "run not found")
 
     async def generator():
         async for event in event_stream:
+            if event.event_type == EventType.MODEL_DELTA:
+                yield {"event": event.event_type.value, "data": json.dumps(serialize(event), ensure_ascii=False)}
+                continue
             yield {
                 "id": str(event.sequence),
                 "event": event.event_type.value,
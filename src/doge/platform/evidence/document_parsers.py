@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from doge.platform.slots import (
     DocumentParserContribution,
@@ -22,7 +23,13 @@ class _ParserEntry:
 
 
 class ParserDispatcher:
-    """Dispatch document parsing to slot-contributed parser instances."""
+    """Dispatch document parsing to slot-contributed parser instances.
+
+    A parser must expose ``parse(path, *, max_chars)`` and may expose
+    ``iter_pages(path)`` yielding page texts in order. :meth:`iter_pages`
+    streams through the selected parser's page iterator when it has one, and
+    otherwise splits an untruncated ``parse`` on form feeds.
+    """
 
     def __init__(
         self,
@@ -60,15 +67,26 @@ class ParserDispatcher:
 
     def parse(self, path: str | Path, *, max_chars: int = 12000) -> str:
         file_path = Path(path)
-        suffix = file_path.suffix.lower()
-        entry = self._select_parser(suffix)
-        parser = entry.parser
-        parse = getattr(parser, "parse", None)
+        entry = self._select_parser(file_path.suffix.lower())
+        return self._parse_method(entry)(file_path, max_chars=max_chars)
+
+    def iter_pages(self, path: str | Path) -> Iterator[str]:
+        file_path = Path(path)
+        entry = self._select_parser(file_path.suffix.lower())
+        iter_pages = getattr(entry.parser, "iter_pages", None)
+        if iter_pages is not None:
+            yield from iter_pages(file_path)
+            return
+        yield from self._parse_method(entry)(file_path, max_chars=sys.maxsize).split("\f")
+
+    @staticmethod
+    def _parse_method(entry: _ParserEntry):
+        parse = getattr(entry.parser, "parse", None)
         if parse is None:
             raise SlotConfigurationError(
                 f"document parser {entry.parser_id} does not expose parse()"
             )
-        return parse(file_path, max_chars=max_chars)
+        return parse
 
     def _select_parser(self, suffix: str) -> _ParserEntry:
         ranked: list[tuple[int, int, str, _ParserEntry]] = []
@@ -38,6 +38,7 @@ _EXPORTS = {
     "IEventPublisher": ("doge.core.ports.event_publisher", "IEventPublisher"),
     "IEventRepository": ("doge.core.ports.agent_repository", "IEventRepository"),
     "IModelRouter": ("doge.core.ports.model_router", "IModelRouter"),
+    "IModelDeltaStream": ("doge.core.ports.runtime_services", "IModelDeltaStream"),
     "IModelExecutionService": ("doge.core.ports.runtime_services", "IModelExecutionService"),
     "IModelResponseAssembler": ("doge.core.ports.runtime_services", "IModelResponseAssembler"),
     "IResearchAgentRuntime": ("doge.core.ports.agent_runtime", "IResearchAgentRuntime"),
@@ -52,6 +53,8 @@ _EXPORTS = {
     "IWebSearchStage": ("doge.core.ports.runtime_services", "IWebSearchStage"),
     "InvalidRunStatusTransition": ("doge.application.agent.state_machine", "InvalidRunStatusTransition"),
     "ModelExecutionResult": ("doge.core.ports.runtime_services", "ModelExecutionResult"),
+    "ModelDeltaChannel": ("doge.application.agent.model_delta_stream", "ModelDeltaChannel"),
+    "ModelDeltaStream": ("doge.application.agent.model_delta_stream", "ModelDeltaStream"),
     "ModelExecutionService": ("doge.platform.runtime.services", "ModelExecutionService"),
     "ModelPolicy": ("doge.core.domain.model_policy", "ModelPolicy"),
     "ModelResponseAssembler": ("doge.application.agent.model_response_assembler", "ModelResponseAssembler"),
@@ -19,17 +19,21 @@ from doge.core.domain.execution_profile import ProfileRegistry
 from doge.core.domain.model_policy import ModelPolicy
 from doge.core.domain.evidence_chunk_models import EvidenceChunk
 from doge.core.domain.run_execution_context import RunExecutionContext
+from doge.core.domain.tool_policy import ToolCategory
 from doge.core.ports.agent_backend import IAgentBackend
 from doge.core.ports.agent_model import IAgentModel
 from doge.core.ports.enterprise_governance import EnterpriseAuditEvent, IEnterpriseGovernanceRepository
 from doge.core.ports.model_router import IModelRouter, RoutingDecision
 from doge.core.ports.runtime_services import (
+    IModelDeltaStream,
     IModelResponseAssembler,
     IWebSearchStage,
     ModelExecutionResult,
     ToolResult,
 )
 
+_PARALLEL_SAFE_CATEGORIES = frozenset({ToolCategory.READ_ONLY.value, ToolCategory.ANALYTICAL.value})
+
 
 class ModelExecutionService:
     """Execute the model turn after RuntimeKernel prepares run context."""
@@ -42,9 +46,11 @@ class ModelExecutionService:
         model_router: IModelRouter | None = None,
         web_search_stage: IWebSearchStage | None = None,
         agent_backends: dict[str, IAgentBackend] | None = None,
+        delta_stream: IModelDeltaStream | None = None,
     ) -> None:
         if response_assembler is None:
             raise ValueError("response_assembler is required")
+        self._delta_stream = delta_stream
         self._model = model
         self._response_assembler = response_assembler
         self._model_router = model_router
@@ -70,6 +76,8 @@ class ModelExecutionService:
         tool_schemas = tool_schemas_for(routing)
         chat_kwargs = self._chat_kwargs(run, policy, routing, tool_schemas, enterprise_context, execution_context)
         chat_stream = self._chat_stream(messages, routing, chat_kwargs)
+        if self._delta_stream is not None:
+            chat_stream = self._delta_stream.tee(run.run_id, chat_stream)
         response = await self._response_assembler.assemble(chat_stream)
         return ModelExecutionResult(
             response=response,
@@ -247,6 +255,16 @@ class ToolExecutionService:
             evidence_refs=evidence_refs if evidence_refs else None,
         )
 
+    def is_parallel_safe(self, context: EnterpriseContext | None, tool_name: str) -> bool:
+        """Return whether a call may overlap other calls of the same model round.
+
+        Only read-only and analytical tools that will not stop for approval
+        qualify; unknown tools do not.
+        """
+        if self._tool_category(tool_name) not in _PARALLEL_SAFE_CATEGORIES:
+            return False
+        return not self._tools.requires_approval(tool_name, context=context)
+
     def audit(
         self,
         context: EnterpriseContext | None,
@@ -46,7 +46,11 @@ class DataSourceContribution:
 
 @dataclass(frozen=True)
 class DocumentParserContribution:
-    """A document parser factory contributed by a slot."""
+    """A document parser factory contributed by a slot.
+
+    The factory returns an object with ``parse(path, *, max_chars)``; it may
+    also offer ``iter_pages(path)`` to stream large documents page by page.
+    """
 
     parser_id: str
     factory: Callable[["SlotContext"], Any]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from inspect import Parameter, signature
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from doge.platform.slots import (
     DataSourceContribution,
@@ -116,6 +116,25 @@ class DataSourceRegistry:
         self._ensure_connected_for(source, market)
         return source.download_kline(ticker, market, start=start, count=count)
 
+    def download_many(
+        self,
+        tickers: Iterable[str],
+        market: str,
+        start: int = 0,
+        count: int = 800,
+    ) -> Iterator[tuple[str, object, str | None]]:
+        source = self.source_for(market)
+        self._ensure_connected_for(source, market)
+        download_many = getattr(source, "download_many", None)
+        if download_many is not None:
+            yield from download_many(tickers, market, start=start, count=count)
+            return
+        for ticker in tickers:
+            try:
+                yield ticker, source.download_kline(ticker, market, start=start, count=count), None
+            except Exception as e:
+                yield ticker, None, str(e)
+
     def get_latest_market_date(self, market: str):
         source = self.source_for(market)
         return source.get_latest_market_date(market)
@@ -49,6 +49,7 @@ class MarketToolProvider:
                 },
                 required=("ticker",),
                 category=ToolCategory.READ_ONLY,
+                cacheable=True,
             ),
             ToolDescriptor(
                 name="stock_overview",
@@ -59,6 +60,7 @@ class MarketToolProvider:
                 },
                 required=("ticker",),
                 category=ToolCategory.READ_ONLY,
+                cacheable=True,
             ),
             ToolDescriptor(
                 name="rsrs_ranking",
@@ -68,6 +70,7 @@ class MarketToolProvider:
                     "top": {"type": "integer", "minimum": 1, "maximum": 100},
                 },
                 category=ToolCategory.READ_ONLY,
+                cacheable=True,
             ),
             ToolDescriptor(
                 name="market_breadth",
@@ -77,6 +80,7 @@ class MarketToolProvider:
                     "days": {"type": "integer", "minimum": 1, "maximum": 30},
                 },
                 category=ToolCategory.READ_ONLY,
+                cacheable=True,
             ),
             ToolDescriptor(
                 name="volume_anomalies",
@@ -86,6 +90,7 @@ class MarketToolProvider:
                     "top": {"type": "integer", "minimum": 1, "maximum": 100},
                 },
                 category=ToolCategory.READ_ONLY,
+                cacheable=True,
             ),
         )
 
@@ -5,11 +5,15 @@ Canonical quant tool execution provider (implementation lives here; `doge.applic
 
 from __future__ import annotations
 
+import base64
+import binascii
+import hashlib
 import json
 from typing import Any
 
 from doge.shared.tool_utils import (
     ServiceFactory,
+    has_top_level_order_by,
     looks_mutating_sql,
     resolve,
 )
@@ -21,8 +25,13 @@ from doge.core.ports.code_executor import (
     ICodeExecutor,
 )
 from doge.core.ports.market_view import IMarketViewRepository  # noqa: F401 (re-exported for doge.products.quant)
+from doge.core.ports.market_view import ViewQueryBudgetExceeded
 from doge.core.services.view_service import ViewService  # noqa: F401 (re-exported for doge.products.quant)
 
+SQL_PAGE_SIZE = 100
+SQL_TIME_BUDGET_SECONDS = 15.0
+SQL_MEMORY_LIMIT = "1GB"
+
 
 class QuantToolProvider:
     """Executes bounded SQL, Python, and view-listing analysis tools."""
@@ -55,10 +64,15 @@ class QuantToolProvider:
             ),
             ToolDescriptor(
                 name="run_sql_query",
-                description="Run a read-only SQL query against analytical views.",
+                description=(
+                    "Run a read-only SQL query against analytical views. Returns up to "
+                    f"{SQL_PAGE_SIZE} rows per call; pass next_page_token back with the same sql "
+                    "to fetch the next page. Only queries with a top-level ORDER BY are paged."
+                ),
                 properties={
                     "sql": {"type": "string"},
                     "readonly": {"type": "boolean"},
+                    "page_token": {"type": "string"},
                 },
                 required=("sql",),
                 category=ToolCategory.ANALYTICAL,
@@ -102,15 +116,43 @@ class QuantToolProvider:
         rows = json.loads(payload)
         return {"views": rows}
 
-    def run_sql_query(self, sql: str, readonly: bool = True) -> dict[str, Any]:
+    def run_sql_query(self, sql: str, readonly: bool = True, page_token: str | None = None) -> dict[str, Any]:
         if not readonly or looks_mutating_sql(sql):
             return {"ok": False, "error": "Only read-only SELECT/WITH queries are allowed."}
+        cursor = _decode_page_token(page_token, sql) if page_token else {"offset": 0}
+        if cursor is None:
+            return {"ok": False, "error": "Invalid page token for this query."}
+        offset = cursor["offset"]
         try:
-            frame = self._view_repository().execute(sql, [])
-            rows = frame.to_dict(orient="records") if hasattr(frame, "to_dict") else []
-            return {"ok": True, "rows": rows[:100], "row_count": len(rows)}
+            page = self._view_repository().query_page(
+                sql,
+                [],
+                offset=offset,
+                limit=SQL_PAGE_SIZE,
+                count_total=offset == 0,
+                timeout_seconds=SQL_TIME_BUDGET_SECONDS,
+                memory_limit=SQL_MEMORY_LIMIT,
+            )
+            rows = page.frame.to_dict(orient="records")
+            has_more = page.has_more
+            total, estimated = page.total_rows, page.total_is_estimate
+            if total is None:
+                total, estimated = cursor.get("total"), bool(cursor.get("estimated"))
+        except ViewQueryBudgetExceeded as exc:
+            return {"ok": False, "error": f"SQL {exc}; narrow the query or aggregate in SQL."}
         except Exception:
             return {"ok": False, "error": "SQL query failed."}
+        result: dict[str, Any] = {"ok": True, "rows": rows, "row_count": total}
+        if estimated:
+            result["row_count_estimated"] = True
+        if has_more and has_top_level_order_by(sql):
+            result["next_page_token"] = _encode_page_token(sql, offset + len(rows), total, estimated)
+        elif has_more:
+            # Without an ORDER BY, rows may come back in a different order on
+            # the next call, so later pages could repeat or skip rows.
+            result["truncated"] = True
+            result["warning"] = "Add a top-level ORDER BY to page through the remaining rows."
+        return result
 
     def run_python_analysis(self, code: str, timeout: float = 5.0) -> dict[str, Any]:
         result = self._code_executor.execute(code, timeout)
@@ -127,3 +169,28 @@ class QuantToolProvider:
 
     def _view_repository(self):
         return resolve(self._view_repository_factory, "view_repository")
+
+
+def _sql_fingerprint(sql: str) -> str:
+    return hashlib.sha256(" ".join(sql.split()).encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_page_token(sql: str, offset: int, total: int | None, estimated: bool) -> str:
+    payload = {"q": _sql_fingerprint(sql), "offset": offset, "total": total, "estimated": estimated}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_page_token(token: str, sql: str) -> dict[str, Any] | None:
+    """Return the cursor in *token*, or None if it is malformed or for other SQL."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("q") != _sql_fingerprint(sql):
+        return None
+    offset = payload.get("offset")
+    if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+        return None
+    return payload
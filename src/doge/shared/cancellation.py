@@ -0,0 +1,111 @@
+"""Cooperative cancellation for work running on tool executor threads.
+
+A thread cannot be killed from the outside, so a timed-out tool call only
+stops early if the work notices. The executor binds a
+:class:`CancellationToken` to the worker thread for the duration of a call:
+
+* long-running tools poll :func:`raise_if_cancelled` between steps;
+* blocking resources register an ``on_cancel`` hook that aborts them, e.g.
+  DuckDB connections register ``interrupt()`` so a running query fails fast.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Generator, Optional
+
+
+class OperationCancelled(Exception):
+    """Raised inside cancelled work when it checks its token."""
+
+
+class CancellationToken:
+    """Thread-safe, one-shot cancellation flag with cancel hooks."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks: dict[int, Callable[[], None]] = {}
+        self._next_id = 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Mark the token cancelled and run every registered hook once."""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:  # noqa: BLE001 - one failing hook must not block the others
+                pass
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run *callback* on cancellation; return a function that unregisters it.
+
+        The callback runs immediately if the token is already cancelled.
+        """
+        with self._lock:
+            if not self._cancelled:
+                handle = self._next_id
+                self._next_id += 1
+                self._callbacks[handle] = callback
+                return lambda: self._unregister(handle)
+        callback()
+        return lambda: None
+
+    def raise_if_cancelled(self) -> None:
+        if self._cancelled:
+            raise OperationCancelled("operation cancelled")
+
+    def _unregister(self, handle: int) -> None:
+        with self._lock:
+            self._callbacks.pop(handle, None)
+
+
+_CURRENT: ContextVar[Optional[CancellationToken]] = ContextVar("doge_cancellation_token", default=None)
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """Return the token bound to the running work, if any."""
+    return _CURRENT.get()
+
+
+def raise_if_cancelled() -> None:
+    """Raise :class:`OperationCancelled` if the running work was cancelled."""
+    token = _CURRENT.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Generator[CancellationToken, None, None]:
+    """Bind *token* as the current token for the enclosed block."""
+    reset = _CURRENT.set(token)
+    try:
+        yield token
+    finally:
+        _CURRENT.reset(reset)
+
+
+@contextmanager
+def interrupt_on_cancel(interrupt: Callable[[], None]) -> Generator[None, None, None]:
+    """Call *interrupt* if the current token is cancelled inside the block."""
+    token = _CURRENT.get()
+    if token is None:
+        yield
+        return
+    token.raise_if_cancelled()
+    unregister = token.on_cancel(interrupt)
+    try:
+        yield
+    finally:
+        unregister()
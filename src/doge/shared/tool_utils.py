@@ -84,6 +84,41 @@ def looks_mutating_sql(sql: str) -> bool:
     return bool(re.search(r"\b(insert|update|delete|drop|alter|create|attach|copy|pragma)\b", stripped))
 
 
+def has_top_level_order_by(sql: str) -> bool:
+    """Return whether *sql* has an ``ORDER BY`` outside parentheses, comments and literals."""
+    words: list[str] = []
+    depth = 0
+    index, size = 0, len(sql)
+    while index < size:
+        char = sql[index]
+        if sql.startswith("--", index):
+            newline = sql.find("\n", index)
+            index = size if newline < 0 else newline
+        elif sql.startswith("/*", index):
+            close = sql.find("*/", index + 2)
+            index = size if close < 0 else close + 2
+        elif char in "'\"":
+            index += 1
+            while index < size and not (sql[index] == char and not sql.startswith(char * 2, index)):
+                index += 2 if sql[index] == char else 1
+            index += 1
+            words.append("")
+        elif char == "(":
+            depth += 1
+            index += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+            index += 1
+        elif depth == 0 and (char.isalpha() or char == "_"):
+            start = index
+            while index < size and (sql[index].isalnum() or sql[index] == "_"):
+                index += 1
+            words.append(sql[start:index].upper())
+        else:
+            index += 1
+    return any(first == "ORDER" and second == "BY" for first, second in zip(words, words[1:]))
+
+
 def unsafe_python(code: str) -> bool:
     lowered = code.lower()
     blocked = (
@@ -0,0 +1,59 @@
+"""Agent repository latency: pooled WAL connections vs a connection per call.
+
+Deterministic benchmark over a fresh agent database. It times the same mix of
+repository operations — session saves and reads — with
+``DOGE_SQLITE_POOL_SIZE=0`` (the previous open/close per call) and with the
+default pool, and reports the per-operation latency of each. The test is
+marked ``benchmark`` and skipped unless ``DOGE_RUN_BENCHMARKS=1``.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from doge.config import reset_settings
+from doge.core.domain.agent_models import AgentSession
+from doge.infrastructure.database.agent_repositories import SQLiteSessionRepository
+from doge.infrastructure.database.sqlite_pool import close_sqlite_pools
+
+
+def _time_operations(db_path: Path, operations: int) -> float:
+    repo = SQLiteSessionRepository(db_path)
+    start = time.perf_counter()
+    for index in range(operations):
+        session_id = f"bench-{index % 20}"
+        repo.save(AgentSession(session_id=session_id, title=f"session {index}"))
+        repo.get(session_id)
+    return (time.perf_counter() - start) / (operations * 2)
+
+
+def run_sqlite_pool_benchmark(root: Path, monkeypatch, *, operations: int = 300) -> dict[str, Any]:
+    """Time repository calls without and with the connection pool."""
+    results: dict[str, float] = {}
+    for label, size in (("per_call", "0"), ("pooled", "4")):
+        monkeypatch.setenv("DOGE_SQLITE_POOL_SIZE", size)
+        reset_settings()
+        close_sqlite_pools()
+        try:
+            results[label] = _time_operations(root / f"{label}.db", operations)
+        finally:
+            close_sqlite_pools()
+    return {
+        "operations": operations * 2,
+        "per_call_us": round(results["per_call"] * 1e6, 1),
+        "pooled_us": round(results["pooled"] * 1e6, 1),
+        "speedup": round(results["per_call"] / results["pooled"], 2) if results["pooled"] else None,
+    }
+
+
+@pytest.mark.benchmark
+def test_sqlite_pool_benchmark_pooled_calls_outpace_per_call_connections(tmp_path, monkeypatch):
+    result = run_sqlite_pool_benchmark(tmp_path, monkeypatch, operations=200)
+    reset_settings()
+
+    assert result["operations"] == 400
+    assert result["pooled_us"] < result["per_call_us"]
@@ -0,0 +1,85 @@
+"""TDX local ``.day`` parser benchmark: numpy memmap vs struct loop.
+
+Deterministic benchmark over a synthetic vipdoc tree. It measures the wall
+time of both :class:`TDXFileScanner` parser modes on the same files and checks
+that they produce identical canonical frames. Only the timing comparison is
+marked ``benchmark``, which is skipped unless ``DOGE_RUN_BENCHMARKS=1``.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from doge.infrastructure.data_source.tdx_file_scanner import TDXFileScanner
+
+
+def build_synthetic_vipdoc(root: Path, *, files: int = 200, bars: int = 2500) -> Path:
+    """Write ``files`` CN ``.day`` files with ``bars`` daily records each."""
+    lday = root / "vipdoc" / "sh" / "lday"
+    lday.mkdir(parents=True, exist_ok=True)
+    base_date = 20000101
+    for index in range(files):
+        payload = bytearray()
+        for bar in range(bars):
+            year, rem = divmod(bar, 12 * 28)
+            month, day = divmod(rem, 28)
+            date_int = base_date + year * 10000 + month * 100 + day
+            price = 1000 + (bar * 7 + index) % 500
+            payload += struct.pack(
+                "<IIIII fII",
+                date_int, price, price + 9, price - 8, price + 3,
+                float(price * 1000), 10000 + bar, 0,
+            )
+        (lday / f"sh{600000 + index:06d}.day").write_bytes(bytes(payload))
+    return root / "vipdoc"
+
+
+def run_tdx_parser_benchmark(vipdoc: Path, *, repeats: int = 3) -> dict[str, Any]:
+    """Time both parser modes over ``vipdoc`` and compare their output."""
+    timings: dict[str, float] = {}
+    frames: dict[str, list[pd.DataFrame]] = {}
+    for mode in ("struct", "mmap"):
+        scanner = TDXFileScanner(parser=mode)
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            frames[mode] = list(scanner.scan_local("cn", str(vipdoc)))
+            best = min(best, time.perf_counter() - start)
+        timings[mode] = best
+
+    identical = len(frames["struct"]) == len(frames["mmap"]) and all(
+        left.equals(right) and list(left.dtypes) == list(right.dtypes)
+        for left, right in zip(frames["struct"], frames["mmap"])
+    )
+    return {
+        "files": len(frames["mmap"]),
+        "struct_seconds": round(timings["struct"], 4),
+        "mmap_seconds": round(timings["mmap"], 4),
+        "speedup": round(timings["struct"] / timings["mmap"], 2) if timings["mmap"] else None,
+        "identical": identical,
+    }
+
+
+def test_tdx_parser_benchmark_mmap_matches_struct(tmp_path):
+    vipdoc = build_synthetic_vipdoc(tmp_path, files=20, bars=500)
+
+    result = run_tdx_parser_benchmark(vipdoc, repeats=1)
+
+    assert result["files"] == 20
+    assert result["identical"] is True
+
+
+@pytest.mark.benchmark
+def test_tdx_parser_benchmark_mmap_outpaces_struct(tmp_path):
+    vipdoc = build_synthetic_vipdoc(tmp_path, files=60, bars=2500)
+
+    result = run_tdx_parser_benchmark(vipdoc, repeats=2)
+
+    assert result["identical"] is True
+    assert result["mmap_seconds"] < result["struct_seconds"]
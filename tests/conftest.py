@@ -1,4 +1,5 @@
 """pytest shared fixtures."""
+import os
 import sys
 from pathlib import Path
 
@@ -37,3 +38,17 @@ def pytest_configure(config):
         "DB (DuckDB views + SQLite research DB). Skipped automatically when "
         "the live DB / views are absent; excluded from CI via -m 'not integration'.",
     )
+    config.addinivalue_line(
+        "markers",
+        "benchmark: wall-clock timing comparisons. Skipped unless "
+        "DOGE_RUN_BENCHMARKS=1, so loaded CI hosts never gate on timings.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("DOGE_RUN_BENCHMARKS") == "1":
+        return
+    skip_benchmark = pytest.mark.skip(reason="timing benchmark; set DOGE_RUN_BENCHMARKS=1 to run")
+    for item in items:
+        if item.get_closest_marker("benchmark") is not None:
+            item.add_marker(skip_benchmark)
@@ -1,8 +1,9 @@
 import sqlite3
 
 from doge.core.domain.agent_models import AgentRun, AgentSession
-from doge.core.domain.document_models import Document, DocumentStatus
+from doge.core.domain.document_models import Document, DocumentExtractionStatus, DocumentStatus
 from doge.infrastructure.database.agent_repositories import (
+    SQLiteDocumentExtractionQueue,
     SQLiteDocumentRepository,
     SQLiteIdempotencyStore,
     SQLiteRunQueue,
@@ -94,3 +95,61 @@ def test_document_repository_persists_file_metadata_and_hash_lookup(tmp_path):
     assert saved["kimi_file_purpose"] == "file-extract"
     assert saved["parsing_status"] == "uploaded"
     assert by_hash == saved
+
+
+def test_document_extraction_queue_dedupes_by_hash_and_leases_jobs(tmp_path):
+    db = tmp_path / "agent_state.db"
+    queue = SQLiteDocumentExtractionQueue(db)
+
+    first = queue.enqueue("doc-1", "tenant-a", file_hash="hash-1")
+    again = queue.enqueue("doc-1", "tenant-a", file_hash="hash-1")
+    version = queue.queue_version()
+    queue.enqueue("doc-2", "tenant-a", file_hash="hash-2")
+
+    assert first.status is DocumentExtractionStatus.PENDING
+    assert again == first
+    assert queue.queue_version() != version
+
+    claimed = queue.claim("worker-a", lease_seconds=30, limit=1)
+    assert [job.document_id for job in claimed] == ["doc-1"]
+    assert claimed[0].status is DocumentExtractionStatus.PARSING
+    assert claimed[0].attempt_count == 1
+    assert [job.document_id for job in queue.claim("worker-b", lease_seconds=30, limit=5)] == ["doc-2"]
+    assert queue.claim("worker-c", lease_seconds=30, limit=5) == []
+
+    assert not queue.update("doc-1", DocumentExtractionStatus.INDEXED, worker_id="worker-b")
+    assert queue.update("doc-1", DocumentExtractionStatus.INDEXED, worker_id="worker-a", page_count=1, chunk_count=2)
+    indexed = queue.get("doc-1", "tenant-a")
+    assert indexed.finished
+    assert (indexed.page_count, indexed.chunk_count) == (1, 2)
+    assert queue.get("doc-1", "tenant-b") is None
+    assert queue.enqueue("doc-1", "tenant-a", file_hash="hash-1").status is DocumentExtractionStatus.INDEXED
+
+
+def test_document_extraction_queue_heartbeat_extends_only_the_owners_lease(tmp_path):
+    queue = SQLiteDocumentExtractionQueue(tmp_path / "agent_state.db")
+    queue.enqueue("doc-1", "tenant-a", file_hash="hash-1")
+    queue.enqueue("doc-2", "tenant-a", file_hash="hash-2")
+    queue.claim("worker-a", lease_seconds=0, limit=2)
+
+    assert queue.heartbeat("worker-a", "doc-1", lease_seconds=300)
+    assert not queue.heartbeat("worker-b", "doc-2", lease_seconds=300)
+
+    assert [job.document_id for job in queue.claim("worker-c", lease_seconds=30, limit=5)] == ["doc-2"]
+
+
+def test_document_extraction_queue_resumes_expired_chunked_jobs_until_max_attempts(tmp_path):
+    db = tmp_path / "agent_state.db"
+    queue = SQLiteDocumentExtractionQueue(db)
+    queue.enqueue("doc-1", "tenant-a", file_hash="hash-1")
+
+    queue.claim("worker-a", lease_seconds=0, limit=1, max_attempts=2)
+    queue.update("doc-1", DocumentExtractionStatus.CHUNKED, worker_id="worker-a", error="chunk indexing failed")
+    resumed = queue.claim("worker-b", lease_seconds=0, limit=1, max_attempts=2)
+
+    assert [(job.status, job.attempt_count) for job in resumed] == [(DocumentExtractionStatus.CHUNKED, 2)]
+    assert queue.claim("worker-c", lease_seconds=0, limit=1, max_attempts=2) == []
+    failed = queue.get("doc-1", "tenant-a")
+    assert failed.status is DocumentExtractionStatus.FAILED
+    assert failed.error == "chunk indexing failed"
+    assert queue.enqueue("doc-1", "tenant-a", file_hash="hash-1").status is DocumentExtractionStatus.PENDING
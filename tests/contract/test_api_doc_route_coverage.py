@@ -107,9 +107,9 @@ class TestApiDocRouteCoverage:
     def test_doc_route_table_has_expected_row_count(self):
         # Arrange/Act
         doc_routes = _parse_doc_routes()
-        # Assert — canonical enumeration: 34 legacy routes + 64 v1/daemon routes.
-        assert len(doc_routes) == 98, (
-            f"docs/API.md route table should enumerate exactly 98 product "
+        # Assert — canonical enumeration: 34 legacy routes + 65 v1/daemon routes.
+        assert len(doc_routes) == 99, (
+            f"docs/API.md route table should enumerate exactly 99 product "
             f"routes, found {len(doc_routes)}: {sorted(doc_routes)}"
         )
 
@@ -10,6 +10,7 @@ from doge.bootstrap.gateway_factories import market as market_factories
 from doge.bootstrap.gateway_factories import use_cases as use_case_factories
 from doge.bootstrap.runtime_factories import slots as slots_module
 from doge.config import reset_settings
+from doge.core.ports.repository import IStockRepository
 from doge.infrastructure.data_source.tdx import TDXDataSource
 from doge.platform.slots import (
     DataSourceContribution,
@@ -44,7 +45,7 @@ _ALL_FEATURE_VARS = [
 ]
 
 
-class _StockRepo:
+class _StockRepo(IStockRepository):
     def __init__(self) -> None:
         self.ensure_schema_markets: list[str] = []
         self.saved: list[tuple[str, pd.DataFrame]] = []
@@ -58,6 +59,18 @@ class _StockRepo:
     def save_prices(self, market: str, df: pd.DataFrame) -> None:
         self.saved.append((market, df.copy()))
 
+    def get_prices(self, ticker, market, days=20):
+        return []
+
+    def get_overview(self, ticker, market):
+        return {}
+
+    def get_sync_state(self, tickers):
+        return {}
+
+    def get_kline(self, ticker, market, days=120):
+        return []
+
 
 class _Source:
     def __init__(self, source_id: str = "data.custom") -> None:
@@ -0,0 +1,178 @@
+"""Contract tests for IStockRepository.save_prices_batch (bulk scan ingest).
+
+Verifies:
+- the port ships a per-frame default so every repository supports batches
+- ``SQLiteStorageRepository.save_prices_batch`` writes a whole batch through
+  one connection, keeps the append-after-``MAX(date)`` semantics and reports
+  appended rows per ticker without re-counting
+- retention is applied to every ticker that gained rows
+- a failing batch is retried per ticker so only the bad ticker fails
+"""
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from doge.core.ports.repository import (
+    IStockRepository,
+    PriceBatchWriteResult,
+    StorageWriteError,
+)
+from doge.infrastructure.database.sqlite_storage import SQLiteStorageRepository
+
+
+def _make_frame(ticker: str, dates: list[str]) -> pd.DataFrame:
+    rows = len(dates)
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": [10.0 + i for i in range(rows)],
+            "high": [11.0 + i for i in range(rows)],
+            "low": [9.0 + i for i in range(rows)],
+            "close": [10.5 + i for i in range(rows)],
+            "volume": [1000 * (i + 1) for i in range(rows)],
+            "amount": [10000.0 * (i + 1) for i in range(rows)],
+            "ticker": [ticker] * rows,
+        }
+    )
+
+
+def _rows(db_path: Path, ticker: str) -> list[tuple]:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute(
+            "SELECT date, close, volume FROM stock_prices WHERE ticker = ? ORDER BY date",
+            (ticker,),
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    from doge.config import settings as settings_module
+
+    monkeypatch.setenv("DOGE_CN_DB", str(tmp_path / "market_cn.db"))
+    settings_module.reset_settings()
+    repository = SQLiteStorageRepository(read_repo=MagicMock(spec=IStockRepository))
+    repository.ensure_schema("cn")
+    yield repository
+    settings_module.reset_settings()
+
+
+def test_batch_round_trips_and_reports_appended_rows(repo, tmp_path):
+    result = repo.save_prices_batch(
+        "cn",
+        [
+            _make_frame("000001.SZ", ["2026-01-02", "2026-01-05"]),
+            _make_frame("600000.SH", ["2026-01-02", "2026-01-05", "2026-01-06"]),
+        ],
+    )
+
+    assert result == PriceBatchWriteResult(appended={"000001.SZ": 2, "600000.SH": 3})
+    assert len(_rows(tmp_path / "market_cn.db", "600000.SH")) == 3
+
+
+def test_batch_appends_only_after_stored_watermark(repo, tmp_path):
+    repo.save_prices("cn", _make_frame("000001.SZ", ["2026-01-02", "2026-01-05"]))
+
+    result = repo.save_prices_batch(
+        "cn",
+        [_make_frame("000001.SZ", ["2026-01-02", "2026-01-05", "2026-01-06"])],
+    )
+
+    assert result.appended == {"000001.SZ": 1}
+    assert [row[0] for row in _rows(tmp_path / "market_cn.db", "000001.SZ")] == [
+        "2026-01-02", "2026-01-05", "2026-01-06",
+    ]
+
+
+def test_batch_uses_one_connection(repo, monkeypatch):
+    opened = []
+    real_connect = sqlite3.connect
+
+    def _counting_connect(*args, **kwargs):
+        opened.append(args)
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, "connect", _counting_connect)
+    frames = [_make_frame(f"{600000 + i}.SH", ["2026-01-02"]) for i in range(25)]
+
+    result = repo.save_prices_batch("cn", frames)
+
+    assert len(result.appended) == 25
+    assert len(opened) == 1
+
+
+def test_batch_prunes_rows_past_retention(repo, tmp_path):
+    result = repo.save_prices_batch(
+        "cn",
+        [_make_frame("000001.SZ", ["2001-01-02", "2026-01-02"])],
+    )
+
+    assert result.appended == {"000001.SZ": 2}
+    assert [row[0] for row in _rows(tmp_path / "market_cn.db", "000001.SZ")] == ["2026-01-02"]
+
+
+def test_batch_stores_missing_amount_as_null_in_one_transaction(repo, tmp_path, monkeypatch):
+    opened = []
+    real_connect = sqlite3.connect
+
+    def _counting_connect(*args, **kwargs):
+        opened.append(args)
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, "connect", _counting_connect)
+    frame = _make_frame("000001.SZ", ["2026-01-02", "2026-01-05"]).drop(columns=["amount"])
+
+    result = repo.save_prices_batch("cn", [frame])
+
+    assert result.appended == {"000001.SZ": 2}
+    assert len(opened) == 1
+    conn = real_connect(str(tmp_path / "market_cn.db"))
+    try:
+        amounts = conn.execute("SELECT amount FROM stock_prices WHERE ticker = '000001.SZ'").fetchall()
+    finally:
+        conn.close()
+    assert amounts == [(None,), (None,)]
+
+
+def test_failed_batch_retries_per_ticker(repo, tmp_path):
+    bad = _make_frame("BAD.SZ", ["2026-01-02"])
+    bad["close"] = [{"unbindable": True}]
+    good = _make_frame("GOOD.SZ", ["2026-01-02"])
+
+    result = repo.save_prices_batch("cn", [bad, good])
+
+    assert set(result.failed) == {"BAD.SZ"}
+    assert result.appended == {"GOOD.SZ": 1}
+    assert len(_rows(tmp_path / "market_cn.db", "GOOD.SZ")) == 1
+
+
+def test_port_default_batch_loops_save_prices():
+    class _Repo(IStockRepository):
+        def __init__(self):
+            self.saved = []
+
+        def save_prices(self, market, frame):
+            ticker = str(frame["ticker"].iloc[0])
+            if ticker == "BAD.SZ":
+                raise StorageWriteError("boom")
+            self.saved.append(ticker)
+            return len(frame)
+
+        ensure_schema = get_prices = get_overview = get_sync_state = None
+        get_kline = list_distinct_tickers = None
+
+    repo = _Repo()
+
+    result = repo.save_prices_batch(
+        "cn",
+        [_make_frame("A.SZ", ["2026-01-02"]), _make_frame("BAD.SZ", ["2026-01-02"])],
+    )
+
+    assert result.appended == {"A.SZ": 1}
+    assert result.failed == {"BAD.SZ": "boom"}
+    assert repo.saved == ["A.SZ"]
@@ -514,6 +514,24 @@ def test_python_sdk_documents_get():
     assert document["document_id"] == "doc-1"
 
 
+def test_python_sdk_documents_wait_for_extraction_polls_until_finished():
+    statuses = iter(["pending", "chunked", "indexed"])
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"document_id": "doc-1", "status": next(statuses)})
+
+    client = DogeClient(base_url="http://testserver", transport=httpx.MockTransport(handler))
+    sleeps = []
+
+    job = client.documents.wait_for_extraction("doc-1", poll_interval=0.2, sleep=sleeps.append)
+
+    assert job["status"] == "indexed"
+    assert paths == ["/v1/documents/doc-1/extraction"] * 3
+    assert sleeps == [0.2, 0.2]
+
+
 def test_python_sdk_documents_upload_path_uses_multipart(tmp_path):
     source = tmp_path / "report.txt"
     source.write_text("alpha beta", encoding="utf-8")
@@ -700,3 +718,34 @@ async def test_async_python_sdk_run_summary_platform_and_capability_resources():
     assert execution["run_id"] == "run-from-execution"
     assert review["case"]["case_id"] == "case-1"
     assert capabilities[0]["capability_id"] == "provider.kimi"
+
+
+def test_python_sdk_stream_requests_live_deltas_and_folds_them():
+    from doge_sdk.streaming import LiveModelOutput
+
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["deltas"] = request.url.params.get("deltas")
+        return httpx.Response(
+            200,
+            content=(
+                'event: model_delta\ndata: {"payload": {"index": 0, "content": "Hel"}}\n\n'
+                'event: model_delta\ndata: {"payload": {"index": 1, "content": "lo", "reasoning_content": "hm"}}\n\n'
+                'id: 3\nevent: model_response\ndata: {"sequence": 3}\n\n'
+            ),
+        )
+
+    client = DogeClient(base_url="http://testserver", transport=httpx.MockTransport(handler))
+    output = LiveModelOutput()
+
+    events = list(client.runs.stream("run-test", deltas=True))
+    texts = [output.feed(event) for event in events[:2]]
+
+    assert seen["deltas"] == "true"
+    assert [event.id for event in events] == [None, None, "3"]
+    assert texts == ["Hel", "lo"]
+    assert (output.content, output.reasoning_content) == ("Hello", "hm")
+    assert output.time_to_first_delta is not None
+    output.feed(events[2])
+    assert output.content == ""
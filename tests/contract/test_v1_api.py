@@ -53,6 +53,20 @@ def _wait_for_run(client: TestClient, run_id: str, statuses: set[str], timeout:
     return body
 
 
+def _wait_for_extraction(client: TestClient, document_id: str, timeout: float = 20.0) -> dict:
+    deadline = time.monotonic() + timeout
+    body = {}
+    while time.monotonic() < deadline:
+        response = client.get(f"/v1/documents/{document_id}/extraction")
+        assert response.status_code == 200
+        body = response.json()
+        if body["status"] in {"indexed", "failed"}:
+            return body
+        time.sleep(0.05)
+    assert body.get("status") in {"indexed", "failed"}
+    return body
+
+
 def test_v1_post_turns_returns_202_with_run_id(tmp_path, monkeypatch):
     _reset_agent_deps(monkeypatch, tmp_path)
     with TestClient(app) as client:
@@ -262,6 +276,7 @@ def test_optional_api_token_auth(tmp_path, monkeypatch):
 
 
 def test_health_ready_reports_daemon_subsystems(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOGE_DUCKDB_POOL_SIZE", "4")
     _reset_agent_deps(monkeypatch, tmp_path)
     with TestClient(app) as client:
         response = client.get("/health/ready")
@@ -278,7 +293,14 @@ def test_health_ready_reports_daemon_subsystems(tmp_path, monkeypatch):
         "outbox_backlog",
         "document_storage",
         "model_provider_configuration",
+        "duckdb_pool",
+        "model_http_pool",
+        "tool_result_cache",
+        "tool_executor",
+        "sqlite_pool",
+        "python_sandbox_pool",
     }
+    assert body["checks"]["duckdb_pool"]["enabled"] is True
     worker_heartbeat = body["checks"]["worker_heartbeat"]
     assert worker_heartbeat["loop_running"] is True
     assert set(worker_heartbeat["worker_metrics"]) == {
@@ -288,6 +310,14 @@ def test_health_ready_reports_daemon_subsystems(tmp_path, monkeypatch):
         "avg_processing_latency_ms",
         "last_heartbeat_at",
         "active_run_count",
+        "in_flight_run_count",
+        "max_concurrent_runs",
+        "backpressure_pauses",
+        "runs_claimed",
+        "avg_queue_wait_ms",
+        "max_queue_wait_ms",
+        "queue_wakeups",
+        "empty_claims",
     }
     assert body["checks"]["model_provider_configuration"]["provider"] == "kimi"
 
@@ -340,17 +370,41 @@ def test_v1_documents_accepts_multipart_upload(tmp_path, monkeypatch):
             "/v1/documents",
             files={"file": ("report.txt", b"alpha beta", "text/plain")},
         )
+        document_id = response.json()["document_id"]
+        job = _wait_for_extraction(client, document_id)
+        fetched = client.get(f"/v1/documents/{document_id}").json()
 
     assert response.status_code == 200
     body = response.json()
-    assert body["document_id"].startswith("doc-")
+    assert document_id.startswith("doc-")
     assert body["filename"] == "report.txt"
     assert body["original_filename"] == "report.txt"
     assert body["file_hash"]
     assert body["mime_type"] == "text/plain"
     assert body["size_bytes"] == len(b"alpha beta")
-    assert body["parsing_status"] == "parsed"
-    assert body["content"] == "alpha beta"
+    assert body["parsing_status"] == "uploaded"
+    assert body["extraction_status"] == "pending"
+    assert job["status"] == "indexed"
+    assert (job["page_count"], job["chunk_count"]) == (1, 1)
+    assert fetched["parsing_status"] == "parsed"
+    assert fetched["content"] == "alpha beta"
+    assert fetched["extraction_status"] == "indexed"
+
+
+def test_v1_documents_extracts_during_upload_without_extraction_workers(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOGE_DOCUMENT_EXTRACTION_WORKERS", "0")
+    _reset_agent_deps(monkeypatch, tmp_path)
+    with TestClient(app) as client:
+        response = client.post(
+            "/v1/documents",
+            files={"file": ("report.txt", b"alpha beta", "text/plain")},
+        )
+        extraction = client.get(f"/v1/documents/{response.json()['document_id']}/extraction")
+
+    assert response.status_code == 200
+    assert response.json()["parsing_status"] == "parsed"
+    assert response.json()["content"] == "alpha beta"
+    assert extraction.status_code == 404
 
 
 def test_v1_documents_keeps_json_registration_compatibility(tmp_path, monkeypatch):
@@ -7,7 +7,11 @@ from pathlib import Path
 from typing import Any
 
 from doge.application.services.file_upload_service import FileUploadService
-from doge.application.services.page_extraction_service import ChunkingService, PageExtractionService
+from doge.application.services.page_extraction_service import (
+    ChunkIndexerPort,
+    ChunkingService,
+    PageExtractionService,
+)
 from doge.core.domain.evidence_models import EvidenceRecord
 from doge.infrastructure.database.agent_repositories import SQLiteDocumentRepository
 from doge.infrastructure.database.evidence_repository import SQLiteEvidenceRepository
@@ -55,6 +59,7 @@ def seed_gold_set(
     db_path: Path,
     storage_dir: Path,
     scope: TenantScope | None = None,
+    chunk_indexer: ChunkIndexerPort | None = None,
 ) -> SeededGoldSet:
     """Seed documents, pages, chunks, and exact evidence IDs for all cases."""
 
@@ -65,6 +70,7 @@ def seed_gold_set(
     extraction_service = PageExtractionService(
         evidence_repository=evidence_repository,
         chunking_service=ChunkingService(chunk_size=10000, overlap=0),
+        chunk_indexer=chunk_indexer,
     )
     upload_service = FileUploadService(
         document_repository,
@@ -51,18 +51,19 @@ def _run_benchmark(
     top_k: int,
 ) -> dict[str, Any]:
     scope = TenantScope.local()
-    seeded = seed_gold_set(
-        cases=cases,
-        db_path=db_path,
-        storage_dir=storage_dir,
-        scope=scope,
-    )
     service = RAGService(
         evidence_repository=SQLiteEvidenceRepository(db_path),
         embedding_provider=HashingEmbeddingProvider(),
         vector_store=SQLiteVectorStore(db_path),
         embedding_cache=SQLiteEmbeddingCache(db_path),
     )
+    seeded = seed_gold_set(
+        cases=cases,
+        db_path=db_path,
+        storage_dir=storage_dir,
+        scope=scope,
+        chunk_indexer=service,
+    )
 
     observations = []
     for case in cases:
@@ -0,0 +1,18 @@
+from tests.eval.vector_index_benchmark import run_benchmark
+
+
+def test_vector_index_benchmark_keeps_recall_against_brute_force(tmp_path):
+    result = run_benchmark(
+        record_count=3000,
+        dim=32,
+        query_count=20,
+        top_k=10,
+        exact_threshold=500,
+        db_path=tmp_path / "agent_state.db",
+    )
+
+    assert result["schema_version"] == "doge.vector_index_benchmark.v1"
+    assert result["corpus"]["record_count"] == 3000
+    metrics = result["metrics"]
+    assert metrics["recall_at_k"] >= 0.9
+    assert metrics["ann_p50_ms"] < metrics["brute_force_p50_ms"]
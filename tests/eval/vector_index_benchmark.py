@@ -0,0 +1,123 @@
+"""Recall/latency benchmark: IVF-indexed ``SQLiteVectorStore`` vs brute force.
+
+The brute-force reference reproduces the store's previous search path: read
+every row, ``json.loads`` each vector and score it with a pure-Python cosine.
+Recall is measured against that reference on the same synthetic corpus.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from doge.core.ports.vector_store import VectorRecord
+from doge.infrastructure.vector.sqlite_store import SQLiteVectorStore
+
+
+def run_benchmark(
+    *,
+    record_count: int = 20_000,
+    dim: int = 256,
+    query_count: int = 50,
+    top_k: int = 10,
+    nprobe: int = 8,
+    exact_threshold: int = 4096,
+    db_path: Path | None = None,
+    seed: int = 7,
+) -> dict[str, Any]:
+    """Build a clustered synthetic corpus and compare both search paths."""
+
+    if db_path is not None:
+        return _run_benchmark(db_path, record_count, dim, query_count, top_k, nprobe, exact_threshold, seed)
+    with tempfile.TemporaryDirectory(prefix="doge-vector-benchmark-") as tmp:
+        return _run_benchmark(
+            Path(tmp) / "agent_state.db", record_count, dim, query_count, top_k, nprobe, exact_threshold, seed
+        )
+
+
+def _run_benchmark(
+    db_path: Path,
+    record_count: int,
+    dim: int,
+    query_count: int,
+    top_k: int,
+    nprobe: int,
+    exact_threshold: int,
+    seed: int,
+) -> dict[str, Any]:
+    rng = np.random.default_rng(seed)
+    vectors = _clustered_vectors(rng, record_count, dim)
+    store = SQLiteVectorStore(db_path, nprobe=nprobe, exact_threshold=exact_threshold)
+
+    started = time.perf_counter()
+    for start in range(0, record_count, 1000):
+        store.upsert([
+            VectorRecord(f"r{index}", vectors[index].tolist(), f"record {index}", {"shard": index % 4})
+            for index in range(start, min(start + 1000, record_count))
+        ])
+    upsert_seconds = time.perf_counter() - started
+
+    legacy_rows = [(f"r{index}", json.dumps(vectors[index].tolist())) for index in range(record_count)]
+    queries = vectors[rng.choice(record_count, size=query_count, replace=False)]
+    queries = queries + rng.normal(scale=0.05, size=queries.shape)
+
+    ann_ms: list[float] = []
+    brute_ms: list[float] = []
+    recalls: list[float] = []
+    for query in queries.tolist():
+        started = time.perf_counter()
+        ann = [result.record.record_id for result in store.search(query, top_k=top_k)]
+        ann_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        exact = _brute_force_search(legacy_rows, query, top_k)
+        brute_ms.append((time.perf_counter() - started) * 1000)
+
+        recalls.append(len(set(ann) & set(exact)) / max(1, len(exact)))
+
+    ann_p50 = statistics.median(ann_ms)
+    brute_p50 = statistics.median(brute_ms)
+    return {
+        "schema_version": "doge.vector_index_benchmark.v1",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "corpus": {"record_count": record_count, "dim": dim, "query_count": query_count},
+        "top_k": top_k,
+        "index": {"nprobe": nprobe, "exact_threshold": exact_threshold},
+        "metrics": {
+            "recall_at_k": round(statistics.fmean(recalls), 4),
+            "ann_p50_ms": round(ann_p50, 3),
+            "brute_force_p50_ms": round(brute_p50, 3),
+            "speedup_p50": round(brute_p50 / ann_p50, 2) if ann_p50 else None,
+            "upsert_seconds": round(upsert_seconds, 3),
+        },
+    }
+
+
+def _clustered_vectors(rng: np.random.Generator, count: int, dim: int) -> np.ndarray:
+    centers = rng.normal(size=(max(1, int(math.sqrt(count))), dim))
+    labels = rng.integers(0, len(centers), size=count)
+    return (centers[labels] + rng.normal(scale=0.6, size=(count, dim))).astype(np.float32)
+
+
+def _brute_force_search(rows: list[tuple[str, str]], query: list[float], top_k: int) -> list[str]:
+    scored = [(record_id, _cosine(query, json.loads(payload))) for record_id, payload in rows]
+    return [record_id for record_id, _score in sorted(scored, key=lambda item: item[1], reverse=True)[:top_k]]
+
+
+def _cosine(left: list[float], right: list[float]) -> float:
+    if not left or not right or len(left) != len(right):
+        return 0.0
+    numerator = sum(a * b for a, b in zip(left, right))
+    left_norm = math.sqrt(sum(a * a for a in left))
+    right_norm = math.sqrt(sum(b * b for b in right))
+    if left_norm == 0 or right_norm == 0:
+        return 0.0
+    return numerator / (left_norm * right_norm)
@@ -17,13 +17,13 @@ def test_rag_service_retrieves_source_chunk_metadata(tmp_path):
         parsing_status=DocumentStatus.PARSED,
         content="Semiconductor outlook improved as AI demand accelerated.",
     )
-    PageExtractionService(evidence_repository=evidence).extract(document)
     service = RAGService(
         evidence_repository=evidence,
         embedding_provider=HashingEmbeddingProvider(),
         vector_store=SQLiteVectorStore(db),
         embedding_cache=SQLiteEmbeddingCache(db),
     )
+    PageExtractionService(evidence_repository=evidence, chunk_indexer=service).extract(document)
 
     result = service.search("semiconductor outlook", limit=1)
 
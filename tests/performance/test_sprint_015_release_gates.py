@@ -48,23 +48,23 @@ def test_s015_document_ingestion_throughput_smoke(tmp_path):
 def test_s015_rag_latency_and_embedding_cache_smoke(tmp_path):
     db = tmp_path / "agent_state.db"
     evidence = SQLiteEvidenceRepository(db)
+    service = RAGService(
+        evidence_repository=evidence,
+        embedding_provider=HashingEmbeddingProvider(dimensions=32),
+        vector_store=SQLiteVectorStore(db),
+        embedding_cache=SQLiteEmbeddingCache(db),
+    )
     upload = FileUploadService(
         SQLiteDocumentRepository(db),
         storage_dir=tmp_path / "documents",
         parser=_TextParser(),
-        extraction_service=PageExtractionService(evidence_repository=evidence),
+        extraction_service=PageExtractionService(evidence_repository=evidence, chunk_indexer=service),
     )
     document = upload.register_text(
         filename="semiconductor.md",
         content="Semiconductor outlook improved as AI demand accelerated and capex remained disciplined.",
         document_id="doc-semi",
     )
-    service = RAGService(
-        evidence_repository=evidence,
-        embedding_provider=HashingEmbeddingProvider(dimensions=32),
-        vector_store=SQLiteVectorStore(db),
-        embedding_cache=SQLiteEmbeddingCache(db),
-    )
 
     start = time.perf_counter()
     result = service.search("semiconductor AI demand", document_ids=[document["document_id"]], limit=1)
@@ -1,5 +1,6 @@
 from doge.application.agent.context_builder import ContextBuilder
 from doge.core.domain.agent_models import AgentRun, AgentSession, AgentTurn
+from doge.core.domain.enterprise_context import EnterpriseContext
 from doge.core.domain.document_models import Document, DocumentStatus
 from doge.core.domain.run_execution_context import RunExecutionContext
 from doge.infrastructure.database.agent_repositories import (
@@ -120,3 +121,14 @@ def test_context_builder_includes_explicit_portfolio_marker():
 
     assert "Authorized run portfolio_id: portfolio-explicit.v1." in messages[0].content
     assert "do not invent or default portfolio ids" in messages[0].content
+
+
+def test_context_builder_preamble_key_rechecks_document_acl():
+    run = AgentRun.create(workflow="investment_research", question="review", document_ids=["doc-a", "doc-b"])
+    granted = EnterpriseContext(tenant_id="acme", document_acl=frozenset({"doc-a", "doc-b"}))
+    revoked = EnterpriseContext(tenant_id="acme", document_acl=frozenset({"doc-a"}))
+    builder = ContextBuilder()
+
+    assert builder.preamble_key(run, enterprise_context=granted) == builder.preamble_key(run, enterprise_context=granted)
+    assert builder.preamble_key(run, enterprise_context=revoked)[1] == ("doc-a",)
+    assert builder.preamble_key(run, enterprise_context=revoked) != builder.preamble_key(run, enterprise_context=granted)
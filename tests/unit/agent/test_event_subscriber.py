@@ -68,3 +68,110 @@ async def test_sqlite_event_subscriber_respects_after_sequence(tmp_path):
 
     assert received.event_id == second.event_id
     assert received.sequence == 2
+
+
+def _append(events, run_id: str, index: int) -> AgentEvent:
+    return events.append(AgentEvent(
+        event_id=f"evt-{run_id}-{index}",
+        run_id=run_id,
+        event_type=EventType.MODEL_RESPONSE,
+        payload={"n": index},
+    ))
+
+
+async def _until(predicate) -> None:
+    for _ in range(1000):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition never held")
+
+
+def _idle_subscriber(db, **kwargs) -> SQLiteEventSubscriber:
+    # The background tailer polls once and then sleeps for the rest of the
+    # test, so each further poll is driven explicitly with ``_poll_once``.
+    return SQLiteEventSubscriber(db, poll_interval_seconds=3600, **kwargs)
+
+
+def _stop(subscriber: SQLiteEventSubscriber) -> None:
+    if subscriber._tailer is not None:
+        subscriber._tailer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_event_subscriber_shares_one_tailer_across_subscriptions(tmp_path):
+    db = tmp_path / "agent_state.db"
+    runs = [AgentRun.create(workflow="investment_research", question="q") for _ in range(2)]
+    for run in runs:
+        SQLiteRunRepository(db).save(run)
+    events = SQLiteEventRepository(db)
+    subscriber = _idle_subscriber(db)
+
+    async def collect(run_id: str, count: int):
+        received = []
+        async for event in subscriber.subscribe(run_id):
+            received.append(event.sequence)
+            if len(received) == count:
+                return received
+
+    tasks = [asyncio.create_task(collect(run.run_id, 3)) for run in runs for _ in range(10)]
+    await _until(lambda: subscriber.metrics()["subscriptions"] == 20)
+    await _until(lambda: subscriber.metrics()["tail_queries"] == 1)
+    for index in range(3):
+        for run in runs:
+            _append(events, run.run_id, index)
+        assert subscriber._poll_once() == 2
+    results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=2)
+
+    assert results == [[1, 2, 3]] * 20
+    assert subscriber.metrics()["tail_queries"] == 4
+    assert subscriber.metrics()["subscriptions"] == 0
+    _stop(subscriber)
+
+
+def test_tail_cursor_steps_over_rows_of_unwatched_runs(tmp_path):
+    db = tmp_path / "agent_state.db"
+    watched, other = (AgentRun.create(workflow="investment_research", question="q") for _ in range(2))
+    for run in (watched, other):
+        SQLiteRunRepository(db).save(run)
+    events = SQLiteEventRepository(db)
+    _append(events, watched.run_id, 0)
+    for index in range(5):
+        _append(events, other.run_id, index)
+
+    cursor, rows = events.tail(0, [watched.run_id], limit=10)
+    assert [event.sequence for _rowid, event in rows] == [1]
+    assert cursor == events.last_rowid() == 6
+
+    assert events.tail(cursor, [watched.run_id], limit=10) == (6, [])
+    _append(events, other.run_id, 5)
+    _append(events, watched.run_id, 1)
+    _append(events, watched.run_id, 2)
+    cursor, rows = events.tail(cursor, [watched.run_id], limit=1)
+    assert [rowid for rowid, _event in rows] == [8]
+    assert cursor == 8
+
+
+@pytest.mark.asyncio
+async def test_sqlite_event_subscriber_resyncs_slow_consumer_from_sqlite(tmp_path):
+    db = tmp_path / "agent_state.db"
+    run = AgentRun.create(workflow="investment_research", question="q")
+    SQLiteRunRepository(db).save(run)
+    events = SQLiteEventRepository(db)
+    subscriber = _idle_subscriber(db, queue_size=2)
+    stream = subscriber.subscribe(run.run_id)
+    first = asyncio.create_task(stream.__anext__())
+    await _until(lambda: subscriber.metrics()["tail_queries"] == 1)
+    _append(events, run.run_id, 0)
+    assert subscriber._poll_once() == 1
+    assert (await asyncio.wait_for(first, timeout=1)).sequence == 1
+
+    for index in range(1, 8):
+        _append(events, run.run_id, index)
+    assert subscriber._poll_once() == 7
+    assert subscriber.metrics()["resyncs"] == 3
+    received = [(await asyncio.wait_for(stream.__anext__(), timeout=1)).sequence for _ in range(7)]
+    await stream.aclose()
+    _stop(subscriber)
+
+    assert received == [2, 3, 4, 5, 6, 7, 8]
@@ -0,0 +1,131 @@
+"""Unit tests for the live model delta channel and batching tee."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from doge.application.agent.model_delta_stream import ModelDeltaChannel, ModelDeltaStream
+from doge.core.domain.agent_models import AgentEvent, EventType
+from doge.core.ports.agent_model import AgentMessage, AgentResponse
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _chunks(parts, clock=None, step=0.0):
+    for content, reasoning in parts:
+        if clock is not None:
+            clock.now += step
+        yield AgentResponse(message=AgentMessage(role="assistant", content=content, reasoning_content=reasoning))
+
+
+async def _collect_deltas(channel: ModelDeltaChannel, run_id: str, received: list[AgentEvent]) -> None:
+    async for event in channel.subscribe(run_id):
+        received.append(event)
+
+
+@pytest.mark.asyncio
+async def test_delta_stream_batches_by_size_and_flushes_the_tail():
+    channel = ModelDeltaChannel()
+    received: list[AgentEvent] = []
+    listener = asyncio.create_task(_collect_deltas(channel, "run-1", received))
+    await asyncio.sleep(0)
+    stream = ModelDeltaStream(channel, flush_interval_seconds=60, flush_bytes=6, clock=_Clock())
+
+    chunks = [chunk async for chunk in stream.tee("run-1", _chunks([("Hel", "think"), ("lo", None), (" world", None)]))]
+    await asyncio.sleep(0)
+    listener.cancel()
+
+    assert [chunk.message.content for chunk in chunks] == ["Hel", "lo", " world"]
+    assert [event.event_type for event in received] == [EventType.MODEL_DELTA, EventType.MODEL_DELTA]
+    assert received[0].payload == {"index": 0, "content": "Hel", "reasoning_content": "think"}
+    assert received[1].payload == {"index": 1, "content": "lo world"}
+    assert all(event.sequence == 0 for event in received)
+
+
+@pytest.mark.asyncio
+async def test_delta_stream_flushes_on_the_time_interval():
+    channel = ModelDeltaChannel()
+    received: list[AgentEvent] = []
+    listener = asyncio.create_task(_collect_deltas(channel, "run-1", received))
+    await asyncio.sleep(0)
+    clock = _Clock()
+    stream = ModelDeltaStream(channel, flush_interval_seconds=0.1, flush_bytes=1024, clock=clock)
+
+    _ = [chunk async for chunk in stream.tee("run-1", _chunks([("a", None), ("b", None), ("c", None)], clock, step=0.06))]
+    await asyncio.sleep(0)
+    listener.cancel()
+
+    assert [event.payload["content"] for event in received] == ["ab", "c"]
+
+
+@pytest.mark.asyncio
+async def test_delta_stream_is_a_pass_through_without_subscribers():
+    published: list[AgentEvent] = []
+
+    class RecordingChannel(ModelDeltaChannel):
+        async def publish(self, event):
+            published.append(event)
+
+    stream = ModelDeltaStream(RecordingChannel(), flush_bytes=1)
+
+    chunks = [chunk async for chunk in stream.tee("run-1", _chunks([("a", None), ("b", None)]))]
+
+    assert len(chunks) == 2
+    assert published == []
+
+
+@pytest.mark.asyncio
+async def test_delta_channel_drops_deltas_for_a_full_subscriber_queue():
+    channel = ModelDeltaChannel(queue_size=1)
+    subscription = channel.subscribe("run-1")
+    first = asyncio.create_task(subscription.__anext__())
+    await asyncio.sleep(0)
+
+    for index in range(3):
+        await channel.publish(AgentEvent(event_id=f"dlt-{index}", run_id="run-1", event_type=EventType.MODEL_DELTA))
+
+    # dlt-0 occupies the single slot until the waiting reader runs.
+    assert (await first).event_id == "dlt-0"
+    assert channel.metrics()["dropped"] == 2
+    await subscription.aclose()
+    assert channel.metrics()["watched_runs"] == 0
+
+
+@pytest.mark.asyncio
+async def test_model_execution_publishes_deltas_and_still_assembles_the_full_response():
+    from doge.application.agent.model_response_assembler import ModelResponseAssembler
+    from doge.core.domain.agent_models import AgentRun
+    from doge.core.domain.model_policy import ModelPolicy
+    from doge.platform.runtime.services import ModelExecutionService
+
+    class StreamingModel:
+        async def chat(self, messages, **kwargs):
+            for part in ("Semis ", "look ", "firm"):
+                yield AgentResponse(message=AgentMessage(role="assistant", content=part))
+
+    run = AgentRun.create(workflow="test", question="Q")
+    channel = ModelDeltaChannel()
+    received: list[AgentEvent] = []
+    listener = asyncio.create_task(_collect_deltas(channel, run.run_id, received))
+    await asyncio.sleep(0)
+    service = ModelExecutionService(
+        model=StreamingModel(),
+        response_assembler=ModelResponseAssembler(),
+        delta_stream=ModelDeltaStream(channel, flush_bytes=8),
+    )
+
+    result = await service.execute(run=run, policy=ModelPolicy(), messages=[], tool_schemas_for=lambda routing: [])
+    await asyncio.sleep(0)
+    listener.cancel()
+
+    assert result.response.message.content == "Semis look firm"
+    assert "".join(event.payload["content"] for event in received) == "Semis look firm"
+    assert len(received) == 2
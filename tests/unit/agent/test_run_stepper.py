@@ -149,7 +149,13 @@ class ConnectedFakeTx:
 
 
 class FakeContextBuilder:
-    def build(self, run, events, *, enterprise_context=None, execution_context=None):
+    def build_preamble(self, run, *, enterprise_context=None, execution_context=None):
+        return []
+
+    def preamble_key(self, run, *, enterprise_context=None, execution_context=None):
+        return ()
+
+    def event_messages(self, events):
         return []
 
 
@@ -548,3 +554,244 @@ async def test_run_stepper_step_cancels_mid_tool_execution(run_repository, event
 async def test_run_stepper_step_raises_when_run_not_found(stepper):
     with pytest.raises(KeyError, match="run not found"):
         await stepper.step(TenantScope.local(), "nonexistent")
+
+
+class MultiToolModelExecutionService(IModelExecutionService):
+    def __init__(self, tool_names):
+        self.tool_names = tool_names
+
+    async def execute(self, *, run, policy, messages, tool_schemas_for, enterprise_context=None, execution_context=None):
+        return ModelExecutionResult(
+            response=AgentResponse(
+                message=AgentMessage(
+                    role="assistant",
+                    content="",
+                    tool_calls=[
+                        {"id": f"tc-{index}", "type": "function", "function": {"name": name, "arguments": "{}"}}
+                        for index, name in enumerate(self.tool_names)
+                    ],
+                )
+            ),
+            routing=None,
+            routing_payload={},
+        )
+
+
+class ConcurrentToolExecutionService(FakeToolExecutionService):
+    """Read-only tools finish in reverse call order to expose result ordering."""
+
+    def __init__(self, run_repository=None, cancel_after=None):
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+        self.run_repository = run_repository
+        self.cancel_after = cancel_after
+
+    def is_parallel_safe(self, context, tool_name):
+        return tool_name.startswith("read_")
+
+    async def execute(self, *, context, tool_name, arguments, run_id, timeout_seconds, request_id):
+        import asyncio
+
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.calls.append({"tool_name": tool_name, "arguments": arguments})
+        if len(self.calls) == self.cancel_after:
+            self.run_repository.runs[run_id].status = RunStatus.CANCELLING
+        await asyncio.sleep(0.05 - 0.01 * len(self.calls))
+        self.active -= 1
+        return ToolResult(name=tool_name, data={"result": "ok"})
+
+
+def _tool_stepper(run_repository, event_repository, artifact_repository, approval_repository, transition_recorder, artifact_finalizer, tools, tool_names):
+    return RunStepper(
+        run_repository=run_repository,
+        event_repository=event_repository,
+        artifact_repository=artifact_repository,
+        approval_repository=approval_repository,
+        context_builder=FakeContextBuilder(),
+        response_assembler=ModelResponseAssembler(),
+        model_execution_service=MultiToolModelExecutionService(tool_names),
+        tool_execution_service=tools,
+        artifact_finalizer=artifact_finalizer,
+        transition_recorder=transition_recorder,
+        citation_assembler=None,
+        max_parallel_tool_calls=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_stepper_runs_read_only_calls_concurrently_and_records_in_call_order(
+    run_repository, event_repository, artifact_repository, approval_repository, transition_recorder, artifact_finalizer, run
+):
+    tools = ConcurrentToolExecutionService()
+    names = ["read_quote", "read_breadth", "read_rsrs", "publish_note", "read_search"]
+    stepper = _tool_stepper(
+        run_repository, event_repository, artifact_repository, approval_repository,
+        transition_recorder, artifact_finalizer, tools, names,
+    )
+
+    result = await stepper.step(TenantScope.local(), run.run_id)
+
+    assert result.status == RunStatus.RUNNING
+    assert tools.peak == 2
+    assert [call["tool_name"] for call in tools.calls][3:] == ["publish_note", "read_search"]
+    tool_events = [e for e in result.events if e.event_type in {EventType.TOOL_CALL, EventType.TOOL_RESULT}]
+    assert [(e.event_type, e.payload.get("tool_call_id") or e.payload["tool_call"]["id"]) for e in tool_events] == [
+        (EventType.TOOL_CALL, "tc-0"),
+        (EventType.TOOL_CALL, "tc-1"),
+        (EventType.TOOL_CALL, "tc-2"),
+        (EventType.TOOL_RESULT, "tc-0"),
+        (EventType.TOOL_RESULT, "tc-1"),
+        (EventType.TOOL_RESULT, "tc-2"),
+        (EventType.TOOL_CALL, "tc-3"),
+        (EventType.TOOL_RESULT, "tc-3"),
+        (EventType.TOOL_CALL, "tc-4"),
+        (EventType.TOOL_RESULT, "tc-4"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_stepper_parallel_calls_honour_cancellation(
+    run_repository, event_repository, artifact_repository, approval_repository, transition_recorder, artifact_finalizer, run
+):
+    tools = ConcurrentToolExecutionService(run_repository, cancel_after=1)
+    stepper = _tool_stepper(
+        run_repository, event_repository, artifact_repository, approval_repository,
+        transition_recorder, artifact_finalizer, tools, ["read_a", "read_b", "read_c", "publish_note"],
+    )
+
+    result = await stepper.step(TenantScope.local(), run.run_id)
+
+    assert result.status == RunStatus.CANCELLED
+    assert [call["tool_name"] for call in tools.calls] == ["read_a"]
+    assert not any(e.event_type == EventType.TOOL_RESULT for e in result.events)
+
+
+class SequencedEventRepository(FakeEventRepository):
+    def __init__(self):
+        super().__init__()
+        self.queries = []
+
+    def append(self, event, scope=None):
+        event.sequence = len(self.events) + 1
+        return super().append(event, scope)
+
+    def list_for_run(self, run_id, *, tenant_id=None, after_sequence=0):
+        self.queries.append(after_sequence)
+        return [e for e in self.events if e.run_id == run_id and e.sequence > after_sequence]
+
+
+class IncrementalContextBuilder(FakeContextBuilder):
+    def __init__(self):
+        self.preambles = 0
+        self.rendered = []
+
+    def build_preamble(self, run, *, enterprise_context=None, execution_context=None):
+        self.preambles += 1
+        return [AgentMessage(role="user", content=run.question)]
+
+    def event_messages(self, events):
+        self.rendered.extend(event.event_type for event in events)
+        return [AgentMessage(role="assistant", content=event.event_type.value) for event in events]
+
+
+class ToolThenAnswerModelExecutionService(ToolCallModelExecutionService):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    async def execute(self, *, run, policy, messages, tool_schemas_for, enterprise_context=None, execution_context=None):
+        self.messages.append(list(messages))
+        if len(self.messages) == 1:
+            return await super().execute(run=run, policy=policy, messages=messages, tool_schemas_for=tool_schemas_for)
+        return ModelExecutionResult(
+            response=AgentResponse(message=AgentMessage(role="assistant", content="final memo")),
+            routing=None,
+            routing_payload={},
+        )
+
+
+def _incremental_stepper(run_repository, event_repository, artifact_repository, approval_repository, artifact_finalizer, context_builder, model_service):
+    return RunStepper(
+        run_repository=run_repository,
+        event_repository=event_repository,
+        artifact_repository=artifact_repository,
+        approval_repository=approval_repository,
+        context_builder=context_builder,
+        response_assembler=ModelResponseAssembler(),
+        model_execution_service=model_service,
+        tool_execution_service=FakeToolExecutionService(),
+        artifact_finalizer=artifact_finalizer,
+        transition_recorder=TransitionRecorder(
+            transaction_factory=ConnectedFakeTxFactory(
+                event_repo=event_repository,
+                artifact_repo=artifact_repository,
+                approval_repo=approval_repository,
+                run_repo=run_repository,
+            ),
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_stepper_reads_only_new_events_and_renders_preamble_once(run_repository, artifact_repository, approval_repository, artifact_finalizer, run):
+    events = SequencedEventRepository()
+    builder = IncrementalContextBuilder()
+    model = ToolThenAnswerModelExecutionService()
+    stepper = _incremental_stepper(run_repository, events, artifact_repository, approval_repository, artifact_finalizer, builder, model)
+
+    await stepper.step(TenantScope.local(), run.run_id)
+    after_first = max(event.sequence for event in events.events)
+    events.queries.clear()
+    result = await stepper.step(TenantScope.local(), run.run_id)
+
+    assert result.status == RunStatus.COMPLETED
+    assert events.queries[0] == after_first
+    assert builder.preambles == 1
+    assert builder.rendered.count(EventType.TOOL_RESULT) == 1
+    assert [message.content for message in model.messages[1]][:1] == ["Q"]
+    assert len(model.messages[1]) == 1 + len(builder.rendered)
+    assert [event.sequence for event in result.events] == sorted({event.sequence for event in events.events})
+    assert stepper._states == {}
+
+
+@pytest.mark.asyncio
+async def test_run_stepper_rebuilds_state_from_the_event_log_in_a_new_instance(run_repository, artifact_repository, approval_repository, artifact_finalizer, run):
+    events = SequencedEventRepository()
+    model = ToolThenAnswerModelExecutionService()
+    first = _incremental_stepper(run_repository, events, artifact_repository, approval_repository, artifact_finalizer, IncrementalContextBuilder(), model)
+    await first.step(TenantScope.local(), run.run_id)
+
+    builder = IncrementalContextBuilder()
+    second = _incremental_stepper(run_repository, events, artifact_repository, approval_repository, artifact_finalizer, builder, model)
+    events.queries.clear()
+    result = await second.step(TenantScope.local(), run.run_id)
+
+    assert result.status == RunStatus.COMPLETED
+    assert events.queries[0] == 0
+    assert EventType.TOOL_RESULT in builder.rendered
+    assert builder.preambles == 1
+
+
+class KeyedContextBuilder(IncrementalContextBuilder):
+    def __init__(self):
+        super().__init__()
+        self.key = ("doc-a", "doc-b")
+
+    def preamble_key(self, run, *, enterprise_context=None, execution_context=None):
+        return self.key
+
+
+@pytest.mark.asyncio
+async def test_run_stepper_rebuilds_the_cached_preamble_when_access_changes(run_repository, artifact_repository, approval_repository, artifact_finalizer, run):
+    builder = KeyedContextBuilder()
+    model = ToolThenAnswerModelExecutionService()
+    stepper = _incremental_stepper(run_repository, SequencedEventRepository(), artifact_repository, approval_repository, artifact_finalizer, builder, model)
+
+    await stepper.step(TenantScope.local(), run.run_id)
+    builder.key = ("doc-a",)
+    result = await stepper.step(TenantScope.local(), run.run_id)
+
+    assert result.status == RunStatus.COMPLETED
+    assert builder.preambles == 2
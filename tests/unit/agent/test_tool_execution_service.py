@@ -315,3 +315,30 @@ class TestToolExecutionServiceEvidenceRefs:
 
         parsed = json.loads(json_str)
         assert "evidence_refs" not in parsed
+
+
+def test_is_parallel_safe_admits_only_read_only_and_analytical_tools_without_approval():
+    from doge.application.tools import ToolRegistry
+    from doge.core.domain.tool_policy import ToolCategory
+
+    def schema(name):
+        return {"type": "function", "function": {"name": name, "parameters": {"type": "object", "properties": {}}}}
+
+    registry = ToolRegistry()
+    for name, category in [
+        ("quote", ToolCategory.READ_ONLY),
+        ("rsrs", ToolCategory.ANALYTICAL),
+        ("draft", ToolCategory.GENERATIVE),
+        ("publish", ToolCategory.HIGH_RISK),
+    ]:
+        registry.register(schema(name), lambda **_: ToolResult("x", {}), category=category)
+    service = ToolExecutionService(tool_registry=registry)
+
+    assert [service.is_parallel_safe(None, name) for name in ("quote", "rsrs", "draft", "publish", "missing")] == [
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert ToolExecutionService(tool_registry=FakeToolRegistry()).is_parallel_safe(None, "quote") is False
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+
+import duckdb
+import pytest
+
+from doge.application.tools import ToolRegistry, ToolResult
+from doge.application.tools.executor import ToolExecutor, ToolExecutorClosed, ToolExecutorSaturated
+from doge.core.domain.tool_descriptor import ToolDescriptor
+from doge.core.domain.tool_policy import ToolCategory
+from doge.shared.cancellation import OperationCancelled, interrupt_on_cancel, raise_if_cancelled
+
+
+async def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+def _metric(executor, category, name):
+    return executor.metrics().get(category, {}).get(name, 0)
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_a_cooperative_tool_and_frees_its_worker():
+    executor = ToolExecutor(default_workers=1)
+    stopped = threading.Event()
+
+    def slow_tool():
+        try:
+            while True:
+                raise_if_cancelled()
+                time.sleep(0.01)
+        except OperationCancelled:
+            stopped.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        await executor.run(ToolCategory.ANALYTICAL, slow_tool, timeout_seconds=0.05)
+
+    await _wait_until(stopped.is_set)
+    await _wait_until(lambda: _metric(executor, "analytical", "running") == 0)
+    metrics = executor.metrics()["analytical"]
+    assert (metrics["timeouts"], metrics["abandoned_running"]) == (1, 1)
+    assert await executor.run(ToolCategory.ANALYTICAL, lambda: "next", timeout_seconds=1) == "next"
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_interrupts_a_running_duckdb_query():
+    executor = ToolExecutor(default_workers=1)
+    interrupted = threading.Event()
+
+    def long_query():
+        con = duckdb.connect()
+        try:
+            with interrupt_on_cancel(con.interrupt):
+                con.execute("SELECT sum(a.range * b.range) FROM range(1000000) a, range(1000000) b").fetchall()
+        except duckdb.InterruptException:
+            interrupted.set()
+            raise
+        finally:
+            con.close()
+
+    with pytest.raises(TimeoutError):
+        await executor.run(ToolCategory.ANALYTICAL, long_query, timeout_seconds=0.2)
+
+    await _wait_until(interrupted.is_set)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_calls_queued_past_their_timeout_never_start():
+    executor = ToolExecutor(default_workers=1)
+    release = threading.Event()
+    started = []
+
+    blocker = asyncio.ensure_future(executor.run(ToolCategory.READ_ONLY, lambda: release.wait(5)))
+    await _wait_until(lambda: _metric(executor, "read_only", "running") == 1)
+    with pytest.raises(TimeoutError):
+        await executor.run(ToolCategory.READ_ONLY, lambda: started.append(1), timeout_seconds=0.05)
+    assert _metric(executor, "read_only", "queued") == 1
+
+    release.set()
+    await blocker
+    await _wait_until(lambda: _metric(executor, "read_only", "queued") == 0)
+    assert started == []
+    assert _metric(executor, "read_only", "dropped_before_start") == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_calls_and_categories_do_not_share_workers():
+    executor = ToolExecutor(default_workers=1, max_queue=0)
+    release = threading.Event()
+
+    blocker = asyncio.ensure_future(executor.run(ToolCategory.ANALYTICAL, lambda: release.wait(5)))
+    await _wait_until(lambda: _metric(executor, "analytical", "running") == 1)
+
+    with pytest.raises(ToolExecutorSaturated):
+        await executor.run(ToolCategory.ANALYTICAL, lambda: None)
+    assert await executor.run(ToolCategory.READ_ONLY, lambda: "ok", timeout_seconds=1) == "ok"
+    assert _metric(executor, "analytical", "rejected") == 1
+
+    release.set()
+    await blocker
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_registry_reports_timeouts_from_the_executor():
+    executor = ToolExecutor(default_workers=1)
+    registry = ToolRegistry(executor=executor)
+
+    def slow() -> ToolResult:
+        while True:
+            raise_if_cancelled()
+            time.sleep(0.01)
+
+    registry.register(ToolDescriptor(name="slow", description="Never finishes."), slow)
+
+    result = await registry.execute_async("slow", {}, timeout_seconds=0.05)
+
+    assert result.ok is False
+    assert result.safe_error["code"] == "tool_execution_timed_out"
+    await _wait_until(lambda: _metric(executor, "read_only", "running") == 0)
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_registry_reports_a_shut_down_executor_as_a_retryable_tool_error():
+    executor = ToolExecutor(default_workers=1)
+    registry = ToolRegistry(executor=executor)
+    registry.register(ToolDescriptor(name="echo", description="Echo."), lambda: ToolResult("echo", data={}))
+    executor.shutdown()
+
+    with pytest.raises(ToolExecutorClosed):
+        await executor.run(ToolCategory.READ_ONLY, lambda: None)
+    result = await registry.execute_async("echo", {})
+
+    assert result.ok is False
+    assert result.safe_error["code"] == "tool_executor_unavailable"
+    assert "retry" in result.error
@@ -339,3 +339,11 @@ def test_generate_industry_report_tool_forwards_to_use_case():
     assert result.ok is True
     assert result.data["report_id"] == "industry-us-semiconductor-demo"
     assert result.data["industry"] == "semiconductor"
+
+
+def test_only_market_data_tools_are_declared_cacheable():
+    registry = build_default_tool_registry()
+
+    cacheable = {descriptor.name for descriptor in registry.descriptors() if descriptor.cacheable}
+
+    assert cacheable == {"query_stock", "stock_overview", "rsrs_ranking", "market_breadth", "volume_anomalies"}
@@ -1,9 +1,11 @@
 import asyncio
+import threading
 
 import pytest
 
 from doge.application.agent.worker import AsyncioWorker
 from doge.core.domain.agent_models import RunStatus
+from doge.core.ports.worker_queue import IRunQueue, RunClaim
 
 
 from doge.shared.scope import TenantScope
@@ -17,32 +19,39 @@ class FakeScopeResolver:
         return self.scopes.get(run_id, TenantScope.local())
 
 
-class FakeRunQueue:
+class FakeRunQueue(IRunQueue):
     def __init__(self):
         self.pending = []
         self.statuses = []
 
-    def enqueue(self, run_id: str) -> None:
+    def enqueue(self, run_id: str, priority=None) -> None:
         self.statuses.append((run_id, "queued"))
 
     def dequeue(self):
         return self.pending.pop(0) if self.pending else None
 
-    def claim_atomic(self, worker_id: str, lease_seconds: int):
+    def claim_atomic(self, worker_id: str, lease_seconds: int, max_attempts: int = 3):
         return self.pending.pop(0) if self.pending else None
 
+    def claim(self, worker_id: str, lease_seconds: int, max_attempts: int = 3, *, max_per_tenant=None):
+        run_id = self.claim_atomic(worker_id, lease_seconds)
+        return RunClaim(run_id, queue_wait_seconds=0.25) if run_id is not None else None
+
     def heartbeat(self, worker_id: str, run_id: str, lease_seconds: int) -> None:
         self.statuses.append((run_id, "heartbeat"))
 
     def release_claim(self, run_id: str, worker_id: str, final_status: str) -> None:
         self.statuses.append((run_id, final_status))
 
-    def recover_stalled_leases(self, lease_timeout_seconds: int):
+    def recover_stalled_leases(self, lease_timeout_seconds: int, max_attempts: int = 3):
         return []
 
     def list_pending(self):
         return list(self.pending)
 
+    def status_summary(self):
+        return {}
+
     def append_status(self, run_id: str, status: str) -> None:
         self.statuses.append((run_id, status))
 
@@ -215,3 +224,114 @@ async def _exercise_worker_enterprise_scope() -> None:
     assert scope.tenant_id == "tenant-a"
     assert scope.subject_hash == "user-hash-a"
     assert scope.tenant_id != "local"
+
+
+class SlowRuntime(ProcessingRuntime):
+    def __init__(self):
+        super().__init__()
+        self.concurrent = 0
+        self.peak = 0
+
+    async def run_to_pause_or_completion(self, scope, run_id: str | None = None):
+        self.concurrent += 1
+        self.peak = max(self.peak, self.concurrent)
+        await asyncio.sleep(0.05)
+        self.concurrent -= 1
+        return await super().run_to_pause_or_completion(scope, run_id)
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_claims_concurrently_up_to_its_limit():
+    queue = FakeRunQueue()
+    queue.pending = [f"run-{index}" for index in range(5)]
+    runtime = SlowRuntime()
+    worker = AsyncioWorker(
+        runtime,
+        FakeSessions(),
+        queue,
+        FakeIdempotencyStore(),
+        poll_interval_seconds=0.01,
+        heartbeat_interval_seconds=0.01,
+        max_concurrent_runs=2,
+    )
+    worker.start()
+
+    try:
+        while len(runtime.processed) < 5:
+            await asyncio.sleep(0.01)
+    finally:
+        await asyncio.wait_for(worker.stop(), timeout=2.0)
+
+    metrics = worker.metrics()
+    assert runtime.peak == 2
+    assert metrics["runs_processed"] == 5
+    assert metrics["backpressure_pauses"] >= 1
+    assert metrics["in_flight_run_count"] == 0
+    assert metrics["avg_queue_wait_ms"] == pytest.approx(250)
+    assert {run_id for run_id, status in queue.statuses if status == "heartbeat"} >= {"run-0", "run-1"}
+
+
+@pytest.mark.asyncio
+async def test_worker_wakes_for_runs_enqueued_by_another_connection(tmp_path):
+    from doge.infrastructure.database.agent_repositories import SQLiteRunQueue
+
+    db = tmp_path / "agent_state.db"
+    runtime = ProcessingRuntime()
+    worker = AsyncioWorker(
+        runtime,
+        FakeSessions(),
+        SQLiteRunQueue(db),
+        FakeIdempotencyStore(),
+        scope_resolver=FakeScopeResolver(),
+        poll_interval_seconds=30.0,
+        watch_interval_seconds=0.01,
+        max_concurrent_runs=2,
+    )
+    worker.start()
+    await asyncio.sleep(0.05)
+
+    try:
+        # A second queue instance stands in for the CLI or another gateway process.
+        other_process = SQLiteRunQueue(db)
+        other_process.enqueue("run-a")
+        other_process.enqueue("run-b")
+        await asyncio.wait_for(_wait_for_processed(runtime, 2), timeout=2.0)
+    finally:
+        await asyncio.wait_for(worker.stop(), timeout=2.0)
+
+    metrics = worker.metrics()
+    assert sorted(runtime.processed) == ["run-a", "run-b"]
+    assert metrics["queue_wakeups"] >= 1
+    assert metrics["max_queue_wait_ms"] < 2000
+
+
+@pytest.mark.asyncio
+async def test_worker_polls_the_queue_version_off_the_event_loop(tmp_path):
+    from doge.infrastructure.database.agent_repositories import SQLiteRunQueue
+
+    class RecordingQueue(SQLiteRunQueue):
+        threads: list[int] = []
+
+        def queue_version(self):
+            self.threads.append(threading.get_ident())
+            return super().queue_version()
+
+    worker = AsyncioWorker(
+        ProcessingRuntime(),
+        FakeSessions(),
+        RecordingQueue(tmp_path / "agent_state.db"),
+        FakeIdempotencyStore(),
+        scope_resolver=FakeScopeResolver(),
+        poll_interval_seconds=0.05,
+        watch_interval_seconds=0.01,
+    )
+
+    await worker._wait_for_signal()
+
+    assert len(RecordingQueue.threads) > 1
+    assert threading.get_ident() not in RecordingQueue.threads
+
+
+async def _wait_for_processed(runtime, count: int) -> None:
+    while len(runtime.processed) < count:
+        await asyncio.sleep(0.01)
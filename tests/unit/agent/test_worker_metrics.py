@@ -4,17 +4,21 @@ import pytest
 
 from doge.application.agent.worker import AsyncioWorker
 from doge.core.domain.agent_models import RunStatus
+from doge.core.ports.worker_queue import IRunQueue
 
 
-class FakeRunQueue:
+class FakeRunQueue(IRunQueue):
     def __init__(self):
         self.pending = []
         self.statuses = []
 
-    def enqueue(self, run_id: str) -> None:
+    def enqueue(self, run_id: str, priority=None) -> None:
         self.pending.append(run_id)
 
-    def claim_atomic(self, worker_id: str, lease_seconds: int):
+    def dequeue(self):
+        return None
+
+    def claim_atomic(self, worker_id: str, lease_seconds: int, max_attempts: int = 3):
         if self.pending:
             self.statuses.append((self.pending[0], "running"))
             return self.pending.pop(0)
@@ -26,12 +30,18 @@ class FakeRunQueue:
     def release_claim(self, run_id: str, worker_id: str, final_status: str) -> None:
         self.statuses.append((run_id, final_status))
 
-    def recover_stalled_leases(self, lease_timeout_seconds: int):
+    def recover_stalled_leases(self, lease_timeout_seconds: int, max_attempts: int = 3):
         return []
 
     def list_pending(self):
         return list(self.pending)
 
+    def status_summary(self):
+        return {}
+
+    def append_status(self, run_id: str, status: str) -> None:
+        self.statuses.append((run_id, status))
+
     def is_ready(self):
         return True
 
@@ -86,6 +96,14 @@ def test_worker_metrics_initial_state():
         "avg_processing_latency_ms": 0,
         "last_heartbeat_at": None,
         "active_run_count": 0,
+        "in_flight_run_count": 0,
+        "max_concurrent_runs": 1,
+        "backpressure_pauses": 0,
+        "runs_claimed": 0,
+        "avg_queue_wait_ms": 0,
+        "max_queue_wait_ms": 0.0,
+        "queue_wakeups": 0,
+        "empty_claims": 0,
     }
 
 
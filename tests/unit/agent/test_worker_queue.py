@@ -87,3 +87,91 @@ def test_run_queue_moves_exhausted_stalled_claim_to_dead_letter(tmp_path):
     assert latest["status"] == "dead_letter"
     assert latest["attempt_count"] == 2
     assert queue.list_pending() == []
+
+
+def _enqueue_for_tenant(db, queue: SQLiteRunQueue, run_id: str, tenant_id: str, priority: int = 0) -> None:
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            """
+            INSERT INTO runs(run_id, tenant_id, workflow, question, status, created_at, updated_at)
+            VALUES (?, ?, 'investment_research', 'q', 'queued', '2026-01-01', '2026-01-01')
+            """,
+            (run_id, tenant_id),
+        )
+    queue.enqueue(run_id, priority=priority)
+
+
+def test_run_queue_claim_orders_by_priority_then_least_busy_tenant(tmp_path):
+    db = tmp_path / "agent_state.db"
+    queue = SQLiteRunQueue(db)
+    for run_id in ("a-1", "a-2", "a-3"):
+        _enqueue_for_tenant(db, queue, run_id, "acme")
+    _enqueue_for_tenant(db, queue, "b-1", "beta")
+    _enqueue_for_tenant(db, queue, "b-urgent", "beta", priority=5)
+
+    claims = [queue.claim("worker-a", lease_seconds=30) for _ in range(5)]
+
+    assert [claim.run_id for claim in claims] == ["b-urgent", "a-1", "a-2", "b-1", "a-3"]
+    assert claims[0].priority == 5
+    assert claims[1].tenant_id == "acme"
+    assert all(claim.queue_wait_seconds >= 0 for claim in claims)
+    assert _latest_queue_row(db, "b-urgent")["priority"] == 5
+
+
+def test_run_queue_claim_skips_tenants_at_their_lease_cap(tmp_path):
+    db = tmp_path / "agent_state.db"
+    queue = SQLiteRunQueue(db)
+    _enqueue_for_tenant(db, queue, "a-1", "acme")
+    _enqueue_for_tenant(db, queue, "a-2", "acme")
+
+    assert queue.claim("worker-a", lease_seconds=30, max_per_tenant=1).run_id == "a-1"
+    assert queue.claim("worker-b", lease_seconds=30, max_per_tenant=1) is None
+
+    queue.release_claim("a-1", "worker-a", "done")
+    assert queue.claim("worker-b", lease_seconds=30, max_per_tenant=1).run_id == "a-2"
+
+
+def test_run_queue_claim_batch_leases_fairly_in_one_call(tmp_path):
+    db = tmp_path / "agent_state.db"
+    queue = SQLiteRunQueue(db)
+    for run_id in ("a-1", "a-2", "a-3"):
+        _enqueue_for_tenant(db, queue, run_id, "acme")
+    _enqueue_for_tenant(db, queue, "b-1", "beta")
+
+    claims = queue.claim_batch("worker-a", lease_seconds=30, limit=3, max_per_tenant=2)
+
+    assert [claim.run_id for claim in claims] == ["a-1", "b-1", "a-2"]
+    assert queue.list_pending() == ["a-3"]
+    assert queue.status_summary() == {"queued": 1, "running": 3}
+
+
+def test_run_queue_claim_reads_the_indexed_queue_head(tmp_path):
+    db = tmp_path / "agent_state.db"
+    SQLiteRunQueue(db)
+
+    with sqlite3.connect(db) as conn:
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT run_id FROM run_queue_head "
+                "WHERE status = 'queued' OR (status = 'running' AND lease_expires_at <= '2026')"
+            ).fetchall()
+        )
+
+    assert "idx_run_queue_head_status_lease" in plan
+
+
+def test_run_queue_version_tracks_foreign_queue_writes_only(tmp_path):
+    db = tmp_path / "agent_state.db"
+    watcher = SQLiteRunQueue(db)
+    writer = SQLiteRunQueue(db)
+    writer.enqueue("run-1")
+    before = watcher.queue_version()
+
+    assert watcher.queue_version() == before
+    assert writer.claim_atomic("worker-a", lease_seconds=30) == "run-1"
+    claimed = watcher.queue_version()
+    writer.heartbeat("worker-a", "run-1", lease_seconds=60)
+
+    assert claimed > before
+    assert watcher.queue_version() == claimed
@@ -3,6 +3,7 @@ import subprocess
 
 import pytest
 from doge.infrastructure.code_execution.python import DisabledCodeExecutor, SubprocessCodeExecutor
+from doge.infrastructure.code_execution.sandbox_pool import PooledSubprocessCodeExecutor, SandboxWorkerPool, shutdown_sandbox_pool
 from doge.products.quant.tools import QuantToolProvider
 from doge.bootstrap.gateway import GatewayContainer
 def build_python_analysis_executor(*a, **kw): return GatewayContainer().build_python_analysis_executor(*a, **kw)
@@ -267,3 +268,80 @@ def test_job_object_plain_nonzero_exit_is_not_reported_as_resource_limit(monkeyp
 def test_infrastructure_code_executors_implement_port():
     assert isinstance(InfrastructureDisabledCodeExecutor(), ICodeExecutor)
     assert isinstance(InfrastructureSubprocessCodeExecutor(), ICodeExecutor)
+
+
+@pytest.fixture
+def sandbox_pool():
+    pool = SandboxWorkerPool(size=1, max_executions=3, preload=())
+    yield pool
+    pool.close()
+
+
+@pytest.mark.skipif(not hasattr(__import__("os"), "fork"), reason="sandbox pool forks workers")
+def test_pooled_executor_matches_subprocess_boundary(sandbox_pool, monkeypatch):
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "secret-value")
+    executor = PooledSubprocessCodeExecutor(sandbox_pool)
+    code = (
+        "import importlib\n"
+        "os_mod = importlib.import_module('os')\n"
+        "print(os_mod.getcwd())\n"
+        "print(os_mod.environ.get('DEEPSEEK_API_KEY'))\n"
+    )
+
+    result = executor.execute(code, timeout=5.0)
+    failure = executor.execute("raise ValueError('boom')", timeout=5.0)
+    denied = executor.execute("import os\nprint(os.getcwd())", timeout=5.0)
+
+    assert result.ok is True
+    cwd, secret = result.stdout.splitlines()
+    assert "doge-python-analysis-" in cwd
+    assert secret == "None"
+    assert failure.ok is False
+    assert failure.returncode == 1
+    assert failure.stderr.startswith("Traceback") and "ValueError: boom" in failure.stderr
+    assert "_child" not in failure.stderr
+    assert denied.error == "Code uses disallowed operations in the demo sandbox."
+    assert executor.executor_name == "subprocess_pool"
+
+
+@pytest.mark.skipif(not hasattr(__import__("os"), "fork"), reason="sandbox pool forks workers")
+def test_pooled_executor_isolates_executions_and_recycles_workers(sandbox_pool):
+    executor = PooledSubprocessCodeExecutor(sandbox_pool)
+
+    executor.execute("import json\njson.leaked = 1", timeout=5.0)
+    probe = executor.execute("import json\nprint(hasattr(json, 'leaked'))", timeout=5.0)
+    timed_out = executor.execute("while True:\n    pass", timeout=1.0)
+    after = executor.execute("print('ok')", timeout=5.0)
+
+    assert probe.stdout.strip() == "False"
+    assert timed_out.ok is False
+    assert timed_out.error == "Python analysis timed out."
+    assert after.stdout.strip() == "ok"
+    metrics = sandbox_pool.metrics()
+    assert metrics.executions == 4
+    assert metrics.limit_breaches == 1
+    assert metrics.recycled >= 1
+    assert metrics.warm_hits >= 1
+    assert 0 < metrics.warm_hit_rate <= 1
+    assert metrics.p50_ms <= metrics.p95_ms
+
+
+def test_composition_selects_pooled_executor_unless_isolation_is_requested():
+    pooled = build_python_analysis_executor(
+        Settings(features=FeatureConfig(python_analysis_enabled=True, python_analysis_executor="pooled"))
+    )
+    isolated = build_python_analysis_executor(
+        Settings(
+            features=FeatureConfig(
+                python_analysis_enabled=True,
+                python_analysis_executor="pooled",
+                slot_code_string_isolation=True,
+            )
+        )
+    )
+
+    shutdown_sandbox_pool()
+    assert isinstance(pooled, PooledSubprocessCodeExecutor)
+    assert isinstance(pooled, ICodeExecutor)
+    assert isinstance(isolated, SubprocessCodeExecutor)
+    assert isolated.isolation_enabled is True
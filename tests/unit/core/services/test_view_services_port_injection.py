@@ -19,7 +19,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from doge.core.ports.market_view import IMarketViewRepository
+from doge.core.ports.market_view import IMarketViewRepository, ViewCatalogEntry
 from doge.core.services.anomaly_service import AnomalyService
 from doge.core.services.breadth_service import BreadthService
 from doge.core.services.ranking_service import RankingService
@@ -174,6 +174,38 @@ def test_view_service_list_views_produces_json_envelope():
     assert payload[1]["columns"] == ""
 
 
+def test_view_service_answers_from_view_catalog_without_queries():
+    """With a recorded catalog neither listing counts or introspects views."""
+
+    class _CatalogRepository(FakeMarketViewRepository):
+        def view_catalog(self):
+            return [
+                ViewCatalogEntry(
+                    name="vw_a",
+                    columns=(("ticker", "VARCHAR"), ("rsrs", "DOUBLE")),
+                    row_count=7,
+                    refreshed_at="2026-01-02T15:00:00",
+                ),
+                ViewCatalogEntry(name="vw_b", columns=(), row_count=None, refreshed_at="2026-01-02T15:00:00"),
+            ]
+
+    fake = _CatalogRepository()
+    svc = ViewService(fake)
+
+    listing = json.loads(svc.list_views())
+    stats = svc.get_view_stats()
+
+    assert fake.calls == []
+    assert listing[0] == {
+        "view": "vw_a",
+        "rows": 7,
+        "columns": "ticker, rsrs",
+        "refreshed_at": "2026-01-02T15:00:00",
+    }
+    assert listing[1]["rows"] is None
+    assert stats["vw_a"] == {"row_count": 7, "refreshed_at": "2026-01-02T15:00:00"}
+
+
 class _RaisingAfterResponses(FakeMarketViewRepository):
     """Fake that raises on a specific call index (to exercise the
     list_views per-view swallow path)."""
@@ -266,8 +266,8 @@ def test_fastapi_route_count_governance_syncs_to_s017_surface():
         entities_registry,
     )
 
-    assert len(route_rows) == 98
-    assert len(entity_routes) == 98
+    assert len(route_rows) == 99
+    assert len(entity_routes) == 99
     assert set(entity_routes) == set(route_rows)
     for path in [
         "/v1/runs",
@@ -309,9 +309,9 @@ def test_fastapi_route_count_governance_syncs_to_s017_surface():
         traceability,
         adr_0007,
     ]:
-        assert "98 HTTP routes" in text
+        assert "99 HTTP routes" in text
         assert "51 HTTP routes" not in text
-    assert "98 canonical HTTP routes" in entities_registry
+    assert "99 canonical HTTP routes" in entities_registry
     assert "51 canonical HTTP routes" not in entities_registry
     assert "88 HTTP routes" in imported_state
 
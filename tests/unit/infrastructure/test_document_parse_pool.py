@@ -0,0 +1,61 @@
+"""Tests for the spooled ``iter_pages`` path of the document parse pool."""
+from __future__ import annotations
+
+import tempfile
+
+import pytest
+
+from doge.infrastructure.documents.parse_pool import DocumentParsePool
+
+PAGES = ["Résumé — 第一页 ✓", "", "a\fb\nc", "x" * 200_000, "naïve café 🐕"]
+
+
+class _PagedParser:
+    def iter_pages(self, path):
+        if str(path).endswith(".broken"):
+            yield "first page"
+            raise ValueError("corrupt page table")
+        yield from PAGES
+
+
+def _paged_parser() -> _PagedParser:
+    return _PagedParser()
+
+
+@pytest.fixture
+def spool_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "spool"
+    directory.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(directory))
+    return directory
+
+
+@pytest.fixture
+def pool():
+    pool = DocumentParsePool(_paged_parser, processes=1)
+    yield pool
+    pool.close()
+
+
+def test_child_process_pages_round_trip_through_the_spool(pool, spool_dir, tmp_path):
+    source = tmp_path / "report.pdf"
+    source.write_bytes(b"%PDF")
+
+    assert list(pool.iter_pages(source)) == PAGES
+    assert list(spool_dir.iterdir()) == []
+
+
+def test_spool_is_removed_when_the_child_fails_or_the_reader_stops(pool, spool_dir, tmp_path):
+    broken = tmp_path / "report.broken"
+    broken.write_bytes(b"")
+    source = tmp_path / "report.pdf"
+    source.write_bytes(b"%PDF")
+
+    with pytest.raises(ValueError, match="corrupt page table"):
+        list(pool.iter_pages(broken))
+    assert list(spool_dir.iterdir()) == []
+
+    pages = pool.iter_pages(source)
+    assert next(pages) == PAGES[0]
+    pages.close()
+    assert list(spool_dir.iterdir()) == []
@@ -17,3 +17,13 @@ def test_file_extractor_returns_document_record(tmp_path):
     assert record["document_id"] == "doc-notes"
     assert record["filename"] == "notes.md"
     assert record["content"] == "# Notes"
+
+
+def test_local_parser_streams_form_feed_pages_past_preview_limit(tmp_path):
+    path = tmp_path / "filing.txt"
+    pages = [f"page {number} " + "x" * 2000 for number in range(1, 51)]
+    path.write_text("\f".join(pages), encoding="utf-8")
+    parser = LocalDocumentParser()
+
+    assert len(parser.parse(path)) == 12000
+    assert list(parser.iter_pages(path)) == pages
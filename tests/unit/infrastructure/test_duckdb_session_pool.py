@@ -0,0 +1,219 @@
+"""Tests for the process-wide DuckDB session pool used by ``doged``."""
+from __future__ import annotations
+
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from doge.config import get_settings, reset_settings
+from doge.infrastructure.database.duckdb import DuckDBConnection
+from doge.infrastructure.database.duckdb_pool import (
+    DuckDBSessionPool,
+    close_duckdb_pool,
+    host_thread_count,
+    install_duckdb_pool,
+)
+
+
+@pytest.fixture
+def db_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOGE_DB_DIR", str(tmp_path))
+    reset_settings()
+    for market in ("cn", "us"):
+        con = sqlite3.connect(tmp_path / f"market_data_{market}.db")
+        con.execute(
+            "CREATE TABLE stock_prices (ticker TEXT, date TEXT, open REAL, high REAL, "
+            "low REAL, close REAL, volume INTEGER, amount REAL, PRIMARY KEY (ticker, date))"
+        )
+        con.execute("INSERT INTO stock_prices VALUES ('A', '2026-06-10', 1, 2, 0.5, 1.5, 10, 15)")
+        con.commit()
+        con.close()
+    duckdb.connect(str(tmp_path / "market.duckdb")).close()
+    yield get_settings().db
+    close_duckdb_pool()
+    reset_settings()
+
+
+def _pool(db, size: int = 4, idle_seconds: float | None = 5.0) -> DuckDBSessionPool:
+    return DuckDBSessionPool(
+        str(db.duckdb), db.cn_db.as_posix(), db.us_db.as_posix(), size=size, idle_seconds=idle_seconds
+    )
+
+
+def _refresh_in_another_process() -> subprocess.CompletedProcess:
+    src = Path(__file__).resolve().parents[3] / "src"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(src), os.environ.get("PYTHONPATH", "")])}
+    return subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from doge.infrastructure.database.duckdb import DuckDBConnection; "
+            "DuckDBConnection(read_only=False).refresh_views()",
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def test_sessions_share_one_attached_read_only_root(db_files):
+    pool = _pool(db_files)
+
+    with pool.session() as first:
+        assert first.execute("SELECT COUNT(*) FROM cn.stock_prices").fetchone() == (1,)
+        with pytest.raises(duckdb.Error):
+            first.execute("CREATE TABLE scratch (a INTEGER)")
+    with pool.session() as second:
+        assert second.execute("SELECT ticker FROM us.stock_prices").fetchone() == ("A",)
+
+    metrics = pool.metrics()
+    assert (metrics.generation, metrics.checkouts, metrics.in_use, metrics.open) == (0, 2, 0, True)
+    assert metrics.threads == host_thread_count()
+    pool.close()
+
+
+def test_connection_routes_read_only_queries_through_installed_pool(db_files):
+    pool = install_duckdb_pool(_pool(db_files))
+
+    frame = DuckDBConnection(read_only=True).execute("SELECT close FROM cn.stock_prices")
+
+    assert frame["close"].tolist() == [1.5]
+    assert pool.metrics().checkouts == 1
+
+
+def test_saturated_pool_blocks_and_records_wait(db_files):
+    pool = _pool(db_files, size=1)
+    release = threading.Event()
+    holding = threading.Event()
+
+    def _hold():
+        with pool.session():
+            holding.set()
+            release.wait(timeout=5)
+
+    holder = threading.Thread(target=_hold)
+    holder.start()
+    holding.wait(timeout=5)
+    threading.Timer(0.05, release.set).start()
+
+    with pool.session() as cursor:
+        cursor.execute("SELECT 1").fetchone()
+    holder.join(timeout=5)
+
+    metrics = pool.metrics()
+    assert metrics.checkouts == 2
+    assert metrics.wait_seconds_max >= 0.04
+    pool.close()
+
+
+def test_refresh_views_swaps_to_a_new_generation(db_files):
+    pool = install_duckdb_pool(_pool(db_files))
+    with pool.session() as cursor:
+        cursor.execute("SELECT 1").fetchone()
+
+    DuckDBConnection(read_only=False).refresh_views()
+
+    assert pool.metrics().generation == 1
+    assert pool.metrics().open is False
+    with pool.session() as cursor:
+        views = {row[0] for row in cursor.execute(
+            "SELECT table_name FROM information_schema.tables WHERE table_type = 'VIEW'"
+        ).fetchall()}
+    assert "vw_daily_enriched_cn" in views
+
+
+def test_swap_waits_for_in_flight_sessions(db_files):
+    pool = _pool(db_files)
+    order: list[str] = []
+    started = threading.Event()
+
+    def _query():
+        with pool.session() as cursor:
+            started.set()
+            time.sleep(0.05)
+            cursor.execute("SELECT 1").fetchone()
+            order.append("query")
+
+    worker = threading.Thread(target=_query)
+    worker.start()
+    started.wait(timeout=5)
+    pool.swap(lambda: order.append("publish"))
+    worker.join(timeout=5)
+
+    assert order == ["query", "publish"]
+    pool.close()
+
+
+def test_host_thread_count_prefers_configured_value():
+    assert host_thread_count(3) == 3
+    assert host_thread_count(0) >= 1
+
+
+def test_pool_is_on_by_default_and_size_zero_disables_it(db_files, monkeypatch):
+    from doge.interfaces.api import deps
+
+    assert db_files.duckdb_pool_size == 4
+    pool = deps.start_duckdb_session_pool()
+    assert pool is not None and pool.size == 4
+
+    monkeypatch.setenv("DOGE_DUCKDB_POOL_SIZE", "0")
+    reset_settings()
+    assert deps.start_duckdb_session_pool() is None
+
+
+def test_root_opens_outside_the_pool_lock(db_files, monkeypatch):
+    pool = _pool(db_files)
+    opening = threading.Event()
+    release = threading.Event()
+    real_open = pool._open
+
+    def slow_open():
+        opening.set()
+        release.wait(5)
+        return real_open()
+
+    monkeypatch.setattr(pool, "_open", slow_open)
+
+    def query():
+        with pool.session() as cursor:
+            cursor.execute("SELECT 1").fetchone()
+
+    thread = threading.Thread(target=query)
+    thread.start()
+    assert opening.wait(5)
+    metrics = pool.metrics()
+    assert (metrics.open, metrics.in_use) == (False, 1)
+    release.set()
+    thread.join(5)
+    assert pool.metrics().open and pool.metrics().in_use == 0
+    pool.close()
+
+
+def test_idle_pool_releases_the_file_for_another_process_refresh(db_files):
+    pool = install_duckdb_pool(_pool(db_files, idle_seconds=0.1))
+
+    with pool.session() as cursor:
+        cursor.execute("SELECT 1").fetchone()
+        blocked = _refresh_in_another_process()
+    deadline = time.monotonic() + 5
+    while pool.metrics().open and time.monotonic() < deadline:
+        time.sleep(0.02)
+    refreshed = _refresh_in_another_process()
+
+    assert blocked.returncode != 0
+    assert "lock" in blocked.stderr.lower()
+    assert pool.metrics().open is False
+    assert refreshed.returncode == 0, refreshed.stderr
+    with pool.session() as cursor:
+        views = {row[0] for row in cursor.execute(
+            "SELECT table_name FROM information_schema.tables WHERE table_type = 'VIEW'"
+        ).fetchall()}
+    assert "vw_daily_enriched_cn" in views
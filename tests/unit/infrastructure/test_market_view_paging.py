@@ -0,0 +1,125 @@
+"""Tests for LIMIT pushdown and page tokens behind ``run_sql_query``."""
+from __future__ import annotations
+
+import sqlite3
+
+import duckdb
+import pytest
+
+from doge.config import get_settings, reset_settings
+from doge.core.ports.market_view import ViewQueryBudgetExceeded
+from doge.infrastructure.database import market_view_repository
+from doge.infrastructure.database.duckdb_pool import close_duckdb_pool
+from doge.infrastructure.database.market_view_repository import DuckDBMarketViewRepository
+from doge.products.quant import tools as quant_tools
+from doge.products.quant.tools import QuantToolProvider
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOGE_DB_DIR", str(tmp_path))
+    reset_settings()
+    for market in ("cn", "us"):
+        sqlite3.connect(tmp_path / f"market_data_{market}.db").close()
+    con = duckdb.connect(str(tmp_path / "market.duckdb"))
+    con.execute("CREATE TABLE big AS SELECT range AS n FROM range(250000)")
+    con.close()
+    get_settings()
+    yield DuckDBMarketViewRepository()
+    close_duckdb_pool()
+    reset_settings()
+
+
+def test_query_page_pushes_limit_into_duckdb_and_counts_first_page(repository):
+    page = repository.query_page("SELECT n FROM big ORDER BY n;", offset=0, limit=10, count_total=True)
+    last = repository.query_page("SELECT n FROM big ORDER BY n", offset=249995, limit=10)
+
+    assert page.frame["n"].tolist() == list(range(10))
+    assert (page.has_more, page.total_rows, page.total_is_estimate) == (True, 250000, False)
+    assert last.frame["n"].tolist() == list(range(249995, 250000))
+    assert (last.has_more, last.total_rows) == (False, 250000)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT n FROM big ORDER BY n -- newest first",
+        "SELECT n FROM big ORDER BY n; -- newest first",
+        "SELECT n FROM big ORDER BY n /* block */ ;\n",
+    ],
+)
+def test_query_page_accepts_trailing_comments(repository, sql):
+    page = repository.query_page(sql, limit=3, count_total=True)
+
+    assert page.frame["n"].tolist() == [0, 1, 2]
+    assert page.total_rows == 250000
+
+
+def test_query_page_keeps_comment_markers_inside_literals(repository):
+    page = repository.query_page("SELECT 'a--b;' AS s, 'it''s' AS t FROM big;", limit=1)
+
+    assert page.frame.iloc[0].tolist() == ["a--b;", "it's"]
+
+
+def test_query_page_estimates_total_when_exact_count_is_too_slow(repository, monkeypatch):
+    monkeypatch.setattr(market_view_repository, "COUNT_TIMEOUT_SECONDS", 0.2)
+
+    page = repository.query_page("SELECT a.n FROM big a CROSS JOIN big b", limit=5, count_total=True)
+
+    assert len(page.frame) == 5
+    assert page.has_more is True
+    assert page.total_is_estimate is True
+    assert page.total_rows == 250000 * 250000
+
+
+def test_query_page_interrupts_queries_over_time_budget(repository):
+    slow = "SELECT COUNT(*) AS c FROM big a CROSS JOIN big b WHERE a.n + b.n = -1"
+
+    with pytest.raises(ViewQueryBudgetExceeded, match="time budget"):
+        repository.query_page(slow, limit=5, timeout_seconds=0.2)
+
+
+def test_run_sql_query_pages_with_tokens_bound_to_the_sql(repository, monkeypatch):
+    monkeypatch.setattr(quant_tools, "SQL_PAGE_SIZE", 100)
+    provider = QuantToolProvider(view_repository_factory=lambda: repository)
+    sql = "SELECT n FROM big WHERE n < 150 ORDER BY n"
+
+    first = provider.run_sql_query(sql)
+    second = provider.run_sql_query(sql, page_token=first["next_page_token"])
+    foreign = provider.run_sql_query("SELECT n FROM big", page_token=first["next_page_token"])
+
+    assert first["ok"] is True
+    assert [row["n"] for row in first["rows"]] == list(range(100))
+    assert first["row_count"] == 150
+    assert [row["n"] for row in second["rows"]] == list(range(100, 150))
+    assert second["row_count"] == 150
+    assert "next_page_token" not in second
+    assert foreign == {"ok": False, "error": "Invalid page token for this query."}
+
+
+def test_run_sql_query_only_pages_queries_with_a_top_level_order_by(repository, monkeypatch):
+    monkeypatch.setattr(quant_tools, "SQL_PAGE_SIZE", 100)
+    provider = QuantToolProvider(view_repository_factory=lambda: repository)
+
+    unordered = provider.run_sql_query("SELECT n FROM (SELECT n FROM big ORDER BY n) WHERE n < 150")
+
+    assert len(unordered["rows"]) == 100
+    assert unordered["truncated"] is True
+    assert "ORDER BY" in unordered["warning"]
+    assert "next_page_token" not in unordered
+
+
+@pytest.mark.parametrize(
+    ("sql", "ordered"),
+    [
+        ("SELECT n FROM big ORDER BY n", True),
+        ("select n from big order\n  by n desc -- newest", True),
+        ("SELECT a FROM t UNION ALL SELECT b FROM u ORDER BY 1", True),
+        ("SELECT n FROM (SELECT n FROM big ORDER BY n)", False),
+        ("SELECT ROW_NUMBER() OVER (ORDER BY n) FROM big", False),
+        ("SELECT 'ORDER BY' AS s, \"order by\" FROM big -- ORDER BY n", False),
+        ("SELECT 'it''s' AS s FROM big /* ORDER BY */", False),
+    ],
+)
+def test_has_top_level_order_by_ignores_nested_quoted_and_commented_clauses(sql, ordered):
+    assert quant_tools.has_top_level_order_by(sql) is ordered
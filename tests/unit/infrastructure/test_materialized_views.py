@@ -0,0 +1,254 @@
+"""Materialized DuckDB analytics tables must match the plain views.
+
+Each test builds small CN/US SQLite market files, refreshes one DuckDB file
+in ``view`` mode (the reference) and one in ``materialized`` mode, and
+compares every ``views.sql`` view row for row after each change.
+"""
+from __future__ import annotations
+
+import re
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from doge.config import reset_settings
+from doge.infrastructure.database.duckdb import DuckDBConnection
+from doge.infrastructure.database import materialized_views
+from doge.infrastructure.database.materialized_views import MATERIALIZED_VIEWS
+
+CN_TICKERS = ["600000.SH", "600001.SH", "000001.SZ", "300001.SZ", "688001.SH"]
+US_TICKERS = ["AAPL", "MSFT", "NVDA"]
+
+
+def _dates(count: int, start: date = date(2026, 1, 1)) -> list[str]:
+    days, current = [], start
+    while len(days) < count:
+        if current.weekday() < 5:
+            days.append(current.isoformat())
+        current += timedelta(days=1)
+    return days
+
+
+def _rows(tickers: list[str], dates: list[str], volume: int) -> list[tuple]:
+    rows = []
+    for t_index, ticker in enumerate(tickers):
+        for d_index, day in enumerate(dates):
+            close = 10 + t_index + d_index * (0.05 + t_index * 0.01) + (d_index % 7) * 0.1
+            vol = volume * (3 if (d_index + t_index) % 29 == 0 else 1) + d_index
+            rows.append((ticker, day, close - 0.2, close + 0.3, close - 0.4, close, vol, close * vol))
+    return rows
+
+
+def _write(db_path, rows: list[tuple]) -> None:
+    con = sqlite3.connect(db_path)
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS stock_prices (ticker TEXT, date TEXT, open REAL, high REAL, "
+        "low REAL, close REAL, volume INTEGER, amount REAL, PRIMARY KEY (ticker, date))"
+    )
+    con.executemany("INSERT OR REPLACE INTO stock_prices VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    con.commit()
+    con.close()
+
+
+@pytest.fixture
+def market_dbs(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOGE_DB_DIR", str(tmp_path))
+    dates = _dates(140)
+    _write(tmp_path / "market_data_cn.db", _rows(CN_TICKERS, dates, 600_000))
+    _write(tmp_path / "market_data_us.db", _rows(US_TICKERS, dates, 60_000))
+    yield tmp_path, dates
+    reset_settings()
+
+
+def _connection(tmp_path, monkeypatch, mode: str) -> DuckDBConnection:
+    monkeypatch.setenv("DOGE_DUCKDB_VIEW_MODE", mode)
+    monkeypatch.setenv("DOGE_DUCKDB_PATH", str(tmp_path / f"{mode}.duckdb"))
+    reset_settings()
+    return DuckDBConnection(read_only=False)
+
+
+def _snapshot(conn: DuckDBConnection) -> dict[str, pd.DataFrame]:
+    frames = {}
+    with conn.connect() as con:
+        for view in MATERIALIZED_VIEWS:
+            df = con.execute(f"SELECT * FROM {view.name}").df()
+            frames[view.name] = df.sort_values(list(df.columns)).reset_index(drop=True)
+    return frames
+
+
+def _assert_same(reference: DuckDBConnection, materialized: DuckDBConnection, atol: float = 0.0) -> None:
+    expected, actual = _snapshot(reference), _snapshot(materialized)
+    for name, frame in expected.items():
+        assert not frame.empty or name.startswith("vw_rsrs"), name
+        pd.testing.assert_frame_equal(
+            actual[name], frame, check_dtype=False, obj=name, **({"atol": atol} if atol else {})
+        )
+
+
+def _refresh_both(tmp_path, monkeypatch) -> tuple[DuckDBConnection, DuckDBConnection]:
+    reference = _connection(tmp_path, monkeypatch, "view")
+    reference.refresh_views()
+    materialized = _connection(tmp_path, monkeypatch, "materialized")
+    materialized.refresh_views()
+    return reference, materialized
+
+
+def _modes(conn: DuckDBConnection) -> dict[str, str]:
+    with conn.connect() as con:
+        return {name: info["refresh_mode"] for name, info in conn.view_freshness(con).items()}
+
+
+def test_materialized_tables_match_plain_views(market_dbs, monkeypatch):
+    tmp_path, dates = market_dbs
+
+    reference, materialized = _refresh_both(tmp_path, monkeypatch)
+
+    _assert_same(reference, materialized)
+    with materialized.connect() as con:
+        tables = {row[0] for row in con.execute("SHOW TABLES").fetchall()}
+        freshness = materialized.view_freshness(con)
+    assert {view.table for view in MATERIALIZED_VIEWS} <= tables
+    assert freshness["vw_daily_enriched_cn"]["source_max_date"] == dates[-1]
+
+
+def test_unchanged_sources_leave_tables_fresh(market_dbs, monkeypatch):
+    tmp_path, _dates_ = market_dbs
+    _reference, materialized = _refresh_both(tmp_path, monkeypatch)
+    with materialized.connect() as con:
+        before = materialized.view_freshness(con)
+
+    materialized.refresh_views()
+
+    with materialized.connect() as con:
+        assert materialized.view_freshness(con) == before
+
+
+def test_restated_ticker_recomputes_only_that_ticker_and_date_tail(market_dbs, monkeypatch):
+    tmp_path, dates = market_dbs
+    _refresh_both(tmp_path, monkeypatch)
+    restated = [
+        row for row in _rows(CN_TICKERS, dates, 600_000)
+        if row[0] == "600001.SH" and row[1] >= dates[-30]
+    ]
+    _write(tmp_path / "market_data_cn.db", [(*row[:5], row[5] * 1.1, *row[6:]) for row in restated])
+
+    reference, materialized = _refresh_both(tmp_path, monkeypatch)
+
+    modes = _modes(materialized)
+    assert modes["vw_daily_enriched_cn"] == "incremental"
+    assert modes["vw_market_breadth_cn"] == "incremental"
+    assert modes["vw_rsrs_ranking_cn"] == "full"
+    assert modes["vw_market_breadth_us"] == "full"  # US untouched since first build
+    _assert_same(reference, materialized)
+
+
+def test_new_trading_day_refreshes_incrementally(market_dbs, monkeypatch):
+    tmp_path, dates = market_dbs
+    _refresh_both(tmp_path, monkeypatch)
+    extended = _dates(141)
+    _write(
+        tmp_path / "market_data_cn.db",
+        [row for row in _rows(CN_TICKERS, extended, 600_000) if row[1] == extended[-1]],
+    )
+
+    reference, materialized = _refresh_both(tmp_path, monkeypatch)
+
+    modes = _modes(materialized)
+    assert modes["vw_daily_enriched_cn"] == "incremental"
+    assert modes["vw_cross_sectional_return_cn"] == "incremental"
+    assert modes["vw_market_breadth_cn"] == "incremental"
+    assert modes["vw_rsrs_ranking_cn"] == "full"
+    with materialized.connect() as con:
+        assert materialized.view_freshness(con)["vw_daily_enriched_cn"]["source_max_date"] == extended[-1]
+    _assert_same(reference, materialized)
+
+
+def test_new_trading_days_past_the_window_prune_and_reanchor_incrementally(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOGE_DB_DIR", str(tmp_path))
+    history = _dates(385, start=date(2025, 1, 1))
+    _write(tmp_path / "market_data_cn.db", _rows(CN_TICKERS, history[:380], 600_000))
+    _write(tmp_path / "market_data_us.db", _rows(US_TICKERS, history[:380], 60_000))
+    _refresh_both(tmp_path, monkeypatch)
+
+    for day in history[380:]:
+        _write(
+            tmp_path / "market_data_cn.db",
+            [row for row in _rows(CN_TICKERS, history, 600_000) if row[1] == day],
+        )
+        reference, materialized = _refresh_both(tmp_path, monkeypatch)
+
+        assert _modes(materialized)["vw_daily_enriched_cn"] == "incremental"
+        # Kept rows were computed under an earlier window start; DuckDB's
+        # windowed AVG may then sum in another order and flip a ROUND(.., 2)
+        # tie by one unit.
+        _assert_same(reference, materialized, atol=0.0101)
+    reset_settings()
+
+
+def test_anchored_windows_match_views_sql():
+    views_sql = (
+        Path(materialized_views.__file__).with_name("views.sql").read_text(encoding="utf-8")
+    )
+    statements = {
+        match.group(1): match.group(0)
+        for match in re.finditer(r"CREATE OR REPLACE VIEW (\w+) AS.*?;", views_sql, re.DOTALL)
+    }
+
+    for view in MATERIALIZED_VIEWS:
+        if view.window_days is not None:
+            assert "MAX(CAST(date AS DATE))" in statements[view.name], view.name
+            assert f"INTERVAL {view.window_days} DAYS" in statements[view.name], view.name
+
+
+def test_view_stats_hide_live_definitions_and_report_freshness(market_dbs, monkeypatch):
+    tmp_path, dates = market_dbs
+    _reference, materialized = _refresh_both(tmp_path, monkeypatch)
+
+    with materialized.connect() as con:
+        stats = materialized.get_duckdb_view_stats(con)
+
+    assert not any(name.endswith("_live") for name in stats)
+    assert stats["vw_market_breadth_cn"]["source_max_date"] == dates[-1]
+    assert stats["vw_market_breadth_cn"]["row_count"] > 0
+
+
+def test_plain_mode_has_no_freshness_watermark(market_dbs, monkeypatch):
+    tmp_path, _dates_ = market_dbs
+    reference = _connection(tmp_path, monkeypatch, "view")
+    reference.refresh_views()
+
+    with reference.connect() as con:
+        assert reference.view_freshness(con) == {}
+        assert con.execute(
+            "SELECT COUNT(*) FROM information_schema.tables WHERE table_name LIKE 'mv_%'"
+        ).fetchone()[0] == 0
+
+
+def test_refresh_records_view_catalog_matching_live_counts(market_dbs, monkeypatch):
+    tmp_path, _dates_ = market_dbs
+    reference, materialized = _refresh_both(tmp_path, monkeypatch)
+
+    for conn in (reference, materialized):
+        with conn.connect() as con:
+            catalog = {entry.name: entry for entry in conn.view_catalog(con)}
+            for view in MATERIALIZED_VIEWS:
+                entry = catalog[view.name]
+                live = con.execute(f"SELECT COUNT(*) FROM {view.name}").fetchone()[0]
+                columns = [row[0] for row in con.execute(f"DESCRIBE {view.name}").fetchall()]
+                assert entry.row_count == live
+                assert [name for name, _type in entry.columns] == columns
+                assert entry.refreshed_at is not None
+            stats = conn.get_duckdb_view_stats(con)
+        assert not any(name.endswith("_live") for name in catalog)
+        assert stats["vw_daily_enriched_cn"]["row_count"] == catalog["vw_daily_enriched_cn"].row_count
+
+
+def test_view_catalog_is_none_before_the_first_refresh(market_dbs, monkeypatch):
+    tmp_path, _dates_ = market_dbs
+    conn = _connection(tmp_path, monkeypatch, "view")
+
+    with conn.connect() as con:
+        assert conn.view_catalog(con) is None
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from doge.config.settings import reset_settings
+from doge.core.ports.agent_model import AgentMessage
+from doge.infrastructure.llm.deepseek_client import DeepSeekClient
+from doge.infrastructure.llm.http_client_pool import ModelHttpClientPool
+from doge.infrastructure.llm.kimi_client import KimiAgentModel
+
+_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "stub-model",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), _CompletionHandler)
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.server.requests += 1
+        time.sleep(self.server.delay)
+        body = json.dumps(_COMPLETION).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        return None
+
+
+@pytest.fixture
+def stub_server():
+    servers = []
+
+    def start(delay: float = 0.0) -> _StubServer:
+        server = _StubServer(delay)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _kimi(server: _StubServer, pool: ModelHttpClientPool) -> KimiAgentModel:
+    return KimiAgentModel(api_key="key", base_url=server.base_url, model="kimi-k2.6", max_retries=0, http_pool=pool)
+
+
+async def _chat(model: KimiAgentModel) -> str:
+    events = [event async for event in model.chat([AgentMessage(role="user", content="hi")], stream=False)]
+    return events[0].message.content
+
+
+@pytest.mark.asyncio
+async def test_kimi_calls_reuse_one_pooled_keep_alive_connection(stub_server):
+    server = stub_server()
+    pool = ModelHttpClientPool(http2=False)
+    model = _kimi(server, pool)
+
+    assert [await _chat(model), await _chat(model), await _chat(_kimi(server, pool))] == ["ok", "ok", "ok"]
+
+    metrics = pool.metrics()
+    assert server.requests == 3
+    assert server.connections == 1
+    assert (metrics.clients, metrics.requests, metrics.in_flight) == (1, 3, 0)
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_saturation_when_calls_exceed_the_connection_limit(stub_server):
+    server = stub_server(delay=0.2)
+    pool = ModelHttpClientPool(max_connections=1, http2=False)
+    model = _kimi(server, pool)
+
+    assert await asyncio.gather(_chat(model), _chat(model)) == ["ok", "ok"]
+
+    metrics = pool.metrics()
+    assert server.connections == 1
+    assert metrics.peak_in_flight == 2
+    assert metrics.saturated_requests == 1
+    assert metrics.in_flight == 0
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_pooled_clients(stub_server):
+    server = stub_server()
+    pool = ModelHttpClientPool(http2=False)
+    client = pool.async_openai(api_key="key", base_url=server.base_url, timeout=5.0)
+
+    await pool.aclose()
+
+    assert client.is_closed()
+    assert pool.metrics().clients == 0
+    assert pool.async_openai(api_key="key", base_url=server.base_url, timeout=5.0) is not client
+    await pool.aclose()
+
+
+def test_deepseek_calls_share_a_pooled_client(stub_server, monkeypatch):
+    server = stub_server()
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "key")
+    monkeypatch.setenv("DEEPSEEK_BASE_URL", server.base_url)
+    reset_settings()
+    pool = ModelHttpClientPool(http2=False)
+    client = DeepSeekClient(http_pool=pool)
+
+    try:
+        assert [client.chat("system", "user"), client.chat("system", "user")] == ["ok", "ok"]
+    finally:
+        pool.close()
+        reset_settings()
+
+    assert server.connections == 1
+    assert pool.metrics().requests == 2
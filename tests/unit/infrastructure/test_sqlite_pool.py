@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+
+from doge.infrastructure.database.sqlite_pool import SQLiteConnectionPool, SQLitePoolRegistry
+
+
+def _seed(path, rows=3):
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(rows)])
+
+
+def test_pool_reuses_tuned_connection_in_wal_mode(tmp_path):
+    db = str(tmp_path / "state.db")
+    pool = SQLiteConnectionPool(db, size=2)
+
+    with pool.connection() as first:
+        assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert first.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert first.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert first.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+    with pool.connection() as second:
+        assert second is first
+
+    metrics = pool.metrics()
+    assert (metrics.opened, metrics.checkouts, metrics.reused, metrics.idle) == (1, 2, 1, 1)
+    pool.close()
+
+
+def test_checkin_rolls_back_and_closes_leftover_cursors(tmp_path):
+    db = str(tmp_path / "state.db")
+    _seed(db)
+    pool = SQLiteConnectionPool(db, size=1)
+
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO t VALUES (99)")
+        leftover = conn.execute("SELECT x FROM t")
+        leftover.fetchone()
+    with sqlite3.connect(db) as writer:
+        writer.execute("INSERT INTO t VALUES (100)")
+    with pool.connection() as conn:
+        values = {row[0] for row in conn.execute("SELECT x FROM t")}
+
+    assert 99 not in values
+    assert 100 in values  # the unexhausted cursor did not pin an old snapshot
+    pool.close()
+
+
+def test_nested_and_concurrent_checkouts_do_not_wait(tmp_path):
+    db = str(tmp_path / "state.db")
+    _seed(db)
+    pool = SQLiteConnectionPool(db, size=1)
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(20):
+                with pool.connection() as outer, pool.connection() as inner:
+                    assert outer is not inner
+                    inner.execute("SELECT COUNT(*) FROM t").fetchone()
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert errors == []
+    metrics = pool.metrics()
+    assert metrics.in_use == 0
+    assert metrics.idle == 1
+    pool.close()
+
+
+def test_replaced_file_drops_pooled_connections(tmp_path):
+    db = tmp_path / "state.db"
+    _seed(str(db), rows=3)
+    pool = SQLiteConnectionPool(str(db), size=1)
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 3
+
+    for suffix in ("", "-wal", "-shm"):
+        (tmp_path / f"state.db{suffix}").unlink(missing_ok=True)
+    _seed(str(db), rows=1)
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+    assert pool.metrics().discarded == 1
+    pool.close()
+
+
+def test_registry_bounds_paths_and_exempts_market_files(tmp_path):
+    market = tmp_path / "market_data_cn.db"
+    registry = SQLitePoolRegistry(1, max_paths=2, journal_exempt=[market])
+
+    with registry.connection(str(market)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    for name in ("a.db", "b.db"):
+        with registry.connection(str(tmp_path / name)):
+            pass
+
+    assert [metrics.path for metrics in registry.metrics()] == [str(tmp_path / "a.db"), str(tmp_path / "b.db")]
+    registry.close()
+    assert registry.metrics() == []
@@ -0,0 +1,262 @@
+"""Pooled TDX downloads against a local fake quote server.
+
+``FakeQuoteServer`` stands in for a set of TDX quotation hosts: each host has
+its own connect latency and can be down or fail every request. It is wired in
+through a fake ``opentdx.tdxClient.TdxClient`` whose sessions route calls to
+the server, so probing, the connection pool, failover and the scan writer
+are exercised end to end without network access.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from doge.application.contracts.request import ScanMarketRequest
+from doge.application.use_cases.scan_market import ScanMarketUseCase
+from doge.core.ports.repository import PriceBatchWriteResult
+from doge.infrastructure.data_source import tdx_helpers
+from doge.infrastructure.data_source.tdx import TDXDataSource
+from doge.infrastructure.data_source.tdx_pool import TdxConnectionPool
+
+
+@dataclass
+class _Host:
+    latency: float = 0.0
+    down: bool = False
+    failing: bool = False
+    delay: float = 0.002
+    gate: threading.Event | None = None
+
+
+class FakeQuoteServer:
+    """In-process fake of a group of TDX quotation hosts."""
+
+    def __init__(self) -> None:
+        self.hosts: dict[str, _Host] = {}
+        self.requests: Counter[str] = Counter()
+        self.disconnects: Counter[str] = Counter()
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def add_host(self, host: str, **behaviour) -> None:
+        self.hosts[host] = _Host(**behaviour)
+
+    def accept(self, host: str) -> None:
+        spec = self.hosts.get(host)
+        if spec is None or spec.down:
+            raise ConnectionRefusedError(host)
+        if spec.gate is not None:
+            spec.gate.wait(5)
+        time.sleep(spec.latency)
+
+    def serve(self, session: "_FakeSession", code: str) -> list[dict]:
+        spec = self.hosts[session.host]
+        with self._lock:
+            session.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, session.in_flight)
+            self.requests[session.host] += 1
+        try:
+            time.sleep(spec.delay)
+            if spec.failing:
+                raise ConnectionResetError(session.host)
+            return _bars_for(code)
+        finally:
+            with self._lock:
+                session.in_flight -= 1
+
+    def client_class(self) -> type:
+        server = self
+
+        class FakeTdxClient:
+            def __init__(self) -> None:
+                self.quotation_client = _FakeSession(server)
+                self.ex_quotation_client = _FakeSession(server)
+
+            def stock_kline(self, market, code, period, start=0, count=800):
+                return server.serve(self.quotation_client, code)
+
+            def goods_kline(self, ex_market, ticker, period, start=0, count=800):
+                return server.serve(self.ex_quotation_client, ticker)
+
+        return FakeTdxClient
+
+
+class _FakeSession:
+    def __init__(self, server: FakeQuoteServer) -> None:
+        self._server = server
+        self.host: str | None = None
+        self.in_flight = 0
+
+    def connect(self, host, port=7709, time_out=5):
+        self._server.accept(host)
+        self.host = host
+
+    def login(self):
+        return True
+
+    def disconnect(self):
+        if self.host is not None:
+            self._server.disconnects[self.host] += 1
+
+
+def _bars_for(code: str) -> list[dict]:
+    base = float(int(code.split(".")[0]) % 97 + 1)
+    return [
+        {
+            "datetime": pd.Timestamp("2026-06-08") + pd.Timedelta(days=i),
+            "open": base, "high": base + 1, "low": base - 1, "close": base + i,
+            "vol": 1000 + i, "amount": 1.0,
+        }
+        for i in range(3)
+    ]
+
+
+@pytest.fixture
+def quote_server(monkeypatch):
+    server = FakeQuoteServer()
+    market = SimpleNamespace(SH="SH", SZ="SZ", BJ="BJ")
+    const = SimpleNamespace(
+        MARKET=market, EX_MARKET=SimpleNamespace(US_STOCK="US"), PERIOD=SimpleNamespace(DAILY="D")
+    )
+    monkeypatch.setitem(sys.modules, "opentdx", SimpleNamespace())
+    monkeypatch.setitem(sys.modules, "opentdx.const", const)
+    monkeypatch.setitem(
+        sys.modules, "opentdx.tdxClient", SimpleNamespace(TdxClient=server.client_class())
+    )
+    return server
+
+
+def _pooled_source(hosts: list[str], pool_size: int, monkeypatch) -> TDXDataSource:
+    probe = tdx_helpers.find_working_servers
+    monkeypatch.setattr(
+        tdx_helpers,
+        "find_working_servers",
+        lambda _servers, market, timeout, limit: probe(hosts, market, timeout=timeout, limit=limit),
+    )
+    source = TDXDataSource(max_retries=2, retry_delay=0.0, pool_size=pool_size)
+    source.connect("cn")
+    return source
+
+
+TICKERS = [f"{600000 + i}.SH" for i in range(24)]
+
+
+def test_find_working_servers_ranks_by_latency_and_closes_extras(quote_server):
+    quote_server.add_host("slow", latency=0.05)
+    quote_server.add_host("fast", latency=0.0)
+    quote_server.add_host("dead", down=True)
+    quote_server.add_host("mid", latency=0.02)
+
+    clients = tdx_helpers.find_working_servers(["slow", "fast", "dead", "mid"], "cn", timeout=1, limit=2)
+
+    assert [host for _client, host in clients] == ["fast", "mid"]
+    assert quote_server.disconnects["slow"] == 1
+
+
+def test_find_working_servers_closes_probes_that_miss_the_deadline(quote_server):
+    gate = threading.Event()
+    quote_server.add_host("fast")
+    quote_server.add_host("late", gate=gate)
+
+    clients = tdx_helpers.find_working_servers(["fast", "late"], "cn", timeout=0, limit=2)
+
+    assert [host for _client, host in clients] == ["fast"]
+    assert quote_server.disconnects["late"] == 0
+    gate.set()
+    deadline = time.monotonic() + 5
+    while quote_server.disconnects["late"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert quote_server.disconnects["late"] == 1
+    assert quote_server.disconnects["fast"] == 0
+
+
+def test_download_many_spreads_load_with_one_request_per_connection(quote_server, monkeypatch):
+    for host in ("a", "b", "c"):
+        quote_server.add_host(host)
+    source = _pooled_source(["a", "b", "c"], 3, monkeypatch)
+
+    results = list(source.download_many(TICKERS, "cn"))
+
+    assert [ticker for ticker, _df, _failed in results] == TICKERS
+    assert all(not failed for _t, _df, failed in results)
+    assert all(df["ticker"].iloc[0] == ticker for ticker, df, _ in results)
+    assert quote_server.max_in_flight == 1
+    assert len(quote_server.requests) > 1
+    assert sum(quote_server.requests.values()) == len(TICKERS)
+
+
+def test_failing_host_fails_over_and_is_evicted(quote_server, monkeypatch):
+    quote_server.add_host("good")
+    quote_server.add_host("bad", failing=True)
+    source = _pooled_source(["good", "bad"], 2, monkeypatch)
+
+    results = list(source.download_many(TICKERS, "cn"))
+
+    assert all(df is not None for _t, df, _failed in results)
+    assert source._pool.hosts == ("good",)
+    assert quote_server.disconnects["bad"] == 1
+    assert source.is_connected()
+
+
+def test_all_hosts_failing_degrades_to_none(quote_server, monkeypatch):
+    quote_server.add_host("x", failing=True)
+    quote_server.add_host("y", failing=True)
+    source = _pooled_source(["x", "y"], 2, monkeypatch)
+
+    results = list(source.download_many(TICKERS[:4], "cn"))
+
+    assert [df for _t, df, _failed in results] == [None] * 4
+    assert not source.is_connected()
+
+
+def test_disconnect_closes_every_pooled_client(quote_server, monkeypatch):
+    for host in ("a", "b"):
+        quote_server.add_host(host)
+    source = _pooled_source(["a", "b"], 2, monkeypatch)
+
+    source.disconnect()
+
+    assert not source.is_connected()
+    assert quote_server.disconnects == Counter({"a": 1, "b": 1})
+
+
+def test_pool_acquire_blocks_until_release_and_honours_exclude():
+    pool = TdxConnectionPool([(object(), "a")], "cn")
+    conn = pool.acquire()
+
+    assert pool.acquire(timeout=0.05) is None
+    pool.release(conn)
+    assert pool.acquire(exclude={"a"}) is None
+    assert pool.acquire(timeout=0.05) is conn
+
+
+def test_scan_persists_pooled_downloads_on_the_calling_thread(quote_server, monkeypatch):
+    for host in ("a", "b", "c"):
+        quote_server.add_host(host)
+    source = _pooled_source(["a", "b", "c"], 3, monkeypatch)
+    writer_threads: set[int] = set()
+    written: list[str] = []
+
+    class _Repo:
+        def ensure_schema(self, market):
+            return None
+
+        def save_prices_batch(self, market, frames):
+            writer_threads.add(threading.get_ident())
+            written.extend(frame["ticker"].iloc[0] for frame in frames)
+            return PriceBatchWriteResult(appended={f["ticker"].iloc[0]: len(f) for f in frames})
+
+    response = ScanMarketUseCase(_Repo(), data_source=source).execute(
+        ScanMarketRequest(market="cn", source="tdx-server", tickers=TICKERS, batch_size=5)
+    )
+
+    assert response.success_count == len(TICKERS)
+    assert written == TICKERS
+    assert writer_threads == {threading.get_ident()}
@@ -0,0 +1,298 @@
+"""Tests for the local TDX ``.day`` scanner parser modes."""
+from __future__ import annotations
+
+import struct
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from doge.infrastructure.data_source.tdx_file_scanner import TDXFileScanner
+
+
+def _trading_dates(count: int, start: date = date(2020, 1, 1)) -> list[int]:
+    days = []
+    current = start
+    while len(days) < count:
+        if current.weekday() < 5:
+            days.append(int(current.strftime("%Y%m%d")))
+        current += timedelta(days=1)
+    return days
+
+
+def _write_cn_day(path: Path, dates: list[int]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        for i, date_int in enumerate(dates):
+            base = 1000 + (i * 37) % 900
+            handle.write(
+                struct.pack(
+                    "<IIIII fII",
+                    date_int, base, base + 13, base - 11, base + 7,
+                    1234567.125 + i * 3.3, 100000 + i * 17, 0,
+                )
+            )
+
+
+def _write_us_day(path: Path, dates: list[int]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        for i, date_int in enumerate(dates):
+            base = 100.0 + (i % 50) * 0.37
+            handle.write(
+                struct.pack(
+                    "<IfffffII",
+                    date_int, base, base + 1.1, base - 0.9, base + 0.3,
+                    98765.43 + i, 5000 + i, 0,
+                )
+            )
+
+
+def _assert_identical(left: pd.DataFrame, right: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(left, right, check_exact=True)
+    assert list(left.dtypes) == list(right.dtypes)
+
+
+@pytest.mark.parametrize("rows", [1, 45, 120, 500])
+def test_mmap_parser_matches_struct_loop_for_cn_files(tmp_path, rows):
+    path = tmp_path / "vipdoc" / "sh" / "lday" / "sh600000.day"
+    _write_cn_day(path, _trading_dates(rows))
+
+    mmap_frame = TDXFileScanner(parser="mmap")._parse_file(str(path), "cn")
+    struct_frame = TDXFileScanner(parser="struct")._parse_file(str(path), "cn")
+
+    _assert_identical(mmap_frame, struct_frame)
+    assert len(mmap_frame) == min(rows, TDXFileScanner.MAX_DAYS)
+
+
+def test_mmap_parser_matches_struct_loop_for_us_files(tmp_path):
+    path = tmp_path / "vipdoc" / "ds" / "lday" / "74#AAPL.day"
+    _write_us_day(path, _trading_dates(300))
+
+    mmap_frame = TDXFileScanner(parser="mmap")._parse_file(str(path), "us")
+    struct_frame = TDXFileScanner(parser="struct")._parse_file(str(path), "us")
+
+    _assert_identical(mmap_frame, struct_frame)
+
+
+def test_mmap_parser_sorts_when_tail_is_out_of_order(tmp_path):
+    dates = _trading_dates(200)
+    dates[-3], dates[-10] = dates[-10], dates[-3]
+    path = tmp_path / "sz000001.day"
+    _write_cn_day(path, dates)
+
+    mmap_frame = TDXFileScanner(parser="mmap")._parse_file(str(path), "cn")
+    struct_frame = TDXFileScanner(parser="struct")._parse_file(str(path), "cn")
+
+    _assert_identical(mmap_frame, struct_frame)
+    assert mmap_frame["date"].is_monotonic_increasing
+
+
+def test_mmap_parser_sorts_when_an_earlier_record_postdates_the_tail(tmp_path):
+    dates = _trading_dates(200)
+    dates.insert(5, dates.pop(-20))
+    path = tmp_path / "sz000003.day"
+    _write_cn_day(path, dates)
+
+    scanner = TDXFileScanner(parser="mmap", max_days=40)
+    mmap_frame = scanner._parse_file(str(path), "cn")
+    struct_frame = TDXFileScanner(parser="struct", max_days=40)._parse_file(str(path), "cn")
+
+    _assert_identical(mmap_frame, struct_frame)
+    assert mmap_frame["date"].is_monotonic_increasing
+    assert len(mmap_frame) == 40
+
+
+def test_mmap_parser_ignores_trailing_partial_record_and_empty_files(tmp_path):
+    path = tmp_path / "sz000002.day"
+    _write_cn_day(path, _trading_dates(10))
+    with path.open("ab") as handle:
+        handle.write(b"\x00" * 7)
+    empty = tmp_path / "sz000003.day"
+    empty.write_bytes(b"")
+
+    scanner = TDXFileScanner(parser="mmap")
+
+    _assert_identical(
+        scanner._parse_file(str(path), "cn"),
+        TDXFileScanner(parser="struct")._parse_file(str(path), "cn"),
+    )
+    assert scanner._parse_file(str(empty), "cn").empty
+
+
+def test_scan_local_yields_identical_frames_in_both_modes(tmp_path):
+    for code in ("600000", "600519"):
+        _write_cn_day(tmp_path / "vipdoc" / "sh" / "lday" / f"sh{code}.day", _trading_dates(150))
+    _write_cn_day(tmp_path / "vipdoc" / "sz" / "lday" / "sz000001.day", _trading_dates(30))
+
+    mmap_frames = list(TDXFileScanner(parser="mmap").scan_local("cn", str(tmp_path)))
+    struct_frames = list(TDXFileScanner(parser="struct").scan_local("cn", str(tmp_path)))
+
+    assert [f["ticker"].iloc[0] for f in mmap_frames] == ["000001.SZ", "600000.SH", "600519.SH"]
+    for left, right in zip(mmap_frames, struct_frames):
+        _assert_identical(left, right)
+
+
+def test_parser_mode_defaults_from_settings_and_rejects_unknown(monkeypatch):
+    from doge.config.settings import reset_settings
+
+    monkeypatch.setenv("DOGE_TDX_LOCAL_PARSER", "struct")
+    reset_settings()
+    try:
+        assert TDXFileScanner()._parser == "struct"
+    finally:
+        monkeypatch.delenv("DOGE_TDX_LOCAL_PARSER")
+        reset_settings()
+    assert TDXFileScanner()._parser == "mmap"
+    with pytest.raises(ValueError):
+        TDXFileScanner(parser="turbo")
+
+
+def _build_cn_tree(root: Path, codes: list[str], rows: int = 80) -> None:
+    for code in codes:
+        _write_cn_day(root / "vipdoc" / "sh" / "lday" / f"sh{code}.day", _trading_dates(rows))
+
+
+def test_parallel_scan_streams_frames_in_ticker_order(tmp_path):
+    codes = [f"{600000 + i:06d}" for i in range(12)]
+    _build_cn_tree(tmp_path, codes)
+    serial_events, parallel_events = [], []
+
+    serial = list(
+        TDXFileScanner(parser="mmap", workers=1).scan_local(
+            "cn", str(tmp_path), progress_callback=lambda p, m: serial_events.append((p, m))
+        )
+    )
+    parallel = list(
+        TDXFileScanner(parser="mmap", workers=2).scan_local(
+            "cn", str(tmp_path), progress_callback=lambda p, m: parallel_events.append((p, m))
+        )
+    )
+
+    assert [f["ticker"].iloc[0] for f in parallel] == [f"{code}.SH" for code in codes]
+    for left, right in zip(serial, parallel):
+        _assert_identical(left, right)
+    assert parallel_events == serial_events
+    assert parallel_events[-1] == (100, "scan complete")
+
+
+def test_parallel_scan_isolates_per_ticker_read_failures(tmp_path):
+    _build_cn_tree(tmp_path, ["600000", "600002"])
+    # A directory with a .day name is listed as a ticker but cannot be parsed.
+    (tmp_path / "vipdoc" / "sh" / "lday" / "sh600001.day").mkdir()
+    events = []
+
+    frames = list(
+        TDXFileScanner(parser="mmap", workers=2).scan_local(
+            "cn", str(tmp_path), progress_callback=lambda p, m: events.append((p, m))
+        )
+    )
+
+    assert [f["ticker"].iloc[0] for f in frames] == ["600000.SH", "600002.SH"]
+    assert events[-1] == (100, "scan complete")
+
+
+def test_parallel_scan_bounds_in_flight_submissions(tmp_path, monkeypatch):
+    from concurrent.futures import ProcessPoolExecutor
+
+    codes = [f"{600000 + i:06d}" for i in range(10)]
+    _build_cn_tree(tmp_path, codes, rows=5)
+    submitted = []
+    original_submit = ProcessPoolExecutor.submit
+
+    def _counting_submit(self, fn, *args, **kwargs):
+        submitted.append(args[1])
+        return original_submit(self, fn, *args, **kwargs)
+
+    monkeypatch.setattr(ProcessPoolExecutor, "submit", _counting_submit)
+    monkeypatch.setattr(TDXFileScanner, "QUEUE_DEPTH_PER_WORKER", 1)
+    scanner = TDXFileScanner(parser="mmap", workers=2)
+
+    jobs = [(f"{c}.SH", None) for c in codes]
+    stream = scanner._read_parallel(str(tmp_path / "vipdoc"), jobs, "cn")
+    first = next(stream)
+
+    assert first[0] == "600000.SH"
+    assert len(submitted) == 3
+    stream.close()
+
+
+def _watermark_for(path: Path, ticker: str, last_date: str):
+    from doge.core.ports.file_scanner import TdxFileWatermark
+
+    stat = path.stat()
+    return TdxFileWatermark(
+        ticker=ticker, size=stat.st_size, mtime_ns=stat.st_mtime_ns, last_date=last_date
+    )
+
+
+def test_delta_scan_skips_unchanged_files_without_opening_them(tmp_path, monkeypatch):
+    path = tmp_path / "vipdoc" / "sh" / "lday" / "sh600000.day"
+    _write_cn_day(path, _trading_dates(50))
+    scanner = TDXFileScanner(parser="mmap", workers=1)
+    watermarks = {"600000.SH": _watermark_for(path, "600000.SH", "2020-03-10")}
+
+    def _boom(*args, **kwargs):
+        raise AssertionError("unchanged file was parsed")
+
+    monkeypatch.setattr(scanner, "_parse_file", _boom)
+    items = list(scanner.scan_local_delta("cn", str(tmp_path), watermarks))
+
+    assert len(items) == 1
+    assert items[0].unchanged is True
+    assert items[0].frame is None
+    assert items[0].watermark == watermarks["600000.SH"]
+
+
+@pytest.mark.parametrize("parser", ["mmap", "struct"])
+def test_delta_scan_reads_only_appended_records(tmp_path, parser):
+    path = tmp_path / "vipdoc" / "sh" / "lday" / "sh600000.day"
+    dates = _trading_dates(203)
+    _write_cn_day(path, dates[:200])
+    scanner = TDXFileScanner(parser=parser, workers=1)
+    first = scanner._parse_file(str(path), "cn")
+    watermark = _watermark_for(path, "600000.SH", first["date"].iloc[-1])
+    _write_cn_day(path, dates)
+
+    items = list(scanner.scan_local_delta("cn", str(tmp_path), {"600000.SH": watermark}))
+
+    full = scanner._parse_file(str(path), "cn")
+    assert len(items) == 1
+    delta = items[0].frame
+    assert list(delta["date"]) == list(full["date"].iloc[-3:])
+    assert list(delta["close"]) == list(full["close"].iloc[-3:])
+    assert items[0].watermark.size == path.stat().st_size
+    assert items[0].watermark.last_date == full["date"].iloc[-1]
+
+
+def test_delta_scan_reparses_rewritten_files(tmp_path):
+    path = tmp_path / "vipdoc" / "sh" / "lday" / "sh600000.day"
+    _write_cn_day(path, _trading_dates(100))
+    watermark = _watermark_for(path, "600000.SH", "2030-01-01")
+    _write_cn_day(path, _trading_dates(110))
+    scanner = TDXFileScanner(parser="mmap", workers=1)
+
+    items = list(scanner.scan_local_delta("cn", str(tmp_path), {"600000.SH": watermark}))
+
+    assert len(items[0].frame) == 110
+    assert items[0].watermark.last_date == "2030-01-01"
+
+
+def test_delta_scan_parses_new_files_on_the_worker_pool(tmp_path):
+    _build_cn_tree(tmp_path, ["600000", "600001", "600002"], rows=20)
+    unchanged = tmp_path / "vipdoc" / "sh" / "lday" / "sh600001.day"
+    watermarks = {"600001.SH": _watermark_for(unchanged, "600001.SH", "2020-01-28")}
+    events = []
+
+    items = list(
+        TDXFileScanner(parser="mmap", workers=2).scan_local_delta(
+            "cn", str(tmp_path), watermarks, progress_callback=lambda p, m: events.append((p, m))
+        )
+    )
+
+    assert [(i.ticker, i.unchanged) for i in items] == [
+        ("600000.SH", False), ("600001.SH", True), ("600002.SH", False),
+    ]
+    assert len(items[0].frame) == 20
+    assert events[-1] == (100, "scan complete")
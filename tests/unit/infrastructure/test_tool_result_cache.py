@@ -0,0 +1,105 @@
+from doge.application.tools import ToolRegistry, ToolResult
+from doge.core.domain.enterprise_context import EnterpriseContext
+from doge.core.domain.tool_descriptor import ToolDescriptor
+from doge.core.domain.tool_policy import ToolCategory
+from doge.infrastructure.cache.tool_result_cache import FileDataVersion, LRUToolResultCache
+
+
+def _registry(cache, *, cacheable=True, category=ToolCategory.READ_ONLY):
+    calls = []
+
+    def query_stock(ticker: str, days: int = 20) -> ToolResult:
+        calls.append((ticker, days))
+        return ToolResult("query_stock", data={"ticker": ticker, "rows": [{"close": 10.0 + len(calls)}]})
+
+    registry = ToolRegistry(result_cache=cache)
+    registry.register(
+        ToolDescriptor(name="query_stock", description="Query rows.", category=category, cacheable=cacheable),
+        query_stock,
+    )
+    return registry, calls
+
+
+def test_repeated_calls_with_reordered_arguments_hit_the_cache():
+    cache = LRUToolResultCache(max_bytes=1 << 20)
+    registry, calls = _registry(cache)
+
+    first = registry.execute("query_stock", '{"ticker": "AAPL", "days": 5}')
+    second = registry.execute("query_stock", {"days": 5, "ticker": "AAPL"})
+    second.data["rows"].clear()
+    third = registry.execute("query_stock", {"days": 5, "ticker": "AAPL"})
+
+    assert calls == [("AAPL", 5)]
+    assert first.data == third.data
+    stats = cache.stats()["query_stock"]
+    assert (stats.hits, stats.misses, stats.stores) == (2, 1, 1)
+
+
+def test_entries_are_scoped_by_tenant():
+    registry, calls = _registry(LRUToolResultCache(max_bytes=1 << 20))
+
+    registry.execute("query_stock", {"ticker": "AAPL"}, context=EnterpriseContext(tenant_id="a"))
+    registry.execute("query_stock", {"ticker": "AAPL"}, context=EnterpriseContext(tenant_id="b"))
+    registry.execute("query_stock", {"ticker": "AAPL"}, context=EnterpriseContext(tenant_id="a"))
+
+    assert calls == [("AAPL", 20), ("AAPL", 20)]
+
+
+def test_invalidate_and_data_version_changes_force_recomputation(tmp_path):
+    db = tmp_path / "market_data_us.db"
+    db.write_bytes(b"v1")
+    cache = LRUToolResultCache(max_bytes=1 << 20, data_version=FileDataVersion([db]))
+    registry, calls = _registry(cache)
+
+    registry.execute("query_stock", {"ticker": "AAPL"})
+    cache.invalidate()
+    registry.execute("query_stock", {"ticker": "AAPL"})
+    db.write_bytes(b"version-2")
+    registry.execute("query_stock", {"ticker": "AAPL"})
+    registry.execute("query_stock", {"ticker": "AAPL"})
+
+    assert len(calls) == 3
+    assert cache.metrics()["generation"] == 1
+
+
+def test_least_recently_used_entries_are_evicted_past_the_byte_budget():
+    cache = LRUToolResultCache(max_bytes=120)
+    registry, calls = _registry(cache)
+
+    registry.execute("query_stock", {"ticker": "AAA"})
+    registry.execute("query_stock", {"ticker": "BBB"})
+    registry.execute("query_stock", {"ticker": "AAA"})
+    registry.execute("query_stock", {"ticker": "CCC"})
+    registry.execute("query_stock", {"ticker": "AAA"})
+    registry.execute("query_stock", {"ticker": "BBB"})
+
+    assert [ticker for ticker, _ in calls] == ["AAA", "BBB", "CCC", "BBB"]
+    assert cache.metrics()["bytes"] <= 120
+    assert cache.stats()["query_stock"].evictions >= 1
+
+
+def test_only_cacheable_successful_calls_are_cached():
+    cache = LRUToolResultCache(max_bytes=1 << 20)
+    registry, calls = _registry(cache, cacheable=False)
+    registry.execute("query_stock", {"ticker": "AAPL"})
+    registry.execute("query_stock", {"ticker": "AAPL"})
+
+    approval, approval_calls = _registry(cache, category=ToolCategory.HIGH_RISK)
+    approval.execute("query_stock", {"ticker": "AAPL"})
+    approval.execute("query_stock", {"ticker": "AAPL"})
+
+    failing = ToolRegistry(result_cache=cache)
+    failures = []
+
+    def flaky() -> ToolResult:
+        failures.append(1)
+        return ToolResult("flaky", data={}, ok=False, error="upstream unavailable")
+
+    failing.register(ToolDescriptor(name="flaky", description="Fails.", cacheable=True), flaky)
+    failing.execute("flaky", {})
+    failing.execute("flaky", {})
+
+    assert len(calls) == 2
+    assert len(approval_calls) == 2
+    assert len(failures) == 2
+    assert cache.metrics()["entries"] == 0
@@ -203,3 +203,36 @@ async def test_run_stream_handler_no_events_at_all() -> None:
     received = [event async for event in stream]
 
     assert received == []
+
+
+@pytest.mark.asyncio
+async def test_run_stream_handler_interleaves_live_deltas_until_the_persisted_stream_ends() -> None:
+    import asyncio
+
+    from doge.application.agent.model_delta_stream import ModelDeltaChannel
+
+    gate = asyncio.Event()
+
+    class GatedSubscriber:
+        async def subscribe(self, run_id: str, after_sequence: int = 0):
+            yield _make_event(1, "run_created")
+            await gate.wait()
+            yield _make_event(2, "model_response")
+
+    channel = ModelDeltaChannel()
+    handler = RunStreamHandler(runtime=FakeRuntime([]), subscriber=GatedSubscriber())
+    stream = handler.open(
+        run_id="run-1",
+        access=RunAccessContext(scope=TenantScope.local()),
+        delta_channel=channel,
+    )
+
+    first = await stream.__anext__()
+    await channel.publish(AgentEvent(event_id="dlt-1", run_id="run-1", event_type=EventType.MODEL_DELTA, payload={"content": "Hel"}))
+    await channel.publish(AgentEvent(event_id="dlt-2", run_id="run-2", event_type=EventType.MODEL_DELTA, payload={"content": "other"}))
+    gate.set()
+    rest = [event async for event in stream]
+
+    assert first.sequence == 1
+    assert [event.event_id for event in rest] == ["dlt-1", "evt-2"]
+    assert channel.has_subscribers("run-1") is False
@@ -12,6 +12,7 @@ import pytest
 
 from doge.application.use_cases.scan_market import ScanMarketUseCase
 from doge.bootstrap.gateway import GatewayContainer
+from doge.core.ports.file_scanner import ITdxFileScanner
 from doge.core.ports.repository import IStockRepository, StorageWriteError
 from doge.interfaces.api.routers import scan as scan_router
 
@@ -50,7 +51,7 @@ class _FakeStorageRepo(IStockRepository):
         return []
 
 
-class _FakeFileScanner:
+class _FakeFileScanner(ITdxFileScanner):
     """Yield canned frames without touching the filesystem."""
 
     def __init__(self, frames):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from doge.platform.evidence.document_parsers import ParserDispatcher
@@ -99,3 +101,43 @@ def test_dispatcher_rejects_unsupported_suffix(tmp_path) -> None:
 
     with pytest.raises(SlotConfigurationError, match="no document parser supports suffix"):
         dispatcher.parse(source)
+
+
+class _FormFeedParser:
+    def __init__(self) -> None:
+        self.max_chars: list[int] = []
+
+    def parse(self, path, *, max_chars: int = 12000) -> str:
+        self.max_chars.append(max_chars)
+        return "page one\fpage two\f\fpage four"
+
+
+class _StreamingParser(_FormFeedParser):
+    def iter_pages(self, path):
+        yield f"streamed:{path.name}"
+
+
+def test_dispatcher_iter_pages_falls_back_to_unbounded_parse_split_on_form_feeds(tmp_path) -> None:
+    source = tmp_path / "report.txt"
+    source.write_text("ignored", encoding="utf-8")
+    parser = _FormFeedParser()
+    dispatcher = ParserDispatcher(
+        (DocumentParserContribution("document.text", lambda _context: parser, (".txt",)),),
+        _context(),
+    )
+
+    assert list(dispatcher.iter_pages(source)) == ["page one", "page two", "", "page four"]
+    assert parser.max_chars == [sys.maxsize]
+
+
+def test_dispatcher_iter_pages_prefers_the_parsers_own_streaming(tmp_path) -> None:
+    source = tmp_path / "report.txt"
+    source.write_text("ignored", encoding="utf-8")
+    parser = _StreamingParser()
+    dispatcher = ParserDispatcher(
+        (DocumentParserContribution("document.text", lambda _context: parser, (".txt",)),),
+        _context(),
+    )
+
+    assert list(dispatcher.iter_pages(source)) == ["streamed:report.txt"]
+    assert parser.max_chars == []
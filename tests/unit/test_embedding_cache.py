@@ -1,3 +1,7 @@
+import sqlite3
+
+import pytest
+
 from doge.infrastructure.database.embedding_cache import SQLiteEmbeddingCache
 from doge.infrastructure.llm.embedding_client import HashingEmbeddingProvider
 
@@ -17,5 +21,27 @@ def test_sqlite_embedding_cache_round_trips_vectors(tmp_path):
 
     cache.set("key-1", [0.1, 0.2, 0.3])
 
-    assert cache.get("key-1") == [0.1, 0.2, 0.3]
+    assert cache.get("key-1") == pytest.approx([0.1, 0.2, 0.3], rel=1e-6)
     assert cache.get("missing") is None
+
+
+def test_sqlite_embedding_cache_bulk_round_trip_and_legacy_json_rows(tmp_path):
+    db = tmp_path / "agent_state.db"
+    cache = SQLiteEmbeddingCache(db)
+    with sqlite3.connect(db) as conn:
+        conn.execute("INSERT INTO embedding_cache(key, vector) VALUES ('legacy', '[0.5, 0.25]')")
+
+    cache.set_many({f"key-{index}": [float(index), 0.125] for index in range(600)})
+
+    found = cache.get_many(["legacy", "key-0", "key-599", "missing"])
+    assert found == {"legacy": [0.5, 0.25], "key-0": [0.0, 0.125], "key-599": [599.0, 0.125]}
+
+
+def test_sqlite_embedding_cache_stores_float32_vectors(tmp_path):
+    db = tmp_path / "agent_state.db"
+    SQLiteEmbeddingCache(db).set("key-1", [0.5] * 8)
+
+    with sqlite3.connect(db) as conn:
+        (payload,) = conn.execute("SELECT vector FROM embedding_cache WHERE key = 'key-1'").fetchone()
+
+    assert len(payload) == 8 * 4
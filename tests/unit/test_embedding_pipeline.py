@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+from doge.application.services.embedding_pipeline import BatchingEmbedder, content_hash
+from doge.core.ports.embedding import IEmbeddingCache
+from doge.infrastructure.database.embedding_cache import SQLiteEmbeddingCache
+from doge.infrastructure.llm.embedding_client import HashingEmbeddingProvider
+
+
+class _SlowProvider(HashingEmbeddingProvider):
+    def __init__(self) -> None:
+        super().__init__(dimensions=16)
+        self.batches: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def embed_texts(self, texts):
+        with self._lock:
+            self.batches.append(list(texts))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        try:
+            return super().embed_texts(texts)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def test_batching_embedder_dedups_batches_and_bounds_parallelism(tmp_path):
+    provider = _SlowProvider()
+    cache = SQLiteEmbeddingCache(tmp_path / "agent_state.db")
+    embedder = BatchingEmbedder(provider, cache, batch_size=4, max_workers=2)
+    texts = [f"text {index % 10}" for index in range(25)]
+
+    vectors, stats = embedder.embed(texts)
+
+    assert vectors == HashingEmbeddingProvider(dimensions=16).embed_texts(texts)
+    assert (stats.texts, stats.unique, stats.embedded, stats.cache_hits, stats.batches) == (25, 10, 10, 0, 3)
+    assert sorted(len(batch) for batch in provider.batches) == [2, 4, 4]
+    assert provider.max_in_flight == 2
+    assert cache.get(content_hash("text 3")) == pytest.approx(vectors[3], rel=1e-6)
+
+
+def test_batching_embedder_serves_repeats_from_one_cache_lookup(tmp_path):
+    provider = _SlowProvider()
+    cache = SQLiteEmbeddingCache(tmp_path / "agent_state.db")
+    embedder = BatchingEmbedder(provider, cache)
+    embedder.embed(["alpha", "beta"])
+    provider.batches.clear()
+
+    vectors, stats = embedder.embed(["beta", "gamma", "alpha"])
+
+    assert provider.batches == [["gamma"]]
+    assert (stats.cache_hits, stats.embedded) == (2, 1)
+    assert stats.as_dict()["texts_per_second"] > 0
+    assert len(vectors) == 3
+
+
+class _KeyValueCache(IEmbeddingCache):
+    def __init__(self) -> None:
+        self.vectors: dict[str, list[float]] = {}
+
+    def get(self, key):
+        return self.vectors.get(key)
+
+    def set(self, key, vector):
+        self.vectors[key] = vector
+
+
+def test_batching_embedder_uses_the_port_default_bulk_methods():
+    cache = _KeyValueCache()
+    embedder = BatchingEmbedder(HashingEmbeddingProvider(dimensions=16), cache)
+
+    first, _ = embedder.embed(["alpha", "beta"])
+    second, stats = embedder.embed(["alpha", "gamma"])
+
+    assert set(cache.vectors) == {content_hash(text) for text in ("alpha", "beta", "gamma")}
+    assert second[0] == first[0]
+    assert (stats.cache_hits, stats.embedded) == (1, 1)
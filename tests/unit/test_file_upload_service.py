@@ -1,12 +1,20 @@
+import asyncio
+import sqlite3
 from pathlib import Path
 
 import pytest
 
+from doge.application.services.document_extraction_worker import DocumentExtractionWorker
 from doge.application.services.file_upload_service import FileUploadError, FileUploadService
 from doge.application.services.file_purpose_router import route_kimi_file_purpose
 from doge.application.services.page_extraction_service import PageExtractionService
-from doge.infrastructure.database.agent_repositories import SQLiteDocumentRepository
+from doge.core.domain.document_models import DocumentExtractionStatus
+from doge.infrastructure.database.agent_repositories import (
+    SQLiteDocumentExtractionQueue,
+    SQLiteDocumentRepository,
+)
 from doge.infrastructure.database.evidence_repository import SQLiteEvidenceRepository
+from doge.infrastructure.documents.parse_pool import DocumentParsePool
 from doge.shared.scope import TenantScope
 
 
@@ -14,6 +22,9 @@ class FakeParser:
     def parse(self, path: str | Path, *, max_chars: int = 12000) -> str:
         return Path(path).read_text(encoding="utf-8")[:max_chars]
 
+    def iter_pages(self, path: str | Path):
+        yield from Path(path).read_text(encoding="utf-8").split("\f")
+
 
 class FakeKimiFiles:
     supports_files_api = True
@@ -217,3 +228,160 @@ def test_unsupported_kimi_files_client_falls_back_to_local_parser(tmp_path):
     assert document["content"] == "local evidence"
     assert document["kimi_file_id"] is None
     assert document["kimi_file_purpose"] == "file-extract"
+
+
+def test_background_upload_queues_extraction_and_worker_indexes_it(tmp_path):
+    db = tmp_path / "agent_state.db"
+    source = tmp_path / "report.txt"
+    source.write_text("alpha beta", encoding="utf-8")
+    documents = SQLiteDocumentRepository(db)
+    evidence = SQLiteEvidenceRepository(db)
+    queue = SQLiteDocumentExtractionQueue(db)
+    parser = DocumentParsePool(FakeParser, processes=0)
+    extraction = PageExtractionService(evidence_repository=evidence, parser=parser)
+    service = FileUploadService(
+        documents,
+        storage_dir=tmp_path / "documents",
+        parser=parser,
+        extraction_service=extraction,
+        extraction_queue=queue,
+    )
+    worker = DocumentExtractionWorker(queue, service, extraction, documents)
+
+    document = service.register_path(source)
+    duplicate = service.register_path(source)
+
+    assert document["parsing_status"] == "uploaded"
+    assert document["extraction_status"] == "pending"
+    assert duplicate["document_id"] == document["document_id"]
+    assert evidence.list_chunks([document["document_id"]], limit=5) == []
+
+    assert asyncio.run(worker.run_once()) == 1
+
+    job = queue.get(document["document_id"], TenantScope.local())
+    assert (job.status, job.page_count, job.chunk_count) == (DocumentExtractionStatus.INDEXED, 1, 1)
+    assert documents.get(document["document_id"], TenantScope.local())["content"] == "alpha beta"
+    assert evidence.list_chunks([document["document_id"]], limit=5)[0].text == "alpha beta"
+    assert service.register_path(source)["extraction_status"] == "indexed"
+
+
+class _HeartbeatQueue(SQLiteDocumentExtractionQueue):
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.db_path = db_path
+        self.heartbeats = []
+        self.steal_after = None
+
+    def heartbeat(self, worker_id, document_id, lease_seconds):
+        self.heartbeats.append(document_id)
+        if len(self.heartbeats) == self.steal_after:
+            # The lease expired and another worker re-claimed the job.
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("UPDATE document_extraction_jobs SET worker_id = 'worker-new' WHERE document_id = ?", (document_id,))
+        return super().heartbeat(worker_id, document_id, lease_seconds)
+
+
+class _FailingParser:
+    def parse_document(self, document, scope):
+        return {**document, "parsing_status": "failed", "parser_error": "RuntimeError: corrupt file"}
+
+
+def _queued_worker(tmp_path, text, *, parser=None):
+    db = tmp_path / "agent_state.db"
+    source = tmp_path / "report.txt"
+    source.write_text(text, encoding="utf-8")
+    documents = SQLiteDocumentRepository(db)
+    evidence = SQLiteEvidenceRepository(db)
+    queue = _HeartbeatQueue(db)
+    extraction = PageExtractionService(evidence_repository=evidence, parser=FakeParser(), page_batch_size=2)
+    service = FileUploadService(
+        documents,
+        storage_dir=tmp_path / "documents",
+        parser=FakeParser(),
+        extraction_service=extraction,
+        extraction_queue=queue,
+    )
+    document = service.register_path(source)
+    worker = DocumentExtractionWorker(queue, parser or service, extraction, documents)
+    return worker, queue, evidence, document["document_id"]
+
+
+def test_worker_renews_the_lease_after_every_page_batch(tmp_path):
+    worker, queue, _evidence, document_id = _queued_worker(tmp_path, "\f".join(f"page {n}" for n in range(5)))
+
+    assert asyncio.run(worker.run_once()) == 1
+
+    assert queue.get(document_id, TenantScope.local()).page_count == 5
+    # After parsing, after each of the three page batches and before indexing.
+    assert queue.heartbeats == [document_id] * 5
+
+
+def test_worker_fails_a_failed_parse_without_writing_pages(tmp_path):
+    worker, queue, evidence, document_id = _queued_worker(tmp_path, "alpha", parser=_FailingParser())
+
+    assert asyncio.run(worker.run_once()) == 1
+
+    job = queue.get(document_id, TenantScope.local())
+    assert (job.status, job.error) == (DocumentExtractionStatus.FAILED, "RuntimeError: corrupt file")
+    assert evidence.list_pages(document_id) == []
+
+
+def test_worker_drops_a_job_whose_lease_another_worker_took_over(tmp_path):
+    worker, queue, evidence, document_id = _queued_worker(tmp_path, "\f".join(f"page {n}" for n in range(5)))
+    queue.steal_after = 3
+
+    assert asyncio.run(worker.run_once()) == 1
+
+    job = queue.get(document_id, TenantScope.local())
+    assert (job.status, job.page_count) == (DocumentExtractionStatus.PARSING, None)
+    assert [page.page_number for page in evidence.list_pages(document_id)] == [1, 2]
+    assert worker.metrics()["jobs_lost"] == 1
+
+
+class _CountingStreamingParser(FakeParser):
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def parse(self, path, *, max_chars=12000):
+        self.calls.append("parse")
+        return super().parse(path, max_chars=max_chars)
+
+    def iter_pages(self, path):
+        self.calls.append("iter_pages")
+        yield from Path(path).read_text(encoding="utf-8").split("\f")
+        if self.fail:
+            raise ValueError("truncated xref table")
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_worker_parses_a_queued_upload_once_and_records_its_content(tmp_path, fail):
+    db = tmp_path / "agent_state.db"
+    source = tmp_path / "report.txt"
+    source.write_text("alpha\fbeta", encoding="utf-8")
+    documents = SQLiteDocumentRepository(db)
+    queue = SQLiteDocumentExtractionQueue(db)
+    parser = _CountingStreamingParser(fail=fail)
+    extraction = PageExtractionService(evidence_repository=SQLiteEvidenceRepository(db), parser=parser)
+    service = FileUploadService(
+        documents,
+        storage_dir=tmp_path / "documents",
+        parser=parser,
+        extraction_service=extraction,
+        extraction_queue=queue,
+    )
+    worker = DocumentExtractionWorker(queue, service, extraction, documents)
+    document_id = service.register_path(source)["document_id"]
+
+    assert asyncio.run(worker.run_once()) == 1
+
+    stored = documents.get(document_id, TenantScope.local())
+    job = queue.get(document_id, TenantScope.local())
+    assert parser.calls == ["iter_pages"]
+    assert stored["content"] == "alpha\fbeta"
+    if fail:
+        assert stored["parsing_status"] == "failed"
+        assert (job.status, job.error) == (DocumentExtractionStatus.FAILED, "ValueError: truncated xref table")
+    else:
+        assert stored["parsing_status"] == "parsed"
+        assert (job.status, job.page_count) == (DocumentExtractionStatus.INDEXED, 2)
@@ -3,6 +3,7 @@ import struct
 from doge.application.services.page_extraction_service import PageExtractionService
 from doge.core.domain.document_models import Document, DocumentStatus
 from doge.infrastructure.database.evidence_repository import SQLiteEvidenceRepository
+from doge.infrastructure.documents import LocalDocumentParser
 
 
 def test_page_extraction_splits_pdf_like_content_and_persists_chunks(tmp_path):
@@ -55,6 +56,9 @@ def test_page_extraction_captures_parser_errors(tmp_path):
         def parse(self, path, *, max_chars=12000):
             raise RuntimeError("cannot parse")
 
+        def iter_pages(self, path):
+            raise RuntimeError("cannot parse")
+
     source = tmp_path / "broken.pdf"
     source.write_bytes(b"%PDF")
     document = Document.create(
@@ -69,3 +73,58 @@ def test_page_extraction_captures_parser_errors(tmp_path):
     assert result.chunks == []
     assert result.errors == ["RuntimeError: cannot parse"]
     assert result.pages[0].parser_error == "RuntimeError: cannot parse"
+
+
+def test_page_extraction_streams_stored_file_in_batches(tmp_path):
+    source = tmp_path / "annual-report.txt"
+    source.write_text(
+        "\f".join(f"Page {number} segment revenue." for number in range(1, 501)),
+        encoding="utf-8",
+    )
+    saved_batches = []
+
+    class RecordingRepository:
+        def save_document_extraction(self, document_id, pages, chunks, scope):
+            saved_batches.append((len(pages), len(chunks)))
+
+        def prune_document_extraction(self, document_id, page_count, scope):
+            pass
+
+    document = Document.create(
+        document_id="doc-long",
+        original_filename="annual-report.txt",
+        storage_path=str(source),
+        parsing_status=DocumentStatus.PARSED,
+        content="Page 1 segment revenue.",
+    )
+
+    result = PageExtractionService(
+        evidence_repository=RecordingRepository(),
+        parser=LocalDocumentParser(),
+        page_batch_size=64,
+    ).extract(document, index=False, collect=False)
+
+    assert (result.page_count, result.chunk_count) == (500, 500)
+    assert result.pages == [] and result.chunks == []
+    assert len(saved_batches) == 8
+    assert saved_batches[-1] == (500 - 7 * 64, 500 - 7 * 64)
+
+
+def test_re_extraction_drops_pages_and_chunks_the_new_version_lacks(tmp_path):
+    repository = SQLiteEvidenceRepository(tmp_path / "agent_state.db")
+    service = PageExtractionService(evidence_repository=repository, page_batch_size=2)
+
+    def version(file_hash, content):
+        return Document.create(
+            document_id="doc-rev",
+            original_filename="report.pdf",
+            file_hash=file_hash,
+            parsing_status=DocumentStatus.PARSED,
+            content=content,
+        )
+
+    service.extract(version("v1", "Old one.\fOld two.\fOld three.\fOld four.\fOld five."))
+    service.extract(version("v2", "New one.\fNew two."))
+
+    assert [page.text for page in repository.list_pages("doc-rev")] == ["New one.", "New two."]
+    assert sorted(chunk.text for chunk in repository.list_chunks(["doc-rev"], limit=20)) == ["New one.", "New two."]
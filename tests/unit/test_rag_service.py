@@ -0,0 +1,149 @@
+import asyncio
+import sqlite3
+from dataclasses import replace
+
+from doge.application.services.chunk_index_backfill import ChunkIndexBackfill
+from doge.application.services.page_extraction_service import PageExtractionService
+from doge.application.services.rag_service import RAGService
+from doge.core.domain.document_models import Document, DocumentStatus
+from doge.infrastructure.database.embedding_cache import SQLiteEmbeddingCache
+from doge.infrastructure.database.evidence_repository import SQLiteEvidenceRepository
+from doge.infrastructure.llm.embedding_client import HashingEmbeddingProvider
+from doge.infrastructure.vector.sqlite_store import SQLiteVectorStore
+from doge.shared.scope import TenantScope
+
+
+class _CountingProvider(HashingEmbeddingProvider):
+    def __init__(self) -> None:
+        super().__init__(dimensions=32)
+        self.texts: list[str] = []
+
+    def embed_texts(self, texts):
+        self.texts.extend(texts)
+        return super().embed_texts(texts)
+
+
+class _CountingStore(SQLiteVectorStore):
+    upserted: int = 0
+
+    def upsert(self, records):
+        self.upserted += len(records)
+        super().upsert(records)
+
+
+def _document(document_id: str, content: str, file_hash: str = "hash") -> Document:
+    return Document.create(
+        document_id=document_id,
+        original_filename=f"{document_id}.md",
+        file_hash=file_hash,
+        parsing_status=DocumentStatus.PARSED,
+        content=content,
+    )
+
+
+def _services(db):
+    evidence = SQLiteEvidenceRepository(db)
+    provider = _CountingProvider()
+    store = _CountingStore(db)
+    rag = RAGService(
+        evidence_repository=evidence,
+        embedding_provider=provider,
+        vector_store=store,
+        embedding_cache=SQLiteEmbeddingCache(db),
+    )
+    extraction = PageExtractionService(evidence_repository=evidence, chunk_indexer=rag)
+    return evidence, provider, store, rag, extraction
+
+
+def test_extraction_indexes_chunks_and_search_only_embeds_the_query(tmp_path):
+    evidence, provider, store, rag, extraction = _services(tmp_path / "agent_state.db")
+    extraction.extract(_document("doc-semi", "Semiconductor outlook improved.\fRetail sales slowed."))
+    extraction.extract(_document("doc-bank", "Bank margins widened on higher rates."))
+    indexed = store.upserted
+    assert (rag.last_ingestion.texts, rag.last_ingestion.embedded) == (1, 1)
+    provider.texts.clear()
+
+    result = rag.search("semiconductor outlook", limit=2)
+
+    assert indexed == 3
+    assert store.upserted == indexed
+    assert provider.texts == ["semiconductor outlook"]
+    assert result["results"][0]["document_id"] == "doc-semi"
+    assert evidence.list_unindexed_chunks(TenantScope.local()) == []
+
+
+def test_index_pending_is_idempotent_and_picks_up_changed_sources(tmp_path):
+    evidence, _provider, store, rag, extraction = _services(tmp_path / "agent_state.db")
+    chunk = extraction.extract(_document("doc-a", "Copper demand rose.", file_hash="v1")).chunks[0]
+
+    assert rag.index_pending() == 0
+    evidence.save_chunk(replace(chunk, source_hash="v2"), TenantScope.local())
+
+    assert [pending.chunk_id for pending in evidence.list_unindexed_chunks(TenantScope.local())] == [chunk.chunk_id]
+    assert rag.index_pending() == 1
+    assert store.upserted == 2
+    assert rag.search("copper", limit=1)["results"][0]["source_hash"] == "v2"
+
+
+def test_search_is_scoped_to_tenant_and_documents(tmp_path):
+    _evidence, _provider, _store, rag, extraction = _services(tmp_path / "agent_state.db")
+    extraction.extract({**_document("doc-local", "Freight rates fell.").to_dict(), "tenant_id": "local"})
+    extraction.extract({**_document("doc-acme", "Freight rates fell sharply.").to_dict(), "tenant_id": "acme"})
+    extraction.extract({**_document("doc-acme-2", "Freight volumes rose.").to_dict(), "tenant_id": "acme"})
+
+    local = rag.search("freight rates", limit=5)
+    acme = rag.search("freight", limit=5, scope=TenantScope.from_tenant_id("acme"))
+    one_doc = rag.search("freight", limit=5, document_ids=["doc-acme-2"], tenant_id="acme")
+
+    assert {item["document_id"] for item in local["results"]} == {"doc-local"}
+    assert {item["document_id"] for item in acme["results"]} == {"doc-acme", "doc-acme-2"}
+    assert [item["document_id"] for item in one_doc["results"]] == ["doc-acme-2"]
+
+
+def test_index_all_pending_backfills_every_tenant(tmp_path):
+    db = tmp_path / "agent_state.db"
+    evidence, _provider, _store, rag, _extraction = _services(db)
+    unindexed = PageExtractionService(evidence_repository=evidence)
+    unindexed.extract({**_document("doc-local", "Steel output fell.").to_dict(), "tenant_id": "local"})
+    unindexed.extract({**_document("doc-acme", "Steel prices rose.").to_dict(), "tenant_id": "acme"})
+
+    assert evidence.list_unindexed_tenants() == ["acme", "local"]
+    assert rag.index_all_pending() == 2
+    assert evidence.list_unindexed_tenants() == []
+    acme = rag.search("steel", limit=5, scope=TenantScope.from_tenant_id("acme"))
+    assert [item["document_id"] for item in acme["results"]] == ["doc-acme"]
+
+
+def test_chunk_index_backfill_runs_the_sweep_off_the_event_loop(tmp_path):
+    evidence, _provider, _store, rag, _extraction = _services(tmp_path / "agent_state.db")
+    PageExtractionService(evidence_repository=evidence).extract(_document("doc-a", "Zinc stocks fell."))
+    backfill = ChunkIndexBackfill(rag)
+
+    assert asyncio.run(backfill.run_once()) == 1
+    assert asyncio.run(backfill.run_once()) == 0
+    assert backfill.metrics() == {"chunks_indexed": 1}
+
+
+def test_re_extraction_deletes_the_vectors_of_removed_chunks(tmp_path):
+    db = tmp_path / "agent_state.db"
+    _evidence, _provider, _store, rag, extraction = _services(db)
+    extraction.extract(_document("doc-a", "Nickel output fell.\fNickel prices rose.\fNickel stocks fell.", file_hash="v1"))
+    extraction.extract(_document("doc-a", "Nickel demand held.", file_hash="v2"))
+
+    with sqlite3.connect(db) as conn:
+        vectors = conn.execute("SELECT COUNT(*) FROM vector_entries").fetchone()[0]
+    results = rag.search("nickel", limit=5)["results"]
+
+    assert vectors == 1
+    assert [item["text"] for item in results] == ["Nickel demand held."]
+
+
+def test_chunks_re_extracted_while_embedding_stay_pending(tmp_path):
+    evidence, _provider, _store, rag, _extraction = _services(tmp_path / "agent_state.db")
+    PageExtractionService(evidence_repository=evidence).extract(_document("doc-a", "Tin supply fell.", file_hash="v1"))
+    read = evidence.list_unindexed_chunks(TenantScope.local())
+    evidence.save_chunk(replace(read[0], source_hash="v2"), TenantScope.local())
+
+    rag.ingest_chunks(read)
+
+    assert [chunk.source_hash for chunk in evidence.list_unindexed_chunks(TenantScope.local())] == ["v2"]
@@ -1,3 +1,6 @@
+import sqlite3
+import struct
+
 from doge.core.ports.vector_store import VectorRecord
 from doge.infrastructure.vector.sqlite_store import SQLiteVectorStore
 
@@ -35,3 +38,125 @@ def test_sqlite_vector_store_applies_metadata_filter(tmp_path):
     results = store.search([1.0], top_k=5, metadata_filter={"document_id": "doc-b"})
 
     assert [result.record.record_id for result in results] == ["b"]
+
+
+def test_sqlite_vector_store_pushes_scalar_and_nested_filters(tmp_path):
+    store = SQLiteVectorStore(tmp_path / "agent_state.db")
+    store.upsert([
+        VectorRecord("a", [1.0, 0.0], "alpha", {"document_id": "doc-a", "pinned": True, "tags": ["x"]}),
+        VectorRecord("b", [0.9, 0.1], "beta", {"document_id": "doc-a", "pinned": False, "tags": ["y"]}),
+        VectorRecord("c", [0.8, 0.2], "gamma", {"document_id": "doc-c"}),
+    ])
+
+    pinned = store.search([1.0, 0.0], metadata_filter={"document_id": "doc-a", "pinned": True})
+    tagged = store.search([1.0, 0.0], metadata_filter={"tags": ["y"]})
+    missing = store.search([1.0, 0.0], metadata_filter={"pinned": None})
+
+    assert [result.record.record_id for result in pinned] == ["a"]
+    assert [result.record.record_id for result in tagged] == ["b"]
+    assert [result.record.record_id for result in missing] == ["c"]
+
+
+def test_sqlite_vector_store_index_catches_up_across_instances(tmp_path):
+    db = tmp_path / "agent_state.db"
+    writer = SQLiteVectorStore(db, exact_threshold=8)
+    writer.upsert([VectorRecord(f"r{i}", [float(i % 5), 1.0, float(i % 3)], f"r{i}") for i in range(40)])
+    reader = SQLiteVectorStore(db, exact_threshold=8)
+
+    assert (tmp_path / "agent_state.vectors.npz").exists()
+    assert len(reader.search([4.0, 1.0, 2.0], top_k=3)) == 3
+
+    writer.upsert([VectorRecord("r0", [0.0, 0.0, 9.0], "moved"), VectorRecord("new", [0.0, -1.0, 0.0], "new")])
+
+    assert reader.search([0.0, 0.0, 1.0], top_k=1)[0].record.text == "moved"
+    assert reader.search([0.0, -1.0, 0.0], top_k=1)[0].record.record_id == "new"
+
+
+def test_sqlite_vector_store_scores_other_dimensions_as_zero(tmp_path):
+    store = SQLiteVectorStore(tmp_path / "agent_state.db")
+    store.upsert([VectorRecord("two", [1.0, 0.0], "two"), VectorRecord("three", [1.0, 0.0, 0.0], "three")])
+
+    results = store.search([1.0, 0.0], top_k=5)
+
+    assert [(result.record.record_id, result.score) for result in results] == [("two", 1.0), ("three", 0.0)]
+
+
+def test_bootstrap_migrates_legacy_json_vectors(tmp_path):
+    db = tmp_path / "agent_state.db"
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            "CREATE TABLE vector_entries (record_id TEXT PRIMARY KEY, vector TEXT NOT NULL, "
+            "text TEXT NOT NULL, metadata TEXT, updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.execute("INSERT INTO vector_entries(record_id, vector, text, metadata) VALUES ('old', '[0.0, 2.0]', 'old', '{}')")
+
+    store = SQLiteVectorStore(db)
+    results = store.search([0.0, 1.0], top_k=1)
+
+    assert results[0].record.record_id == "old"
+    assert results[0].record.vector == [0.0, 2.0]
+    assert results[0].score == 1.0
+
+
+def test_sqlite_vector_store_persists_index_every_n_revisions(tmp_path, monkeypatch):
+    from doge.infrastructure.vector import sqlite_store
+
+    saved: list[int] = []
+    real_save = sqlite_store.save_indexes
+
+    def _recording_save(path, indexes):
+        saved.append(max(index.revision for index in indexes.values()))
+        real_save(path, indexes)
+
+    monkeypatch.setattr(sqlite_store, "save_indexes", _recording_save)
+    store = SQLiteVectorStore(tmp_path / "agent_state.db", persist_every=3)
+
+    for i in range(7):
+        store.upsert([VectorRecord(f"r{i}", [1.0, float(i)], f"r{i}")])
+
+    assert saved == [1, 4, 7]
+    reader = SQLiteVectorStore(tmp_path / "agent_state.db")
+    assert reader.search([1.0, 6.0], top_k=1)[0].record.record_id == "r6"
+
+
+def test_save_indexes_writes_through_a_private_temp_file(tmp_path, monkeypatch):
+    import os
+
+    from doge.infrastructure.vector import ann_index
+
+    replaced: list[str] = []
+    real_replace = os.replace
+
+    def _recording_replace(src, dst):
+        replaced.append(str(src))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(ann_index.os, "replace", _recording_replace)
+    index = ann_index.IVFIndex(2)
+    index.add(["a"], ann_index.np.array([[1.0, 0.0]], dtype="float32"))
+    target = tmp_path / "agent_state.vectors.npz"
+
+    ann_index.save_indexes(target, {2: index})
+    ann_index.save_indexes(target, {2: index})
+
+    assert len(set(replaced)) == 2
+    assert all(name != str(target) + ".tmp" and name.startswith(str(target)) for name in replaced)
+    assert [path.name for path in tmp_path.iterdir()] == [target.name]
+    assert ann_index.load_indexes(target)[2].search(ann_index.np.array([1.0, 0.0], dtype="float32"), 1)[0][0] == "a"
+
+
+def test_sqlite_vector_store_sees_deletes_and_writes_made_outside_the_store(tmp_path):
+    db = tmp_path / "agent_state.db"
+    store = SQLiteVectorStore(db)
+    store.upsert([VectorRecord("a", [1.0, 0.0], "a"), VectorRecord("b", [0.9, 0.1], "b")])
+    assert store.search([1.0, 0.0], top_k=1)[0].record.record_id == "a"
+
+    with sqlite3.connect(db) as conn:
+        conn.execute("DELETE FROM vector_entries WHERE record_id = 'a'")
+    assert [result.record.record_id for result in store.search([1.0, 0.0], top_k=5)] == ["b"]
+
+    with sqlite3.connect(db) as conn:
+        conn.execute("UPDATE vector_entries SET vector = ?, norm = 1.0 WHERE record_id = 'b'", (struct.pack("<2f", 0.0, 1.0),))
+        state = conn.execute("SELECT revision, deletions FROM vector_entries_state").fetchone()
+    assert store.search([0.0, 1.0], top_k=1)[0].score == 1.0
+    assert state == (4, 1)
@@ -0,0 +1,188 @@
+"""ScanMarketUseCase batched persistence through save_prices_batch."""
+from __future__ import annotations
+
+import pandas as pd
+
+from doge.application.contracts.request import ScanMarketRequest
+from doge.application.use_cases.scan_market import ScanMarketUseCase
+from doge.core.ports.data_source import IMarketDataSource
+from doge.core.ports.file_scanner import ITdxFileScanner
+from doge.core.ports.repository import IStockRepository, PriceBatchWriteResult
+
+
+def _frame(ticker: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": ["2026-01-02", "2026-01-05"],
+            "open": [10.0, 10.2],
+            "high": [11.0, 11.2],
+            "low": [9.0, 9.2],
+            "close": [10.5, 10.7],
+            "volume": [1000, 1100],
+            "amount": [10000.0, 11000.0],
+            "ticker": [ticker, ticker],
+        }
+    )
+
+
+class _WriteOnlyRepo(IStockRepository):
+    def ensure_schema(self, market):
+        pass
+
+    def save_prices(self, market, frame):
+        raise NotImplementedError
+
+    def get_prices(self, ticker, market, days=20):
+        return []
+
+    def get_overview(self, ticker, market):
+        return {}
+
+    def get_sync_state(self, tickers):
+        return {}
+
+    def get_kline(self, ticker, market, days=120):
+        return []
+
+    def list_distinct_tickers(self, market):
+        return []
+
+
+class _BatchRepo(_WriteOnlyRepo):
+    def __init__(self, fail=()):
+        self.batches: list[list[str]] = []
+        self._fail = set(fail)
+
+    def save_prices_batch(self, market, frames):
+        tickers = [str(frame["ticker"].iloc[0]) for frame in frames]
+        self.batches.append(tickers)
+        return PriceBatchWriteResult(
+            appended={t: 2 for t in tickers if t not in self._fail},
+            failed={t: "forced" for t in tickers if t in self._fail},
+        )
+
+
+class _Scanner(ITdxFileScanner):
+    def __init__(self, tickers):
+        self._tickers = tickers
+
+    def scan_local(self, market, tdx_path, progress_callback=None):
+        for ticker in self._tickers:
+            yield _frame(ticker)
+
+    def list_tickers(self, market, tdx_path):
+        return list(self._tickers)
+
+
+class _Source(IMarketDataSource):
+    def __init__(self, empty=(), broken=()):
+        self._empty = set(empty)
+        self._broken = set(broken)
+
+    def is_connected(self):
+        return True
+
+    def connect(self, market="cn"):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def get_latest_market_date(self, market):
+        return None
+
+    def download_kline(self, ticker, market, start=0, count=800):
+        if ticker in self._broken:
+            raise RuntimeError("network down")
+        if ticker in self._empty:
+            return pd.DataFrame()
+        return _frame(ticker)
+
+
+def test_local_scan_writes_in_request_sized_batches():
+    tickers = [f"{600000 + i}.SH" for i in range(5)]
+    repo = _BatchRepo(fail={"600003.SH"})
+    use_case = ScanMarketUseCase(repo, file_scanner=_Scanner(tickers))
+
+    response = use_case.execute(
+        ScanMarketRequest(market="cn", source="tdx-local", tdx_path="/x", batch_size=2)
+    )
+
+    assert repo.batches == [tickers[0:2], tickers[2:4], tickers[4:5]]
+    assert [r.ticker for r in response.results] == tickers
+    assert [r.status for r in response.results] == [
+        "success", "success", "success", "failed", "success",
+    ]
+    assert response.results[0].rows_appended == 2
+    assert response.failed_count == 1
+
+
+def test_remote_scan_batches_writes_and_keeps_result_order():
+    tickers = ["A.SZ", "B.SZ", "C.SZ", "D.SZ"]
+    repo = _BatchRepo()
+    events = []
+    use_case = ScanMarketUseCase(repo, data_source=_Source(empty={"B.SZ"}, broken={"C.SZ"}))
+
+    response = use_case.execute(
+        ScanMarketRequest(market="cn", tickers=tickers, batch_size=50),
+        progress_callback=lambda pct, msg: events.append(pct),
+    )
+
+    assert repo.batches == [["A.SZ", "D.SZ"]]
+    assert [(r.ticker, r.status) for r in response.results] == [
+        ("A.SZ", "success"), ("B.SZ", "skipped"), ("C.SZ", "failed"), ("D.SZ", "success"),
+    ]
+    assert events == [25, 50, 75, 100]
+
+
+class _PooledSource(_Source):
+    def download_many(self, tickers, market, start=0, count=800):
+        for ticker in tickers:
+            try:
+                yield ticker, self.download_kline(ticker, market), None
+            except Exception as e:
+                yield ticker, None, f"pooled: {e}"
+
+
+def test_remote_scan_reports_the_download_error_text():
+    use_case = ScanMarketUseCase(_BatchRepo(), data_source=_PooledSource(broken={"B.SZ"}))
+
+    response = use_case.execute(ScanMarketRequest(market="cn", tickers=["A.SZ", "B.SZ"]))
+
+    assert [(r.ticker, r.status, r.message) for r in response.results] == [
+        ("A.SZ", "success", None), ("B.SZ", "failed", "pooled: network down"),
+    ]
+
+
+def test_repositories_without_batch_api_fall_back_to_save_prices():
+    class _LegacyRepo(_WriteOnlyRepo):
+        def __init__(self):
+            self.saved = []
+
+        def save_prices(self, market, frame):
+            self.saved.append(str(frame["ticker"].iloc[0]))
+            return len(frame)
+
+    repo = _LegacyRepo()
+    use_case = ScanMarketUseCase(repo, file_scanner=_Scanner(["A.SZ", "B.SZ"]))
+
+    response = use_case.execute(
+        ScanMarketRequest(market="cn", source="tdx-local", tdx_path="/x")
+    )
+
+    assert repo.saved == ["A.SZ", "B.SZ"]
+    assert response.success_count == 2
+
+
+def test_completed_scan_reports_the_data_change_after_refreshing_views():
+    order = []
+    use_case = ScanMarketUseCase(
+        _BatchRepo(),
+        file_scanner=_Scanner(["A.SZ"]),
+        refresh_views_callable=lambda: order.append("refresh"),
+        data_changed_callable=lambda: order.append("changed"),
+    )
+
+    use_case.execute(ScanMarketRequest(market="cn", source="tdx-local", tdx_path="/x"))
+
+    assert order == ["refresh", "changed"]
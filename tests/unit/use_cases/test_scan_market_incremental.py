@@ -0,0 +1,104 @@
+"""Incremental ``tdx-local`` scans driven by persisted file watermarks."""
+from __future__ import annotations
+
+import sqlite3
+import struct
+from unittest.mock import MagicMock
+
+import pytest
+
+from doge.application.contracts.request import ScanMarketRequest
+from doge.application.use_cases.scan_market import ScanMarketUseCase
+from doge.core.ports.repository import IStockRepository
+from doge.infrastructure.data_source.tdx_file_scanner import TDXFileScanner
+from doge.infrastructure.database.sqlite_storage import SQLiteStorageRepository
+
+
+def _write_day(path, count):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = bytearray()
+    for i in range(count):
+        date_int = 20260000 + (1 + i // 28) * 100 + (1 + i % 28)
+        payload += struct.pack("<IIIII fII", date_int, 1000, 1010, 990, 1005, 1.0e6, 1000 + i, 0)
+    path.write_bytes(bytes(payload))
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    from doge.config import settings as settings_module
+
+    monkeypatch.setenv("DOGE_CN_DB", str(tmp_path / "market_cn.db"))
+    settings_module.reset_settings()
+    lday = tmp_path / "vipdoc" / "sh" / "lday"
+    for code in ("600000", "600001", "600002"):
+        _write_day(lday / f"sh{code}.day", 30)
+    repo = SQLiteStorageRepository(read_repo=MagicMock(spec=IStockRepository))
+    use_case = ScanMarketUseCase(
+        repo, file_scanner=TDXFileScanner(parser="mmap", workers=1)
+    )
+    yield use_case, lday, tmp_path
+    settings_module.reset_settings()
+
+
+def _request(tmp_path, **kwargs):
+    return ScanMarketRequest(market="cn", source="tdx-local", tdx_path=str(tmp_path), **kwargs)
+
+
+def test_rescan_skips_unchanged_files_and_appends_new_bars(setup):
+    use_case, lday, tmp_path = setup
+
+    first = use_case.execute(_request(tmp_path))
+    _write_day(lday / "sh600001.day", 31)
+    second = use_case.execute(_request(tmp_path))
+
+    assert first.success_count == 3
+    assert first.unchanged_count == 0
+    assert second.unchanged_count == 2
+    assert second.success_count == 1
+    assert [(r.ticker, r.status, r.rows_appended) for r in second.results] == [
+        ("600000.SH", "unchanged", 0),
+        ("600001.SH", "success", 1),
+        ("600002.SH", "unchanged", 0),
+    ]
+    conn = sqlite3.connect(str(tmp_path / "market_cn.db"))
+    try:
+        counts = dict(conn.execute(
+            "SELECT ticker, COUNT(*) FROM stock_prices GROUP BY ticker"
+        ).fetchall())
+        watermark_sizes = dict(conn.execute(
+            "SELECT ticker, file_size FROM tdx_file_watermarks"
+        ).fetchall())
+    finally:
+        conn.close()
+    assert counts == {"600000.SH": 30, "600001.SH": 31, "600002.SH": 30}
+    assert watermark_sizes["600001.SH"] == 31 * 32
+
+
+def test_non_incremental_request_reparses_everything(setup):
+    use_case, _, tmp_path = setup
+
+    use_case.execute(_request(tmp_path))
+    again = use_case.execute(_request(tmp_path, incremental=False))
+
+    assert again.unchanged_count == 0
+    assert again.success_count == 3
+    assert all(r.rows_appended == 0 for r in again.results)
+
+
+def test_watermark_save_failure_is_logged_and_next_scan_rereads(setup, monkeypatch, caplog):
+    use_case, _, tmp_path = setup
+
+    def _fail(market, watermarks):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch, caplog.at_level(
+        "WARNING", logger="doge.application.use_cases.scan_market"
+    ):
+        patch.setattr(use_case._stock_repo, "save_file_watermarks", _fail)
+        first = use_case.execute(_request(tmp_path))
+    again = use_case.execute(_request(tmp_path))
+
+    assert first.success_count == 3
+    assert "3 TDX file watermark(s)" in caplog.text
+    assert "disk full" in caplog.text
+    assert again.unchanged_count == 0